@@ -1,6 +1,13 @@
 """Clawgotchi - Autonomous self-evolving terminal pet."""
 
-# Re-export main CLI functions for backward compatibility
-from clawgotchi_cli import len_visible
-
 __all__ = ["len_visible"]
+
+
+def __getattr__(name):
+    # Re-export main CLI functions for backward compatibility. Resolved on
+    # first use: importing the TUI (blessed, the agent) here would make
+    # every ``clawgotchi.*`` import pay for it.
+    if name == "len_visible":
+        from clawgotchi_cli import len_visible
+        return len_visible
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -127,14 +127,21 @@ class GoalGenerator:
         ],
     }
 
-    def __init__(self, memory_path: str = "memory/goals.json"):
+    def __init__(self, memory_path: str = "memory/goals.json", store=None):
         self.goals_path = Path(memory_path)
+        # Optional SQLite store (core.memory_store); replaces goals.json.
+        self.store = store
+        self._repo = store.collection("goals") if store is not None else None
         self._goals: list[Goal] = []
         self._history: list[dict] = []
         self._load()
 
     def _load(self):
         """Load goals from disk."""
+        if self._repo is not None:
+            self._goals = [Goal.from_dict(g) for g in self._repo.all()]
+            self._history = self.store.get_document("goals.history", [])
+            return
         if self.goals_path.exists():
             try:
                 data = json.loads(self.goals_path.read_text())
@@ -144,8 +151,19 @@ class GoalGenerator:
                 self._goals = []
                 self._history = []
 
-    def _save(self):
-        """Persist goals to disk."""
+    def _save(self, *changed: Goal):
+        """Persist goals to disk.
+
+        With a store, passing the ``changed`` goals updates just those rows;
+        no arguments rewrites every goal and the history.
+        """
+        if self._repo is not None:
+            if changed:
+                self._repo.put_many(g.to_dict() for g in changed)
+            else:
+                self._repo.replace_all(g.to_dict() for g in self._goals)
+                self.store.put_document("goals.history", self._history)
+            return
         self.goals_path.parent.mkdir(parents=True, exist_ok=True)
         data = {
             "goals": [g.to_dict() for g in self._goals],
@@ -314,7 +332,7 @@ class GoalGenerator:
             new_goals.append(goal)
             self._goals.append(goal)
 
-        self._save()
+        self._save(*new_goals)
         return new_goals
 
     def get_active_goals(self) -> list[Goal]:
@@ -350,7 +368,7 @@ class GoalGenerator:
             goal.status = "completed"
             goal.completed_at = datetime.now().isoformat()
 
-        self._save()
+        self._save(goal)
 
     def increment_progress(self, goal_id: str, delta: float = 1.0, note: str = None):
         """Increment goal progress by delta."""
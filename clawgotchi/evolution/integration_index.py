@@ -0,0 +1,99 @@
+"""
+IntegrationIndex - cached inputs for IntegrationManager's orphan scan.
+
+- Per-file AST summaries (classes, public functions) keyed by path and
+  (mtime, size), so unchanged modules are never re-parsed
+- The identifiers referenced by core/autonomous_agent.py and every
+  __init__.py, gathered in one walk over the tree and cached per file
+- A fingerprint of all of the above, so callers can memoize results
+  until something on disk actually changes
+"""
+
+import ast
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+SKIP_DIRS = {
+    ".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache",
+    ".venv", "venv", ".tox", ".nox", "node_modules",
+}
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+Stamp = Optional[tuple]
+
+
+def file_stamp(path: Path) -> Stamp:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class IntegrationIndex:
+    """Caches module summaries and references for one source tree."""
+
+    def __init__(self, base: Path):
+        self.base = Path(base)
+        self._summaries: dict[str, tuple] = {}  # path -> (stamp, summary)
+        self._identifiers: dict[str, tuple] = {}  # path -> (stamp, set of names)
+
+    def summary(self, path: Path) -> dict:
+        """Classes and public functions defined in ``path``."""
+        key = str(path)
+        stamp = file_stamp(path)
+        cached = self._summaries.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            tree = ast.parse(path.read_text())
+            summary = {
+                "classes": [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)],
+                "functions": [
+                    node.name for node in ast.walk(tree)
+                    if isinstance(node, ast.FunctionDef) and not node.name.startswith("_")
+                ],
+            }
+        except (SyntaxError, ValueError, OSError):
+            summary = {"classes": [], "functions": []}
+        self._summaries[key] = (stamp, summary)
+        return summary
+
+    def reference_files(self) -> list[Path]:
+        """The agent module plus every package ``__init__.py``."""
+        files = [self.base / "core" / "autonomous_agent.py"]
+        for root, dirs, names in os.walk(self.base):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            if "__init__.py" in names:
+                files.append(Path(root) / "__init__.py")
+        return files
+
+    def _names_in(self, path: Path, stamp: Stamp) -> set:
+        key = str(path)
+        cached = self._identifiers.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            names = set(_IDENTIFIER.findall(path.read_text()))
+        except (OSError, UnicodeDecodeError):
+            names = set()
+        self._identifiers[key] = (stamp, names)
+        return names
+
+    def references(self) -> tuple[set, tuple]:
+        """Return (referenced identifiers, fingerprint of the files read)."""
+        referenced: set = set()
+        fingerprint = []
+        for path in self.reference_files():
+            stamp = file_stamp(path)
+            if stamp is None:
+                continue
+            referenced |= self._names_in(path, stamp)
+            fingerprint.append((str(path), stamp))
+        live = {key for key, _ in fingerprint}
+        for key in [k for k in self._identifiers if k not in live]:
+            del self._identifiers[key]
+        return referenced, tuple(fingerprint)
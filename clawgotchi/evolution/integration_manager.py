@@ -12,13 +12,14 @@ Integration points:
 - Safety modules → validation
 """
 
-import ast
 import json
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from clawgotchi.evolution.integration_index import IntegrationIndex, file_stamp
+
 
 @dataclass
 class ModuleInfo:
@@ -61,15 +62,23 @@ class IntegrationManager:
         },
     }
 
-    def __init__(self, registry=None, memory_dir: str = "memory"):
+    def __init__(self, registry=None, memory_dir: str = "memory", store=None):
         self.registry = registry
         self.memory_dir = Path(memory_dir)
         self.integrations_path = self.memory_dir / "integrations.json"
+        # Optional SQLite store (core.memory_store); replaces integrations.json.
+        self._repo = store.collection("integrations") if store is not None else None
         self._integrations: dict[str, ModuleInfo] = {}
+        self._indexes: dict[str, IntegrationIndex] = {}
+        self._orphan_cache: Optional[tuple] = None
         self._load()
 
     def _load(self):
         """Load integration state from disk."""
+        if self._repo is not None:
+            for info in self._repo.all():
+                self._integrations[info["name"]] = ModuleInfo(**info)
+            return
         if self.integrations_path.exists():
             try:
                 data = json.loads(self.integrations_path.read_text())
@@ -78,8 +87,15 @@ class IntegrationManager:
             except (json.JSONDecodeError, KeyError, TypeError):
                 pass
 
-    def _save(self):
-        """Save integration state to disk."""
+    def _save(self, *changed: str):
+        """Save integration state to disk.
+
+        With a store only the ``changed`` module rows are written.
+        """
+        if self._repo is not None:
+            names = changed or self._integrations.keys()
+            self._repo.put_many(asdict(self._integrations[n]) for n in names)
+            return
         self.memory_dir.mkdir(parents=True, exist_ok=True)
         data = {
             "modules": {
@@ -93,91 +109,83 @@ class IntegrationManager:
         """Find modules that exist but aren't integrated.
 
         Scans package directories for Python files and checks
-        if they're registered/imported in the main system.
+        if they're registered/imported in the main system. AST summaries
+        and references come from a per-tree IntegrationIndex, and the result
+        is reused until a scanned file, a reference file, an integration
+        status or the registry changes.
 
         Returns:
             List of orphaned module dicts with path, name, category
         """
         base = Path(base_dir)
-        orphaned = []
+        index = self._index_for(base)
 
-        # Scan each integration point directory
+        candidates = []
         for package_path, config in self.INTEGRATION_POINTS.items():
             pkg_dir = base / package_path
             if not pkg_dir.exists():
                 continue
+            for py_file in sorted(pkg_dir.glob("*.py")):
+                if not py_file.name.startswith("_"):
+                    candidates.append((package_path, config, py_file))
+
+        referenced, ref_fingerprint = index.references()
+        registered = self._registered_names()
+        key = (
+            str(base.resolve()),
+            tuple((str(f), file_stamp(f)) for _, _, f in candidates),
+            ref_fingerprint,
+            tuple(sorted((name, info.status) for name, info in self._integrations.items())),
+            tuple(sorted(registered)),
+        )
+        if self._orphan_cache is not None and self._orphan_cache[0] == key:
+            return [dict(m) for m in self._orphan_cache[1]]
 
-            for py_file in pkg_dir.glob("*.py"):
-                if py_file.name.startswith("_"):
+        orphaned = []
+        for package_path, config, py_file in candidates:
+            module_name = py_file.stem
+
+            # Check if already tracked as integrated
+            if module_name in self._integrations:
+                if self._integrations[module_name].status == "integrated":
                     continue
 
-                module_name = py_file.stem
-                full_path = str(py_file)
-
-                # Check if already tracked as integrated
-                if module_name in self._integrations:
-                    if self._integrations[module_name].status == "integrated":
-                        continue
-
-                # Parse to get classes/functions
-                try:
-                    content = py_file.read_text()
-                    tree = ast.parse(content)
-                    classes = [
-                        node.name for node in ast.walk(tree)
-                        if isinstance(node, ast.ClassDef)
-                    ]
-                    functions = [
-                        node.name for node in ast.walk(tree)
-                        if isinstance(node, ast.FunctionDef)
-                        and not node.name.startswith("_")
-                    ]
-                except SyntaxError:
-                    classes = []
-                    functions = []
-
-                # Check if module is actually used
-                if not self._is_module_integrated(module_name, base):
-                    orphaned.append({
-                        "path": full_path,
-                        "name": module_name,
-                        "package": package_path,
-                        "category": config["category"],
-                        "integration_point": config["point"],
-                        "classes": classes,
-                        "functions": functions,
-                    })
-
-        return orphaned
+            # Check if module is actually used
+            if module_name in referenced or module_name in registered:
+                continue
+
+            summary = index.summary(py_file)
+            orphaned.append({
+                "path": str(py_file),
+                "name": module_name,
+                "package": package_path,
+                "category": config["category"],
+                "integration_point": config["point"],
+                "classes": list(summary["classes"]),
+                "functions": list(summary["functions"]),
+            })
+
+        self._orphan_cache = (key, orphaned)
+        return [dict(m) for m in orphaned]
+
+    def _index_for(self, base: Path) -> IntegrationIndex:
+        key = str(base.resolve())
+        if key not in self._indexes:
+            self._indexes[key] = IntegrationIndex(base)
+        return self._indexes[key]
+
+    def _registered_names(self) -> set:
+        if not self.registry:
+            return set()
+        try:
+            return {r.get("name") for r in self.registry.list_all()}
+        except Exception:
+            return set()
 
     def _is_module_integrated(self, module_name: str, base: Path) -> bool:
         """Check if a module is imported/used in the main system."""
-        # Check autonomous_agent.py for imports
-        agent_path = base / "core" / "autonomous_agent.py"
-        if agent_path.exists():
-            content = agent_path.read_text()
-            if module_name in content:
-                return True
-
-        # Check resilience registry
-        if self.registry:
-            try:
-                registered = self.registry.list_all()
-                if module_name in [r.get("name") for r in registered]:
-                    return True
-            except Exception:
-                pass
-
-        # Check __init__.py files
-        for init_path in base.rglob("__init__.py"):
-            try:
-                content = init_path.read_text()
-                if module_name in content:
-                    return True
-            except Exception:
-                continue
-
-        return False
+        referenced, _ = self._index_for(Path(base)).references()
+        return module_name in referenced or module_name in self._registered_names()
 
     def categorize_module(self, module_path: str) -> str:
         """Determine where a module should be integrated.
@@ -291,7 +299,7 @@ class IntegrationManager:
             last_checked=datetime.now().isoformat(),
         )
         self._integrations[name] = info
-        self._save()
+        self._save(name)
 
         if errors:
             return {
@@ -357,10 +365,10 @@ class IntegrationManager:
         if module_name in self._integrations:
             self._integrations[module_name].status = "integrated"
             self._integrations[module_name].last_checked = datetime.now().isoformat()
-            self._save()
+            self._save(module_name)
 
     def mark_orphaned(self, module_name: str):
         """Mark a module as orphaned."""
         if module_name in self._integrations:
             self._integrations[module_name].status = "orphaned"
-            self._save()
+            self._save(module_name)
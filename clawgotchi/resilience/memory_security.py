@@ -13,7 +13,9 @@ import json
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+from utils.secret_scanner import SecretScanner, scanner_for
 
 
 class SecurityLevel(Enum):
@@ -209,6 +211,13 @@ class SecurityReport:
         return "\n".join(lines)
 
 
+def _pattern_scanner() -> Tuple[SecretScanner, Tuple[SensitivePattern, ...]]:
+    """The shared scanner over every regex of every pattern, and each regex's owner."""
+    owners = tuple(p for p in SensitivePattern for _ in p._config['patterns'])
+    sources = tuple(r for p in SensitivePattern for r in p._config['patterns'])
+    return scanner_for(sources, re.IGNORECASE), owners
+
+
 class MemorySecurityScanner:
     """
     Scans memory files for sensitive data exposure.
@@ -246,25 +255,21 @@ class MemorySecurityScanner:
         if not file_path.exists():
             return findings
         
-        content = file_path.read_text()
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, start=1):
+        scanner, owners = _pattern_scanner()
+        for hit in scanner.scan_file(file_path).hits:
+            matched = {owners[index] for index in hit.patterns}
             for pattern in self.patterns:
-                if pattern in self.exclude_patterns:
+                if pattern in self.exclude_patterns or pattern not in matched:
                     continue
-                    
-                if pattern.matches(line):
-                    match = self._extract_match(line, pattern)
-                    finding = SecurityFinding(
-                        pattern=pattern,
-                        security_level=pattern.security_level,
-                        line_number=line_num,
-                        context=line.strip()[:100],
-                        match=match
-                    )
-                    findings.append(finding)
-                    self.history.append(finding)
+                finding = SecurityFinding(
+                    pattern=pattern,
+                    security_level=pattern.security_level,
+                    line_number=hit.line,
+                    context=hit.text.strip()[:100],
+                    match=self._extract_match(hit.text, pattern)
+                )
+                findings.append(finding)
+                self.history.append(finding)
         
         return findings
     
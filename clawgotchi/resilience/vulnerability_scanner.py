@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
 
+from utils.secret_scanner import SecretScanner
+
 
 class Severity(Enum):
     """Vulnerability severity levels."""
@@ -218,24 +220,36 @@ class VulnerabilityScanner:
         lines = code.split('\n')
         result.lines_scanned = len(lines)
         
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith('//') or line.startswith('#'):
-                continue
-                
-            for pattern_info in self.patterns:
-                match = pattern_info["regex"].search(line)
-                if match:
-                    vuln = VulnerabilityReport(
-                        vulnerability_type=pattern_info["type"],
-                        severity=pattern_info["severity"],
-                        cve_id=pattern_info["cve_id"],
-                        location=f"{filename}:{line_num}",
-                        line_number=line_num,
-                        description=pattern_info["description"],
-                        remediation=pattern_info["remediation"]
-                    )
-                    result.vulnerabilities.append(vuln)
+        # Each pattern runs once over the whole code; only the lines its
+        # matches touch are checked line by line (stripped, comments skipped)
+        starts = SecretScanner.line_starts(code)
+        stripped = {}
+        hits = {}
+        for index, pattern_info in enumerate(self.patterns):
+            regex = pattern_info["regex"]
+            for i in SecretScanner.touched_lines(regex, code, starts):
+                line = stripped.get(i)
+                if line is None:
+                    line = stripped[i] = lines[i].strip()
+                if not line or line.startswith('//') or line.startswith('#'):
+                    continue
+                if regex.search(line):
+                    hits.setdefault(i, []).append(index)
+        
+        for i in sorted(hits):
+            line_num = i + 1
+            for index in hits[i]:
+                pattern_info = self.patterns[index]
+                vuln = VulnerabilityReport(
+                    vulnerability_type=pattern_info["type"],
+                    severity=pattern_info["severity"],
+                    cve_id=pattern_info["cve_id"],
+                    location=f"{filename}:{line_num}",
+                    line_number=line_num,
+                    description=pattern_info["description"],
+                    remediation=pattern_info["remediation"]
+                )
+                result.vulnerabilities.append(vuln)
         
         result.scan_time_ms = (time.time() - start_time) * 1000
         return result
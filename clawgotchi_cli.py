@@ -3,32 +3,48 @@
 Clawgotchi — A Pwnagotchi-style terminal pet with Moltbook topics.
 """
 
-import json
-import re
+import functools
 import signal
-import subprocess
 import sys
 import textwrap
 import threading
 import time
+
+_IMPORT_START = time.perf_counter()
+
 from datetime import datetime
 from pathlib import Path
 from blessed import Terminal
 
-from integrations.moltbook_client import fetch_feed
+from core import startup_profile
+from core.startup_profile import phase
+
+if startup_profile.CHILD_FLAG in sys.argv:
+    startup_profile.enable()
+
+# The agent, skill tree and gateway client are imported where first used:
+# none of them is needed to draw the first frame.
 from integrations.openclaw_watcher import OpenClawWatcher
 from core.pet_state import PetState
 from core import lifetime
-from core.autonomous_agent import start_agent, stop_agent, get_agent, AutonomousAgent
-from cli.skill_tree import list_skills
+from core.data_refresher import DataRefresher
+from core.screen_buffer import ScreenBuffer
+from core.text_layout import Segments, bordered_row, visible_width
 
 # Start autonomous agent
-_agent_instance: AutonomousAgent = None
+_agent_instance = None
 
 
 # ── Data-fetching helpers (safe, never crash the TUI) ──────────────
 
 
+VITALS_DEFAULTS = {
+    "health": 0, "trend": "→", "curiosity_count": 0,
+    "taste_rejections": 0, "assumption_accuracy": None,
+    "goal": "", "thought": "",
+}
+
+
 def get_vitals_data() -> dict:
     """Fetch compact vitals for the pet view strip.
 
@@ -36,11 +52,7 @@ def get_vitals_data() -> dict:
     taste_rejections, assumption_accuracy, goal, thought.
     All values have safe defaults so callers never need try/except.
     """
-    data = {
-        "health": 0, "trend": "→", "curiosity_count": 0,
-        "taste_rejections": 0, "assumption_accuracy": None,
-        "goal": "", "thought": "",
-    }
+    data = dict(VITALS_DEFAULTS)
     try:
         agent = get_autonomous_agent()
         status = agent.get_status()
@@ -190,6 +202,7 @@ def fetch_skills() -> list:
     Returns list of dicts with: name, description, path, category, icon.
     """
     try:
+        from cli.skill_tree import list_skills
         raw = list_skills()
     except Exception:
         return []
@@ -218,6 +231,7 @@ def get_autonomous_agent():
     """Get or create the autonomous agent instance."""
     global _agent_instance
     if _agent_instance is None:
+        from core.autonomous_agent import get_agent, start_agent
         _agent_instance = get_agent()
         start_agent()
     return _agent_instance
@@ -225,114 +239,87 @@ def get_autonomous_agent():
 FPS = 4
 FRAME_TIME = 1.0 / FPS
 
+# Background refresh TTLs (seconds) for the data shown by draw()
+VITALS_TTL = 3
+DASHBOARD_TTL = 10
+SKILLS_TTL = 120
+
 TOPICS_CACHE = Path.home() / ".openclaw" / "cache" / "moltbook_topics.json"
 
 
 def fetch_moltbook_topics():
-    """Fetch topics from Moltbook using the new client."""
-    from integrations.moltbook_client import get_cached_posts, CACHE_DIR
-    import os
-    
-    # Check cache first
-    cache_file = CACHE_DIR / "moltbook_posts.json"
-    if cache_file.exists():
-        try:
-            data = json.loads(cache_file.read_text())
-            if time.time() - data.get("timestamp", 0) < 300:  # 5 min cache
-                posts = data.get("posts", [])
-                return [{
-                    "id": p.get("id"),
-                    "title": p.get("title", "Untitled"),
-                    "author": p.get("author", {}).get("name", "?"),
-                    "karma": p.get("upvotes", 0),
-                    "comments": p.get("comment_count", 0),
-                    "content": p.get("content", ""),
-                    "submolt": p.get("submolt", {}).get("name", "") if isinstance(p.get("submolt"), dict) else "",
-                } for p in posts]
-        except:
-            pass
-    
-    # Fetch fresh posts
-    posts = fetch_feed(limit=20)
-    if posts:
-        return [{
-            "id": p.get("id"),
-            "title": p.get("title", "Untitled"),
-            "author": p.get("author", {}).get("name", "?"),
-            "karma": p.get("upvotes", 0),
-            "comments": p.get("comment_count", 0),
-            "content": p.get("content", ""),
-            "submolt": p.get("submolt", {}).get("name", "") if isinstance(p.get("submolt"), dict) else "",
-        } for p in posts]
-    
-    return []
+    """Fetch topics from Moltbook using the new client.
+
+    Reads the shared post store and never blocks the TUI on the network;
+    a stale store is refreshed in the background.
+    """
+    from integrations.moltbook_client import get_feed_posts
+
+    posts = get_feed_posts("tui", limit=20)
+    return [{
+        "id": p.get("id"),
+        "title": p.get("title", "Untitled"),
+        "author": p.get("author", {}).get("name", "?"),
+        "karma": p.get("upvotes", 0),
+        "comments": p.get("comment_count", 0),
+        "content": p.get("content", ""),
+        "submolt": p.get("submolt", {}).get("name", "") if isinstance(p.get("submolt"), dict) else "",
+    } for p in posts]
 
 
 def send_message_async(message: str, chat_history: list):
     """Send message to the main OpenClaw agent in a background thread."""
+    def _replace_thinking(entry: dict) -> bool:
+        for i in range(len(chat_history) - 1, -1, -1):
+            if chat_history[i].get("source") == "Clawd" and chat_history[i].get("text") == "thinking...":
+                chat_history[i] = entry
+                return True
+        return False
+
     def _run():
+        from integrations.gateway_client import GatewayError, get_gateway_client
+
         try:
-            result = subprocess.run(
-                ["openclaw", "agent", "--agent", "main", "-m", message, "--json"],
-                capture_output=True, text=True, timeout=120,
-            )
-            ts = datetime.now().strftime("%H:%M")
-            if result.returncode == 0:
-                # Try to extract reply from JSON output
-                reply = None
-                try:
-                    data = json.loads(result.stdout)
-                    reply = data.get("reply") or data.get("response") or data.get("text")
-                except:
-                    pass
-                if not reply and result.stdout.strip():
-                    reply = result.stdout.strip()
-                if reply:
-                    # Replace the "thinking..." entry
-                    for i in range(len(chat_history) - 1, -1, -1):
-                        if chat_history[i].get("source") == "Clawd" and chat_history[i].get("text") == "thinking...":
-                            chat_history[i] = {"source": "Clawd", "text": reply[:200], "time": ts}
-                            return
-                    chat_history.append({"source": "Clawd", "text": reply[:200], "time": ts})
-                else:
-                    # Remove "thinking..." if no reply text
-                    for i in range(len(chat_history) - 1, -1, -1):
-                        if chat_history[i].get("source") == "Clawd" and chat_history[i].get("text") == "thinking...":
-                            chat_history[i] = {"source": "Clawd", "text": "(no response)", "time": ts}
-                            return
-            else:
-                ts = datetime.now().strftime("%H:%M")
-                for i in range(len(chat_history) - 1, -1, -1):
-                    if chat_history[i].get("source") == "Clawd" and chat_history[i].get("text") == "thinking...":
-                        chat_history[i] = {"source": "system", "text": "[send failed]", "time": ts}
-                        return
-        except:
+            reply = get_gateway_client().send_agent_message(message, agent="main")
+        except GatewayError:
             ts = datetime.now().strftime("%H:%M")
-            for i in range(len(chat_history) - 1, -1, -1):
-                if chat_history[i].get("source") == "Clawd" and chat_history[i].get("text") == "thinking...":
-                    chat_history[i] = {"source": "system", "text": "[send failed]", "time": ts}
-                    return
+            _replace_thinking({"source": "system", "text": "[send failed]", "time": ts})
+            return
+        ts = datetime.now().strftime("%H:%M")
+        if reply:
+            # Replace the "thinking..." entry
+            entry = {"source": "Clawd", "text": reply[:200], "time": ts}
+            if not _replace_thinking(entry):
+                chat_history.append(entry)
+        else:
+            _replace_thinking({"source": "Clawd", "text": "(no response)", "time": ts})
 
     thread = threading.Thread(target=_run, daemon=True)
     thread.start()
 
 
 def len_visible(s: str) -> int:
-    return len(re.sub(r"\x1b\[[0-9;]*m", "", s))
+    return visible_width(s)
 
 
-def pad_row(term: Terminal, content: str, w: int) -> str:
-    vis = len_visible(content)
-    pad = max(0, w - 2 - vis)
-    return term.grey50 + "\u2502" + term.normal + content + " " * pad + term.grey50 + "\u2502"
+def pad_row(term: Terminal, content: str, w: int, width: int = None) -> str:
+    """``content`` between the side borders; ``width`` if already known."""
+    edge = term.grey50 + "\u2502"
+    return bordered_row(content, w, edge + term.normal, edge, width)
 
 
 def center_art(text: str, w: int) -> str:
-    vis = len_visible(text) if "\x1b" in text else len(text)
-    pad = max(0, (w - 2 - vis) // 2)
+    pad = max(0, (w - 2 - visible_width(text)) // 2)
     return " " * pad + text
 
 
+@functools.lru_cache(maxsize=256)
+def face_rows(term: Terminal, centered: tuple, w: int) -> tuple:
+    """Bordered rows for already-centred art lines; the art is precompiled
+    (core.art_cache), so each frame is built once per terminal width."""
+    return tuple(pad_row(term, line + term.normal, w) for line in centered)
+
+
 def build_mood_meter(term: Terminal, pet: PetState, max_len: int) -> str:
     """Build a compact mood meter string that fits within max_len (visible chars)."""
     if max_len < 6:
@@ -398,15 +385,16 @@ def build_mood_meter(term: Terminal, pet: PetState, max_len: int) -> str:
     return term.grey70 + " " + label + " " + bar + term.normal
 
 
-def build_vitals_strip(term: Terminal, w: int) -> str:
+def build_vitals_strip(term: Terminal, w: int, vitals: dict = None) -> str:
     """Build a separator line with inline vitals metrics.
 
     Format: ├ 💚 92%↑ │ 🧠 3 │ 👅 12 │ ✅ 85% ──────┤
     Falls back to a plain separator when data is unavailable.
+    Pass ``vitals`` to reuse already-fetched data instead of reading disk.
     """
     plain = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
     try:
-        v = get_vitals_data()
+        v = vitals if vitals is not None else get_vitals_data()
     except Exception:
         return plain
 
@@ -431,30 +419,34 @@ def build_vitals_strip(term: Terminal, w: int) -> str:
     else:
         parts.append("\u2705 --")
 
-    inner = " \u2502 ".join(parts)
-    inner_vis = len(re.sub(r"\x1b\[[0-9;]*m", "", inner))
-    # Account for emoji widths (each emoji ≈ 2 cells)
-    emoji_count = inner.count("\U0001f49a") + inner.count("\U0001f49b") + inner.count("\u2764") + \
-                  inner.count("\U0001f9e0") + inner.count("\U0001f445") + inner.count("\u2705")
-    vis_len = inner_vis + emoji_count  # emojis take extra cell
+    line = Segments().style(term.grey50).text("\u251c ", 2).style(term.normal)
+    for i, part in enumerate(parts):
+        if i:
+            line.text(" \u2502 ", 3)
+        line.text(part)
 
-    fill = max(0, w - 4 - vis_len)
-    return (term.grey50 + "\u251c " + term.normal + inner +
-            term.grey50 + " " + "\u2500" * fill + "\u2524")
+    fill = max(0, w - 2 - line.width)
+    return str(line.style(term.grey50).text(" " + "\u2500" * fill + "\u2524", fill + 2))
 
 
 def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
          scroll_offset: int, mode: str = "pet", selected_topic: int = 0,
          current_thread: dict = None, thread_scroll: int = 0,
          chat_input: str = None, chat_scroll: int = 0,
-         dashboard_scroll: int = 0):
-    """Modes: pet, topics, thread, chat, dashboard"""
+         dashboard_scroll: int = 0, screen: ScreenBuffer = None,
+         data: DataRefresher = None):
+    """Modes: pet, topics, thread, chat, dashboard
+
+    With a ``screen`` only the cells that changed since the last frame are
+    written; with ``data`` vitals/dashboard come from the background
+    refresher instead of being read from disk every frame.
+    """
     w = term.width
     h = term.height
-    out = []
+    out = {}  # row -> rendered line
 
     # Border
-    out.append(term.move(0, 0) + term.grey50 + "\u250c" + "\u2500" * (w - 2) + "\u2510")
+    out[0] = term.grey50 + "\u250c" + "\u2500" * (w - 2) + "\u2510"
 
     # Title
     mode_icon = {"pet": "", "skills": " \U0001f3ae", "thread": " \U0001f4d6",
@@ -469,11 +461,11 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
         mid = meter + " " * max(0, gap - meter_len)
     else:
         mid = " " * gap
-    out.append(term.move(1, 0) + term.grey50 + "\u2502" + term.light_salmon + term.bold + title +
-               term.normal + mid + term.grey50 + clock + term.normal + term.grey50 + "\u2502")
+    out[1] = (term.grey50 + "\u2502" + term.light_salmon + term.bold + title +
+              term.normal + mid + term.grey50 + clock + term.normal + term.grey50 + "\u2502")
 
     # Separator
-    out.append(term.move(2, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+    out[2] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
     if mode == "thread" and current_thread:
         # Thread view — skill detail or post content
@@ -554,11 +546,11 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
             if i < len(visible):
                 line = visible[i]
                 # Truncate visible length to fit
-                out.append(term.move(row, 0) + pad_row(term, " " + line, w))
+                out[row] = pad_row(term, " " + line, w)
             else:
-                out.append(term.move(row, 0) + pad_row(term, "", w))
+                out[row] = pad_row(term, "", w)
 
-        out.append(term.move(h - 4, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+        out[h - 4] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
     elif mode == "skills":
         # Skills list (rows 3 to h-4)
@@ -604,23 +596,23 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
             is_selected = (actual_idx == selected_topic)
             if skill is None:
                 # Category header
-                out.append(term.move(row, 0) + pad_row(term, line_text, w))
+                out[row] = pad_row(term, line_text, w)
             else:
                 desc = skill.get("description", "")
                 max_desc = max(5, inner_w - len(skill["name"]) - 6)
                 desc_trunc = desc[:max_desc]
                 display = f" {skill['icon']} {skill['name']:<20} {term.grey70}{desc_trunc}{term.normal}"
                 if is_selected:
-                    out.append(term.move(row, 0) + pad_row(term,
-                        term.reverse + term.cyan + "\u25b8" + display + term.normal, w))
+                    out[row] = pad_row(term,
+                        term.reverse + term.cyan + "\u25b8" + display + term.normal, w)
                 else:
-                    out.append(term.move(row, 0) + pad_row(term,
-                        term.cyan + " " + display + term.normal, w))
+                    out[row] = pad_row(term,
+                        term.cyan + " " + display + term.normal, w)
 
         for i in range(len(visible), content_height):
-            out.append(term.move(skills_start + i, 0) + pad_row(term, "", w))
+            out[skills_start + i] = pad_row(term, "", w)
 
-        out.append(term.move(h - 4, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+        out[h - 4] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
     elif mode == "chat":
         # Chat mode - history above, input line at bottom
@@ -658,19 +650,19 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
 
         for i, (color, line) in enumerate(visible):
             row = chat_start + i
-            out.append(term.move(row, 0) + pad_row(term, color + line + term.normal, w))
+            out[row] = pad_row(term, color + line + term.normal, w)
 
         for i in range(len(visible), content_height):
-            out.append(term.move(chat_start + i, 0) + pad_row(term, "", w))
+            out[chat_start + i] = pad_row(term, "", w)
 
         if typing:
-            out.append(term.move(h - 5, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+            out[h - 5] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
             max_input = max(1, w - 5)
             display_text = chat_input[-max_input:] if len(chat_input) > max_input else chat_input
             input_line = term.light_salmon + "> " + term.normal + display_text + term.reverse + " " + term.normal
-            out.append(term.move(h - 4, 0) + pad_row(term, input_line, w))
+            out[h - 4] = pad_row(term, input_line, w)
         else:
-            out.append(term.move(h - 4, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+            out[h - 4] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
     elif mode == "dashboard":
         # Scrollable dashboard — replaces status/backup/curiosity modes
@@ -679,7 +671,7 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
         content_height = content_end - content_start
         inner_w = max(20, w - 4)
 
-        dd = get_dashboard_data()
+        dd = (data.get("dashboard") if data else get_dashboard_data()) or {}
         vt = dd.get("vitals", {})
         ident = dd.get("identity", {})
         cur = dd.get("curiosity", {})
@@ -769,11 +761,11 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
         for i in range(content_height):
             row = content_start + i
             if i < len(visible):
-                out.append(term.move(row, 0) + pad_row(term, " " + visible[i], w))
+                out[row] = pad_row(term, " " + visible[i], w)
             else:
-                out.append(term.move(row, 0) + pad_row(term, "", w))
+                out[row] = pad_row(term, "", w)
 
-        out.append(term.move(h - 4, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+        out[h - 4] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
     else:
         # Pet mode — face + vitals strip + goal/thought + activity feed
@@ -795,7 +787,7 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
         if face_end <= face_start:
             face_end = face_start + 1
 
-        face_lines = pet.get_face_lines()
+        face_lines = pet.get_face_lines(width=w)
 
         spark_row = None
         if face_lines:
@@ -815,20 +807,16 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
                     candidate_row = max(face_start, art_top - 1)
                     if candidate_row < art_top:
                         spark_row = candidate_row
-                        out.append(
-                            term.move(spark_row, 0)
-                            + pad_row(term, term.yellow + center_art(spark, w) + term.normal, w)
-                        )
+                        out[spark_row] = pad_row(term, term.yellow + center_art(spark, w) + term.normal, w)
 
-            for i, line in enumerate(face_lines):
+            for i, line in enumerate(face_rows(term, face_lines, w)):
                 row = art_top + i
                 if face_start <= row < face_end:
-                    centered = center_art(line, w)
-                    out.append(term.move(row, 0) + pad_row(term, centered + term.normal, w))
+                    out[row] = line
 
             quip_row = min(art_top + art_height, face_end - 1)
             quip = term.italic + term.grey70 + center_art(f'"{pet.quip}"', w) + term.normal
-            out.append(term.move(quip_row, 0) + pad_row(term, quip, w))
+            out[quip_row] = pad_row(term, quip, w)
 
             # Fill empty rows
             used = set(range(art_top, min(art_top + art_height, face_end))) | {quip_row}
@@ -836,7 +824,7 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
                 used.add(spark_row)
             for i in range(face_start, face_end + 1):
                 if i not in used:
-                    out.append(term.move(i, 0) + pad_row(term, "", w))
+                    out[i] = pad_row(term, "", w)
         else:
             # Existing single-line face (fallback)
             bob = pet.get_bob_offset()
@@ -852,35 +840,33 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
                     candidate_row = max(face_start, face_mid - 1)
                     if candidate_row not in (face_mid, face_mid + 1):
                         spark_row = candidate_row
-                        out.append(
-                            term.move(spark_row, 0)
-                            + pad_row(term, term.yellow + center_art(spark, w) + term.normal, w)
-                        )
-            out.append(term.move(face_mid, 0) + pad_row(term, fc + term.bold + center_art(face, w) + term.normal, w))
+                        out[spark_row] = pad_row(term, term.yellow + center_art(spark, w) + term.normal, w)
+            out[face_mid] = pad_row(term, fc + term.bold + center_art(face, w) + term.normal, w)
 
             quip = term.italic + term.grey70 + center_art(f'"{pet.quip}"', w) + term.normal
-            out.append(term.move(face_mid + 1, 0) + pad_row(term, quip, w))
+            out[face_mid + 1] = pad_row(term, quip, w)
 
             for i in range(face_start, face_end + 1):
                 if i not in (face_mid, face_mid + 1) and i != spark_row:
-                    out.append(term.move(i, 0) + pad_row(term, "", w))
+                    out[i] = pad_row(term, "", w)
 
         # Vitals strip (h-10)
-        out.append(term.move(h - 10, 0) + build_vitals_strip(term, w))
+        # None until the refresher's first pass if registered without a default
+        vitals = (data.get("vitals") if data else get_vitals_data()) or VITALS_DEFAULTS
+        out[h - 10] = build_vitals_strip(term, w, vitals)
 
         # Goal + Thought (h-9, h-8)
-        vitals = get_vitals_data()
         goal_text = vitals.get("goal", "")
         thought_text = vitals.get("thought", "")
         max_text_w = max(10, w - 6)
 
         goal_line = f" \U0001f3af {goal_text[:max_text_w]}" if goal_text else ""
         thought_line = f" \U0001f4ad {thought_text[:max_text_w]}" if thought_text else ""
-        out.append(term.move(h - 9, 0) + pad_row(term, term.cyan + goal_line + term.normal, w))
-        out.append(term.move(h - 8, 0) + pad_row(term, term.grey70 + thought_line + term.normal, w))
+        out[h - 9] = pad_row(term, term.cyan + goal_line + term.normal, w)
+        out[h - 8] = pad_row(term, term.grey70 + thought_line + term.normal, w)
 
         # Separator
-        out.append(term.move(h - 7, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+        out[h - 7] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
         # Activity feed (h-6 to h-3) — 4 lines
         feed_start = h - 6
@@ -895,11 +881,11 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
                 text = msg.get("text", "")[:max_feed_text]
                 line = f"{source}: {text}"
                 color = term.light_salmon if source != "Clawd" else term.cyan
-                out.append(term.move(row, 0) + pad_row(term, color + line + term.normal, w))
+                out[row] = pad_row(term, color + line + term.normal, w)
             else:
-                out.append(term.move(row, 0) + pad_row(term, "", w))
+                out[row] = pad_row(term, "", w)
 
-        out.append(term.move(h - 3, 0) + term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524")
+        out[h - 3] = term.grey50 + "\u251c" + "\u2500" * (w - 2) + "\u2524"
 
     # Controls
     uptime = f"UP {pet.get_uptime()}"
@@ -919,31 +905,81 @@ def draw(term: Terminal, pet: PetState, topics: list, chat_history: list,
     ctrl_line = (" " + term.grey50 + controls + " " * ctrl_pad +
                  (term.cyan + moltbook_url + term.grey50 if moltbook_url else "") +
                  " " + term.grey50 + "\u2502")
-    out.append(term.move(h - 2, 0) + pad_row(term, ctrl_line, w))
+    out[h - 2] = pad_row(term, ctrl_line, w)
 
-    out.append(term.move(h - 1, 0) + term.grey50 + "\u2514" + "\u2500" * (w - 2) + "\u2518")
-    print(term.normal + "".join(out), end="", flush=True)
+    out[h - 1] = term.grey50 + "\u2514" + "\u2500" * (w - 2) + "\u2518"
+    if screen is not None:
+        screen.flush(out)
+    else:
+        print(term.normal + "".join(term.move(row, 0) + line for row, line in out.items()),
+              end="", flush=True)
+
+
+def _profile_startup_child():
+    """The startup path of ``main()`` up to the first frame, without side
+    effects (no wakeup record, no threads), then the agent's warm-up."""
+    with phase("terminal"):
+        term = Terminal()
+    with phase("pet state"):
+        pet = PetState()
+    with phase("watcher"):
+        OpenClawWatcher()
+    with phase("agent"):
+        from core.autonomous_agent import get_agent
+        agent = get_agent()
+    with phase("data refresher"):
+        data = _data_refresher([])
+    with phase("first frame"):
+        screen = ScreenBuffer(term, write=lambda _: None)
+        draw(term, pet, [], [], 0, "pet", screen=screen, data=data)
+    first_frame = time.perf_counter() - _IMPORT_START
+    with phase("agent warm-up (background)"):
+        agent.warm_up()
+    startup_profile.emit_child_report(first_frame)
+
+
+def _data_refresher(topics: list) -> DataRefresher:
+    data = DataRefresher()
+    # Defaults let the first frame draw before any source has been read
+    data.register("vitals", get_vitals_data, VITALS_TTL, default=dict(VITALS_DEFAULTS))
+    data.register("dashboard", get_dashboard_data, DASHBOARD_TTL)
+    data.register("skills", fetch_skills, SKILLS_TTL, default=topics)
+    return data
 
 
 def main():
+    if startup_profile.CHILD_FLAG in sys.argv:
+        _profile_startup_child()
+        return
+    if "--profile-startup" in sys.argv:
+        print(startup_profile.profile_startup(Path(__file__).resolve()))
+        return
+
     # Record wakeup - I am alive!
     lifetime.wakeup()
 
-    term = Terminal()
-    pet = PetState()
-    watcher = OpenClawWatcher()
-    watcher.start()
+    with phase("terminal"):
+        term = Terminal()
+    with phase("pet state"):
+        pet = PetState()
+    with phase("watcher"):
+        watcher = OpenClawWatcher()
+        watcher.start()
     
     # Start autonomous agent
-    agent = get_autonomous_agent()
+    with phase("agent"):
+        agent = get_autonomous_agent()
 
     scroll_offset = 0
     mode = "pet"  # pet, skills, thread, chat, dashboard
     chat_mode = False
     chat_input = ""
-    topics = fetch_skills()  # skills list (reuses 'topics' var name for draw compat)
+    topics = []  # skills list (reuses 'topics' var name for draw compat)
+    data = _data_refresher(topics)
+    data.start()
+    screen = ScreenBuffer(term)
     chat_history = []
-    last_topic_fetch = 0
+    last_feed_version = -1
     selected_topic = 0
     current_thread = None
     thread_scroll = 0
@@ -952,6 +988,8 @@ def main():
 
     def cleanup(*_):
         watcher.stop()
+        data.stop()
+        from core.autonomous_agent import stop_agent
         stop_agent()  # Stop autonomous agent
         lifetime.sleep()  # Record that I'm going to sleep
         print(term.normal + term.clear)
@@ -974,18 +1012,18 @@ def main():
             h = term.height
             skills_height = max(5, h - 10)
 
-            # Refresh skills list periodically
-            if now - last_topic_fetch > 120:
-                topics = fetch_skills()
-                last_topic_fetch = now
+            # Skills list is refreshed in the background
+            topics = data.get("skills") or topics
 
-            # Update chat history from watcher
-            new_items = watcher.get_feed(count=20)
-            for item in new_items:
-                if not any(item.summary == ch.get("text", "") and item.source == ch.get("source", "")
-                          for ch in chat_history[-50:]):
-                    chat_history.append({"source": item.source, "text": item.summary, "time": item.time_str})
-                    pet.add_message_source(item.source)
+            # Update chat history from watcher (only when the feed changed)
+            if watcher.feed_version != last_feed_version:
+                last_feed_version = watcher.feed_version
+                recent = {(ch.get("source", ""), ch.get("text", "")) for ch in chat_history[-50:]}
+                for item in watcher.get_feed(count=20):
+                    if (item.source, item.summary) not in recent:
+                        recent.add((item.source, item.summary))
+                        chat_history.append({"source": item.source, "text": item.summary, "time": item.time_str})
+                        pet.add_message_source(item.source)
 
             # Input
             key = term.inkey(timeout=FRAME_TIME)
@@ -1129,7 +1167,8 @@ def main():
                  thread_scroll=thread_scroll,
                  chat_input=chat_input if chat_mode else None,
                  chat_scroll=chat_scroll,
-                 dashboard_scroll=dashboard_scroll)
+                 dashboard_scroll=dashboard_scroll,
+                 screen=screen, data=data)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ Usage:
     clawgotchi memory summarize [--days N] [--json]
     clawgotchi memory promote "Your insight here" [--category C]
     clawgotchi memory show
-    clawgotchi memory search <query>
+    clawgotchi memory search <query> [--limit N]
     clawgotchi memory stats
     clawgotchi memory diagnose
 """
@@ -15,6 +15,7 @@ import sys
 import argparse
 from cognition.memory_curation import MemoryCuration, MemoryConsistencyChecker
 from cognition.memory_decay import MemoryAccessTracker
+from cognition.memory_index import MemoryIndex
 
 
 def run_memory_command(args):
@@ -59,14 +60,17 @@ def run_memory_command(args):
         tracker.record_access("curated_memory.md", source="show")
 
     elif args.command == 'search':
-        results = curation.search_memories(args.query)
+        index = MemoryIndex(curation.memory_dir)
+        index.refresh()
+        results = index.search(args.query, limit=args.limit)
         if results:
             print(f"🔍 Results for '{args.query}':")
             for r in results:
-                print(f"  {r}")
+                print(f"  {r['file']}:{r['line']}  {r['content'][:100]}")
             
-            # Track search access for the curated memory
-            tracker.record_access("curated_memory.md", source="search")
+            # Track search access for every file that matched
+            for filename in dict.fromkeys(r['file'] for r in results):
+                tracker.record_access(filename, source="search")
         else:
             print(f"No results found for '{args.query}'")
 
@@ -134,11 +138,15 @@ def main():
     # clawgotchi memory search <query>
     search_parser = subparsers.add_parser(
         'search',
-        help='Search through curated memories'
+        help='Search through memories (ranked)'
     )
     search_parser.add_argument(
         'query',
-        help='Search term'
+        help='Search terms ("phrase", prefix*, since:/until:YYYY-MM-DD)'
+    )
+    search_parser.add_argument(
+        '--limit', type=int, default=10,
+        help='Maximum results (default: 10)'
     )
 
     # clawgotchi memory stats
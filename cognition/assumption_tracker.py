@@ -101,11 +101,16 @@ class AssumptionTracker:
     and what I've actually confirmed to be true.
     """
     
-    def __init__(self, storage_path: str = None):
+    def __init__(self, storage_path: str = None, store=None):
         if storage_path is None:
             from config import ASSUMPTIONS_FILE
             storage_path = str(ASSUMPTIONS_FILE)
+            if store is None:
+                from core.memory_store import get_memory_store
+                store = get_memory_store()
         self.storage_path = storage_path
+        # Optional SQLite repository (core.memory_store); replaces the JSON file.
+        self._repo = store.collection("assumptions") if store is not None else None
         self.assumptions: list[Assumption] = []
         self._load()
     
@@ -140,7 +145,7 @@ class AssumptionTracker:
             confidence=confidence
         )
         self.assumptions.append(assumption)
-        self._save()
+        self._save(assumption)
         return assumption.id
     
     def get(self, assumption_id: str) -> Assumption | None:
@@ -174,7 +179,7 @@ class AssumptionTracker:
         assumption.confidence = 1.0 if correct else 0.0
         assumption.confidence_history.append((datetime.now(), assumption.confidence))
         
-        self._save()
+        self._save(assumption)
     
     def update_confidence(self, assumption_id: str, new_confidence: float) -> None:
         """
@@ -194,7 +199,7 @@ class AssumptionTracker:
         
         assumption.confidence = new_confidence
         assumption.confidence_history.append((datetime.now(), new_confidence))
-        self._save()
+        self._save(assumption)
     
     def get_stale(self, days_old: int = 7) -> list[Assumption]:
         """Get assumptions older than N days that haven't been verified."""
@@ -273,12 +278,19 @@ class AssumptionTracker:
                 expired.append(a)
         
         if expired:
-            self._save()
+            self._save(*expired)
         
         return expired
     
-    def _save(self) -> None:
-        """Save assumptions to disk."""
+    def _save(self, *changed: Assumption) -> None:
+        """Save assumptions to disk.
+
+        With a repository only the ``changed`` rows are written (all rows if
+        none are given); the JSON file is always rewritten whole.
+        """
+        if self._repo is not None:
+            self._repo.put_many(a.to_dict() for a in (changed or self.assumptions))
+            return
         os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
         data = {
             "assumptions": [a.to_dict() for a in self.assumptions],
@@ -289,6 +301,9 @@ class AssumptionTracker:
     
     def _load(self) -> None:
         """Load assumptions from disk."""
+        if self._repo is not None:
+            self.assumptions = [Assumption.from_dict(a) for a in self._repo.all()]
+            return
         if not os.path.exists(self.storage_path):
             return
         
@@ -4,6 +4,9 @@ Heartbeat Alert System for Clawgotchi.
 Checks assumptions for conditions that need attention:
 - Low confidence assumptions
 - Stale assumptions (not verified in N days)
+
+With the default path, assumptions come from the SQLite memory store
+(core.memory_store) once it exists, like AssumptionTracker's.
 """
 import json
 import os
@@ -34,9 +37,15 @@ class AlertEngine:
         self,
         assumptions_path: str = None,
         low_confidence_threshold: float = None,
-        stale_days: int = None
+        stale_days: int = None,
+        store=None
     ):
+        if assumptions_path is None and store is None:
+            from core.memory_store import get_memory_store
+            store = get_memory_store()
         self.assumptions_path = assumptions_path or self._default_assumptions_path()
+        # Optional SQLite repository (core.memory_store); replaces the JSON file.
+        self._repo = store.collection("assumptions") if store is not None else None
         self.low_confidence_threshold = low_confidence_threshold or self.DEFAULT_LOW_CONFIDENCE_THRESHOLD
         self.stale_days = stale_days or self.DEFAULT_STALE_DAYS
 
@@ -46,7 +55,9 @@ class AlertEngine:
         return str(ASSUMPTIONS_FILE)
 
     def load_assumptions(self) -> List[Dict[str, Any]]:
-        """Load assumptions from JSON file."""
+        """Load assumptions from the memory store or the JSON file."""
+        if self._repo is not None:
+            return self._repo.all()
         if not os.path.exists(self.assumptions_path):
             return []
 
@@ -36,7 +36,11 @@ class IkigaiEngine:
         state_path: str = None,
         gate_path: str = None,
         success_target: float = 0.90,
+        store=None,
     ):
+        if state_path is None and gate_path is None and store is None:
+            from core.memory_store import get_memory_store
+            store = get_memory_store()
         if state_path is None or gate_path is None:
             from config import MEMORY_DIR
             state_path = state_path or str(MEMORY_DIR / "ikigai_state.json")
@@ -44,6 +48,8 @@ class IkigaiEngine:
 
         self.state_path = Path(state_path)
         self.gate_path = Path(gate_path)
+        # Optional SQLite store (core.memory_store); replaces both JSON files.
+        self.store = store
         self.success_target = success_target
         self.alpha = 0.25
 
@@ -70,6 +76,8 @@ class IkigaiEngine:
         }
 
     def _load_state(self) -> dict:
+        if self.store is not None:
+            return self.store.get_document("ikigai_state") or self._default_state()
         if self.state_path.exists():
             try:
                 return json.loads(self.state_path.read_text())
@@ -78,6 +86,8 @@ class IkigaiEngine:
         return self._default_state()
 
     def _load_gate(self) -> dict:
+        if self.store is not None:
+            return self.store.get_document("policy_gate") or self._default_gate()
         if self.gate_path.exists():
             try:
                 return json.loads(self.gate_path.read_text())
@@ -86,13 +96,19 @@ class IkigaiEngine:
         return self._default_gate()
 
     def _save_state(self):
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
         self.state["updated_at"] = datetime.now().isoformat()
+        if self.store is not None:
+            self.store.put_document("ikigai_state", self.state)
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
         self.state_path.write_text(json.dumps(self.state, indent=2))
 
     def _save_gate(self):
-        self.gate_path.parent.mkdir(parents=True, exist_ok=True)
         self.gate["updated_at"] = datetime.now().isoformat()
+        if self.store is not None:
+            self.store.put_document("policy_gate", self.gate)
+            return
+        self.gate_path.parent.mkdir(parents=True, exist_ok=True)
         self.gate_path.write_text(json.dumps(self.gate, indent=2))
 
     @staticmethod
@@ -16,6 +16,8 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from utils.secret_scanner import scanner_for
+
 
 # Patterns that indicate sensitive data
 SENSITIVE_PATTERNS = [
@@ -40,6 +42,9 @@ class SensitiveDataDetector:
         """Initialize the detector with patterns."""
         self.patterns = SENSITIVE_PATTERNS
 
+    def _scanner(self):
+        return scanner_for(tuple(p for p, _ in self.patterns), re.IGNORECASE, 'ignore')
+
     def scan_file(self, file_path):
         """
         Scan a file for sensitive data patterns.
@@ -53,21 +58,7 @@ class SensitiveDataDetector:
         matches = []
 
         try:
-            with open(file_path, 'r', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
-
-                for line_num, line in enumerate(lines, 1):
-                    for pattern, pattern_type in self.patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            # Redact the actual secret value for safety
-                            redacted = self._redact_line(line)
-                            matches.append({
-                                'file': file_path,
-                                'line': line_num,
-                                'type': pattern_type,
-                                'redacted_content': redacted
-                            })
+            scan = self._scanner().scan_file(file_path)
         except Exception as e:
             matches.append({
                 'file': file_path,
@@ -75,21 +66,24 @@ class SensitiveDataDetector:
                 'type': 'Error',
                 'redacted_content': f'Error reading file: {e}'
             })
+            return matches
+
+        for hit in scan.hits:
+            # Redact the actual secret value for safety
+            redacted = self._redact_line(hit.text)
+            for index in hit.patterns:
+                matches.append({
+                    'file': file_path,
+                    'line': hit.line,
+                    'type': self.patterns[index][1],
+                    'redacted_content': redacted
+                })
 
         return matches
 
     def _redact_line(self, line):
         """Redact sensitive parts of a line while keeping context."""
-        redacted = line
-        for pattern, _ in self.patterns:
-            # Replace matched secrets with [REDACTED]
-            redacted = re.sub(
-                pattern,
-                f'[{_}]',
-                redacted,
-                flags=re.IGNORECASE
-            )
-        return redacted.strip()
+        return self.redact_text(line).strip()
 
     def scan_memory_directory(self, memory_dir):
         """
@@ -125,8 +119,8 @@ class SensitiveDataDetector:
             Tuple of (is_safe, detected_types)
         """
         detected_types = []
-        for pattern, pattern_type in self.patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for regex, (_, pattern_type) in zip(self._scanner().compiled, self.patterns):
+            if regex.search(text):
                 detected_types.append(pattern_type)
 
         return len(detected_types) == 0, detected_types
@@ -142,8 +136,8 @@ class SensitiveDataDetector:
             Redacted text
         """
         redacted = text
-        for pattern, pattern_type in self.patterns:
-            redacted = re.sub(pattern, f'[{pattern_type}]', redacted, flags=re.IGNORECASE)
+        for regex, (_, pattern_type) in zip(self._scanner().compiled, self.patterns):
+            redacted = regex.sub(f'[{pattern_type}]', redacted)
         return redacted
 
 
@@ -0,0 +1,351 @@
+"""
+Memory Index - persistent inverted index over the memory directory.
+
+- Line-level postings (term -> file -> line -> term frequency), BM25 ranked
+- Quoted phrases (``"taste profile"``), prefix terms (``tast*``) and
+  ``since:`` / ``until:`` filters on the date in the file name
+- Covers ``memory/*.md`` and the WORKING.md archive segments rotated into
+  ``memory/working/``
+- Stored under ``.memory_index/``: a manifest with each file's mtime/size,
+  line statistics and term counts, plus one sidecar per source file with
+  its lines and postings. A refresh re-tokenises and rewrites only the
+  files that changed; sidecars are read on the first query that touches
+  their file
+
+Matching is on whole tokens: ``taste`` does not match ``tasted`` as the
+old substring scan did, because an inverted index can only look terms up,
+not scan inside them. ``tast*`` asks for the prefix match explicitly.
+
+The markdown files stay the source of truth; the sidecars are a cache and
+are rebuilt if missing, unreadable or from another index version.
+"""
+
+import bisect
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from urllib.parse import quote
+
+from core.persistence import atomic_write_json
+from core.working_journal import SEGMENT_DIR
+
+INDEX_VERSION = 2
+INDEX_NAME = ".memory_index"
+MANIFEST_NAME = "manifest.json"
+LEGACY_INDEX_NAME = ".memory_index.json"  # version 1: one document for everything
+SUFFIXES = (".md", ".txt")
+SUBDIRS = (SEGMENT_DIR,)
+HEADER_BOOST = 1.5
+
+_TOKEN = re.compile(r"[a-z0-9_]+")
+_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+_FILTERS = {"since": "since", "after": "since", "until": "until", "before": "until"}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens used for both indexing and querying."""
+    return _TOKEN.findall(text.lower())
+
+
+def file_date(name: str) -> Optional[str]:
+    """The YYYY-MM-DD a daily log or working segment is named after, if any."""
+    base = name.rsplit("/", 1)[-1]
+    if base.startswith("WORKING-"):
+        base = base[len("WORKING-"):]
+    match = _DATE.match(base)
+    return match.group(1) if match else None
+
+
+def parse_query(query: str) -> dict:
+    """Split a query into terms, prefixes, phrases and date filters."""
+    parsed = {"terms": [], "prefixes": [], "phrases": [], "since": None, "until": None}
+    for phrase, word in _QUERY.findall(query):
+        if phrase:
+            tokens = tokenize(phrase)
+            if len(tokens) > 1:
+                parsed["phrases"].append(tokens)
+            parsed["terms"].extend(tokens)
+            continue
+        key, sep, value = word.partition(":")
+        if sep and key.lower() in _FILTERS and _DATE.fullmatch(value):
+            parsed[_FILTERS[key.lower()]] = value
+        elif word.endswith("*") and tokenize(word):
+            parsed["prefixes"].append(tokenize(word)[-1])
+            parsed["terms"].extend(tokenize(word)[:-1])
+        else:
+            parsed["terms"].extend(tokenize(word))
+    return parsed
+
+
+def _contains_phrase(tokens: List[str], phrase: List[str]) -> bool:
+    n = len(phrase)
+    return any(tokens[i:i + n] == phrase for i in range(len(tokens) - n + 1))
+
+
+class MemoryIndex:
+    """BM25-ranked line search over memory files, maintained incrementally."""
+
+    def __init__(self, memory_dir, index_path: Optional[Path] = None,
+                 k1: float = 1.2, b: float = 0.75):
+        self.memory_dir = Path(memory_dir)
+        self.index_path = Path(index_path) if index_path else self.memory_dir / INDEX_NAME
+        self.k1 = k1
+        self.b = b
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        # name -> {"mtime", "size", "date", "docs", "length", "terms": {term: lines}}
+        self.files: Dict[str, dict] = {}
+        # term -> {name: number of lines in that file containing it}
+        self.terms: Dict[str, Dict[str, int]] = {}
+        # name -> {"lines": {line: (length, text)}, "postings": {term: {line: tf}}}
+        self._sidecars: Dict[str, dict] = {}
+        self._vocab: Optional[List[str]] = None
+        self._docs = 0
+        self._total_len = 0
+
+    def _sidecar_path(self, name: str) -> Path:
+        return self.index_path / (quote(name, safe="") + ".json")
+
+    def _load(self):
+        try:
+            data = json.loads((self.index_path / MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        try:
+            for name, meta in data.get("files", {}).items():
+                self._track(name, meta)
+        except (KeyError, TypeError, AttributeError):
+            self._reset()  # damaged manifest: everything is re-indexed
+
+    def _track(self, name: str, meta: dict):
+        self.files[name] = meta
+        self._docs += meta["docs"]
+        self._total_len += meta["length"]
+        for term, count in meta["terms"].items():
+            self.terms.setdefault(term, {})[name] = count
+
+    def _save(self):
+        try:
+            atomic_write_json(self.index_path / MANIFEST_NAME,
+                              {"version": INDEX_VERSION, "files": self.files}, compact=True)
+            legacy = self.memory_dir / LEGACY_INDEX_NAME
+            if legacy.exists():
+                legacy.unlink()
+        except OSError:
+            pass  # the index is a cache; the memory files are still authoritative
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> Dict[str, tuple]:
+        found = {}
+        for prefix in ("",) + tuple(sub + "/" for sub in SUBDIRS):
+            try:
+                entries = list(os.scandir(self.memory_dir / prefix))
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or os.path.splitext(name)[1] not in SUFFIXES:
+                    continue
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        found[prefix + name] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+        return found
+
+    def refresh(self) -> bool:
+        """Re-index files added, changed or removed since the last refresh.
+
+        Returns True if the index changed.
+        """
+        found = self._scan()
+        changed = False
+        for name in list(self.files):
+            if name not in found:
+                self._remove(name)
+                changed = True
+        for name, (mtime, size) in found.items():
+            meta = self.files.get(name)
+            if meta and meta["mtime"] == mtime and meta["size"] == size:
+                continue
+            self._remove(name)
+            self._add(name, mtime, size)
+            changed = True
+        if changed:
+            self._save()
+        return changed
+
+    def _add(self, name: str, mtime: int, size: int):
+        try:
+            with open(self.memory_dir / name, "r", errors="ignore") as f:
+                content = f.read()
+        except OSError:
+            return
+        lines = {}
+        postings: Dict[str, Dict[int, int]] = {}
+        for ln, line in enumerate(content.split("\n"), 1):
+            tokens = tokenize(line)
+            if not tokens:
+                continue
+            lines[ln] = (len(tokens), line.strip())
+            for term, tf in Counter(tokens).items():
+                postings.setdefault(term, {})[ln] = tf
+        try:
+            atomic_write_json(self._sidecar_path(name), {
+                "version": INDEX_VERSION,
+                "mtime": mtime,
+                "size": size,
+                "lines": [[ln, length, text] for ln, (length, text) in lines.items()],
+                "postings": {term: list(by_line.items()) for term, by_line in postings.items()},
+            }, compact=True)
+        except OSError:
+            pass
+        self._sidecars[name] = {"lines": lines, "postings": postings}
+        self._track(name, {
+            "mtime": mtime,
+            "size": size,
+            "date": file_date(name),
+            "docs": len(lines),
+            "length": sum(length for length, _ in lines.values()),
+            "terms": {term: len(by_line) for term, by_line in postings.items()},
+        })
+        self._vocab = None
+
+    def _remove(self, name: str):
+        meta = self.files.pop(name, None)
+        if meta is None:
+            return
+        self._sidecars.pop(name, None)
+        self._docs -= meta["docs"]
+        self._total_len -= meta["length"]
+        for term in meta["terms"]:
+            by_file = self.terms.get(term)
+            if by_file is not None:
+                by_file.pop(name, None)
+                if not by_file:
+                    del self.terms[term]
+        self._vocab = None
+        try:
+            self._sidecar_path(name).unlink()
+        except OSError:
+            pass
+
+    def _sidecar(self, name: str) -> dict:
+        """Lines and postings of one file, read from its sidecar on first use."""
+        data = self._sidecars.get(name)
+        if data is not None:
+            return data
+        meta = self.files[name]
+        try:
+            raw = json.loads(self._sidecar_path(name).read_text())
+            if (raw.get("version"), raw.get("mtime"), raw.get("size")) != (
+                    INDEX_VERSION, meta["mtime"], meta["size"]):
+                raise ValueError("stale sidecar")
+            data = {
+                "lines": {ln: (length, text) for ln, length, text in raw["lines"]},
+                "postings": {term: dict(pairs) for term, pairs in raw["postings"].items()},
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or damaged: re-tokenise the source
+            self._remove(name)
+            self._add(name, meta["mtime"], meta["size"])
+            self._save()
+            return self._sidecars.get(name, {"lines": {}, "postings": {}})
+        self._sidecars[name] = data
+        return data
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def expand_prefix(self, prefix: str) -> List[str]:
+        """Indexed terms starting with ``prefix``."""
+        if self._vocab is None:
+            self._vocab = sorted(self.terms)
+        start = bisect.bisect_left(self._vocab, prefix)
+        end = bisect.bisect_left(self._vocab, prefix + "\uffff")
+        return self._vocab[start:end]
+
+    def files_with(self, term: str, prefix: bool = False) -> Set[str]:
+        """Names of files containing ``term`` (or any term it prefixes)."""
+        term = term.lower()
+        names = set()
+        for t in self.expand_prefix(term) if prefix else [term]:
+            names.update(self.terms.get(t, {}))
+        return names
+
+    def _in_range(self, name: str, since: Optional[str], until: Optional[str]) -> bool:
+        if not since and not until:
+            return True
+        date = self.files[name]["date"]
+        if date is None:
+            return False
+        return (not since or date >= since) and (not until or date <= until)
+
+    def search(self, query: str, limit: int = 10, since: Optional[str] = None,
+               until: Optional[str] = None) -> List[dict]:
+        """Rank matching lines with BM25.
+
+        Returns dicts with ``file``, ``line``, ``content``, ``score`` and
+        ``date`` (None for files without a date in their name), best first.
+        Only the sidecars of files that contain a query term are read.
+        """
+        parsed = parse_query(query)
+        since = since or parsed["since"]
+        until = until or parsed["until"]
+        terms = set(parsed["terms"])
+        for prefix in parsed["prefixes"]:
+            terms.update(self.expand_prefix(prefix))
+        if not terms or not self._docs:
+            return []
+
+        avgdl = self._total_len / self._docs
+        scores: Dict[tuple, float] = {}
+        for term in terms:
+            by_file = self.terms.get(term)
+            if not by_file:
+                continue
+            df = sum(by_file.values())
+            idf = math.log(1 + (self._docs - df + 0.5) / (df + 0.5))
+            for name in list(by_file):
+                if name not in self.files or not self._in_range(name, since, until):
+                    continue
+                data = self._sidecar(name)
+                doc_lines = data["lines"]
+                for ln, tf in data["postings"].get(term, {}).items():
+                    dl = doc_lines[ln][0]
+                    norm = tf + self.k1 * (1 - self.b + self.b * dl / avgdl)
+                    key = (name, ln)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (self.k1 + 1) / norm
+
+        results = []
+        for (name, ln), score in scores.items():
+            text = self._sidecar(name)["lines"][ln][1]
+            if parsed["phrases"]:
+                tokens = tokenize(text)
+                if not all(_contains_phrase(tokens, p) for p in parsed["phrases"]):
+                    continue
+            if text.startswith("#"):
+                score *= HEADER_BOOST
+            results.append({
+                "file": name,
+                "line": ln,
+                "content": text,
+                "score": round(score, 4),
+                "date": self.files[name]["date"],
+            })
+        results.sort(key=lambda r: (-r["score"], r["file"], r["line"]))
+        return results[:limit] if limit else results
@@ -3,7 +3,8 @@
 Memory Query System for Clawgotchi.
 
 Provides semantic search and relationship mapping across memories:
-- Full-text search across all memory files
+- Full-text search across all memory files (BM25 over a persistent
+  inverted index, see memory_index.py)
 - Entity extraction (people, concepts, projects)
 - Concept relationship tracking over time
 - Temporal queries (what did I learn on date X?)
@@ -18,16 +19,28 @@ from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 
+from cognition.memory_index import MemoryIndex
+
 
 class MemoryQuery:
     """Query and analyze Clawgotchi's memory system."""
 
     def __init__(self, memory_dir=None):
         """Initialize query system."""
-        self.memory_dir = memory_dir or os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), 'memory'
-        )
+        if memory_dir is None:
+            from config import MEMORY_DIR
+            memory_dir = str(MEMORY_DIR)
+        self.memory_dir = memory_dir
         self._cache = {}
+        self._index = None
+
+    @property
+    def index(self):
+        """Inverted index over the memory files, refreshed on every access."""
+        if self._index is None:
+            self._index = MemoryIndex(self.memory_dir)
+        self._index.refresh()
+        return self._index
         
     def _get_memory_files(self):
         """Get all memory files to index."""
@@ -41,52 +54,37 @@ class MemoryQuery:
         return sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
     
     def _read_file(self, filepath):
-        """Read file contents with caching."""
-        if filepath not in self._cache:
+        """Read file contents, cached until the file's mtime or size changes."""
+        st = os.stat(filepath)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(filepath)
+        if cached is None or cached[0] != stamp:
             with open(filepath, 'r', errors='ignore') as f:
-                self._cache[filepath] = f.read()
-        return self._cache[filepath]
+                cached = (stamp, f.read())
+            self._cache[filepath] = cached
+        return cached[1]
     
-    def search(self, query, max_results=10):
+    def search(self, query, max_results=10, since=None, until=None):
         """
         Full-text search across all memories.
         
         Args:
-            query: Search term (supports regex)
+            query: Search terms; supports "quoted phrases", prefix* terms
+                and since:/until: YYYY-MM-DD filters
             max_results: Maximum results to return
+            since, until: Optional YYYY-MM-DD bounds on the log date
             
         Returns:
-            List of dicts with {file, line, content, relevance}
+            List of dicts with {file, line, content, score, date}, best first
         """
-        results = []
-        query_lower = query.lower()
-        
-        for filepath in self._get_memory_files():
-            content = self._read_file(filepath)
-            lines = content.split('\n')
-            
-            for line_num, line in enumerate(lines, 1):
-                if query_lower in line.lower():
-                    # Calculate simple relevance score
-                    score = 0
-                    # Exact match in title/header
-                    if line.strip().startswith('#'):
-                        score += 3
-                    # Title case match
-                    if query in line:
-                        score += 1
-                    
-                    results.append({
-                        'file': filepath.name,
-                        'line': line_num,
-                        'content': line.strip()[:200],
-                        'score': score,
-                        'date': filepath.name.replace('.md', '')[:10]
-                    })
-        
-        # Sort by score descending, then by file date
-        results.sort(key=lambda x: (-x['score'], x['file']))
-        return results[:max_results]
+        hits = self.index.search(query, limit=max_results, since=since, until=until)
+        return [{
+            'file': hit['file'],
+            'line': hit['line'],
+            'content': hit['content'][:200],
+            'score': hit['score'],
+            'date': hit['date'] or os.path.splitext(hit['file'])[0][:10],
+        } for hit in hits]
     
     def extract_entities(self):
         """
@@ -210,6 +208,12 @@ class MemoryQuery:
             Dict of {concept: [dates it appeared]}
         """
         frequency = defaultdict(list)
+        index = self.index
+        
+        # Track key concepts
+        concepts = ['taste', 'memory', 'identity', 'test', 'build', 
+                   'ship', 'learn', 'feature', 'agent', 'moltbook']
+        files_by_concept = {c: index.files_with(c, prefix=True) for c in concepts}
         
         for filepath in self._get_memory_files():
             if not filepath.name.endswith('.md'):
@@ -219,13 +223,8 @@ class MemoryQuery:
                 continue
             date = date_match.group(1)
             
-            content = self._read_file(filepath).lower()
-            
-            # Track key concepts
-            concepts = ['taste', 'memory', 'identity', 'test', 'build', 
-                       'ship', 'learn', 'feature', 'agent', 'moltbook']
             for concept in concepts:
-                if concept in content:
+                if filepath.name in files_by_concept[concept]:
                     frequency[concept].append(date)
         
         return {k: v for k, v in sorted(
@@ -238,7 +237,9 @@ def run_query_command(args):
     query = MemoryQuery()
     
     if args.action == 'search':
-        results = query.search(args.query, max_results=args.limit)
+        results = query.search(args.query, max_results=args.limit,
+                               since=getattr(args, 'since', None),
+                               until=getattr(args, 'until', None))
         if results:
             print(f"Found {len(results)} results for '{args.query}':\n")
             for r in results:
@@ -299,6 +300,8 @@ def main():
     search_p = subparsers.add_parser('search', help='Search memories')
     search_p.add_argument('query', help='Search term')
     search_p.add_argument('--limit', type=int, default=10, help='Max results')
+    search_p.add_argument('--since', help='Only logs on or after YYYY-MM-DD')
+    search_p.add_argument('--until', help='Only logs on or before YYYY-MM-DD')
     
     # entities
     subparsers.add_parser('entities', help='Extract entities from memories')
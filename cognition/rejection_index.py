@@ -0,0 +1,201 @@
+"""
+Rejection Index - running aggregates over the taste rejection ledger.
+
+The ledger (``taste_rejections.jsonl``) stays the append-only source of truth.
+This sidecar keeps everything TasteProfile needs to answer fingerprint and
+growth queries without re-reading the ledger:
+
+- Counts per axis, per category and axis × category
+- A ring buffer of the last few rejections
+- Per-day, per-axis counts for the growth signal
+
+The index remembers how many ledger bytes it has folded in. Any query first
+consumes just the bytes appended since (by TasteProfile or anyone else) and
+rebuilds from scratch only if the ledger shrank or was rewritten.
+
+``RepositoryRejectionIndex`` answers the same queries with indexed SQL
+aggregates when the ledger lives in the SQLite memory store.
+"""
+
+import json
+import os
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+INDEX_VERSION = 1
+RECENT_SIZE = 5
+CATEGORIES = ("considered_rejected", "ignored", "deferred", "auto_filtered")
+
+
+class RejectionIndex:
+    """Incrementally maintained aggregates for one rejection ledger."""
+
+    def __init__(self, ledger_path: Path, index_path: Optional[Path] = None):
+        self.ledger_path = Path(ledger_path)
+        self.index_path = Path(index_path) if index_path else self.ledger_path.with_suffix(".idx.json")
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self.offset = 0
+        self.head = ""
+        self.total = 0
+        self.axes = {}
+        self.by_category = {cat: 0 for cat in CATEGORIES}
+        self.matrix = {}
+        self.recent = deque(maxlen=RECENT_SIZE)
+        self.days = {}  # "YYYY-MM-DD" -> {axis: count}
+
+    def _load(self):
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.offset = data.get("offset", 0)
+        self.head = data.get("head", "")
+        self.total = data.get("total", 0)
+        self.axes = data.get("axes", {})
+        self.by_category = data.get("by_category", self.by_category)
+        self.matrix = data.get("matrix", {})
+        self.recent = deque(data.get("recent", []), maxlen=RECENT_SIZE)
+        self.days = data.get("days", {})
+
+    def _save(self):
+        data = {
+            "version": INDEX_VERSION,
+            "offset": self.offset,
+            "head": self.head,
+            "total": self.total,
+            "axes": self.axes,
+            "by_category": self.by_category,
+            "matrix": self.matrix,
+            "recent": list(self.recent),
+            "days": self.days,
+        }
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass  # the index is a cache; the ledger is still authoritative
+
+    def _read_head(self) -> str:
+        with open(self.ledger_path, "rb") as f:
+            return f.readline(256).decode("utf-8", "replace")
+
+    def refresh(self) -> bool:
+        """Fold in ledger bytes appended since the last refresh.
+
+        Returns True if the index changed.
+        """
+        try:
+            size = self.ledger_path.stat().st_size
+        except OSError:
+            if self.offset:
+                self._reset()
+                self._save()
+                return True
+            return False
+
+        rebuilt = False
+        if size < self.offset or (self.offset and self._read_head() != self.head):
+            self._reset()
+            rebuilt = True
+        if size == self.offset:
+            if rebuilt:
+                self._save()
+            return rebuilt
+
+        with open(self.ledger_path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+        # Leave a partially written trailing line for the next refresh.
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if line.strip():
+                try:
+                    self._add(json.loads(line))
+                except ValueError:
+                    continue
+        if self.offset == 0 and end:
+            self.head = self._read_head()
+        self.offset += end
+        self._save()
+        return True
+
+    def _add(self, rejection: dict):
+        axis = rejection.get("axis", "unknown")
+        category = rejection.get("category", "considered_rejected")
+
+        self.total += 1
+        self.axes[axis] = self.axes.get(axis, 0) + 1
+        self.by_category[category] = self.by_category.get(category, 0) + 1
+        row = self.matrix.setdefault(axis, {cat: 0 for cat in CATEGORIES})
+        row[category] = row.get(category, 0) + 1
+        self.recent.append({
+            "subject": rejection.get("subject", ""),
+            "axis": axis,
+            "fingerprint": rejection.get("fingerprint", ""),
+            "category": category,
+        })
+
+        try:
+            ts = datetime.fromisoformat(rejection.get("timestamp", "").replace("Z", "+00:00"))
+        except (TypeError, ValueError):
+            return
+        if ts.tzinfo is not None:
+            ts = ts.astimezone().replace(tzinfo=None)
+        day = self.days.setdefault(ts.date().isoformat(), {})
+        day[axis] = day.get(axis, 0) + 1
+
+    def split_by_day(self, cutoff_day: str) -> tuple:
+        """Return (recent, older) per-axis counts around ``cutoff_day`` (inclusive)."""
+        recent, older = {}, {}
+        for day, counts in self.days.items():
+            target = recent if day >= cutoff_day else older
+            for axis, count in counts.items():
+                target[axis] = target.get(axis, 0) + count
+        return recent, older
+
+
+def _axis(value) -> str:
+    return "unknown" if value is None else str(value)
+
+
+class RepositoryRejectionIndex:
+    """RejectionIndex interface over a ``taste_rejections`` repository."""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.refresh()
+
+    def refresh(self) -> bool:
+        self.axes = {_axis(k): v for k, v in self.repo.group_count("axis").items()}
+        self.by_category = {cat: 0 for cat in CATEGORIES}
+        self.matrix = {}
+        for (axis, category), count in self.repo.group_count("axis", "category").items():
+            axis, category = _axis(axis), category or "considered_rejected"
+            self.by_category[category] = self.by_category.get(category, 0) + count
+            row = self.matrix.setdefault(axis, {cat: 0 for cat in CATEGORIES})
+            row[category] = row.get(category, 0) + count
+        self.total = sum(self.axes.values())
+        self.recent = deque(
+            ({
+                "subject": r.get("subject", ""),
+                "axis": r.get("axis", "unknown"),
+                "fingerprint": r.get("fingerprint", ""),
+                "category": r.get("category", "considered_rejected"),
+            } for r in reversed(self.repo.query(limit=RECENT_SIZE, newest_first=True))),
+            maxlen=RECENT_SIZE,
+        )
+        return True
+
+    def split_by_day(self, cutoff_day: str) -> tuple:
+        """Return (recent, older) per-axis counts around ``cutoff_day`` (inclusive)."""
+        recent = {_axis(k): v for k, v in self.repo.group_count("axis", since=cutoff_day).items()}
+        older = {axis: count - recent.get(axis, 0) for axis, count in self.axes.items()}
+        return recent, {axis: count for axis, count in older.items() if count}
@@ -15,6 +15,8 @@ from enum import Enum
 import json
 import hashlib
 
+from cognition.rejection_index import RejectionIndex, RepositoryRejectionIndex
+
 
 class RejectionCategory(Enum):
     """
@@ -41,18 +43,42 @@ class TasteProfile:
     - Timestamp and context
     """
     
-    def __init__(self, memory_dir: str = None):
+    def __init__(self, memory_dir: str = None, store=None):
         if memory_dir is None:
             from config import MEMORY_DIR
             memory_dir = str(MEMORY_DIR)
+            if store is None:
+                from core.memory_store import get_memory_store
+                store = get_memory_store()
         self.memory_dir = Path(memory_dir)
         self.rejections_file = self.memory_dir / "taste_rejections.jsonl"
-        self._ensure_storage()
+        # Optional SQLite repository (core.memory_store) replacing the ledger.
+        self._repo = store.collection("taste_rejections") if store is not None else None
+        if self._repo is not None:
+            self._index = RepositoryRejectionIndex(self._repo)
+        else:
+            self._ensure_storage()
+            self._index = RejectionIndex(self.rejections_file)
     
     def _ensure_storage(self):
         """Create the rejections file if it doesn't exist."""
         if not self.rejections_file.exists():
             self.rejections_file.touch()
+
+    def _has_ledger(self) -> bool:
+        return self._repo is not None or self.rejections_file.exists()
+
+    def _read_rejections(self) -> list[dict]:
+        """Full rejection history, oldest first."""
+        if self._repo is not None:
+            return self._repo.all()
+        rejections = []
+        if self.rejections_file.exists():
+            with open(self.rejections_file, "r") as f:
+                for line in f:
+                    if line.strip():
+                        rejections.append(json.loads(line))
+        return rejections
     
     def log_rejection(
         self,
@@ -89,8 +115,12 @@ class TasteProfile:
             "category": category.value
         }
         
-        with open(self.rejections_file, "a") as f:
-            f.write(json.dumps(rejection) + "\n")
+        if self._repo is not None:
+            self._repo.put(rejection)
+        else:
+            with open(self.rejections_file, "a") as f:
+                f.write(json.dumps(rejection) + "\n")
+        self._index.refresh()
         
         return decision_hash
     
@@ -98,10 +128,13 @@ class TasteProfile:
         """
         Generate a summary of the taste fingerprint.
         
+        Served from the incremental rejection index, so the cost does not
+        grow with the size of the ledger.
+        
         Returns:
             Dict with counts per axis, per category, and matrix of axis×category.
         """
-        if not self.rejections_file.exists():
+        if not self._has_ledger():
             return {
                 "total_rejections": 0, 
                 "axes": {}, 
@@ -110,37 +143,12 @@ class TasteProfile:
                 "recent": []
             }
         
-        axes = {}
-        by_category = {cat.value: 0 for cat in RejectionCategory}
-        matrix = {}  # axis -> category -> count
-        recent = []
-        
-        with open(self.rejections_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    rejection = json.loads(line)
-                    
-                    # Count by axis
-                    axis = rejection.get("axis", "unknown")
-                    axes[axis] = axes.get(axis, 0) + 1
-                    
-                    # Initialize matrix entry for this axis if needed
-                    if axis not in matrix:
-                        matrix[axis] = {cat.value: 0 for cat in RejectionCategory}
-                    
-                    # Count by category
-                    category = rejection.get("category", "considered_rejected")
-                    by_category[category] = by_category.get(category, 0) + 1
-                    matrix[axis][category] = matrix[axis].get(category, 0) + 1
-                    
-                    # Recent samples
-                    if len(recent) < 5:
-                        recent.append({
-                            "subject": rejection["subject"],
-                            "axis": axis,
-                            "fingerprint": rejection["fingerprint"],
-                            "category": category
-                        })
+        index = self._index
+        index.refresh()
+        axes = dict(index.axes)
+        by_category = dict(index.by_category)
+        matrix = {axis: dict(row) for axis, row in index.matrix.items()}
+        recent = list(index.recent)
         
         return {
             "total_rejections": sum(axes.values()),
@@ -327,12 +335,8 @@ class TasteProfile:
             lines.append("")
             
             # Read full rejection history for the report
-            if self.rejections_file.exists():
-                rejections = []
-                with open(self.rejections_file, "r") as f:
-                    for line in f:
-                        if line.strip():
-                            rejections.append(json.loads(line))
+            if self._has_ledger():
+                rejections = self._read_rejections()
                 
                 # Show last 10 rejections
                 for rejection in list(reversed(rejections))[-10:]:
@@ -373,13 +377,14 @@ class TasteProfile:
         
         Args:
             days: Number of days to look back for "recent" vs "older"
+                (resolved to whole days by the rejection index)
         
         Returns:
             Dict with growth signal metrics
         """
         from datetime import datetime, timedelta
         
-        if not self.rejections_file.exists():
+        if not self._has_ledger():
             return {
                 "recent_axes": {},
                 "older_axes": {},
@@ -389,28 +394,9 @@ class TasteProfile:
                 "note": "No rejections recorded"
             }
         
-        now = datetime.now()
-        cutoff = now - timedelta(days=days)
-        
-        recent = {}
-        older = {}
-        
-        with open(self.rejections_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    rejection = json.loads(line)
-                    ts_str = rejection.get("timestamp", "")
-                    
-                    try:
-                        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                        axis = rejection.get("axis", "unknown")
-                        
-                        if ts >= cutoff:
-                            recent[axis] = recent.get(axis, 0) + 1
-                        else:
-                            older[axis] = older.get(axis, 0) + 1
-                    except:
-                        pass
+        cutoff = datetime.now() - timedelta(days=days)
+        self._index.refresh()
+        recent, older = self._index.split_by_day(cutoff.date().isoformat())
         
         emerging = {}
         declining = {}
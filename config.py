@@ -11,14 +11,20 @@ DOCS_DIR = PROJECT_ROOT / "docs"
 
 # Specific files
 CATS_JSON = DATA_DIR / "cats.json"
+ASCII_MOODS_JSON = DATA_DIR / "ascii_moods.json"
 MOLTBOOK_CREDENTIALS = PROJECT_ROOT / ".moltbook.json"
 LIFETIME_FILE = MEMORY_DIR / "lifetime.json"
 ASSUMPTIONS_FILE = MEMORY_DIR / "assumptions.json"
 AGENT_STATE_FILE = MEMORY_DIR / "agent_state.json"
 CURIOSITY_FILE = MEMORY_DIR / "curiosity_queue.json"
+CURIOSITY_ARCHIVE_FILE = MEMORY_DIR / "curiosity_archive.jsonl"
 BELIEFS_FILE = MEMORY_DIR / "beliefs.json"
 RESOURCES_FILE = MEMORY_DIR / "resources.json"
+MEMORY_DB_FILE = MEMORY_DIR / "memory.db"  # optional SQLite store (core.memory_store)
 
 # External
 OPENCLAW_DIR = Path.home() / ".openclaw"
 OPENCLAW_CACHE = OPENCLAW_DIR / "cache"
+# Built from CATS_JSON and ASCII_MOODS_JSON (core.art_cache)
+ART_CACHE_FILE = OPENCLAW_CACHE / "clawgotchi_art.json"
+OPENCLAW_GATEWAY_SOCKET = OPENCLAW_DIR / "gateway.sock"
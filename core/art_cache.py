@@ -0,0 +1,206 @@
+"""
+Precompiled cat art and mood frames for PetState and core.ascii_cats.
+
+data/cats.json and data/ascii_moods.json are compiled into one JSON file in
+~/.openclaw/cache, not data/, where writing it would force a full test run
+(``python -m core.art_cache``, or on first use when it is missing or stale):
+- Cats as (name, art) pairs, with a list of matching cat indices per
+  emotion in EMOTION_CAT_TERMS priority order, so picking a cat is a dict
+  lookup instead of a scan of every cat name
+- Mood frames, plain and coloured, as tuples, with the visible width of
+  every line (ANSI colour codes excluded) stored next to them
+- The size and mtime of both sources and the terms table are stored with
+  it; if any of them changed, the cache is rebuilt from the sources
+The cache dir is user-writable, so the artifact is plain JSON (no pickle)
+and nothing is loaded or written until the art is first needed.
+``centered_frame`` memoises each frame centred for a terminal width, so
+drawing the face builds no strings after the first frame at that width.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import ART_CACHE_FILE, ASCII_MOODS_JSON, CATS_JSON
+from core.ascii_cats import EMOTION_CAT_TERMS
+from core.persistence import atomic_write_json
+from core.text_layout import visible_width
+
+FORMAT = 3  # 2: widths measured with core.text_layout; 3: JSON artifact
+DEFAULT_TERMS = ("Cat",)  # emotions missing from EMOTION_CAT_TERMS
+DEFAULT_KEY = ""
+
+Lines = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MoodArt:
+    frames: Tuple[Lines, ...]
+    colored: Tuple[Lines, ...]
+    durations: Tuple[float, ...]
+    widths: Tuple[Tuple[int, ...], ...]  # visible width per line of ``frames``
+    colored_widths: Tuple[Tuple[int, ...], ...]
+
+
+@dataclass(frozen=True)
+class ArtCache:
+    cats: Tuple[Tuple[str, str], ...]  # (name, art)
+    emotion_cats: Dict[str, Tuple[int, ...]]  # emotion (or DEFAULT_KEY) -> cat indices
+    moods: Dict[str, MoodArt]
+
+    def cats_for(self, emotion: str) -> Tuple[int, ...]:
+        found = self.emotion_cats.get(emotion.lower())
+        return self.emotion_cats[DEFAULT_KEY] if found is None else found
+
+
+# ---- compiling ---------------------------------------------------------
+
+def _load_cats(path: Path) -> Tuple[Tuple[str, str], ...]:
+    if not path.exists():
+        return ()
+    try:
+        data = json.loads(path.read_text())
+        return tuple((item["name"], item["art"]) for item in data if item.get("art"))
+    except (json.JSONDecodeError, OSError, KeyError):
+        return ()
+
+
+def _index_cats(cats: Tuple[Tuple[str, str], ...]) -> Dict[str, Tuple[int, ...]]:
+    names = [name.lower() for name, _ in cats]
+    index = {}
+    for emotion, terms in [*EMOTION_CAT_TERMS.items(), (DEFAULT_KEY, DEFAULT_TERMS)]:
+        matches = []
+        for term in terms:
+            term = term.lower()
+            matches += [i for i, name in enumerate(names) if term in name and i not in matches]
+        index[emotion] = tuple(matches)
+    return index
+
+
+def _load_moods(path: Path) -> Dict[str, MoodArt]:
+    moods = {}
+    if not path.exists():
+        return moods
+    try:
+        data = json.loads(path.read_text())
+        for name, info in data.get("moods", {}).items():
+            frames = info.get("frames", [])
+            plain = tuple(tuple(f["lines"]) for f in frames if f.get("lines"))
+            colored = tuple(tuple(f["colored_lines"]) for f in frames if f.get("colored_lines"))
+            moods[name] = MoodArt(
+                frames=plain,
+                colored=colored,
+                durations=tuple(f.get("duration_ms", 100) / 1000.0 for f in frames),
+                widths=tuple(tuple(map(visible_width, lines)) for lines in plain),
+                colored_widths=tuple(tuple(map(visible_width, lines)) for lines in colored),
+            )
+    except Exception:
+        return {}
+    return moods
+
+
+def compile_art(cats_path: Path = CATS_JSON, moods_path: Path = ASCII_MOODS_JSON) -> ArtCache:
+    cats = _load_cats(cats_path)
+    return ArtCache(cats=cats, emotion_cats=_index_cats(cats), moods=_load_moods(moods_path))
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _source_key(cats_path: Path, moods_path: Path) -> list:
+    # In its JSON form, so it compares equal to the stored copy
+    terms = [[k, list(v)] for k, v in EMOTION_CAT_TERMS.items()]
+    return json.loads(json.dumps([FORMAT, _stamp(cats_path), _stamp(moods_path), terms]))
+
+
+def _tuples(value):
+    """Nested JSON lists back to the tuples the compiled art uses."""
+    return tuple(_tuples(v) for v in value) if isinstance(value, list) else value
+
+
+def _to_json(art: ArtCache) -> dict:
+    return {
+        "cats": art.cats,
+        "emotion_cats": art.emotion_cats,
+        "moods": {name: asdict(mood) for name, mood in art.moods.items()},
+    }
+
+
+def _from_json(data: dict) -> ArtCache:
+    return ArtCache(
+        cats=_tuples(data["cats"]),
+        emotion_cats={k: _tuples(v) for k, v in data["emotion_cats"].items()},
+        moods={
+            name: MoodArt(**{field: _tuples(value) for field, value in mood.items()})
+            for name, mood in data["moods"].items()
+        },
+    )
+
+
+# ---- artifact ----------------------------------------------------------
+
+def build(path: Path = ART_CACHE_FILE, cats_path: Path = CATS_JSON,
+          moods_path: Path = ASCII_MOODS_JSON) -> ArtCache:
+    """Compile the JSON sources and write the compiled art to ``path``."""
+    key = _source_key(cats_path, moods_path)
+    art = compile_art(cats_path, moods_path)
+    atomic_write_json(path, {"key": key, "art": _to_json(art)}, compact=True)
+    return art
+
+
+def load(path: Path = ART_CACHE_FILE, cats_path: Path = CATS_JSON,
+         moods_path: Path = ASCII_MOODS_JSON) -> ArtCache:
+    """The compiled art; rebuilt (and rewritten, if possible) when stale."""
+    key = _source_key(cats_path, moods_path)
+    try:
+        stored = json.loads(path.read_text())
+        if stored["key"] == key:
+            return _from_json(stored["art"])
+    except Exception:
+        pass  # missing, unreadable or from another version of this module
+    try:
+        return build(path, cats_path, moods_path)
+    except OSError:
+        return compile_art(cats_path, moods_path)
+
+
+_ART: Optional[ArtCache] = None
+_ART_LOCK = threading.Lock()
+
+
+def get() -> ArtCache:
+    """The process-wide compiled art, loaded on first use."""
+    global _ART
+    if _ART is None:
+        with _ART_LOCK:
+            if _ART is None:
+                _ART = load()
+    return _ART
+
+
+@functools.lru_cache(maxsize=1024)
+def centered_frame(emotion: str, index: int, width: int, colored: bool = True) -> Lines:
+    """Frame ``index`` of ``emotion`` with each line centred in ``width`` columns
+    (inside a one-column border on each side)."""
+    mood = get().moods[emotion]
+    frames, widths = (mood.colored, mood.colored_widths) if colored else (mood.frames, mood.widths)
+    return tuple(
+        " " * max(0, (width - 2 - vis) // 2) + line
+        for line, vis in zip(frames[index], widths[index])
+    )
+
+
+if __name__ == "__main__":
+    art = build()
+    frames = sum(len(m.frames) + len(m.colored) for m in art.moods.values())
+    print(f"Wrote {ART_CACHE_FILE}: {len(art.cats)} cats, {len(art.moods)} moods, {frames} frames")
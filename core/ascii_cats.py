@@ -1,7 +1,5 @@
 """Clawgotchi ASCII cats — loads cat art from local cache (78 cats from asciiart.eu)."""
 
-import json
-from pathlib import Path
 from typing import Optional
 
 from dataclasses import dataclass
@@ -13,10 +11,6 @@ class CatArt:
     art: str
 
 
-# Path to local cat cache
-from config import CATS_JSON
-CAT_CACHE_FILE = CATS_JSON
-
 # Search terms for emotion → cat mapping
 EMOTION_CAT_TERMS = {
     "creative": ["Lion", "Panther", "Tiger"],
@@ -40,44 +34,40 @@ EMOTION_CAT_TERMS = {
 }
 
 
-def _load_cat_cache() -> list[CatArt]:
-    """Load cat cache from local JSON file."""
-    if not CAT_CACHE_FILE.exists():
-        return []
-    try:
-        data = json.loads(CAT_CACHE_FILE.read_text())
-        return [CatArt(name=item["name"], art=item["art"]) for item in data if item.get("art")]
-    except (json.JSONDecodeError, OSError, KeyError):
-        return []
+# Loaded on first use, not at import, from the compiled art (core.art_cache)
+_CAT_CACHE: Optional[list[CatArt]] = None
 
 
-# Pre-load cache
-_CAT_CACHE = _load_cat_cache()
+def _cats() -> list[CatArt]:
+    global _CAT_CACHE
+    if _CAT_CACHE is None:
+        from core import art_cache
+        _CAT_CACHE = [CatArt(name=name, art=art) for name, art in art_cache.get().cats]
+    return _CAT_CACHE
 
 
 def get_cat_for_emotion(emotion: str) -> Optional[CatArt]:
     """Get an ASCII cat matching the given emotion."""
-    if not _CAT_CACHE:
+    cats = _cats()
+    if not cats:
         return None
 
-    terms = EMOTION_CAT_TERMS.get(emotion.lower(), ["Cat"])
-
-    for term in terms:
-        term_lower = term.lower()
-        for cat in _CAT_CACHE:
-            if term_lower in cat.name.lower():
-                return cat
+    from core import art_cache
+    matches = art_cache.get().cats_for(emotion)
+    if matches:
+        return cats[matches[0]]
 
     # Return random cat
     import random
-    return random.choice(_CAT_CACHE) if _CAT_CACHE else None
+    return random.choice(cats) if cats else None
 
 
 def get_random_cat() -> Optional[CatArt]:
     """Get a random ASCII cat."""
-    if _CAT_CACHE:
+    cats = _cats()
+    if cats:
         import random
-        return random.choice(_CAT_CACHE)
+        return random.choice(cats)
     return None
 
 
@@ -125,4 +115,4 @@ def get_fallback_cat(emotion: str) -> str:
 
 def get_cat_count() -> int:
     """Return number of cats in cache."""
-    return len(_CAT_CACHE)
+    return len(_cats())
@@ -8,16 +8,20 @@ Inspired by Circuit_Scribe's "receipts for recurring tasks" concept
 and b_crab's automation reliability patterns.
 """
 
+import bisect
 import hashlib
 import hmac
 import json
 import os
+import threading
 import uuid
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any
 
+from core.persistence import atomic_write_text
+
 
 class ReceiptError(Exception):
     """Raised when receipt operations fail."""
@@ -115,14 +119,72 @@ class AuditReceipt:
         )
 
 
+def _epoch(timestamp: str) -> Optional[float]:
+    """Seconds since the epoch for an ISO timestamp (naive means UTC)."""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+@dataclass
+class IndexEntry:
+    """Where a receipt lives and the fields queries need without loading it."""
+    receipt_id: str
+    action: str
+    content_hash: str
+    timestamp: str
+    epoch: Optional[float]
+    segment: Optional[str] = None  # None: stored as <receipt_id>.json
+    offset: int = 0
+    length: int = 0
+
+    def to_record(self) -> Dict:
+        record = {
+            "id": self.receipt_id,
+            "action": self.action,
+            "hash": self.content_hash,
+            "ts": self.timestamp,
+        }
+        if self.segment:
+            record.update(seg=self.segment, off=self.offset, len=self.length)
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "IndexEntry":
+        return cls(
+            receipt_id=record["id"],
+            action=record["action"],
+            content_hash=record["hash"],
+            timestamp=record["ts"],
+            epoch=_epoch(record["ts"]),
+            segment=record.get("seg"),
+            offset=record.get("off", 0),
+            length=record.get("len", 0),
+        )
+
+
 class ReceiptStore:
     """
     Storage and retrieval for audit receipts.
     
     Provides idempotency checking, tamper detection, and
     receipt querying capabilities.
+    
+    New receipts are written one file per receipt. ``compact()`` folds them
+    into append-only JSONL segments under ``segments/``. An append-only
+    index log (``index.jsonl``) records every receipt's action, content
+    hash, timestamp and location. It is replayed into memory on open, so
+    idempotency checks are a dict lookup, pruning is a range scan over a
+    timestamp-sorted list, and stats need no receipt reads at all.
     """
     
+    INDEX_FILE = "index.jsonl"
+    SEGMENT_DIR = "segments"
+    
     def __init__(self, store_path: Path):
         """
         Initialize receipt store.
@@ -132,31 +194,157 @@ class ReceiptStore:
         """
         self.store_path = Path(store_path)
         self.store_path.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.store_path / self.INDEX_FILE
+        self.segment_dir = self.store_path / self.SEGMENT_DIR
+        self._lock = threading.RLock()
+        self._entries: Dict[str, IndexEntry] = {}
+        self._by_key: Dict[Tuple[str, str], str] = {}
+        self._by_action: Dict[str, set] = {}
+        self._by_time: List[Tuple[float, str]] = []  # sorted (epoch, receipt_id)
+        self._load_index()
+    
+    # ---- index ---------------------------------------------------------
+    
+    def _add_entry(self, entry: IndexEntry) -> None:
+        self._drop_entry(entry.receipt_id)
+        self._entries[entry.receipt_id] = entry
+        self._by_key[(entry.action, entry.content_hash)] = entry.receipt_id
+        self._by_action.setdefault(entry.action, set()).add(entry.receipt_id)
+        if entry.epoch is not None:
+            bisect.insort(self._by_time, (entry.epoch, entry.receipt_id))
+    
+    def _drop_entry(self, receipt_id: str) -> Optional[IndexEntry]:
+        entry = self._entries.pop(receipt_id, None)
+        if entry is None:
+            return None
+        key = (entry.action, entry.content_hash)
+        if self._by_key.get(key) == receipt_id:
+            del self._by_key[key]
+        ids = self._by_action.get(entry.action)
+        if ids is not None:
+            ids.discard(receipt_id)
+            if not ids:
+                del self._by_action[entry.action]
+        if entry.epoch is not None:
+            i = bisect.bisect_left(self._by_time, (entry.epoch, receipt_id))
+            if i < len(self._by_time) and self._by_time[i] == (entry.epoch, receipt_id):
+                del self._by_time[i]
+        return entry
+    
+    def _append_index(self, records: List[Dict]) -> None:
+        with open(self.index_path, 'a') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    
+    def _load_index(self) -> None:
+        """Replay the index log, then index receipt files it doesn't know."""
+        if self.index_path.exists():
+            with open(self.index_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if record.get("deleted"):
+                            self._drop_entry(record["id"])
+                        else:
+                            self._add_entry(IndexEntry.from_record(record))
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # torn final write
+        
+        on_disk = {p.stem for p in self.store_path.glob("*.json")}
+        records = []
+        for receipt_id in sorted(on_disk):
+            entry = self._entries.get(receipt_id)
+            if entry is not None:
+                continue  # indexed (a leftover file after compaction is harmless)
+            try:
+                data = json.loads(self._receipt_file(receipt_id).read_text())
+                entry = self._entry_for(data)
+            except (OSError, json.JSONDecodeError, KeyError, TypeError):
+                continue
+            self._add_entry(entry)
+            records.append(entry.to_record())
+        for entry in [e for e in self._entries.values() if e.segment is None]:
+            if entry.receipt_id not in on_disk:
+                self._drop_entry(entry.receipt_id)
+                records.append({"id": entry.receipt_id, "deleted": True})
+        if records:
+            self._append_index(records)
+    
+    @staticmethod
+    def _entry_for(data: Dict, segment: Optional[str] = None,
+                   offset: int = 0, length: int = 0) -> IndexEntry:
+        return IndexEntry(
+            receipt_id=data["receipt_id"],
+            action=data["action"],
+            content_hash=data["content_hash"],
+            timestamp=data["timestamp"],
+            epoch=_epoch(data["timestamp"]),
+            segment=segment,
+            offset=offset,
+            length=length,
+        )
+    
+    # ---- receipt data --------------------------------------------------
     
     def _receipt_file(self, receipt_id: str) -> Path:
         """Get the file path for a receipt."""
         return self.store_path / f"{receipt_id}.json"
     
+    def _read_data(self, entry: IndexEntry) -> Dict:
+        """Raw receipt dict for an index entry (raises OSError/JSONDecodeError)."""
+        if entry.segment is None:
+            with open(self._receipt_file(entry.receipt_id), 'r') as f:
+                return json.load(f)
+        with open(self.segment_dir / entry.segment, 'rb') as f:
+            f.seek(entry.offset)
+            return json.loads(f.read(entry.length))
+    
+    def _read_many(self, ids) -> List[Dict]:
+        """Receipt dicts for ``ids``, skipping unreadable ones."""
+        found = []
+        for receipt_id in ids:
+            entry = self._entries.get(receipt_id)
+            if entry is None:
+                continue
+            try:
+                found.append(self._read_data(entry))
+            except (OSError, json.JSONDecodeError):
+                continue
+        return found
+    
     def save(self, receipt: AuditReceipt) -> None:
         """Save a receipt to the store."""
         filepath = self._receipt_file(receipt.receipt_id)
-        with open(filepath, 'w') as f:
-            json.dump(receipt.to_dict(), f, indent=2)
+        data = receipt.to_dict()
+        with self._lock:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
+            entry = self._entry_for(data)
+            self._add_entry(entry)
+            self._append_index([entry.to_record()])
     
     def load(self, receipt_id: str) -> AuditReceipt:
         """Load a receipt from the store."""
-        filepath = self._receipt_file(receipt_id)
-        
-        if not filepath.exists():
-            raise ReceiptError(f"Receipt not found: {receipt_id}")
-        
+        entry = self._entries.get(receipt_id)
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if entry is not None:
+                data = self._read_data(entry)
+            else:
+                # Not indexed (e.g. written by hand): fall back to the file
+                filepath = self._receipt_file(receipt_id)
+                if not filepath.exists():
+                    raise ReceiptError(f"Receipt not found: {receipt_id}")
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
         except json.JSONDecodeError as e:
             raise ReceiptError(f"Corrupted receipt file: {receipt_id}") from e
+        except OSError as e:
+            raise ReceiptError(f"Receipt not found: {receipt_id}") from e
         
-        receipt = AuditReceipt.from_dict(data)
+        try:
+            receipt = AuditReceipt.from_dict(data)
+        except (KeyError, TypeError) as e:
+            raise ReceiptError(f"Corrupted receipt file: {receipt_id}") from e
         
         # Verify on load - detect tampering
         if not receipt.verify():
@@ -175,53 +363,32 @@ class ReceiptStore:
         Returns:
             Tuple of (is_duplicate, existing_receipt)
         """
-        for filepath in self.store_path.glob("*.json"):
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                
-                if (data.get("action") == action and 
-                    data.get("content_hash") == payload_hash):
-                    return True, AuditReceipt.from_dict(data)
-            except (json.JSONDecodeError, ReceiptError):
-                continue
-        
+        receipt_id = self._by_key.get((action, payload_hash))
+        if receipt_id is None:
+            return False, None
+        for data in self._read_many([receipt_id]):
+            if data.get("action") == action and data.get("content_hash") == payload_hash:
+                return True, AuditReceipt.from_dict(data)
         return False, None
     
     def list_by_action(self, action: str) -> List[AuditReceipt]:
         """List all receipts for a specific action."""
-        receipts = []
-        for filepath in self.store_path.glob("*.json"):
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                if data.get("action") == action:
-                    receipts.append(AuditReceipt.from_dict(data))
-            except (json.JSONDecodeError, ReceiptError):
-                continue
+        receipts = [
+            AuditReceipt.from_dict(data)
+            for data in self._read_many(sorted(self._by_action.get(action, ())))
+            if data.get("action") == action
+        ]
         return sorted(receipts, key=lambda r: r.timestamp)
     
     def get_stats(self) -> Dict:
         """Get statistics about the receipt store."""
         stats = {
-            "total_receipts": 0,
-            "actions": {},
+            "total_receipts": len(self._entries),
+            "actions": {action: len(ids) for action, ids in self._by_action.items()},
             "date_range": None
         }
         
-        timestamps = []
-        for filepath in self.store_path.glob("*.json"):
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                
-                stats["total_receipts"] += 1
-                action = data.get("action", "unknown")
-                stats["actions"][action] = stats["actions"].get(action, 0) + 1
-                timestamps.append(data.get("timestamp", ""))
-            except (json.JSONDecodeError, ReceiptError):
-                continue
-        
+        timestamps = [entry.timestamp for entry in self._entries.values()]
         if timestamps:
             stats["date_range"] = {
                 "earliest": min(timestamps),
@@ -234,31 +401,104 @@ class ReceiptStore:
         """
         Remove receipts older than a given timestamp.
         
+        Receipts held in segments are dropped from the index; their bytes
+        are reclaimed by the next ``compact()``.
+        
         Args:
             before_timestamp: ISO format timestamp (exclusive)
             
         Returns:
             Number of receipts pruned
         """
-        pruned = 0
-        cutoff = datetime.fromisoformat(before_timestamp.replace('Z', '+00:00'))
+        cutoff = _epoch(before_timestamp)
+        if cutoff is None:
+            raise ValueError(f"Invalid timestamp: {before_timestamp}")
         
-        for filepath in list(self.store_path.glob("*.json")):
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                
-                receipt_time = datetime.fromisoformat(
-                    data.get("timestamp", "").replace('Z', '+00:00')
-                )
-                
-                if receipt_time < cutoff:
-                    filepath.unlink()
-                    pruned += 1
-            except (json.JSONDecodeError, ReceiptError, ValueError):
-                continue
+        with self._lock:
+            end = bisect.bisect_left(self._by_time, (cutoff, ""))
+            expired = [receipt_id for _, receipt_id in self._by_time[:end]]
+            records = []
+            for receipt_id in expired:
+                entry = self._drop_entry(receipt_id)
+                if entry.segment is None:
+                    try:
+                        self._receipt_file(receipt_id).unlink()
+                    except FileNotFoundError:
+                        pass
+                records.append({"id": receipt_id, "deleted": True})
+            if records:
+                self._append_index(records)
+        return len(expired)
+    
+    def compact(self, before_timestamp: Optional[str] = None) -> int:
+        """
+        Fold per-file receipts into a new segment and rewrite the index.
+        
+        Live receipts already in segments are carried into the new segment,
+        so pruned records are dropped. Receipt files that fail HMAC
+        verification are left in place, so loading them still raises.
         
-        return pruned
+        Args:
+            before_timestamp: Only fold receipt files older than this
+            
+        Returns:
+            Number of receipt files folded into the segment
+        """
+        cutoff = _epoch(before_timestamp) if before_timestamp else None
+        with self._lock:
+            old_segments = sorted(self.segment_dir.glob("*.jsonl")) if self.segment_dir.exists() else []
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            name = f"receipts-{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}.jsonl"
+            folded = []
+            new_entries = []
+            with open(self.segment_dir / name, 'wb') as seg:
+                for entry in sorted(self._entries.values(), key=lambda e: (e.epoch or 0, e.receipt_id)):
+                    if entry.segment is None and cutoff is not None and (
+                        entry.epoch is None or entry.epoch >= cutoff
+                    ):
+                        new_entries.append(entry)
+                        continue
+                    try:
+                        data = self._read_data(entry)
+                    except (OSError, json.JSONDecodeError):
+                        if entry.segment is None:
+                            new_entries.append(entry)  # load() reports it
+                        continue  # unreadable segment record: dropped
+                    if entry.segment is None:
+                        try:
+                            valid = AuditReceipt.from_dict(data).verify()
+                        except (KeyError, TypeError):
+                            valid = False
+                        if not valid:
+                            new_entries.append(entry)
+                            continue
+                        folded.append(entry.receipt_id)
+                    line = json.dumps(data, separators=(",", ":")).encode()
+                    new_entries.append(self._entry_for(data, name, seg.tell(), len(line)))
+                    seg.write(line + b"\n")
+                seg.flush()
+                os.fsync(seg.fileno())
+            
+            atomic_write_text(
+                self.index_path,
+                "".join(json.dumps(e.to_record(), separators=(",", ":")) + "\n" for e in new_entries),
+            )
+            if not folded and not any(e.segment == name for e in new_entries):
+                (self.segment_dir / name).unlink()
+            self._entries.clear()
+            self._by_key.clear()
+            self._by_action.clear()
+            self._by_time.clear()
+            for entry in new_entries:
+                self._add_entry(entry)
+            for receipt_id in folded:
+                try:
+                    self._receipt_file(receipt_id).unlink()
+                except FileNotFoundError:
+                    pass
+            for segment in old_segments:
+                segment.unlink()
+        return len(folded)
 
 
 # Convenience function for CLI use
@@ -284,6 +524,11 @@ def main():
     stats_parser = subparsers.add_parser("stats", help="Show store statistics")
     stats_parser.add_argument("--store", default="./receipts", help="Store path")
     
+    # Compact command
+    compact_parser = subparsers.add_parser("compact", help="Fold receipt files into a segment")
+    compact_parser.add_argument("--before", default=None, help="Only fold receipts older than this ISO timestamp")
+    compact_parser.add_argument("--store", default="./receipts", help="Store path")
+    
     args = parser.parse_args()
     
     if args.command == "create":
@@ -305,6 +550,11 @@ def main():
         stats = store.get_stats()
         print(json.dumps(stats, indent=2))
     
+    elif args.command == "compact":
+        store = ReceiptStore(Path(args.store))
+        folded = store.compact(before_timestamp=args.before)
+        print(f"Folded {folded} receipt files into a segment")
+    
     else:
         parser.print_help()
 
@@ -16,7 +16,6 @@ The TUI (clawgotchi.py) displays the agent's state, thoughts, and health.
 Hot-Reload: Watches source files for changes and auto-restarts.
 """
 
-import asyncio
 import json
 import os
 import re
@@ -24,9 +23,10 @@ import subprocess
 import sys
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class HotReloader:
@@ -75,17 +75,42 @@ STATE_SHARING = "SHARING"
 STATE_REFLECTING = "REFLECTING"
 
 # Paths
-from config import PROJECT_ROOT, MEMORY_DIR, AGENT_STATE_FILE, CURIOSITY_FILE, BELIEFS_FILE, RESOURCES_FILE
+from config import (
+    PROJECT_ROOT, MEMORY_DIR, AGENT_STATE_FILE, CURIOSITY_FILE, CURIOSITY_ARCHIVE_FILE,
+    BELIEFS_FILE, RESOURCES_FILE, MEMORY_DB_FILE,
+)
+from core.backup_ring import BackupRing
+from core.curiosity_index import NearDuplicateIndex, PriorityHeap
+from core.incremental_verifier import IncrementalVerifier
+from core.memory_store import get_memory_store
+from core.observe import disk_usage_mb, git_snapshot, run_probes
+from core.persistence import PersistenceManager
+from core.pytest_worker import PytestWorkerPool, WorkerError
+from core.startup_profile import phase as startup_phase
+from core.working_journal import WorkingJournal
 BASE_DIR = PROJECT_ROOT
 STATE_FILE = AGENT_STATE_FILE
 
 WAKE_INTERVAL = 15 * 60  # 15 minutes in seconds
+# Incremental verification only follows import edges; every this many wake
+# cycles (and after builds and self-repairs) the whole suite runs instead.
+FULL_VERIFY_EVERY = 10
+
+# Per-probe TimeoutBudget for the concurrent OBSERVE phase (milliseconds).
+OBSERVE_BUDGETS_MS = {
+    "disk": 2_000,
+    "git": 10_000,
+    "tests": 10 * 60_000,
+    "collect": 2 * 60_000,
+}
 
 
 class AgentState:
     """Persistent agent state."""
     
-    def __init__(self):
+    def __init__(self, persistence: Optional[PersistenceManager] = None):
+        self.persistence = persistence or PersistenceManager()
+        self._dirty = False
         self.version = "1.0"
         self.last_wake = None
         self.current_state = STATE_SLEEPING
@@ -118,8 +143,14 @@ class AgentState:
         return False
     
     def save(self):
-        """Persist state to file."""
-        MEMORY_DIR.mkdir(exist_ok=True)
+        """Mark state changed; the persistence manager decides when to write."""
+        self._dirty = True
+        self.persistence.mark_dirty(self)
+
+    def flush(self):
+        """Write state to file now if it changed."""
+        if not self._dirty:
+            return
         data = {
             "version": self.version,
             "last_wake": self.last_wake,
@@ -133,7 +164,8 @@ class AgentState:
             "errors": self.errors,
             "updated_at": datetime.now().isoformat()
         }
-        STATE_FILE.write_text(json.dumps(data, indent=2))
+        self.persistence.write_json(STATE_FILE, data)
+        self._dirty = False
     
     def add_error(self, error: str):
         """Add an error to the error log (keeps last 10)."""
@@ -151,54 +183,132 @@ class AgentState:
 
 
 class CuriosityQueue:
-    """Queue of things the agent wants to explore."""
-    
-    def __init__(self):
+    """Queue of things the agent wants to explore.
+
+    Pending items are indexed for near-duplicate merging and kept in a
+    priority heap. Explored items are moved to an append-only archive so
+    the hot file only holds live work. Saves are debounced; wrap bursts of
+    updates in ``batch()`` and call ``flush()`` at phase boundaries.
+    """
+
+    SAVE_INTERVAL = 5.0  # seconds between debounced writes
+
+    def __init__(self, persistence: Optional[PersistenceManager] = None, store=None):
+        self.persistence = persistence or PersistenceManager(debounce=self.SAVE_INTERVAL)
+        # Optional SQLite store (core.memory_store): explored items stay in the
+        # same collection and only touched rows are written.
+        self.store = store
+        self._repo = store.collection("curiosity") if store is not None else None
+        self._touched = set()
         self.queue = []
         self.explored_count = 0
         self.total_discovered = 0
-    
+        self._by_id = {}
+        self._index = NearDuplicateIndex()
+        self._heap = PriorityHeap()
+        self._to_archive = []
+        self._dirty = False
+
     def load(self) -> bool:
+        if self._repo is not None:
+            self.queue = self._repo.query(exclude_status="explored", newest_first=True)
+            meta = self.store.get_document("curiosity.meta", {})
+            self.explored_count = meta.get("explored_count", 0)
+            self.total_discovered = meta.get("total_discovered", 0)
+            self._rebuild_indexes()
+            return True
         if CURIOSITY_FILE.exists():
             try:
                 data = json.loads(CURIOSITY_FILE.read_text())
-                self.queue = data.get("queue", [])
+                queue = data.get("queue", [])
                 self.explored_count = data.get("explored_count", 0)
                 self.total_discovered = data.get("total_discovered", 0)
+                # Older files kept explored items inline; move them out on next flush.
+                self._to_archive = [i for i in queue if i.get("status") == "explored"]
+                self.queue = [i for i in queue if i.get("status") != "explored"]
+                self._dirty = bool(self._to_archive)
+                self._rebuild_indexes()
                 return True
             except:
                 pass
         return False
-    
+
+    def _rebuild_indexes(self):
+        self._by_id = {}
+        self._index = NearDuplicateIndex()
+        self._heap = PriorityHeap()
+        # self.queue is newest-first; heap order grows with age-of-insertion.
+        for order, item in enumerate(reversed(self.queue), start=1):
+            self._by_id[item.get("id")] = item
+            if item.get("status") == "pending":
+                self._index.add(item["id"], item.get("topic", ""))
+                self._heap.push(item["id"], item.get("priority", 0), order)
+
     def save(self):
+        """Mark dirty and write unless a batch is open or a write just happened."""
+        self._dirty = True
+        self.persistence.mark_dirty(self)
+
+    def flush(self):
+        """Write pending changes now."""
+        if not self._dirty:
+            return
+        if self._repo is not None:
+            changed = [self._by_id[i] for i in self._touched if i in self._by_id]
+            self._repo.put_many(changed + self._to_archive)
+            self.store.put_document("curiosity.meta", {
+                "explored_count": self.explored_count,
+                "total_discovered": self.total_discovered,
+            })
+            self._touched.clear()
+            self._to_archive = []
+            self._dirty = False
+            return
+        if self._to_archive:
+            with open(CURIOSITY_ARCHIVE_FILE, "a") as f:
+                for item in self._to_archive:
+                    f.write(json.dumps(item) + "\n")
+            self._to_archive = []
         data = {
             "queue": self.queue,
             "explored_count": self.explored_count,
             "total_discovered": self.total_discovered,
             "updated_at": datetime.now().isoformat()
         }
-        CURIOSITY_FILE.write_text(json.dumps(data, indent=2))
-    
+        self.persistence.write_json(CURIOSITY_FILE, data)
+        self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """Coalesce every save inside the block into one write at the end."""
+        with self.persistence.phase():
+            yield self
+
     def add(self, topic: str, source: str, priority: int = 3,
             categories: list = None):
         """Add a curiosity or boost an existing one.
 
-        If a topic with the same normalised name already exists in the queue
-        (and is still pending), boost its seen_count and priority instead of
+        If a pending topic with the same or a nearly identical normalised
+        name already exists, boost its seen_count and priority instead of
         duplicating.
         """
-        norm = topic.strip().lower()
-        for item in self.queue:
-            if item.get("status") == "pending" and item["topic"].strip().lower() == norm:
-                item["seen_count"] = item.get("seen_count", 1) + 1
-                item["priority"] = max(item["priority"], priority) + 1
-                if source not in item.get("sources", []):
-                    item.setdefault("sources", []).append(source)
-                if categories:
-                    existing = set(item.get("categories", []))
-                    item["categories"] = list(existing | set(categories))
-                self.save()
-                return
+        match = self._by_id.get(self._index.find(topic))
+        if match is not None and match.get("status") == "pending":
+            match["seen_count"] = match.get("seen_count", 1) + 1
+            match["priority"] = max(match["priority"], priority) + 1
+            if source not in match.get("sources", []):
+                match.setdefault("sources", []).append(source)
+            if categories:
+                existing = set(match.get("categories", []))
+                match["categories"] = list(existing | set(categories))
+            if topic.strip().lower() != match["topic"].strip().lower():
+                aliases = match.setdefault("aliases", [])
+                if topic not in aliases:
+                    aliases.append(topic)
+            self._heap.push(match["id"], match["priority"], self._heap.order_of(match["id"]))
+            self._touched.add(match["id"])
+            self.save()
+            return
 
         item = {
             "id": f"cur-{self.total_discovered + 1}",
@@ -212,15 +322,16 @@ class CuriosityQueue:
             "status": "pending",
         }
         self.queue.insert(0, item)
+        self._by_id[item["id"]] = item
+        self._index.add(item["id"], topic)
+        self._heap.push(item["id"], priority)
+        self._touched.add(item["id"])
         self.total_discovered += 1
         self.save()
     
     def get_next(self) -> Optional[dict]:
         """Get the highest priority pending item."""
-        pending = [i for i in self.queue if i.get("status") == "pending"]
-        if not pending:
-            return None
-        return max(pending, key=lambda x: x.get("priority", 0))
+        return self._by_id.get(self._heap.peek())
 
     def get_mature(self, min_seen: int = 2, min_age_hours: float = 12) -> Optional[dict]:
         """Return the highest-priority *mature* pending item.
@@ -231,46 +342,55 @@ class CuriosityQueue:
         Returns None if nothing qualifies.
         """
         now = datetime.now()
-        mature = []
-        for item in self.queue:
-            if item.get("status") != "pending":
-                continue
-            seen = item.get("seen_count", 1)
+
+        def is_mature(item_id: str) -> bool:
+            item = self._by_id[item_id]
+            if item.get("seen_count", 1) >= min_seen:
+                return True
             try:
                 added = datetime.fromisoformat(item["added_at"])
                 age_hours = (now - added).total_seconds() / 3600
             except (KeyError, ValueError):
                 age_hours = 0
-            if seen >= min_seen or age_hours >= min_age_hours:
-                mature.append(item)
-        if not mature:
-            return None
-        return max(mature, key=lambda x: x.get("priority", 0))
+            return age_hours >= min_age_hours
+
+        return self._by_id.get(self._heap.peek(is_mature))
+
+    def _unindex(self, item_id: str):
+        self._index.remove(item_id)
+        self._heap.discard(item_id)
     
     def mark_explored(self, item_id: str):
-        """Mark an item as explored."""
-        for item in self.queue:
-            if item.get("id") == item_id:
-                item["status"] = "explored"
-                item["explored_at"] = datetime.now().isoformat()
-                self.explored_count += 1
-                self.save()
-                return
+        """Mark an item as explored and move it to the archive."""
+        item = self._by_id.pop(item_id, None)
+        if item is None:
+            return
+        item["status"] = "explored"
+        item["explored_at"] = datetime.now().isoformat()
+        self._unindex(item_id)
+        self.queue.remove(item)
+        self._to_archive.append(item)
+        self.explored_count += 1
+        self.save()
     
     def mark_exploring(self, item_id: str):
         """Mark an item as currently exploring."""
-        for item in self.queue:
-            if item.get("id") == item_id:
-                item["status"] = "exploring"
-                item["started_at"] = datetime.now().isoformat()
-                self.save()
-                return
+        item = self._by_id.get(item_id)
+        if item is None:
+            return
+        item["status"] = "exploring"
+        item["started_at"] = datetime.now().isoformat()
+        self._unindex(item_id)
+        self._touched.add(item_id)
+        self.save()
 
 
 class Beliefs:
     """Agent's beliefs about itself and the world."""
     
-    def __init__(self):
+    def __init__(self, persistence: Optional[PersistenceManager] = None):
+        self.persistence = persistence or PersistenceManager()
+        self._dirty = False
         self.beliefs = []
         self.questions = []
         self.version = 1
@@ -288,13 +408,20 @@ class Beliefs:
         return False
     
     def save(self):
+        self._dirty = True
+        self.persistence.mark_dirty(self)
+
+    def flush(self):
+        if not self._dirty:
+            return
         data = {
             "beliefs": self.beliefs,
             "questions": self.questions,
             "version": self.version,
             "updated_at": datetime.now().isoformat()
         }
-        BELIEFS_FILE.write_text(json.dumps(data, indent=2))
+        self.persistence.write_json(BELIEFS_FILE, data)
+        self._dirty = False
     
     def add_belief(self, statement: str, confidence: float = 0.5):
         """Add a new belief."""
@@ -333,7 +460,9 @@ class Beliefs:
 class ResourceMonitor:
     """Monitor agent resources (disk, uptime, etc.)."""
     
-    def __init__(self):
+    def __init__(self, persistence: Optional[PersistenceManager] = None):
+        self.persistence = persistence or PersistenceManager()
+        self._dirty = False
         self.data = {
             "disk": {"used_mb": 0, "available_mb": 0},
             "uptime": {"seconds": 0},
@@ -351,33 +480,44 @@ class ResourceMonitor:
         return False
     
     def save(self):
+        self._dirty = True
+        self.persistence.mark_dirty(self)
+
+    def flush(self):
+        if not self._dirty:
+            return
         self.data["updated_at"] = datetime.now().isoformat()
-        RESOURCES_FILE.write_text(json.dumps(self.data, indent=2))
+        self.persistence.write_json(RESOURCES_FILE, self.data)
+        self._dirty = False
     
-    def update(self):
-        """Update all resource metrics."""
-        # Disk usage
-        try:
-            result = os.popen("df -m . | tail -1").read()
-            parts = result.split()
-            if len(parts) >= 2:
-                used = int(parts[2]) if parts[2].isdigit() else 0
-                avail = int(parts[3]) if parts[3].isdigit() else 0
-                self.data["disk"] = {
-                    "used_mb": used,
-                    "available_mb": avail
-                }
-        except:
-            pass
-        
-        # Git commits today
-        try:
-            today = datetime.now().strftime("%Y-%m-%d")
-            result = os.popen(f'git log --since="{today}" --oneline | wc -l').read()
-            self.data["git"]["commits_today"] = int(result.strip()) if result.strip().isdigit() else 0
-        except:
-            pass
-        
+    def update(self, probes: Optional[dict] = None):
+        """Update all resource metrics.
+
+        The OBSERVE phase passes in its probe results (a failed probe keeps
+        the previous value); called on its own, the probes run inline.
+        """
+        disk = git = None
+        if probes is not None:
+            disk = probes["disk"].value if probes["disk"].ok else None
+            git = probes["git"].value if probes["git"].ok else None
+        else:
+            try:
+                disk = disk_usage_mb(BASE_DIR)
+            except OSError:
+                pass
+            try:
+                from clawgotchi.resilience.timeout_budget import TimeoutBudget
+                budget = TimeoutBudget(default_budget_ms=OBSERVE_BUDGETS_MS["git"])
+                budget.reset()
+                git = git_snapshot(BASE_DIR, budget)
+            except Exception:
+                pass
+
+        if disk is not None:
+            self.data["disk"] = disk
+        if git is not None:
+            self.data.setdefault("git", {})["commits_today"] = git["commits_today"]
+
         self.save()
         return self.data
     
@@ -395,18 +535,70 @@ class ResourceMonitor:
         return issues
 
 
+class _Component:
+    """Agent attribute set by an ``_init_*`` method the first time it is read.
+
+    A non-data descriptor: once the loader has stored the value on the
+    instance, reads never reach this again.
+    """
+
+    def __init__(self, loader: str):
+        self.loader = loader
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, agent, owner=None):
+        if agent is None:
+            return self
+        agent._load_component(self.loader)
+        return agent.__dict__.get(self.name)
+
+
 class AutonomousAgent:
     """Main autonomous agent with state machine."""
 
+    # Heavier subsystems (each imports its module and reads its JSON files)
+    # load on first use or from warm_up(), so constructing the agent, and
+    # with it the TUI's first frame, doesn't wait for them.
+    soul_manager = _Component("_init_evolution_components")
+    goal_generator = _Component("_init_evolution_components")
+    knowledge_synthesizer = _Component("_init_evolution_components")
+    integration_manager = _Component("_init_evolution_components")
+    self_modifier = _Component("_init_evolution_components")
+    _evolution_enabled = _Component("_init_evolution_components")
+    ikigai = _Component("_init_ikigai_engine")
+    self_evolution = _Component("_init_self_evolution_loop")
+    safety_guard = _Component("_init_safety_guard")
+
+    COMPONENT_LOADERS = (
+        "_init_evolution_components",
+        "_init_ikigai_engine",
+        "_init_self_evolution_loop",
+        "_init_safety_guard",
+    )
+
     def __init__(self):
-        self.state = AgentState()
-        self.curiosity = CuriosityQueue()
-        self.beliefs = Beliefs()
-        self.resources = ResourceMonitor()
+        self._component_lock = threading.RLock()
+        self._loaded_components: set = set()
+        self._loading_components: set = set()
+        self.component_errors: Dict[str, str] = {}  # loader -> why it failed
+        # One manager for all state files: writes are held during a wake
+        # cycle and flushed once per phase.
+        self.persistence = PersistenceManager(debounce=CuriosityQueue.SAVE_INTERVAL)
+        # SQLite memory store, only once memory/memory.db has been imported.
+        self.memory_store = get_memory_store(MEMORY_DB_FILE)
+        self.state = AgentState(self.persistence)
+        self.curiosity = CuriosityQueue(self.persistence, store=self.memory_store)
+        self.beliefs = Beliefs(self.persistence)
+        self.resources = ResourceMonitor(self.persistence)
         self.running = False
         self.paused = False
         self._thread: Optional[threading.Thread] = None
         self._last_action_result = ""
+        self.test_pool: Optional[PytestWorkerPool] = None
+        self.verifier = IncrementalVerifier(BASE_DIR, runner=self._run_tests)
+        self.working_journal = WorkingJournal(MEMORY_DIR / "WORKING.md")
 
         # Load persisted state
         self.state.load()
@@ -414,11 +606,38 @@ class AutonomousAgent:
         self.beliefs.load()
         self.resources.load()
 
-        # Initialize evolution components
-        self._init_evolution_components()
-        self._init_ikigai_engine()
-        self._init_self_evolution_loop()
-        self._init_safety_guard()
+    def _load_component(self, loader: str):
+        with self._component_lock:
+            if loader in self._loaded_components or loader in self._loading_components:
+                return  # done, or a read from inside the loader itself
+            self._loading_components.add(loader)
+            try:
+                with startup_phase(loader.replace("_init_", "agent.", 1)):
+                    getattr(self, loader)()
+            except Exception as e:
+                # Handled like a missing module: every attribute the loader
+                # owns is None rather than half set.
+                print(f"Agent component {loader} failed to load: {e}")
+                self.component_errors[loader] = f"{type(e).__name__}: {e}"
+                for name in self._component_names(loader):
+                    setattr(self, name, None)
+            finally:
+                self._loading_components.discard(loader)
+            self._loaded_components.add(loader)
+
+    @classmethod
+    def _component_names(cls, loader: str) -> List[str]:
+        return [
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, _Component) and attr.loader == loader
+        ]
+
+    def warm_up(self):
+        """Load every lazily initialised component now."""
+        for loader in self.COMPONENT_LOADERS:
+            self._load_component(loader)
 
     def _init_evolution_components(self):
         """Initialize the evolution subsystem components."""
@@ -434,7 +653,8 @@ class AutonomousAgent:
                 memory_dir=str(MEMORY_DIR),
             )
             self.goal_generator = GoalGenerator(
-                memory_path=str(MEMORY_DIR / "goals.json")
+                memory_path=str(MEMORY_DIR / "goals.json"),
+                store=self.memory_store,
             )
             self.knowledge_synthesizer = KnowledgeSynthesizer(
                 memory_dir=str(MEMORY_DIR)
@@ -442,6 +662,7 @@ class AutonomousAgent:
             self.integration_manager = IntegrationManager(
                 registry=None,  # Will set after resilience imports
                 memory_dir=str(MEMORY_DIR),
+                store=self.memory_store,
             )
             self.self_modifier = SelfModifier(
                 soul_manager=self.soul_manager,
@@ -466,6 +687,7 @@ class AutonomousAgent:
                 state_path=str(MEMORY_DIR / "ikigai_state.json"),
                 gate_path=str(MEMORY_DIR / "policy_gate.json"),
                 success_target=0.90,
+                store=self.memory_store,
             )
         except ImportError:
             self.ikigai = None
@@ -495,6 +717,7 @@ class AutonomousAgent:
             return
         
         self.running = True
+        self._start_test_pool()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
         print("Autonomous agent started")
@@ -504,8 +727,46 @@ class AutonomousAgent:
         self.running = False
         if self._thread:
             self._thread.join(timeout=5)
+        if self.test_pool:
+            self.test_pool.shutdown()
+            self.test_pool = None
+        self.persistence.flush()
+        self.working_journal.close()
         print("Autonomous agent stopped")
     
+    def _start_test_pool(self):
+        """Start the warm pytest worker used by every test call site."""
+        if self.test_pool:
+            return
+        try:
+            self.test_pool = PytestWorkerPool(BASE_DIR)
+            self.test_pool.start()
+        except Exception as e:
+            print(f"Pytest worker pool not available: {e}")
+            self.test_pool = None
+
+    def _run_tests(self, targets: list, collect_only: bool = False) -> tuple:
+        """Run pytest on ``targets``. Returns (returncode, combined output).
+
+        Uses the warm worker pool while the agent is running and falls back
+        to a one-shot subprocess otherwise (or if the worker misbehaves).
+        """
+        if self.test_pool:
+            try:
+                if collect_only:
+                    returncode, _, output = self.test_pool.collect(targets)
+                    return returncode, output
+                return self.test_pool.run(targets)
+            except WorkerError as e:
+                self.state.add_error(f"Pytest worker error: {e}")
+
+        args = ["--collect-only", "-q"] if collect_only else ["-q", "--tb=short", "-rfE"]
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", *targets, *args],
+            capture_output=True, text=True, cwd=str(BASE_DIR)
+        )
+        return result.returncode, result.stdout + result.stderr
+
     def pause(self):
         """Pause the agent."""
         self.paused = True
@@ -516,6 +777,9 @@ class AutonomousAgent:
     
     def _run_loop(self):
         """Main run loop."""
+        import asyncio  # only the loop thread needs it (~50ms at import)
+
+        self.warm_up()
         while self.running:
             if self.paused:
                 time.sleep(1)
@@ -533,6 +797,7 @@ class AutonomousAgent:
                 print(error_msg)
                 self.state.add_error(error_msg)
                 self.state.save()
+                self.persistence.flush()
                 time.sleep(60)  # Brief pause on error
     
     async def wake_cycle(self):
@@ -546,7 +811,13 @@ class AutonomousAgent:
         4. VERIFY - Run tests
         5. REFLECT - Update memory, consider consolidation/self-modification
         6. SLEEP
+
+        State saves are held for the whole cycle and written once per phase.
         """
+        with self.persistence.phase():
+            return await self._run_wake_phases()
+
+    async def _run_wake_phases(self):
         # Check for crash recovery first
         if not await self._recover_from_crash():
             self.state.add_error("State recovery performed")
@@ -570,11 +841,13 @@ class AutonomousAgent:
                 self.state.current_thought = f"Goal: {goal_desc}..."
 
         self.state.save()
+        self.persistence.flush()
 
-        # 1. OBSERVING
+        # 1. OBSERVING - disk, git and test probes run concurrently
         self.state.current_state = STATE_OBSERVING
-        self.resources.update()
-        health_score = await self._check_health()
+        probes = await self._observe()
+        self.resources.update(probes)
+        health_score = await self._check_health(probes)
 
         # Check disk space
         disk_status, disk_msg = await self._check_disk_space()
@@ -584,7 +857,7 @@ class AutonomousAgent:
         self.state.update_health(health_score)
         self.state.current_thought = "Observing my surroundings..."
         self.state.save()
-        await asyncio.sleep(2)
+        self.persistence.flush()
 
         # Check goal progress (new)
         if self._evolution_enabled and self.goal_generator:
@@ -628,7 +901,7 @@ class AutonomousAgent:
 
         self.state.current_goal = action.get("description", "")
         self.state.save()
-        await asyncio.sleep(1)
+        self.persistence.flush()
 
         # 3. EXECUTE ACTION
         if action["type"] == "BUILD":
@@ -688,15 +961,15 @@ class AutonomousAgent:
         self._last_action_result = result
         self.state.current_thought = result
         self.state.save()
+        self.persistence.flush()
 
-        # 4. VERIFYING — run the test suite
+        # 4. VERIFYING — re-run only the tests affected by this cycle's changes
+        # (all of them after a build: new code may be reached without an import)
         self.state.current_state = STATE_VERIFYING
-        verify_result = subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
-            capture_output=True, text=True, cwd=str(BASE_DIR)
-        )
+        built = action["type"] == "BUILD" and result.startswith("Built ")
+        verify_result = self.verifier.verify(force_full=built)
         if verify_result.returncode != 0:
-            self.state.add_error(f"Tests failed: {verify_result.stdout[-200:]}")
+            self.state.add_error(f"Tests failed: {verify_result.output[-200:]}")
             # Auto-repair common issues
             repair_result = await self._self_repair()
             self.state.current_thought = repair_result
@@ -822,55 +1095,76 @@ class AutonomousAgent:
 
         return f"Consolidated: {result.get('extracted_count', 0)} principles, {result.get('synthesized_count', 0)} insights"
     
-    async def _check_health(self) -> int:
-        """Run health checks. Returns score 0-100."""
+    async def _observe(self, run_tests: bool = True) -> dict:
+        """Run the OBSERVE probes concurrently. Returns {name: ProbeResult}.
+
+        With ``run_tests=False`` the tests probe is only a collect-only check
+        (or the last verification), for callers outside the wake cycle.
+        """
+        if run_tests:
+            # The test result is reused by DECIDE and VERIFY
+            full = self.state.total_wakes % FULL_VERIFY_EVERY == 0
+            tests = (lambda budget: self.verifier.verify(force_full=full), OBSERVE_BUDGETS_MS["tests"])
+        else:
+            tests = (lambda budget: self.verifier.collect(budget.remaining_ms() / 1000),
+                     OBSERVE_BUDGETS_MS["collect"])
+        probes = await run_probes({
+            "disk": (lambda budget: disk_usage_mb(BASE_DIR), OBSERVE_BUDGETS_MS["disk"]),
+            "git": (lambda budget: git_snapshot(BASE_DIR, budget), OBSERVE_BUDGETS_MS["git"]),
+            "tests": tests,
+        })
+        for probe in probes.values():
+            if not probe.ok:
+                self.state.add_error(f"Observe probe {probe.name} failed: {probe.error}")
+        return probes
+
+    async def _check_health(self, probes: Optional[dict] = None) -> int:
+        """Run health checks. Returns score 0-100.
+
+        Without ``probes`` (standalone use) only a collect-only test check is
+        made; the wake cycle passes its own probes, full test run included.
+        """
+        if probes is None:
+            probes = await self._observe(run_tests=False)
         score = 100
         
         # Check disk
-        disk_mb = self.resources.data.get("disk", {}).get("available_mb", 1000)
+        disk = probes["disk"].value if probes["disk"].ok else self.resources.data.get("disk", {})
+        disk_mb = disk.get("available_mb", 1000)
         if disk_mb < 100:
             score -= 30
         elif disk_mb < 500:
             score -= 10
         
         # Check git status
-        try:
-            result = os.popen("git status --porcelain").read()
-            if result.strip():
+        git = probes["git"]
+        if git.ok:
+            if git.value["dirty"]:
                 self.state.git_status = "dirty"
                 score -= 5
             else:
                 self.state.git_status = "clean"
-        except:
+        else:
             score -= 10
         
-        # Check for tests
-        try:
-            test_result = os.popen("python -m pytest --co -q 2>&1 | tail -1").read()
-            if "error" in test_result.lower():
-                score -= 20
-        except:
-            pass
+        # Check for tests (a timed-out run costs nothing here)
+        tests = probes["tests"]
+        if tests.ok and tests.value.errors:
+            score -= 20
         
         return max(0, min(100, score))
     
     async def _get_incomplete_features(self) -> str:
         """Check for incomplete features (modules with failing tests)."""
-        # Run tests and check for failures in resilience modules
-        test_result = subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=no", "-q"],
-            capture_output=True, text=True, cwd=str(BASE_DIR)
-        )
-        
+        # Reuse this cycle's verification and check failures in resilience modules
+        test_result = self.verifier.verify()
+
         incomplete = []
-        stdout = test_result.stdout + test_result.stderr
-        failed_modules = set(
-            re.findall(
-                r"^FAILED\s+tests/(?:resilience/)?test_([a-z0-9_]+)\.py::",
-                stdout,
-                flags=re.MULTILINE,
-            )
-        )
+        failed_modules = set()
+        for nodeid in test_result.failed:
+            match = re.match(r"tests/(?:resilience/)?test_([a-z0-9_]+)\.py::", nodeid)
+            if match:
+                failed_modules.add(match.group(1))
         if not failed_modules:
             return ""
         
@@ -1144,7 +1438,7 @@ class AutonomousAgent:
         """
         try:
             from cognition.taste_profile import TasteProfile
-            tp = TasteProfile(memory_dir=str(MEMORY_DIR))
+            tp = TasteProfile(memory_dir=str(MEMORY_DIR), store=self.memory_store)
             fp = tp.get_taste_fingerprint()
             recent_subjects = [r.get("subject", "").lower() for r in fp.get("recent", [])]
             title_lower = title.lower()
@@ -1591,11 +1885,8 @@ def test_status_command():
         
         # Run tests
         print("    🔎 Running tests...")
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", str(test_path), "-v"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
+        returncode, _ = self._run_tests([str(test_path.relative_to(BASE_DIR))])
+        if returncode != 0:
             # Clean up failed skill
             import shutil
             shutil.rmtree(skill_dir, ignore_errors=True)
@@ -1761,11 +2052,12 @@ if __name__ == "__main__":
 
         This is the intake funnel.  Every ~4 cycles the agent scans the
         Moltbook feed and:
-          1. Scores every post with score_post_relevance()
+          1. Scores every post with score_posts() (relevance on the
+             sanitized title, noise and prompt-injection flags in one batch)
           2. Rejects ~90% → logged via TasteProfile
           3. Adds passing ideas to the curiosity queue (or boosts existing)
         """
-        from integrations.moltbook_client import fetch_feed, score_post_relevance
+        from integrations.moltbook_client import fetch_feed, score_posts
 
         posts = fetch_feed(limit=50)
         if not posts:
@@ -1777,59 +2069,54 @@ if __name__ == "__main__":
         # Load TasteProfile for rejection logging
         try:
             from cognition.taste_profile import TasteProfile
-            tp = TasteProfile(memory_dir=str(MEMORY_DIR))
+            tp = TasteProfile(memory_dir=str(MEMORY_DIR), store=self.memory_store)
         except Exception:
             tp = None
 
-        for post in posts:
-            raw_title = post.get("title") or "untitled"
-            if self.safety_guard and self.safety_guard.is_prompt_injection_like(raw_title):
-                rejected += 1
-                if tp:
-                    try:
-                        tp.log_rejection(
-                            subject=f"moltbook:{raw_title[:80]}",
-                            reason="prompt injection pattern",
-                            taste_axis="safety",
-                        )
-                    except Exception:
-                        pass
-                continue
-
-            title = (
-                self.safety_guard.sanitize_untrusted_text(raw_title).strip()
-                if self.safety_guard
-                else raw_title
-            ) or "untitled"
-
-            safe_post = dict(post)
-            safe_post["title"] = title
-            result = score_post_relevance(safe_post)
-
-            # Reject: noise, low score, or too few categories
-            if result["noise"] or result["score"] < 0.15 or len(result["categories"]) < 2:
-                rejected += 1
-                if tp:
-                    reason = "noise" if result["noise"] else f"low relevance ({result['score']})"
-                    try:
-                        tp.log_rejection(
-                            subject=f"moltbook:{title[:80]}",
-                            reason=reason,
-                            taste_axis="relevance",
-                        )
-                    except Exception:
-                        pass
-                continue
-
-            # Accept — add to curiosity queue (or boost if duplicate)
-            accepted += 1
-            priority = int(result["score"] * 10)
-            self.curiosity.add(
-                topic=title,
-                source=f"moltbook:{post.get('id', '?')}",
-                priority=priority,
-                categories=result["categories"],
-            )
+        results = score_posts(posts, guard=self.safety_guard)
+
+        with self.curiosity.batch():
+            for post, result in zip(posts, results):
+                raw_title = post.get("title") or "untitled"
+                if result["injection"]:
+                    rejected += 1
+                    if tp:
+                        try:
+                            tp.log_rejection(
+                                subject=f"moltbook:{raw_title[:80]}",
+                                reason="prompt injection pattern",
+                                taste_axis="safety",
+                            )
+                        except Exception:
+                            pass
+                    continue
+
+                title = result["title"]  # sanitized when there is a guard
+
+                # Reject: noise, low score, or too few categories
+                if result["noise"] or result["score"] < 0.15 or len(result["categories"]) < 2:
+                    rejected += 1
+                    if tp:
+                        reason = "noise" if result["noise"] else f"low relevance ({result['score']})"
+                        try:
+                            tp.log_rejection(
+                                subject=f"moltbook:{title[:80]}",
+                                reason=reason,
+                                taste_axis="relevance",
+                            )
+                        except Exception:
+                            pass
+                    continue
+
+                # Accept — add to curiosity queue (or boost if duplicate)
+                accepted += 1
+                priority = int(result["score"] * 10)
+                self.curiosity.add(
+                    topic=title,
+                    source=f"moltbook:{post.get('id', '?')}",
+                    priority=priority,
+                    categories=result["categories"],
+                )
 
         return f"Explored Moltbook: {accepted} accepted, {rejected} rejected"
 
@@ -1891,8 +2178,7 @@ if __name__ == "__main__":
         if "explore" in desc:
             self.beliefs.add_question(f"Explored: {desc}")
 
-        # Update WORKING.md
-        working_md = MEMORY_DIR / "WORKING.md"
+        # Append to WORKING.md (old entries rotate into memory/working/)
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
             entry = (
@@ -1901,8 +2187,7 @@ if __name__ == "__main__":
                 f"- Result: {result}\n"
                 f"- Health: {self.state.health_score}/100\n"
             )
-            existing = working_md.read_text() if working_md.exists() else "# WORKING.md\n"
-            working_md.write_text(existing + entry)
+            self.working_journal.append(entry)
         except Exception:
             pass
 
@@ -1921,14 +2206,35 @@ if __name__ == "__main__":
     
     BACKUP_DIR = MEMORY_DIR / "backups"
     
+    @staticmethod
+    def _is_agent_backup(data) -> bool:
+        """Whether a ``state_*.json`` file was written by the old _backup_state.
+
+        utils/state_versioner keeps its versions in the same directory under
+        the same names; those are left alone.
+        """
+        return isinstance(data, dict) and {"timestamp", "state", "resources", "backups_count"} <= data.keys()
+    
+    def _backups(self) -> BackupRing:
+        """The backup ring for BACKUP_DIR (reopened if the directory changes).
+
+        Opening it migrates the agent's pre-ring backup files once.
+        """
+        ring = getattr(self, "_backup_ring", None)
+        if ring is None or ring.directory != self.BACKUP_DIR:
+            ring = self._backup_ring = BackupRing(self.BACKUP_DIR)
+            try:
+                ring.import_legacy(accept=self._is_agent_backup)
+            except OSError:
+                pass
+        return ring
+    
     async def _backup_state(self) -> str:
-        """Create a timestamped backup of agent state."""
-        self.BACKUP_DIR.mkdir(exist_ok=True)
+        """Snapshot agent state into the backup ring (deduplicated, delta-encoded)."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = self.BACKUP_DIR / f"state_{timestamp}.json"
+        ring = self._backups()
         
         backup_data = {
-            "timestamp": timestamp,
             "state": {
                 "version": self.state.version,
                 "health_score": self.state.health_score,
@@ -1936,17 +2242,22 @@ if __name__ == "__main__":
                 "current_goal": self.state.current_goal,
                 "current_state": self.state.current_state,
             },
-            "resources": self.resources.data,
-            "backups_count": len(list(self.BACKUP_DIR.glob("state_*.json")))
+            # Bookkeeping that changes every cycle would defeat deduplication
+            "resources": {
+                k: v for k, v in self.resources.data.items()
+                if k not in ("updated_at", "last_backup", "backup_count")
+            },
         }
         
-        backup_file.write_text(json.dumps(backup_data, indent=2))
+        snapshot = ring.save(backup_data, label=timestamp)
         
         # Update resources.json
         self.resources.data["last_backup"] = timestamp
-        self.resources.data["backup_count"] = backup_data["backups_count"]
+        self.resources.data["backup_count"] = len(ring)
         self.resources.save()
         
+        if snapshot is None:
+            return f"Backup unchanged: {timestamp}"
         return f"Backup created: {timestamp}"
     
     async def _cleanup_resources(self) -> str:
@@ -1964,16 +2275,6 @@ if __name__ == "__main__":
                 except:
                     pass
         
-        # Clean old backups (>90 days)
-        backup_cutoff = (datetime.now() - timedelta(days=90)).timestamp()
-        for backup in self.BACKUP_DIR.glob("state_*.json"):
-            try:
-                if backup.stat().st_mtime < backup_cutoff:
-                    backup.unlink()
-                    cleaned += 1
-            except:
-                pass
-        
         return f"Cleaned {cleaned} old files"
     
     async def _self_repair(self) -> str:
@@ -1981,14 +2282,11 @@ if __name__ == "__main__":
         fixed = []
         repairs = []
         
-        # Run tests and check for import errors
-        test_result = subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/", "--collect-only", "-q"],
-            capture_output=True, text=True, cwd=str(BASE_DIR)
-        )
-        
+        # Collect tests and check for import errors
+        _, collect_output = self._run_tests(["tests"], collect_only=True)
+
         # Fix import errors in test files
-        if "ModuleNotFoundError" in test_result.stdout or "ModuleNotFoundError" in test_result.stderr:
+        if "ModuleNotFoundError" in collect_output:
             for test_file in Path(BASE_DIR / "tests").rglob("test_*.py"):
                 try:
                     content = test_file.read_text()
@@ -2033,6 +2331,8 @@ if __name__ == "__main__":
                     pass
         
         if fixed:
+            # Rewritten tests and stub modules: verify the whole suite next time
+            self.verifier.invalidate()
             return f"Self-repair complete: {', '.join(fixed)}"
         return "No repairs needed"
     
@@ -2091,13 +2391,13 @@ if __name__ == "__main__":
     
     async def _restore_from_backup(self) -> bool:
         """Restore state from latest backup."""
-        backups = sorted(self.BACKUP_DIR.glob("state_*.json"), reverse=True)
-        if not backups:
+        ring = self._backups()
+        latest = ring.latest()
+        if latest is None:
             return False
         
-        latest = backups[0]
         try:
-            data = json.loads(latest.read_text())
+            data = ring.load(latest)
             state_data = data.get("state", {})
             
             # Restore state
@@ -2110,7 +2410,7 @@ if __name__ == "__main__":
             recovery_log = MEMORY_DIR / "recovery_log.json"
             log_entry = {
                 "timestamp": datetime.now().isoformat(),
-                "restored_from": str(latest),
+                "restored_from": f"{self.BACKUP_DIR}@{latest.label}",
                 "health_score": self.state.health_score
             }
             
@@ -2130,12 +2430,11 @@ if __name__ == "__main__":
     
     def get_backup_status(self) -> dict:
         """Get backup status for TUI."""
-        backups = list(self.BACKUP_DIR.glob("state_*.json"))
         last_backup = self.resources.data.get("last_backup", "Never")
         
         return {
             "last_backup": last_backup,
-            "backup_count": len(backups),
+            "backup_count": len(self._backups()),
             "recovery_log_exists": (MEMORY_DIR / "recovery_log.json").exists(),
             "emergency_mode": self.state.health_score < 30
         }
@@ -2229,6 +2528,8 @@ if __name__ == "__main__":
             status = agent.get_status()
             print(json.dumps(status, indent=2))
         elif cmd == "health":
+            import asyncio
+
             score = asyncio.run(agent._check_health())
             print(f"Health score: {score}/100")
         elif cmd == "curiosity":
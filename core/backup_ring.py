@@ -0,0 +1,324 @@
+"""
+Deduplicated, delta-encoded backup ring for agent state snapshots.
+
+The wake cycle used to write a full ``state_*.json`` into memory/backups
+every cycle and glob the directory to count them. The ring instead:
+- Addresses snapshots by the SHA-256 of their canonical JSON, so saving the
+  same content as the newest snapshot writes nothing
+- Stores most snapshots as a small JSON delta against the current keyframe
+  (a full snapshot); a new keyframe is cut when the delta grows past half
+  the full size or after ``keyframe_every`` deltas, so a restore never
+  applies more than one delta
+- Keeps a small manifest (time, label, hash) sorted by time, so lookup by
+  time is a binary search and counting is ``len()``; no directory listing
+- Thins old snapshots with a tiered retention policy (newest per hour,
+  per day, per week) and deletes objects no manifest entry still needs
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from core.persistence import atomic_write_json
+
+MANIFEST = "manifest.json"
+OBJECTS = "objects"
+
+
+def canonical_json(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def content_hash(data: Any) -> str:
+    return hashlib.sha256(canonical_json(data).encode()).hexdigest()
+
+
+# ---- JSON deltas -------------------------------------------------------
+
+def json_delta(old: Any, new: Any) -> Optional[dict]:
+    """Describe how to turn ``old`` into ``new``; None if they are equal.
+
+    Dicts are diffed key by key (recursively); anything else is replaced.
+    """
+    if old == new:
+        return None
+    if not (isinstance(old, dict) and isinstance(new, dict)):
+        return {"=": new}
+    delta: Dict[str, Any] = {}
+    removed = [k for k in old if k not in new]
+    if removed:
+        delta["-"] = removed
+    changed = {}
+    for key, value in new.items():
+        if key not in old:
+            changed[key] = {"=": value}
+        else:
+            sub = json_delta(old[key], value)
+            if sub is not None:
+                changed[key] = sub
+    if changed:
+        delta["~"] = changed
+    return delta
+
+
+def apply_delta(old: Any, delta: Optional[dict]) -> Any:
+    """Inverse of ``json_delta``: apply ``delta`` to ``old``."""
+    if delta is None:
+        return old
+    if "=" in delta:
+        return delta["="]
+    result = dict(old)
+    for key in delta.get("-", ()):
+        result.pop(key, None)
+    for key, sub in delta.get("~", {}).items():
+        result[key] = apply_delta(result.get(key), sub)
+    return result
+
+
+# ---- retention ---------------------------------------------------------
+
+@dataclass
+class RetentionPolicy:
+    """Keep the newest snapshot per hour / day / ISO week, for this many."""
+
+    hourly: int = 48
+    daily: int = 30
+    weekly: int = 26
+
+    def keep(self, times: List[float]) -> set:
+        """Indices of ``times`` (ascending epochs) to keep."""
+        kept = set()
+        if not times:
+            return kept
+        kept.add(len(times) - 1)
+        tiers = (
+            (self.hourly, lambda d: (d.year, d.month, d.day, d.hour)),
+            (self.daily, lambda d: (d.year, d.month, d.day)),
+            (self.weekly, lambda d: d.isocalendar()[:2]),
+        )
+        for limit, bucket in tiers:
+            seen = set()
+            for i in range(len(times) - 1, -1, -1):
+                if len(seen) >= limit:
+                    break
+                key = bucket(datetime.fromtimestamp(times[i]))
+                if key not in seen:
+                    seen.add(key)
+                    kept.add(i)
+        return kept
+
+
+@dataclass
+class Snapshot:
+    """One manifest entry."""
+
+    ts: float
+    label: str
+    hash: str
+    base: Optional[str] = None  # keyframe hash when stored as a delta
+
+    @property
+    def is_delta(self) -> bool:
+        return self.base is not None
+
+
+class BackupRing:
+    """Content-addressed, delta-encoded snapshots with tiered retention."""
+
+    def __init__(
+        self,
+        directory: Path,
+        retention: Optional[RetentionPolicy] = None,
+        keyframe_every: int = 50,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = Path(directory)
+        self.objects = self.directory / OBJECTS
+        self.manifest_path = self.directory / MANIFEST
+        self.retention = retention or RetentionPolicy()
+        self.keyframe_every = keyframe_every
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.legacy_imported = False
+        self._snapshots: List[Snapshot] = self._load_manifest()
+        self._times = [s.ts for s in self._snapshots]
+        self._keyframe: Optional[str] = None
+        self._keyframe_data: Any = None
+        self._since_keyframe = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def _load_manifest(self) -> List[Snapshot]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+            if isinstance(manifest, list):  # before the legacy-import marker
+                manifest = {"snapshots": manifest}
+            snapshots = [Snapshot(**entry) for entry in manifest["snapshots"]]
+        except (OSError, json.JSONDecodeError, TypeError, KeyError):
+            return []
+        self.legacy_imported = bool(manifest.get("legacy_imported"))
+        snapshots.sort(key=lambda s: s.ts)
+        return snapshots
+
+    def _save_manifest(self):
+        atomic_write_json(self.manifest_path, {
+            "legacy_imported": self.legacy_imported,
+            "snapshots": [asdict(s) for s in self._snapshots],
+        })
+
+    # ---- objects -------------------------------------------------------
+
+    def _full_path(self, digest: str) -> Path:
+        return self.objects / f"{digest}.json"
+
+    def _delta_path(self, base: str, digest: str) -> Path:
+        # Keyed by the keyframe too: the same content can recur after a new
+        # keyframe is cut, and its delta against the old one does not apply.
+        return self.objects / f"{base}-{digest}.delta.json"
+
+    def _read_full(self, digest: str) -> Any:
+        return json.loads(self._full_path(digest).read_text())
+
+    def _load(self, snapshot: Snapshot) -> Any:
+        if not snapshot.is_delta:
+            return self._read_full(snapshot.hash)
+        base = self._read_full(snapshot.base)
+        delta = json.loads(self._delta_path(snapshot.base, snapshot.hash).read_text())
+        return apply_delta(base, delta)
+
+    def _current_keyframe(self) -> Optional[str]:
+        if self._keyframe is None and self._snapshots:
+            newest = self._snapshots[-1]
+            self._keyframe = newest.base or newest.hash
+            try:
+                self._keyframe_data = self._read_full(self._keyframe)
+            except (OSError, json.JSONDecodeError):
+                self._keyframe = None
+                return None
+            self._since_keyframe = sum(1 for s in self._snapshots if s.base == self._keyframe)
+        return self._keyframe
+
+    # ---- public API ----------------------------------------------------
+
+    def save(self, data: Any, label: Optional[str] = None,
+             ts: Optional[float] = None) -> Optional[Snapshot]:
+        """Record a snapshot taken at ``ts`` (default: now).
+
+        Returns None, writing nothing, if it matches the newest snapshot.
+        """
+        digest = content_hash(data)
+        with self._lock:
+            if self._snapshots and self._snapshots[-1].hash == digest:
+                return None
+            now = self.clock() if ts is None else ts
+            label = label or datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S")
+            self.objects.mkdir(parents=True, exist_ok=True)
+
+            full = canonical_json(data)
+            base = self._current_keyframe()
+            snapshot = Snapshot(ts=now, label=label, hash=digest)
+            if base is not None and base != digest and self._since_keyframe < self.keyframe_every:
+                delta = canonical_json(json_delta(self._keyframe_data, data))
+                if len(delta) * 2 < len(full):
+                    snapshot.base = base
+                    path = self._delta_path(base, digest)
+                    if not path.exists():
+                        path.write_text(delta)
+                    self._since_keyframe += 1
+            if not snapshot.is_delta:
+                if not self._full_path(digest).exists():
+                    self._full_path(digest).write_text(full)
+                previous, self._keyframe = self._keyframe, digest
+                self._keyframe_data = json.loads(full)
+                self._since_keyframe = 0
+                if previous and previous != digest and not any(
+                    previous in (s.hash, s.base) for s in self._snapshots
+                ):
+                    self._full_path(previous).unlink(missing_ok=True)
+
+            i = bisect.bisect_right(self._times, now)
+            self._snapshots.insert(i, snapshot)
+            self._times.insert(i, now)
+            self._apply_retention()
+            self._save_manifest()
+            return snapshot
+
+    def latest(self) -> Optional[Snapshot]:
+        return self._snapshots[-1] if self._snapshots else None
+
+    def at(self, when: float) -> Optional[Snapshot]:
+        """The newest snapshot taken at or before ``when``."""
+        i = bisect.bisect_right(self._times, when)
+        return self._snapshots[i - 1] if i else None
+
+    def snapshots(self) -> List[Snapshot]:
+        return list(self._snapshots)
+
+    def load(self, snapshot: Optional[Snapshot] = None) -> Any:
+        """Snapshot contents (the newest if none given); None if empty."""
+        snapshot = snapshot or self.latest()
+        if snapshot is None:
+            return None
+        return self._load(snapshot)
+
+    # ---- retention -----------------------------------------------------
+
+    def _apply_retention(self):
+        keep = self.retention.keep(self._times)
+        if len(keep) == len(self._snapshots):
+            return
+        dropped = [s for i, s in enumerate(self._snapshots) if i not in keep]
+        self._snapshots = [s for i, s in enumerate(self._snapshots) if i in keep]
+        self._times = [s.ts for s in self._snapshots]
+        live_full = {s.base or s.hash for s in self._snapshots}
+        live_delta = {(s.base, s.hash) for s in self._snapshots if s.is_delta}
+        for snapshot in dropped:
+            if snapshot.is_delta:
+                if (snapshot.base, snapshot.hash) not in live_delta:
+                    self._delta_path(snapshot.base, snapshot.hash).unlink(missing_ok=True)
+                if snapshot.base not in live_full and snapshot.base != self._keyframe:
+                    self._full_path(snapshot.base).unlink(missing_ok=True)
+            elif snapshot.hash not in live_full and snapshot.hash != self._keyframe:
+                self._full_path(snapshot.hash).unlink(missing_ok=True)
+
+    def import_legacy(self, pattern: str = "state_*.json",
+                      accept: Optional[Callable[[Any], bool]] = None) -> int:
+        """One-time migration of per-file ``state_*.json`` backups into the ring.
+
+        Only files ``accept`` recognises (all, if None) are folded in and
+        deleted; the directory may hold other tools' files with the same
+        names. Files are imported oldest first with their own timestamps, so
+        the retention policy decides which survive. The manifest records the
+        migration, so later calls do nothing. Returns files removed.
+        """
+        if self.legacy_imported:
+            return 0
+        files = sorted(self.directory.glob(pattern))
+        removed = 0
+        for path in files:
+            try:
+                data = json.loads(path.read_text())
+                stamp = datetime.strptime(path.stem[len("state_"):], "%Y%m%d_%H%M%S")
+            except (OSError, json.JSONDecodeError, ValueError):
+                continue
+            if accept is not None and not accept(data):
+                continue
+            if isinstance(data, dict):
+                data = {k: v for k, v in data.items() if k not in ("timestamp", "backups_count")}
+            self.save(data, label=path.stem[len("state_"):], ts=stamp.timestamp())
+            path.unlink()
+            removed += 1
+        with self._lock:
+            self.legacy_imported = True
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._save_manifest()
+        return removed
@@ -0,0 +1,176 @@
+"""
+Indexes behind the agent's CuriosityQueue.
+
+- ``NearDuplicateIndex``: exact normalised-topic lookup plus MinHash/LSH over
+  character shingles, so "Adaptive memory for agents" and "Adaptive memory
+  for agent" merge instead of queueing twice.
+- ``PriorityHeap``: lazy-deletion max-heap of pending items for
+  ``get_next`` / ``get_mature``.
+"""
+
+import hashlib
+import heapq
+import random
+import re
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+_PRIME = (1 << 61) - 1
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_topic(topic: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(_NON_WORD.sub(" ", topic.lower()).split())
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """Character k-shingles of an already-normalised string."""
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    """Deterministic MinHash signatures (stable across runs)."""
+
+    def __init__(self, num_perm: int = 32, seed: int = 1):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, items: Set[str]) -> Tuple[int, ...]:
+        hashes = [_hash64(s) for s in items] or [0]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self.params)
+
+
+class NearDuplicateIndex:
+    """Find an indexed item whose topic is the same or nearly the same."""
+
+    def __init__(self, threshold: float = 0.75, num_perm: int = 32, bands: int = 8):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self._exact: Dict[str, str] = {}
+        self._shingles: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, Tuple[str, List[tuple]]] = {}
+        self._buckets: Dict[tuple, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[tuple]:
+        return [(b,) + signature[b * self.rows:(b + 1) * self.rows] for b in range(self.bands)]
+
+    def add(self, item_id: str, topic: str):
+        self.remove(item_id)
+        norm = normalize_topic(topic)
+        grams = shingles(norm)
+        band_keys = self._band_keys(self.hasher.signature(grams))
+        self._exact.setdefault(norm, item_id)
+        self._shingles[item_id] = grams
+        self._keys[item_id] = (norm, band_keys)
+        for key in band_keys:
+            self._buckets.setdefault(key, set()).add(item_id)
+
+    def remove(self, item_id: str):
+        entry = self._keys.pop(item_id, None)
+        if entry is None:
+            return
+        norm, band_keys = entry
+        if self._exact.get(norm) == item_id:
+            del self._exact[norm]
+            # Another indexed item may share the same normalised topic.
+            for other, (other_norm, _) in self._keys.items():
+                if other_norm == norm:
+                    self._exact[norm] = other
+                    break
+        self._shingles.pop(item_id, None)
+        for key in band_keys:
+            bucket = self._buckets.get(key)
+            if bucket:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def find(self, topic: str) -> Optional[str]:
+        """Return the id of the closest indexed near-duplicate, if any."""
+        norm = normalize_topic(topic)
+        if norm in self._exact:
+            return self._exact[norm]
+        grams = shingles(norm)
+        if not grams:
+            return None
+        candidates = set()
+        for key in self._band_keys(self.hasher.signature(grams)):
+            candidates |= self._buckets.get(key, set())
+
+        best, best_score = None, self.threshold
+        for candidate in candidates:
+            other = self._shingles[candidate]
+            score = len(grams & other) / len(grams | other)
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+
+class PriorityHeap:
+    """Max-heap of item ids by priority with lazy invalidation.
+
+    Ties go to the most recently added item, matching the queue's
+    newest-first order.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._live: Dict[str, tuple] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._live
+
+    def push(self, item_id: str, priority: int, order: Optional[int] = None):
+        """Insert or re-prioritise an item. ``order`` keeps its original age."""
+        if order is None:
+            self._seq += 1
+            order = self._seq
+        else:
+            self._seq = max(self._seq, order)
+        entry = (-priority, -order, item_id)
+        self._live[item_id] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._live) + 32:
+            self._heap = list(self._live.values())
+            heapq.heapify(self._heap)
+
+    def order_of(self, item_id: str) -> Optional[int]:
+        entry = self._live.get(item_id)
+        return -entry[1] if entry else None
+
+    def discard(self, item_id: str):
+        self._live.pop(item_id, None)
+
+    def _is_live(self, entry: tuple) -> bool:
+        return self._live.get(entry[2]) == entry
+
+    def peek(self, accept: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """Highest-priority live id, optionally the first one ``accept`` allows."""
+        skipped = []
+        found = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue  # stale entry: drop for good
+            skipped.append(entry)
+            if accept is None or accept(entry[2]):
+                found = entry[2]
+                break
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return found
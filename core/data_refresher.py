@@ -0,0 +1,104 @@
+"""
+Background data refresher for the TUI.
+
+Each source is a fetch callable with its own TTL. A single daemon thread
+refetches a source once it is older than its TTL *and* somebody has read it
+since the last fetch, so views that are not on screen cost nothing. Readers
+always get the last value immediately and never touch the disk themselves.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class _Source:
+    def __init__(self, fetch: Callable[[], Any], ttl: float, default: Any):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.value = default
+        self.fetched_at: Optional[float] = None
+        self.read_since_fetch = True  # fetch once at start-up
+
+
+class DataRefresher:
+    """Caches slow data sources and refreshes them off the draw thread."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._sources: Dict[str, _Source] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, fetch: Callable[[], Any], ttl: float, default: Any = None):
+        with self._lock:
+            self._sources[name] = _Source(fetch, ttl, default)
+        self._wake.set()
+
+    def get(self, name: str) -> Any:
+        """Last fetched value (or the default). Marks the source as in use."""
+        with self._lock:
+            source = self._sources[name]
+            source.read_since_fetch = True
+            stale = source.fetched_at is None or self.clock() - source.fetched_at >= source.ttl
+        if stale:
+            self._wake.set()
+        return source.value
+
+    def invalidate(self, name: str):
+        """Refetch ``name`` as soon as possible."""
+        with self._lock:
+            source = self._sources[name]
+            source.fetched_at = None
+            source.read_since_fetch = True
+        self._wake.set()
+
+    def _due(self, now: float) -> list:
+        with self._lock:
+            return [
+                (name, source) for name, source in self._sources.items()
+                if source.read_since_fetch
+                and (source.fetched_at is None or now - source.fetched_at >= source.ttl)
+            ]
+
+    def refresh_due(self) -> int:
+        """Fetch every due source now. Returns the number refreshed."""
+        due = self._due(self.clock())
+        for name, source in due:
+            try:
+                value = source.fetch()
+            except Exception:
+                value = source.value  # keep the last good value
+            with self._lock:
+                source.value = value
+                source.fetched_at = self.clock()
+                source.read_since_fetch = False
+        return len(due)
+
+    def _next_wait(self) -> Optional[float]:
+        now = self.clock()
+        with self._lock:
+            waits = [
+                max(0.0, source.fetched_at + source.ttl - now)
+                for source in self._sources.values()
+                if source.read_since_fetch and source.fetched_at is not None
+            ]
+        return min(waits) if waits else None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh_due()
+            self._wake.wait(self._next_wait())
+            self._wake.clear()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
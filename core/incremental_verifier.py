@@ -0,0 +1,319 @@
+"""
+Incremental test verification for the agent's wake cycle.
+
+Instead of running the whole suite several times per cycle, the verifier:
+- Snapshots source mtimes/sizes and diffs them against the last verified tree
+- Maps changed files to the tests that (transitively) import them, and
+  re-runs every test file whose last outcome was a failure
+- Runs only the affected test files in a single pytest process
+- Merges the outcome into a per-test-file ledger so unaffected tests keep
+  their last known status
+- Reuses the result while the tree is unchanged, so OBSERVE, DECIDE and
+  VERIFY share one run per cycle
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Directories never scanned for source files.
+SKIP_DIRS = {
+    ".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache",
+    ".venv", "venv", ".tox", ".nox", "memory", "node_modules",
+}
+
+# Changes to these files can affect every test, so they force a full run.
+FULL_RUN_FILES = {"conftest.py", "pyproject.toml", "setup.cfg", "pytest.ini", "requirements.txt"}
+FULL_RUN_DIRS = ("data/",)
+
+_FAILED_RE = re.compile(r"^FAILED\s+(\S+?\.py)(::\S+)?", re.MULTILINE)
+_ERROR_RE = re.compile(r"^ERROR\s+(\S+?\.py)(::\S+)?", re.MULTILINE)
+
+Fingerprint = Dict[str, Tuple[int, int]]
+Runner = Callable[[List[str]], Tuple[int, str]]
+
+
+@dataclass
+class VerificationResult:
+    """Aggregate test status for the current tree."""
+
+    returncode: int
+    output: str = ""
+    failed: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    selected: List[str] = field(default_factory=list)
+    full_run: bool = False
+    reused: bool = False
+    duration: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+    @property
+    def failed_files(self) -> Set[str]:
+        """Test files with at least one failing test or collection error."""
+        files = {nodeid.split("::", 1)[0] for nodeid in self.failed}
+        files.update(self.errors)
+        return files
+
+
+class ImportGraph:
+    """Reverse import graph over the project's Python files."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.modules: Dict[str, str] = {}          # dotted name -> rel path
+        self.imports: Dict[str, Set[str]] = {}     # rel path -> imported rel paths
+        self.dependents: Dict[str, Set[str]] = {}  # rel path -> importing rel paths
+
+    @staticmethod
+    def module_name(rel_path: str) -> str:
+        parts = rel_path[:-3].split("/")
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        return ".".join(parts)
+
+    def build(self, files: Iterable[str]) -> "ImportGraph":
+        files = sorted(files)
+        self.modules = {self.module_name(f): f for f in files}
+        self.imports = {f: self._resolve_imports(f) for f in files}
+        self.dependents = {f: set() for f in files}
+        for src, targets in self.imports.items():
+            for target in targets:
+                self.dependents.setdefault(target, set()).add(src)
+        return self
+
+    def _resolve_imports(self, rel_path: str) -> Set[str]:
+        try:
+            tree = ast.parse((self.root / rel_path).read_text(errors="replace"))
+        except (OSError, SyntaxError, ValueError):
+            return set()
+
+        package = self.module_name(rel_path)
+        if not rel_path.endswith("__init__.py"):
+            package = package.rpartition(".")[0]
+
+        names: Set[str] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    anchor = package.split(".") if package else []
+                    anchor = anchor[: len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                    base = ".".join(p for p in anchor + base.split(".") if p)
+                if base:
+                    names.add(base)
+                names.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+
+        resolved = set()
+        for name in names:
+            # Importing a.b.c also executes a and a.b.
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                target = self.modules.get(".".join(parts[:i]))
+                if target and target != rel_path:
+                    resolved.add(target)
+        return resolved
+
+    def affected_by(self, changed: Iterable[str]) -> Set[str]:
+        """Return every file that transitively imports one of ``changed``."""
+        seen = set(changed)
+        stack = list(seen)
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return seen
+
+
+def _default_runner(root: Path) -> Runner:
+    def run(targets: List[str]) -> Tuple[int, str]:
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", *targets, "-q", "--tb=short", "-rfE"],
+            capture_output=True, text=True, cwd=str(root),
+        )
+        return result.returncode, result.stdout + result.stderr
+    return run
+
+
+class IncrementalVerifier:
+    """Run only the tests affected by changes since the last verification."""
+
+    def __init__(self, root, test_dir: str = "tests", runner: Optional[Runner] = None):
+        self.root = Path(root)
+        self.test_dir = test_dir.rstrip("/")
+        self.runner = runner or _default_runner(self.root)
+        self._fingerprint: Optional[Fingerprint] = None
+        self._graph: Optional[ImportGraph] = None
+        self._outcomes: Dict[str, Tuple[List[str], bool]] = {}  # test file -> (failed ids, errored)
+        self._last: Optional[VerificationResult] = None
+        # OBSERVE runs verify() on a probe thread; later callers wait for it
+        # and then reuse its result.
+        self._lock = threading.Lock()
+
+    # ---- Tree inspection ----
+
+    def scan(self) -> Fingerprint:
+        """Stat every tracked source file. Cheap compared to a test run."""
+        fingerprint: Fingerprint = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+            rel_dir = os.path.relpath(dirpath, self.root)
+            for name in filenames:
+                if not (name.endswith(".py") or name in FULL_RUN_FILES
+                        or (rel_dir + "/").startswith(FULL_RUN_DIRS)):
+                    continue
+                rel = name if rel_dir == "." else f"{rel_dir}/{name}".replace(os.sep, "/")
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                fingerprint[rel] = (st.st_mtime_ns, st.st_size)
+        return fingerprint
+
+    @staticmethod
+    def diff(old: Fingerprint, new: Fingerprint) -> Set[str]:
+        changed = {path for path, sig in new.items() if old.get(path) != sig}
+        changed.update(path for path in old if path not in new)
+        return changed
+
+    def is_test_file(self, rel_path: str) -> bool:
+        name = rel_path.rsplit("/", 1)[-1]
+        return rel_path.startswith(self.test_dir + "/") and name.startswith("test_") and name.endswith(".py")
+
+    def _needs_full_run(self, changed: Set[str]) -> bool:
+        for path in changed:
+            if path.rsplit("/", 1)[-1] in FULL_RUN_FILES or path.startswith(FULL_RUN_DIRS):
+                return True
+        return False
+
+    def select_tests(self, changed: Set[str], graph: ImportGraph, old_graph: Optional[ImportGraph] = None) -> Set[str]:
+        """Map changed files to the test files that depend on them."""
+        affected = graph.affected_by(changed)
+        if old_graph is not None:
+            # Deleted or renamed modules break whatever used to import them.
+            affected |= old_graph.affected_by(changed)
+        return {
+            path for path in affected
+            if self.is_test_file(path) and (self.root / path).exists()
+        }
+
+    # ---- Verification ----
+
+    def verify(self, force_full: bool = False) -> VerificationResult:
+        """Return the test status of the current tree, running what changed."""
+        with self._lock:
+            return self._verify(force_full)
+
+    def _verify(self, force_full: bool) -> VerificationResult:
+        fingerprint = self.scan()
+        if not force_full and self._last is not None and fingerprint == self._fingerprint:
+            self._last.reused = True
+            return self._last
+
+        py_files = [p for p in fingerprint if p.endswith(".py")]
+        graph = ImportGraph(self.root).build(py_files)
+
+        full = force_full or self._fingerprint is None
+        changed: Set[str] = set()
+        if not full:
+            changed = self.diff(self._fingerprint, fingerprint)
+            full = self._needs_full_run(changed)
+
+        start = time.time()
+        if full:
+            targets = [self.test_dir]
+            returncode, output = self.runner(targets)
+            self._outcomes = {}
+            self._record(output, files=None)
+            selected = sorted(p for p in py_files if self.is_test_file(p))
+        else:
+            # Known failures are re-run on any change: the fix may not sit on
+            # an import edge (subprocess-launched modules, data files).
+            failing = {path for path, (failed, errored) in self._outcomes.items()
+                       if (failed or errored) and path in fingerprint and self.is_test_file(path)}
+            selected = sorted(self.select_tests(changed, graph, self._graph) | failing)
+            # Drop ledger entries for test files that no longer exist.
+            for gone in [p for p in self._outcomes if p not in fingerprint]:
+                del self._outcomes[gone]
+            if selected:
+                returncode, output = self.runner(selected)
+                self._record(output, files=selected)
+            else:
+                returncode, output = 0, ""
+
+        # Non-zero exit with nothing parseable (usage error, crash) is still a failure.
+        crashed = returncode not in (0, 1, 5) and not any(
+            failed or errored for failed, errored in self._outcomes.values()
+        )
+
+        self._fingerprint = fingerprint
+        self._graph = graph
+        self._last = self._aggregate(output, selected, full, crashed, time.time() - start)
+        return self._last
+
+    def _record(self, output: str, files: Optional[List[str]]):
+        if files is not None:
+            for path in files:
+                self._outcomes[path] = ([], False)
+        for match in _FAILED_RE.finditer(output):
+            path = match.group(1)
+            failed, errored = self._outcomes.setdefault(path, ([], False))
+            failed.append(path + (match.group(2) or ""))
+        for match in _ERROR_RE.finditer(output):
+            path = match.group(1)
+            failed, _ = self._outcomes.setdefault(path, ([], False))
+            self._outcomes[path] = (failed, True)
+
+    def _aggregate(self, output: str, selected: List[str], full: bool,
+                   crashed: bool, duration: float) -> VerificationResult:
+        failed = sorted(nodeid for ids, _ in self._outcomes.values() for nodeid in ids)
+        errors = sorted(path for path, (_, errored) in self._outcomes.items() if errored)
+        returncode = 1 if (failed or errors or crashed) else 0
+        return VerificationResult(
+            returncode=returncode,
+            output=output,
+            failed=failed,
+            errors=errors,
+            selected=selected,
+            full_run=full,
+            duration=duration,
+        )
+
+    def collect(self, timeout: Optional[float] = None) -> VerificationResult:
+        """Cheap status check: the last verification, else a collect-only pass.
+
+        Used outside the wake cycle (e.g. the ``health`` command), where a full
+        test run would be far too slow.
+        """
+        if self._last is not None:
+            return self._last
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", self.test_dir, "--co", "-q"],
+            capture_output=True, text=True, cwd=str(self.root), timeout=timeout,
+        )
+        output = result.stdout + result.stderr
+        errors = sorted({match.group(1) for match in _ERROR_RE.finditer(output)})
+        returncode = result.returncode if result.returncode not in (0, 5) or errors else 0
+        return VerificationResult(returncode=returncode, output=output, errors=errors)
+
+    def invalidate(self):
+        """Forget the baseline so the next ``verify`` runs the full suite."""
+        with self._lock:
+            self._fingerprint = None
+            self._graph = None
+            self._outcomes = {}
+            self._last = None
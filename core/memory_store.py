@@ -0,0 +1,408 @@
+"""
+SQLite storage engine for the memory/ directory.
+
+An optional alternative to the per-module JSON/JSONL files:
+- One database (``memory/memory.db``) in WAL mode, so the TUI and the agent
+  thread read concurrently without torn reads while a write is in progress
+- Record collections (assumptions, goals, integrations, taste rejections,
+  curiosity items) behind a small Repository interface with row-level
+  upserts and indexes on status, category and timestamp
+- Whole-document state (ikigai state, policy gate, goal history, curiosity
+  counters) in a key/value documents table
+- One-shot ``import``/``export`` to and from the current file formats
+
+Modules opt in by taking a ``store``; ``get_memory_store()`` returns the
+shared store only once the database exists, so the file formats stay the
+default until ``python -m core.memory_store import`` has been run. After that
+the files are no longer written. Readers that follow the store:
+AssumptionTracker, heartbeat_alerts.AlertEngine, TasteProfile, GoalGenerator,
+IntegrationManager, IkigaiEngine, CuriosityQueue and the curiosity-queue and
+taste-exporter skill scripts. No other reader opens these files; a new one
+must use the store too, or it will only see them as of the import
+(``python -m core.memory_store export`` writes them back out).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    status TEXT,
+    category TEXT,
+    ts TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (collection, key)
+);
+CREATE INDEX IF NOT EXISTS records_status ON records (collection, status);
+CREATE INDEX IF NOT EXISTS records_category ON records (collection, category);
+CREATE INDEX IF NOT EXISTS records_ts ON records (collection, ts);
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """Which record fields become the key and the indexed columns."""
+    key: str
+    status: Optional[str] = None
+    category: Optional[str] = None
+    ts: Optional[str] = None
+
+
+COLLECTIONS = {
+    "assumptions": CollectionSpec(key="id", status="status", category="category", ts="timestamp"),
+    "goals": CollectionSpec(key="id", status="status", category="category", ts="created_at"),
+    "integrations": CollectionSpec(key="name", status="status", category="category", ts="last_checked"),
+    "taste_rejections": CollectionSpec(key="fingerprint", category="category", ts="timestamp"),
+    "curiosity": CollectionSpec(key="id", status="status", ts="added_at"),
+}
+
+
+class Repository:
+    """Rows of one collection, stored as JSON and keyed by a string id."""
+
+    def __init__(self, store: "SQLiteMemoryStore", name: str, spec: CollectionSpec):
+        self.store = store
+        self.name = name
+        self.spec = spec
+
+    def _row(self, record: dict) -> tuple:
+        spec = self.spec
+
+        def col(field):
+            value = record.get(field) if field else None
+            return None if value is None else str(value)
+
+        return (self.name, str(record[spec.key]), col(spec.status), col(spec.category),
+                col(spec.ts), json.dumps(record))
+
+    def get(self, key: str) -> Optional[dict]:
+        row = self.store._conn().execute(
+            "SELECT data FROM records WHERE collection = ? AND key = ?", (self.name, key)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, record: dict):
+        self.put_many([record])
+
+    def put_many(self, records: Iterable[dict]):
+        """Insert or update rows in one transaction. Row order is kept on update."""
+        rows = [self._row(r) for r in records]
+        if not rows:
+            return
+        with self.store._write() as conn:
+            conn.executemany(
+                "INSERT INTO records (collection, key, status, category, ts, data)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (collection, key) DO UPDATE SET"
+                " status = excluded.status, category = excluded.category,"
+                " ts = excluded.ts, data = excluded.data",
+                rows,
+            )
+
+    def delete(self, key: str):
+        with self.store._write() as conn:
+            conn.execute("DELETE FROM records WHERE collection = ? AND key = ?", (self.name, key))
+
+    def replace_all(self, records: Iterable[dict]):
+        rows = [self._row(r) for r in records]
+        with self.store._write() as conn:
+            conn.execute("DELETE FROM records WHERE collection = ?", (self.name,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO records (collection, key, status, category, ts, data)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _where(self, status, exclude_status, category, since, until) -> tuple:
+        clauses = ["collection = ?"]
+        params: List[Any] = [self.name]
+        for column, op, value in (
+            ("status", "=", status), ("status", "!=", exclude_status),
+            ("category", "=", category), ("ts", ">=", since), ("ts", "<", until),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def query(self, status: Optional[str] = None, category: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              exclude_status: Optional[str] = None, limit: Optional[int] = None,
+              newest_first: bool = False) -> List[dict]:
+        """Rows matching every given filter, in timestamp (then insertion) order.
+
+        ``since``/``until`` compare ISO timestamps as strings: since <= ts < until.
+        """
+        where, params = self._where(status, exclude_status, category, since, until)
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT data FROM records WHERE {where} ORDER BY ts {order}, rowid {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row[0]) for row in self.store._conn().execute(sql, params)]
+
+    def all(self) -> List[dict]:
+        return self.query()
+
+    def count(self, status: Optional[str] = None, category: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              exclude_status: Optional[str] = None) -> int:
+        where, params = self._where(status, exclude_status, category, since, until)
+        return self.store._conn().execute(f"SELECT COUNT(*) FROM records WHERE {where}", params).fetchone()[0]
+
+    def group_count(self, *fields: str, since: Optional[str] = None) -> Dict[Any, int]:
+        """Count rows per value of JSON field(s); keys are tuples for several fields."""
+        where, params = self._where(None, None, None, since, None)
+        columns = ", ".join("json_extract(data, ?)" for _ in fields)
+        groups = ", ".join(str(i + 1) for i in range(len(fields)))
+        rows = self.store._conn().execute(
+            f"SELECT {columns}, COUNT(*) FROM records WHERE {where} GROUP BY {groups}",
+            [*(f"$.{field}" for field in fields), *params],
+        )
+        if len(fields) == 1:
+            return {value: count for value, count in rows}
+        return {tuple(row[:-1]): row[-1] for row in rows}
+
+
+class SQLiteMemoryStore:
+    """WAL-mode SQLite database with one connection per thread."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._repos: Dict[str, Repository] = {}
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self):
+        """One IMMEDIATE transaction; writers in this process queue on a lock."""
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def collection(self, name: str) -> Repository:
+        if name not in self._repos:
+            self._repos[name] = Repository(self, name, COLLECTIONS[name])
+        return self._repos[name]
+
+    def get_document(self, name: str, default: Any = None) -> Any:
+        row = self._conn().execute("SELECT data FROM documents WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def put_document(self, name: str, data: Any):
+        with self._write() as conn:
+            conn.execute(
+                "INSERT INTO documents (name, data, updated_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET data = excluded.data,"
+                " updated_at = excluded.updated_at",
+                (name, json.dumps(data), datetime.now().isoformat()),
+            )
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_store: Optional[SQLiteMemoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_memory_store(path: Optional[Path] = None) -> Optional[SQLiteMemoryStore]:
+    """The shared store if the database exists, else None (use the files)."""
+    global _store
+    if path is None:
+        from config import MEMORY_DB_FILE
+        path = MEMORY_DB_FILE
+    path = Path(path)
+    if not path.exists():
+        return None
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = SQLiteMemoryStore(path)
+        return _store
+
+
+# ---- one-shot conversion ----------------------------------------------------
+
+def _read_json(path: Path, default: Any) -> Any:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return default
+
+
+def _read_jsonl(path: Path) -> List[dict]:
+    records = []
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+    except OSError:
+        pass
+    return records
+
+
+def import_files(store: SQLiteMemoryStore, memory_dir: Path) -> Dict[str, int]:
+    """Load the current memory/ files into ``store``. Returns rows per collection."""
+    memory_dir = Path(memory_dir)
+    counts = {}
+
+    assumptions = _read_json(memory_dir / "assumptions.json", {}).get("assumptions", [])
+    store.collection("assumptions").replace_all(assumptions)
+    counts["assumptions"] = len(assumptions)
+
+    goals = _read_json(memory_dir / "goals.json", {})
+    store.collection("goals").replace_all(goals.get("goals", []))
+    store.put_document("goals.history", goals.get("history", []))
+    counts["goals"] = len(goals.get("goals", []))
+
+    for name in ("ikigai_state", "policy_gate"):
+        data = _read_json(memory_dir / f"{name}.json", None)
+        if data is not None:
+            store.put_document(name, data)
+
+    modules = _read_json(memory_dir / "integrations.json", {}).get("modules", {})
+    store.collection("integrations").replace_all(modules.values())
+    counts["integrations"] = len(modules)
+
+    rejections = _read_jsonl(memory_dir / "taste_rejections.jsonl")
+    store.collection("taste_rejections").replace_all(rejections)
+    counts["taste_rejections"] = len(rejections)
+
+    curiosity = _read_json(memory_dir / "curiosity_queue.json", {})
+    archived = _read_jsonl(memory_dir / "curiosity_archive.jsonl")
+    # The queue file is newest-first; rows are kept oldest-first.
+    items = archived + list(reversed(curiosity.get("queue", [])))
+    store.collection("curiosity").replace_all(items)
+    store.put_document("curiosity.meta", {
+        "explored_count": curiosity.get("explored_count", 0),
+        "total_discovered": curiosity.get("total_discovered", 0),
+    })
+    counts["curiosity"] = len(items)
+    return counts
+
+
+def _write_json(path: Path, data: Any):
+    from core.persistence import atomic_write_json
+    atomic_write_json(path, data)
+
+
+def _write_jsonl(path: Path, records: Iterable[dict]):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    tmp.replace(path)
+
+
+def export_files(store: SQLiteMemoryStore, memory_dir: Path) -> Dict[str, int]:
+    """Write ``store`` back out in the current memory/ file formats."""
+    memory_dir = Path(memory_dir)
+    memory_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now().isoformat()
+    counts = {}
+
+    assumptions = store.collection("assumptions").all()
+    _write_json(memory_dir / "assumptions.json", {"assumptions": assumptions, "last_updated": now})
+    counts["assumptions"] = len(assumptions)
+
+    goals = store.collection("goals").all()
+    _write_json(memory_dir / "goals.json", {
+        "goals": goals,
+        "history": store.get_document("goals.history", []),
+        "updated_at": now,
+    })
+    counts["goals"] = len(goals)
+
+    for name in ("ikigai_state", "policy_gate"):
+        data = store.get_document(name)
+        if data is not None:
+            _write_json(memory_dir / f"{name}.json", data)
+
+    modules = store.collection("integrations").all()
+    _write_json(memory_dir / "integrations.json", {
+        "modules": {m["name"]: m for m in modules},
+        "updated_at": now,
+    })
+    counts["integrations"] = len(modules)
+
+    rejections = store.collection("taste_rejections").all()
+    _write_jsonl(memory_dir / "taste_rejections.jsonl", rejections)
+    counts["taste_rejections"] = len(rejections)
+
+    curiosity = store.collection("curiosity")
+    meta = store.get_document("curiosity.meta", {})
+    queue = curiosity.query(exclude_status="explored", newest_first=True)
+    _write_json(memory_dir / "curiosity_queue.json", {
+        "queue": queue,
+        "explored_count": meta.get("explored_count", 0),
+        "total_discovered": meta.get("total_discovered", 0),
+        "updated_at": now,
+    })
+    archived = curiosity.query(status="explored")
+    _write_jsonl(memory_dir / "curiosity_archive.jsonl", archived)
+    counts["curiosity"] = len(queue) + len(archived)
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from config import MEMORY_DB_FILE, MEMORY_DIR
+
+    parser = argparse.ArgumentParser(description="Convert memory/ files to and from SQLite")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("--db", default=str(MEMORY_DB_FILE), help="Database path")
+    parser.add_argument("--dir", default=str(MEMORY_DIR), help="memory/ directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "export" and not Path(args.db).exists():
+        parser.error(f"no database at {args.db}")
+    store = SQLiteMemoryStore(Path(args.db))
+    convert = import_files if args.command == "import" else export_files
+    counts = convert(store, Path(args.dir))
+    store.close()
+    for name, count in counts.items():
+        print(f"{name}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
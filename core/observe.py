@@ -0,0 +1,120 @@
+"""
+Concurrent probes for the wake cycle's OBSERVE phase.
+
+Disk, git and test probes are independent, so they run at the same time on
+a small thread pool and the phase takes as long as the slowest probe:
+- Each probe gets its own TimeoutBudget; one that overruns reports a
+  timeout instead of holding up the cycle
+- Disk space comes from ``shutil.disk_usage`` rather than forking ``df``
+- Git state comes from one ``git status`` per cycle (no shell, no ``wc``)
+  with the probe's remaining budget as its timeout; today's commit count
+  is recomputed only when HEAD moves
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from clawgotchi.resilience.timeout_budget import TimeoutBudget
+
+# Not tied to an event loop: the agent calls asyncio.run() once per cycle,
+# and a probe that overran its budget must not block the loop's shutdown.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="observe")
+
+Probe = Callable[["TimeoutBudget"], Any]
+
+
+@dataclass
+class ProbeResult:
+    name: str
+    value: Any = None
+    ok: bool = False
+    elapsed_ms: int = 0
+    error: Optional[str] = None
+
+
+def disk_usage_mb(path: Path) -> dict:
+    usage = shutil.disk_usage(path)
+    return {"used_mb": usage.used // (1024 * 1024), "available_mb": usage.free // (1024 * 1024)}
+
+
+def _git(repo: Path, args: list, timeout: float) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=str(repo), capture_output=True, text=True, timeout=timeout,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+
+# (repo, since, HEAD oid) -> commits since ``since``; HEAD rarely moves between
+# cycles, so the count is only recomputed when it does.
+_COMMIT_COUNTS: Dict[Tuple[str, str, str], int] = {}
+
+
+def git_snapshot(repo: Path, budget: "TimeoutBudget", since: Optional[str] = None) -> dict:
+    """Working-tree state and today's commit count for ``repo``.
+
+    One ``git status --porcelain=v2 --branch`` gives both the dirty flag
+    and the HEAD commit; ``rev-list --count`` runs only when HEAD (or the
+    day) changed since the last snapshot.
+    """
+    since = since or datetime.now().strftime("%Y-%m-%d")
+    status = _git(repo, ["status", "--porcelain=v2", "--branch"], max(budget.remaining_ms(), 1) / 1000)
+    head = ""
+    dirty = False
+    for line in status.splitlines():
+        if line.startswith("# branch.oid "):
+            head = line[len("# branch.oid "):].strip()
+        elif line and not line.startswith("#"):
+            dirty = True
+    if head in ("", "(initial)"):
+        return {"dirty": dirty, "commits_today": 0}
+    key = (str(repo), since, head)
+    if key not in _COMMIT_COUNTS:
+        # A bare date means "that day at the current time"; anchor it at midnight.
+        count = _git(repo, ["rev-list", "--count", f"--since={since} 00:00:00", head],
+                     max(budget.remaining_ms(), 1) / 1000)
+        if len(_COMMIT_COUNTS) > 64:
+            _COMMIT_COUNTS.clear()
+        _COMMIT_COUNTS[key] = int(count.strip() or 0)
+    return {"dirty": dirty, "commits_today": _COMMIT_COUNTS[key]}
+
+
+async def run_probes(probes: Dict[str, Tuple[Probe, int]]) -> Dict[str, ProbeResult]:
+    """Run ``{name: (probe, budget_ms)}`` concurrently and collect the results."""
+    # Imported here: asyncio is already loaded by the caller's event loop, and
+    # the agent (which imports this module) imports clawgotchi lazily.
+    import asyncio
+
+    from clawgotchi.resilience.timeout_budget import BudgetCategory, TimeoutBudget
+
+    loop = asyncio.get_running_loop()
+
+    async def run(name: str, probe: Probe, budget_ms: int) -> ProbeResult:
+        budget = TimeoutBudget(default_budget_ms=budget_ms, category=BudgetCategory.FILE_IO)
+        budget.reset()
+        start = time.monotonic()
+        result = ProbeResult(name)
+        try:
+            result.value = await asyncio.wait_for(
+                loop.run_in_executor(_EXECUTOR, probe, budget), timeout=budget_ms / 1000
+            )
+            result.ok = True
+        except asyncio.TimeoutError:
+            result.error = f"timed out after {budget_ms}ms"
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        result.elapsed_ms = int((time.monotonic() - start) * 1000)
+        return result
+
+    results = await asyncio.gather(*(run(name, probe, ms) for name, (probe, ms) in probes.items()))
+    return {result.name: result for result in results}
@@ -0,0 +1,157 @@
+"""
+Write-coalescing persistence for the agent's JSON state files.
+
+AgentState, CuriosityQueue, Beliefs and ResourceMonitor used to rewrite
+their whole file on every ``save()``. They now share a PersistenceManager:
+- ``save()`` only marks the object dirty
+- Dirty objects are written on a leading-edge debounce, or all at once when
+  a ``phase()`` block ends or ``flush()`` is called. A save held back by
+  the debounce arms a one-shot timer, so it lands within ``debounce``
+  seconds even if nothing else is saved
+- Every write goes to a temp file in the same directory, is fsynced and then
+  renamed over the target, so a crash never leaves half-written JSON
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+def atomic_write_json(path: Path, data: Any, compact: bool = False):
+    """Write ``data`` as JSON to ``path`` via temp file + fsync + rename."""
+    if compact:
+        text = json.dumps(data, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=2)
+    atomic_write_text(path, text)
+
+
+def atomic_write_text(path: Path, text: str):
+    """Write ``text`` to ``path`` via temp file + fsync + rename."""
+    _atomic_write(path, "w", text)
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write ``data`` to ``path`` via temp file + fsync + rename."""
+    _atomic_write(path, "wb", data)
+
+
+def _atomic_write(path: Path, mode: str, payload):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class PersistenceManager:
+    """Tracks dirty state objects and coalesces their writes.
+
+    An object takes part by implementing ``flush()``, which writes it if it
+    has unsaved changes. ``debounce=0`` makes every ``mark_dirty`` a
+    write-through. ``timer(delay, fn)`` builds the trailing-flush timer; it
+    must return an object with ``start()`` and ``cancel()``.
+    """
+
+    def __init__(self, debounce: float = 0.0, compact: bool = False,
+                 clock: Callable[[], float] = time.monotonic,
+                 timer: Callable[[float, Callable[[], None]], Any] = threading.Timer):
+        self.debounce = debounce
+        self.compact = compact
+        self.clock = clock
+        self.timer = timer
+        self._dirty: Dict[int, Any] = {}
+        self._depth = 0
+        self._last_flush = float("-inf")
+        self._pending_timer: Optional[Any] = None
+        self._lock = threading.RLock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    def write_json(self, path: Path, data: Any):
+        atomic_write_json(path, data, compact=self.compact)
+
+    def mark_dirty(self, obj: Any):
+        """Schedule ``obj`` for writing; write now if the debounce allows."""
+        with self._lock:
+            self._dirty[id(obj)] = obj
+            if self._depth:
+                return  # written when the phase ends
+            wait = self.debounce - (self.clock() - self._last_flush)
+            if wait <= 0:
+                self.flush()
+            elif self._pending_timer is None:
+                self._arm(wait)
+
+    def _arm(self, delay: float):
+        def fire():
+            with self._lock:
+                if self._pending_timer is not timer:
+                    return  # cancelled by a flush that got the lock first
+                self._pending_timer = None
+                if self._depth:
+                    return
+                try:
+                    self.flush()
+                except Exception:
+                    pass  # still dirty; retried on the next save or flush
+
+        timer = self.timer(delay, fire)
+        if isinstance(timer, threading.Thread):
+            timer.daemon = True
+        self._pending_timer = timer
+        timer.start()
+
+    def _cancel_timer(self):
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+
+    def flush(self) -> int:
+        """Write every dirty object now. Returns the number written."""
+        with self._lock:
+            self._cancel_timer()
+            written = 0
+            while self._dirty:
+                key = next(iter(self._dirty))
+                obj = self._dirty.pop(key)
+                try:
+                    obj.flush()
+                except BaseException:
+                    self._dirty[key] = obj
+                    raise
+                written += 1
+            self._last_flush = self.clock()
+            return written
+
+    @contextmanager
+    def phase(self):
+        """Hold every write inside the block and flush once at the end."""
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if not self._depth:
+                    self.flush()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 """Clawgotchi pet state — Pwnagotchi-style faces driven by live activity."""
 
-import json
 import random
 import time
 from datetime import datetime
@@ -10,30 +9,34 @@ from pathlib import Path
 from core.lifetime import get_stats as get_lifetime_stats
 from typing import Optional
 
+from core import art_cache
 from core.ascii_cats import get_cat_for_emotion, get_fallback_cat, CatArt
-from config import DATA_DIR
-
-# ── Load ASCII mood animations from generated JSON ───────────────────────────
-
-ASCII_MOODS: dict[str, list[list[str]]] = {}  # emotion -> list of frames (each frame = list[str])
-ASCII_MOODS_COLORED: dict[str, list[list[str]]] = {}  # emotion -> colored frames (ANSI escapes)
-ASCII_MOODS_DURATIONS: dict[str, list[float]] = {}  # emotion -> per-frame duration in seconds
-_ascii_moods_file = DATA_DIR / "ascii_moods.json"
-if _ascii_moods_file.exists():
-    try:
-        _data = json.loads(_ascii_moods_file.read_text())
-        for _name, _info in _data.get("moods", {}).items():
-            _frames = [f["lines"] for f in _info.get("frames", []) if f.get("lines")]
-            _colored = [f["colored_lines"] for f in _info.get("frames", []) if f.get("colored_lines")]
-            _durations = [f.get("duration_ms", 100) / 1000.0 for f in _info.get("frames", [])]
-            if _frames:
-                ASCII_MOODS[_name] = _frames
-            if _colored:
-                ASCII_MOODS_COLORED[_name] = _colored
-            if _durations:
-                ASCII_MOODS_DURATIONS[_name] = _durations
-    except Exception:
-        pass
+
+# ── ASCII mood animations, precompiled from data/ascii_moods.json ───────────
+
+# ASCII_MOODS: emotion -> frames (each frame = tuple of lines)
+# ASCII_MOODS_COLORED: the same with ANSI escapes
+# ASCII_MOODS_DURATIONS: emotion -> seconds per frame
+# Built from the compiled art on first use, not at import (see __getattr__).
+_MOOD_TABLES = ("ASCII_MOODS", "ASCII_MOODS_COLORED", "ASCII_MOODS_DURATIONS")
+
+
+def _mood_table(name: str) -> dict:
+    table = globals().get(name)
+    if table is None:
+        moods = art_cache.get().moods
+        tables = globals()
+        tables.setdefault("ASCII_MOODS", {k: m.frames for k, m in moods.items() if m.frames})
+        tables.setdefault("ASCII_MOODS_COLORED", {k: m.colored for k, m in moods.items() if m.colored})
+        tables.setdefault("ASCII_MOODS_DURATIONS", {k: m.durations for k, m in moods.items() if m.durations})
+        table = tables[name]
+    return table
+
+
+def __getattr__(name):
+    if name in _MOOD_TABLES:
+        return _mood_table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ── Animated faces with multiple frames ─────────────────────────────────────
 
@@ -372,14 +375,14 @@ class PetState:
 
         # Update animation frame — use GIF durations when available
         now = time.time()
-        gif_durations = ASCII_MOODS_DURATIONS.get(self.face_key)
+        gif_durations = _mood_table("ASCII_MOODS_DURATIONS").get(self.face_key)
         if gif_durations:
             cur_duration = gif_durations[self._anim_frame % len(gif_durations)]
             interval = max(cur_duration, 0.03)  # floor at 30ms
         else:
             interval = ANIMATION_INTERVALS.get(self.face_key, 0.5)
         if now - self._last_anim_time >= interval:
-            ascii_frames = ASCII_MOODS.get(self.face_key)
+            ascii_frames = _mood_table("ASCII_MOODS").get(self.face_key)
             frame_count = len(ascii_frames) if ascii_frames else len(FACES.get(self.face_key, ["(⌐■_■)"]))
             self._anim_frame = (self._anim_frame + 1) % frame_count
             self._last_anim_time = now
@@ -420,20 +423,21 @@ class PetState:
         self.quip = random.choice(QUIPS["proud"])
         self._quip_cooldown = 12.0
 
-    def get_face_lines(self, colored: bool = True) -> list[str] | None:
+    def get_face_lines(self, colored: bool = True, width: int | None = None) -> tuple[str, ...] | None:
         """Multi-line ASCII art for current emotion, or None for fallback.
 
         If colored=True and colored frames exist, returns lines with ANSI
-        escape sequences for truecolor rendering.
+        escape sequences for truecolor rendering. With a ``width`` the
+        lines come centred for a bordered row of that width (memoised).
         """
-        if colored:
-            cframes = ASCII_MOODS_COLORED.get(self.face_key)
-            if cframes:
-                return cframes[self._anim_frame % len(cframes)]
-        frames = ASCII_MOODS.get(self.face_key)
+        colored = colored and self.face_key in _mood_table("ASCII_MOODS_COLORED")
+        frames = _mood_table("ASCII_MOODS_COLORED" if colored else "ASCII_MOODS").get(self.face_key)
         if not frames:
             return None
-        return frames[self._anim_frame % len(frames)]
+        index = self._anim_frame % len(frames)
+        if width is None:
+            return frames[index]
+        return art_cache.centered_frame(self.face_key, index, width, colored)
 
     def get_face(self) -> str:
         frames = FACES.get(self.face_key, ["(⌐■_■)"])
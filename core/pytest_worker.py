@@ -0,0 +1,275 @@
+"""
+Persistent pytest worker pool.
+
+Each worker is a long-lived ``python -m core.pytest_worker`` process that keeps
+project and test modules imported between requests. Before serving a request
+it drops only the modules whose source changed (plus everything that imports
+them), and it caches collected node ids per test file so collect-only
+requests for unchanged files never touch pytest.
+
+Protocol: one JSON object per line over the worker's stdin/stdout.
+    {"op": "collect", "targets": [...]} -> {"returncode", "nodeids", "output"}
+    {"op": "run", "targets": [...]}     -> {"returncode", "output"}
+    {"op": "ping"} / {"op": "shutdown"}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.incremental_verifier import ImportGraph, IncrementalVerifier
+
+RUN_ARGS = ["-q", "--tb=short", "-rfE", "-p", "no:cacheprovider"]
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+class WorkerError(Exception):
+    """Raised when a worker dies, times out or answers garbage."""
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+class _WorkerState:
+    """Module and collection caches that live inside one worker process."""
+
+    def __init__(self, root: Path, test_dir: str = "tests"):
+        self.root = root
+        self.scanner = IncrementalVerifier(root, test_dir=test_dir, runner=lambda t: (0, ""))
+        self.fingerprint: Dict[str, Tuple[int, int]] = {}
+        self.graph: Optional[ImportGraph] = None
+        self.collected: Dict[str, Tuple[tuple, List[str]]] = {}  # test file -> (dep signature, node ids)
+
+    def refresh(self):
+        """Drop modules whose source (or any import) changed since last request."""
+        fingerprint = self.scanner.scan()
+        changed = self.scanner.diff(self.fingerprint, fingerprint) if self.fingerprint else set()
+        if self.graph is None or changed:
+            self.graph = ImportGraph(self.root).build(p for p in fingerprint if p.endswith(".py"))
+        self.fingerprint = fingerprint
+        if not changed:
+            return
+
+        stale = {str(self.root / p) for p in self.graph.affected_by(changed)}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if path and os.path.abspath(path) in stale and name != __name__:
+                del sys.modules[name]
+
+    def _signature(self, test_file: str) -> tuple:
+        deps, stack = {test_file}, [test_file]
+        while stack:
+            for dep in self.graph.imports.get(stack.pop(), ()):
+                if dep not in deps:
+                    deps.add(dep)
+                    stack.append(dep)
+        return tuple(sorted((d, self.fingerprint.get(d)) for d in deps))
+
+    def _expand(self, targets: List[str]) -> List[str]:
+        files = []
+        for target in targets:
+            target = target.rstrip("/")
+            for path in sorted(self.fingerprint):
+                if self.scanner.is_test_file(path) and (path == target or path.startswith(target + "/")):
+                    files.append(path)
+        return files
+
+    def collect(self, targets: List[str]) -> dict:
+        files = self._expand(targets)
+        stale = [f for f in files if self.collected.get(f, (None,))[0] != self._signature(f)]
+        output, returncode = "", 0
+        if stale:
+            returncode, output = _pytest(["--collect-only", "-q", *stale])
+            by_file: Dict[str, List[str]] = {f: [] for f in stale}
+            for line in output.splitlines():
+                path = line.split("::", 1)[0]
+                if "::" in line and path in by_file:
+                    by_file[path].append(line.strip())
+            if returncode in (0, 5):
+                for path, nodeids in by_file.items():
+                    self.collected[path] = (self._signature(path), nodeids)
+            else:
+                for path in stale:
+                    self.collected.pop(path, None)
+        nodeids = [n for f in files for n in self.collected.get(f, (None, []))[1]]
+        return {"returncode": returncode, "nodeids": nodeids, "output": output}
+
+    def run(self, targets: List[str]) -> dict:
+        returncode, output = _pytest([*targets, *RUN_ARGS])
+        return {"returncode": returncode, "output": output}
+
+
+def _pytest(args: List[str]) -> Tuple[int, str]:
+    import pytest
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            returncode = int(pytest.main(list(args)))
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            buffer.write(f"\nworker error: {e!r}\n")
+            returncode = 3
+    return returncode, buffer.getvalue()
+
+
+def serve(root: Path):
+    # Keep the protocol channel private: anything a test prints to fd 1
+    # (including child processes) must not corrupt the response stream.
+    channel = os.fdopen(os.dup(1), "w", buffering=1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+
+    os.chdir(root)
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    state = _WorkerState(root)
+
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        op = request.get("op")
+        if op == "shutdown":
+            break
+        try:
+            state.refresh()
+            if op == "collect":
+                response = state.collect(request.get("targets") or ["tests"])
+            elif op == "run":
+                response = state.run(request.get("targets") or ["tests"])
+            else:
+                response = {"returncode": 0, "output": "pong"}
+        except Exception as e:
+            response = {"returncode": 3, "output": f"worker error: {e!r}"}
+        channel.write(json.dumps(response) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+class _Worker:
+    def __init__(self, root: Path):
+        self.requests = 0
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(_PACKAGE_ROOT), env.get("PYTHONPATH")) if p
+        )
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "core.pytest_worker", str(root)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            cwd=str(root), env=env, text=True, bufsize=1,
+        )
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, payload: dict, timeout: float) -> dict:
+        self.requests += 1
+        try:
+            self.proc.stdin.write(json.dumps(payload) + "\n")
+            self.proc.stdin.flush()
+            line = self._lines.get(timeout=timeout)
+        except (OSError, queue.Empty) as e:
+            raise WorkerError(f"worker did not answer: {e!r}")
+        if line is None:
+            raise WorkerError("worker exited")
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise WorkerError(f"bad worker response: {line[:80]!r}")
+
+    def close(self):
+        if self.alive():
+            try:
+                self.proc.stdin.write(json.dumps({"op": "shutdown"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=5)
+            except Exception:
+                self.proc.kill()
+
+
+class PytestWorkerPool:
+    """Pool of warm pytest workers shared by the agent's test call sites."""
+
+    def __init__(self, root, size: int = 1, timeout: float = 900, max_requests: int = 50):
+        self.root = Path(root)
+        self.size = size
+        self.timeout = timeout
+        self.max_requests = max_requests  # recycle to shed state leaked by tests
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            while len(self._workers) < self.size:
+                worker = _Worker(self.root)
+                self._workers.append(worker)
+                self._idle.put(worker)
+
+    def shutdown(self):
+        with self._lock:
+            for worker in self._workers:
+                worker.close()
+            self._workers = []
+            self._idle = queue.Queue()
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.close()
+        fresh = _Worker(self.root)
+        with self._lock:
+            if worker in self._workers:
+                self._workers[self._workers.index(worker)] = fresh
+        return fresh
+
+    def request(self, payload: dict) -> dict:
+        if not self._workers:
+            raise WorkerError("pool not started")
+        worker = self._idle.get(timeout=self.timeout)
+        try:
+            if not worker.alive() or worker.requests >= self.max_requests:
+                worker = self._replace(worker)
+            try:
+                return worker.request(payload, self.timeout)
+            except WorkerError:
+                worker = self._replace(worker)
+                raise
+        finally:
+            self._idle.put(worker)
+
+    def collect(self, targets: Optional[List[str]] = None) -> Tuple[int, List[str], str]:
+        response = self.request({"op": "collect", "targets": targets or ["tests"]})
+        return response["returncode"], response.get("nodeids", []), response.get("output", "")
+
+    def run(self, targets: Optional[List[str]] = None) -> Tuple[int, str]:
+        response = self.request({"op": "run", "targets": targets or ["tests"]})
+        return response["returncode"], response.get("output", "")
+
+    def run_all(self) -> Tuple[int, str]:
+        return self.run(["tests"])
+
+
+if __name__ == "__main__":
+    serve(Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve())
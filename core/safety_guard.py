@@ -50,16 +50,42 @@ class SafetyGuard:
         r"\brm\s+-rf\b",
     ]
 
+    # Literals at least one of which must appear (lowercased) for the pattern
+    # at the same index to match. Clean ASCII text is ruled out by substring
+    # checks alone; the regex only runs for a pattern whose anchor is present.
+    # Non-ASCII text runs every pattern, since IGNORECASE folds some non-ASCII
+    # letters onto ASCII ones.
+    INJECTION_ANCHORS = [
+        ("ignore",),
+        ("disregard",),
+        ("system:",),
+        ("developer:",),
+        ("reveal",),
+        ("exfiltrat", "dump"),
+        ("run",),
+        ("rm",),
+    ]
+
     def __init__(self, project_root: str, allow_high_risk: bool = False):
         self.project_root = Path(project_root).resolve()
         self.allow_high_risk = allow_high_risk
-        self._compiled_patterns = [re.compile(p, re.IGNORECASE) for p in self.INJECTION_PATTERNS]
+        self._compiled_patterns = [
+            (anchors, re.compile(p, re.IGNORECASE))
+            for p, anchors in zip(self.INJECTION_PATTERNS, self.INJECTION_ANCHORS)
+        ]
 
     def is_prompt_injection_like(self, text: str) -> bool:
         """Detect obvious instruction-injection payloads."""
         if not text:
             return False
-        return any(p.search(text) for p in self._compiled_patterns)
+        if not text.isascii():
+            return any(pattern.search(text) for _, pattern in self._compiled_patterns)
+        lowered = text.lower()
+        return any(
+            pattern.search(text)
+            for anchors, pattern in self._compiled_patterns
+            if any(anchor in lowered for anchor in anchors)
+        )
 
     def sanitize_untrusted_text(self, text: str) -> str:
         """Drop lines that look like instruction injection."""
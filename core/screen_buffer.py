@@ -0,0 +1,134 @@
+"""
+Retained-mode screen buffer for the blessed TUI.
+
+``draw`` hands over a whole frame as ``{row: rendered line}``. The buffer
+splits each line into cells (text + active SGR style + display width),
+compares them with what is already on screen and writes only the changed
+span of each changed row. An idle frame writes nothing at all.
+
+A resize, or an explicit ``invalidate()``, forces one full repaint. Rows
+that did not change since an earlier frame are not parsed again.
+"""
+
+import functools
+from typing import Dict, List, Optional, Tuple
+
+from core.text_layout import ESCAPE as _ESCAPE, wcwidth
+
+Cell = Tuple[str, str, int]  # (style, text, width)
+
+
+def parse_cells(line: str) -> Tuple[List[Cell], bool]:
+    """Split a rendered line into cells.
+
+    Returns (cells, exact). ``exact`` is False when the line contains
+    zero-width modifiers (emoji variation selectors, ZWJ) whose on-screen
+    width terminals disagree about; such rows are repainted from column 0.
+    """
+    cells: List[Cell] = []
+    style = ""
+    exact = True
+    pos = 0
+    for match in _ESCAPE.finditer(line + "\x1b[m"):
+        for ch in line[pos:match.start()]:
+            width = wcwidth(ch)
+            if width == 0 and cells:
+                prev_style, prev_text, prev_width = cells[-1]
+                cells[-1] = (prev_style, prev_text + ch, prev_width)
+                exact = False
+                continue
+            cells.append((style, ch, 1 if width < 0 else max(width, 1)))
+        seq = match.group()
+        pos = match.end()
+        if seq.endswith("m"):
+            params = seq[2:-1]
+            style = "" if params in ("", "0") else style + seq
+    return cells, exact
+
+
+# Most rows are identical from one frame to the next; their cells are
+# shared between frames and never mutated.
+_cached_cells = functools.lru_cache(maxsize=1024)(parse_cells)
+
+
+class ScreenBuffer:
+    """Diffs successive frames and emits only the cells that changed."""
+
+    def __init__(self, term, write=None):
+        self.term = term
+        self._write = write
+        self._rows: Dict[int, List[Cell]] = {}
+        self._size: Optional[Tuple[int, int]] = None
+
+    def invalidate(self):
+        """Forget what is on screen; the next frame is a full repaint."""
+        self._rows = {}
+        self._size = None
+
+    def _emit(self, cells: List[Cell]) -> str:
+        normal = self.term.normal
+        parts = [normal]
+        style = ""
+        for cell_style, text, _ in cells:
+            if cell_style != style:
+                parts.append(normal + cell_style)
+                style = cell_style
+            parts.append(text)
+        parts.append(normal)
+        return "".join(parts)
+
+    def _diff_row(self, row: int, old: Optional[List[Cell]], new: List[Cell], exact: bool) -> str:
+        if old == new:
+            return ""
+        if old is None or not exact:
+            return self.term.move(row, 0) + self._emit(new) + self.term.clear_eol
+
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+
+        old_width = sum(c[2] for c in old)
+        new_width = sum(c[2] for c in new)
+        end = len(new)
+        if old_width == new_width:
+            # Same row width: unchanged trailing cells sit in the same columns.
+            k = 0
+            while k < limit - start and old[-1 - k] == new[-1 - k]:
+                k += 1
+            end = len(new) - k
+
+        col = sum(c[2] for c in new[:start])
+        out = self.term.move(row, col) + self._emit(new[start:end])
+        if new_width < old_width:
+            out += self.term.clear_eol
+        return out
+
+    def render(self, rows: Dict[int, str]) -> str:
+        """Return the escape string that turns the last frame into ``rows``."""
+        size = (self.term.height, self.term.width)
+        out = []
+        if size != self._size:
+            self._rows = {}
+            self._size = size
+            out.append(self.term.normal + self.term.clear)
+
+        new_rows: Dict[int, List[Cell]] = {}
+        for row in sorted(rows):
+            cells, exact = _cached_cells(rows[row])
+            new_rows[row] = cells
+            out.append(self._diff_row(row, self._rows.get(row), cells, exact))
+        for row in self._rows.keys() - new_rows.keys():
+            out.append(self.term.move(row, 0) + self.term.normal + self.term.clear_eol)
+        self._rows = new_rows
+        return "".join(out)
+
+    def flush(self, rows: Dict[int, str]) -> int:
+        """Write the diff for ``rows`` and return the number of bytes written."""
+        diff = self.render(rows)
+        if diff:
+            if self._write is not None:
+                self._write(diff)
+            else:
+                print(diff, end="", flush=True)
+        return len(diff)
@@ -0,0 +1,95 @@
+"""
+Startup profiling behind ``clawgotchi_cli.py --profile-startup``.
+
+- ``phase(name)`` times one initialisation step; it does nothing unless
+  ``enable()`` was called, so call sites stay in the normal startup path
+- ``profile_startup(script)`` runs the CLI's startup (up to and including
+  the first frame, then the background warm-up) in a child interpreter
+  under ``-X importtime`` and turns that into a report: the slowest
+  imports by cumulative time, every timed phase, and time to first frame
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+CHILD_FLAG = "--profile-startup-child"
+
+_PHASES: Optional[List[Tuple[str, float]]] = None
+
+
+def enable():
+    global _PHASES
+    _PHASES = []
+
+
+def phases() -> List[Tuple[str, float]]:
+    """(name, seconds) for every phase finished since ``enable()``."""
+    return list(_PHASES or [])
+
+
+@contextmanager
+def phase(name: str):
+    if _PHASES is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _PHASES.append((name, time.perf_counter() - start))
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # the header row
+        rows.append((parts[2].strip(), self_us, cumulative_us))
+    return rows
+
+
+def emit_child_report(first_frame_s: float):
+    """Last line of the child's stdout: what the parent needs."""
+    print(json.dumps({"phases": phases(), "first_frame": first_frame_s}))
+
+
+def profile_startup(script: Path, limit: int = 15, timeout: float = 120) -> str:
+    """Run ``script`` with ``CHILD_FLAG`` under ``-X importtime``; return the report."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script), CHILD_FLAG],
+        capture_output=True, text=True, timeout=timeout,
+    )
+    lines = proc.stdout.strip().splitlines()
+    try:
+        child = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        return f"Startup profile failed (exit {proc.returncode}):\n{tail}"
+
+    imports = parse_importtime(proc.stderr)
+    total_us = sum(self_us for _, self_us, _ in imports)
+    out = [f"Imports: {len(imports)} modules, {total_us / 1000:.1f} ms", ""]
+    out.append(f"  {'cumulative':>10}  {'self':>8}  module")
+    for name, self_us, cumulative_us in sorted(imports, key=lambda r: -r[2])[:limit]:
+        out.append(f"  {cumulative_us / 1000:8.1f}ms  {self_us / 1000:6.1f}ms  {name}")
+    out += ["", "Init phases:"]
+    for name, seconds in child["phases"]:
+        out.append(f"  {seconds * 1000:8.1f}ms  {name}")
+    out += ["", f"Time to first frame: {child['first_frame'] * 1000:.1f} ms"
+                " (from the start of clawgotchi_cli's imports)"]
+    return "\n".join(out)
@@ -0,0 +1,91 @@
+"""
+Visible-width and padding primitives for the TUI.
+
+draw() rebuilds every row on every frame, and padding a row to the border
+needs its width on screen. These helpers keep that off the regex engine:
+- ``visible_width`` strips escape sequences with one precompiled pattern
+  and measures the rest with wcwidth, so wide emoji and CJK count two
+  columns and combining marks none. Plain ASCII is measured with ``len``.
+  Everything else is LRU-cached per string, so an unchanged row costs one
+  dict lookup
+- ``Segments`` assembles a styled line from pieces, adding up their widths
+  as they are appended, so the finished line is never parsed again
+- ``bordered_row`` pads content between two border strings and is
+  memoised, so an unchanged row comes back without building any strings
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import List, Optional
+
+try:
+    from wcwidth import wcswidth, wcwidth  # installed with blessed
+except ImportError:  # pragma: no cover
+    def wcwidth(ch: str) -> int:
+        return 1
+
+    def wcswidth(text: str) -> int:
+        return len(text)
+
+# CSI sequences (colours, cursor moves) and charset selection (blessed's
+# ``normal`` is "\x1b(B\x1b[m" on xterm).
+ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]|\x1b[()][0-9A-Za-z]")
+
+
+def strip_escapes(text: str) -> str:
+    return ESCAPE.sub("", text) if "\x1b" in text else text
+
+
+def visible_width(text: str) -> int:
+    """Terminal columns ``text`` occupies, ignoring escape sequences."""
+    if text.isascii() and "\x1b" not in text:
+        return len(text)
+    return _measure(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _measure(text: str) -> int:
+    text = strip_escapes(text)
+    if text.isascii():
+        return len(text)
+    width = wcswidth(text)
+    if width < 0:  # a non-printable character; count the rest
+        width = sum(max(wcwidth(ch), 0) for ch in text)
+    return width
+
+
+class Segments:
+    """A styled line built from pieces whose widths are summed on append."""
+
+    __slots__ = ("_parts", "width")
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self.width = 0
+
+    def style(self, *codes: str) -> "Segments":
+        """Append escape sequences (zero width)."""
+        self._parts.extend(codes)
+        return self
+
+    def text(self, text: str, width: Optional[int] = None) -> "Segments":
+        """Append visible text; pass ``width`` when it is already known."""
+        self._parts.append(text)
+        self.width += visible_width(text) if width is None else width
+        return self
+
+    def __str__(self) -> str:
+        return "".join(self._parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def bordered_row(content: str, w: int, left: str, right: str, width: Optional[int] = None) -> str:
+    """``left + content + right``, padded with spaces to ``w`` columns.
+
+    ``left`` and ``right`` are one visible column each. ``width`` is the
+    visible width of ``content`` when the caller already has it.
+    """
+    vis = visible_width(content) if width is None else width
+    return left + content + " " * max(0, w - 2 - vis) + right
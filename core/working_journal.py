@@ -0,0 +1,156 @@
+"""
+Append-only journal for memory/WORKING.md.
+
+The wake cycle used to read the whole of WORKING.md, add one entry and write
+the file back. The journal instead:
+- Keeps one O_APPEND handle open and writes each entry as a single append
+- Batches fsyncs (every N entries or every T seconds, and on ``sync()``)
+- Once the file grows past ``max_bytes``, moves all but the newest
+  ``keep_entries`` wake-cycle sections into a dated segment under
+  ``memory/working/`` and atomically rewrites WORKING.md as preamble + tail,
+  so WORKING.md itself stays a small "current" view. The segments are
+  searched through cognition.memory_index
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+HEADER = "# WORKING.md\n"
+SEGMENT_DIR = "working"  # under the directory holding WORKING.md
+SEGMENT_GLOB = "WORKING-*.md"
+
+_ENTRY_START = re.compile(r"(?m)^(?=## Wake Cycle )")
+
+
+def split_entries(text: str) -> Tuple[str, List[str]]:
+    """Split WORKING.md text into (preamble, [wake-cycle sections])."""
+    parts = _ENTRY_START.split(text)
+    return parts[0], parts[1:]
+
+
+class WorkingJournal:
+    """Appends wake-cycle entries to WORKING.md and rotates old ones out."""
+
+    def __init__(
+        self,
+        path: Path,
+        segment_dir: Optional[Path] = None,
+        max_bytes: int = 64 * 1024,
+        keep_entries: int = 20,
+        fsync_every: int = 8,
+        fsync_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], str] = lambda: datetime.now().strftime("%Y-%m-%d"),
+    ):
+        self.path = Path(path)
+        self.segment_dir = Path(segment_dir) if segment_dir else self.path.parent / SEGMENT_DIR
+        self.max_bytes = max_bytes
+        self.keep_entries = keep_entries
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.clock = clock
+        self.today = today
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._unsynced = 0
+        self._last_sync = clock()
+
+    # ---- writing -------------------------------------------------------
+
+    def _open(self) -> int:
+        """Return the append handle, reopening if the file was replaced."""
+        if self._fd is not None:
+            try:
+                if os.stat(self.path).st_ino == os.fstat(self._fd).st_ino:
+                    return self._fd
+            except OSError:
+                pass
+            self._close_fd()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size == 0:
+            os.write(self._fd, HEADER.encode())
+        return self._fd
+
+    def _close_fd(self):
+        if self._fd is not None:
+            try:
+                if self._unsynced:
+                    os.fsync(self._fd)
+            except OSError:
+                pass
+            os.close(self._fd)
+            self._fd = None
+            self._unsynced = 0
+
+    def append(self, entry: str):
+        """Append one entry (normally a ``## Wake Cycle`` section)."""
+        if not entry.endswith("\n"):
+            entry += "\n"
+        with self._lock:
+            fd = self._open()
+            os.write(fd, entry.encode())
+            self._unsynced += 1
+            now = self.clock()
+            if self._unsynced >= self.fsync_every or now - self._last_sync >= self.fsync_interval:
+                self._fsync(fd, now)
+            if os.fstat(fd).st_size > self.max_bytes:
+                self._rotate()
+
+    def _fsync(self, fd: int, now: float):
+        os.fsync(fd)
+        self._unsynced = 0
+        self._last_sync = now
+
+    def sync(self):
+        """Flush batched entries to disk."""
+        with self._lock:
+            if self._fd is not None and self._unsynced:
+                self._fsync(self._fd, self.clock())
+
+    def close(self):
+        with self._lock:
+            self._close_fd()
+
+    # ---- rotation ------------------------------------------------------
+
+    def rotate(self) -> int:
+        """Move old entries into today's segment. Returns entries moved."""
+        with self._lock:
+            return self._rotate()
+
+    def _rotate(self) -> int:
+        try:
+            text = self.path.read_text()
+        except OSError:
+            return 0
+        preamble, entries = split_entries(text)
+        if len(entries) <= self.keep_entries:
+            return 0
+        cut = len(entries) - self.keep_entries
+        old, kept = entries[:cut], entries[cut:]
+
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        segment = self.segment_dir / f"WORKING-{self.today()}.md"
+        with open(segment, "a") as f:
+            if f.tell() == 0:
+                f.write(f"# WORKING.md archive ({self.today()})\n\n")
+            f.write("".join(old))
+            f.flush()
+            os.fsync(f.fileno())
+
+        tmp = self.path.with_suffix(".md.tmp")
+        with open(tmp, "w") as f:
+            f.write(preamble + "".join(kept))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._close_fd()  # the old handle points at the replaced inode
+        return cut
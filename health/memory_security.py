@@ -9,13 +9,14 @@ Inspired by kuro_noir's post: "Memory is an attack surface"
 This scanner helps identify what secrets might be leaking through memory.
 """
 
-import re
 import json
 import os
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
+from utils.secret_scanner import scanner_for
+
 
 @dataclass
 class SecurityFinding:
@@ -74,6 +75,7 @@ class MemorySecurityScanner:
     
     def __post_init__(self):
         self.memory_path = Path(self.memory_dir)
+        self.scanner = scanner_for(tuple(p for p, _, _ in SECRET_PATTERNS))
     
     def scan_file(self, file_path: Path) -> list[SecurityFinding]:
         """Scan a single file for security findings."""
@@ -97,26 +99,24 @@ class MemorySecurityScanner:
         findings = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    for pattern, name, severity in SECRET_PATTERNS:
-                        try:
-                            matches = re.finditer(pattern, line)
-                            for match in matches:
-                                # Extract the full line for context
-                                snippet = line.strip()[:100]
-                                findings.append(SecurityFinding(
-                                    file_path=str(file_path),
-                                    line_number=line_num,
-                                    finding_type=name,
-                                    severity=severity,
-                                    snippet=snippet,
-                                    recommendation=self._get_recommendation(name, severity)
-                                ))
-                        except re.error:
-                            continue
+            scan = self.scanner.scan_file(file_path)
         except (IOError, UnicodeDecodeError):
-            pass
+            return findings
+        
+        for hit in scan.hits:
+            # Extract the full line for context
+            snippet = hit.text.strip()[:100]
+            for index in hit.patterns:
+                _, name, severity = SECRET_PATTERNS[index]
+                for _match in self.scanner.compiled[index].finditer(hit.text):
+                    findings.append(SecurityFinding(
+                        file_path=str(file_path),
+                        line_number=hit.line,
+                        finding_type=name,
+                        severity=severity,
+                        snippet=snippet,
+                        recommendation=self._get_recommendation(name, severity)
+                    ))
         
         return findings
     
@@ -132,9 +132,8 @@ class MemorySecurityScanner:
                 # Convert to string for pattern matching
                 content_str = json.dumps(data)
                 
-                for pattern, name, severity in SECRET_PATTERNS:
-                    matches = re.finditer(pattern, content_str)
-                    for match in matches:
+                for regex, (_, name, severity) in zip(self.scanner.compiled, SECRET_PATTERNS):
+                    for match in regex.finditer(content_str):
                         # Get context around match
                         start = max(0, match.start() - 20)
                         end = min(len(content_str), match.end() + 20)
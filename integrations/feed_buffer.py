@@ -0,0 +1,126 @@
+"""Bounded, timestamp-ordered feed storage for the OpenClaw watcher.
+
+- ``FeedBuffer`` is a fixed-capacity ring buffer kept in timestamp order.
+  Items almost always arrive newest-last, so insertion walks back only as far
+  as the item is out of order, and reading the newest N is O(N).
+- ``RateWindow`` counts events in a sliding time window; expired timestamps
+  are dropped from the left, so a rate query is amortised O(1).
+- ``SeenKeys`` is an LRU-ordered dedupe set that evicts the least recently
+  seen key instead of arbitrary ones.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Callable, Iterable
+
+
+def _insert_sorted(items: deque, value, key: Callable = lambda x: x) -> bool:
+    """Insert into a deque sorted by ``key``, scanning from the newest end.
+
+    Returns False (and does nothing) if ``value`` sorts before a full deque.
+    """
+    k = key(value)
+    if not items or key(items[-1]) <= k:
+        if items.maxlen is not None and len(items) == items.maxlen:
+            items.popleft()
+        items.append(value)
+        return True
+    if items.maxlen is not None and len(items) == items.maxlen:
+        if k < key(items[0]):
+            return False  # older than everything we keep
+        items.popleft()
+    pos = len(items)
+    for existing in reversed(items):
+        if key(existing) <= k:
+            break
+        pos -= 1
+    items.insert(pos, value)
+    return True
+
+
+class FeedBuffer:
+    """Thread-safe ring buffer of feed items ordered by ``timestamp``."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._items: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.version = 0  # bumped on every insert, lets readers skip unchanged frames
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item) -> bool:
+        with self._lock:
+            added = _insert_sorted(self._items, item, key=lambda x: x.timestamp)
+            if added:
+                self.version += 1
+            return added
+
+    def latest(self, count: int) -> list:
+        """The newest ``count`` items, oldest first."""
+        with self._lock:
+            newest = list(islice(reversed(self._items), count))
+        newest.reverse()
+        return newest
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return list(self._items)
+
+
+class RateWindow:
+    """Number of events whose timestamp falls in the last ``window`` seconds."""
+
+    def __init__(self, window: float, clock: Callable[[], float] = time.time):
+        self.window = window
+        self.clock = clock
+        self._times: deque = deque()
+        self._lock = threading.Lock()
+
+    def add(self, timestamp: float):
+        with self._lock:
+            if timestamp > self.clock() - self.window:
+                _insert_sorted(self._times, timestamp)
+
+    def extend(self, timestamps: Iterable[float]):
+        for ts in timestamps:
+            self.add(ts)
+
+    def count(self) -> int:
+        cutoff = self.clock() - self.window
+        with self._lock:
+            while self._times and self._times[0] <= cutoff:
+                self._times.popleft()
+            return len(self._times)
+
+    def per_minute(self) -> float:
+        return (self.count() / self.window) * 60 if self.window > 0 else 0.0
+
+
+class SeenKeys:
+    """Dedupe set that forgets the least recently seen keys first."""
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self._keys: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def add(self, key) -> bool:
+        """Record ``key``. Returns True if it had not been seen."""
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+        return True
@@ -0,0 +1,237 @@
+"""Directory change notifications — inotify where available, polling otherwise.
+
+- ``FileWatcher`` runs one event loop for any number of watched directories
+  and calls ``callback(name)`` with the name of the file that changed, or
+  ``callback(None)`` when the watcher lost track (queue overflow, directory
+  recreated) and the consumer should rescan.
+- On Linux it blocks on an inotify descriptor (via ctypes, no extra
+  dependency), so an idle watcher does not wake up at all.
+- Elsewhere, or if inotify is unavailable, it falls back to comparing
+  ``scandir`` snapshots every ``poll_interval`` seconds.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT = struct.Struct("iIII")
+
+Event = Tuple[Path, Optional[str]]  # (directory, file name or None = rescan)
+
+
+class _Inotify:
+    """Minimal inotify binding: one descriptor, one watch per directory."""
+
+    mode = "inotify"
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is Linux-only")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._dirs: Dict[int, Path] = {}
+
+    def add(self, directory: Path) -> bool:
+        wd = self._add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dirs[wd] = directory
+        return True
+
+    def wait(self, timeout: Optional[float]) -> Tuple[List[Event], List[Path]]:
+        """Block until events arrive. Returns (events, directories lost)."""
+        ready, _, _ = select.select([self.fd, self._wake_r], [], [], timeout)
+        if self._wake_r in ready:
+            try:
+                os.read(self._wake_r, 512)
+            except BlockingIOError:
+                pass
+        if self.fd not in ready:
+            return [], []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return [], []
+
+        events: List[Event] = []
+        lost: List[Path] = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            raw = data[offset + _EVENT.size: offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                events.extend((d, None) for d in self._dirs.values())
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._dirs[wd]
+                lost.append(directory)
+                continue
+            name = raw.rstrip(b"\0")
+            if name:
+                events.append((directory, os.fsdecode(name)))
+        return events, lost
+
+    def wake(self):
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    def close(self):
+        for fd in (self.fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class _Poller:
+    """Fallback: diff ``scandir`` snapshots of each directory."""
+
+    mode = "poll"
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._snapshots: Dict[Path, Dict[str, tuple]] = {}
+        self._wake = threading.Event()
+
+    @staticmethod
+    def _snapshot(directory: Path) -> Dict[str, tuple]:
+        snapshot = {}
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return snapshot
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            snapshot[entry.name] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return snapshot
+
+    def add(self, directory: Path) -> bool:
+        self._snapshots[directory] = self._snapshot(directory)
+        return True
+
+    def wait(self, timeout: Optional[float]) -> Tuple[List[Event], List[Path]]:
+        delay = self.interval if timeout is None else min(timeout, self.interval)
+        self._wake.wait(delay)
+        self._wake.clear()
+        events: List[Event] = []
+        for directory, old in self._snapshots.items():
+            new = self._snapshot(directory)
+            for name in old.keys() | new.keys():
+                if old.get(name) != new.get(name):
+                    events.append((directory, name))
+            self._snapshots[directory] = new
+        return events, []
+
+    def wake(self):
+        self._wake.set()
+
+    def close(self):
+        self._wake.set()
+
+
+class FileWatcher:
+    """One event loop delivering per-file change callbacks for watched directories."""
+
+    def __init__(self, poll_interval: float = 2.0, retry_interval: float = 30.0,
+                 use_inotify: bool = True):
+        self.retry_interval = retry_interval
+        self._backend = None
+        if use_inotify:
+            try:
+                self._backend = _Inotify()
+            except (OSError, AttributeError):
+                self._backend = None
+        if self._backend is None:
+            self._backend = _Poller(poll_interval)
+        self._callbacks: Dict[Path, List[Callable[[Optional[str]], None]]] = {}
+        self._pending: Set[Path] = set()
+
+    @property
+    def mode(self) -> str:
+        return self._backend.mode
+
+    def watch(self, directory, callback: Callable[[Optional[str]], None]):
+        """Call ``callback(name)`` whenever a file in ``directory`` changes.
+
+        A directory that does not exist yet is retried every
+        ``retry_interval`` seconds; ``callback(None)`` fires once it appears.
+        """
+        directory = Path(directory)
+        first = directory not in self._callbacks
+        self._callbacks.setdefault(directory, []).append(callback)
+        if first and not self._backend.add(directory):
+            self._pending.add(directory)
+
+    def _retry_pending(self) -> List[Event]:
+        found = [d for d in self._pending if self._backend.add(d)]
+        self._pending.difference_update(found)
+        return [(d, None) for d in found]
+
+    def poll_once(self, timeout: Optional[float] = None) -> int:
+        """Wait for one batch of changes and dispatch it. Returns callbacks fired."""
+        events = self._retry_pending()
+        if not events:
+            if self._pending:
+                timeout = self.retry_interval if timeout is None else min(timeout, self.retry_interval)
+            events, lost = self._backend.wait(timeout)
+            for directory in lost:
+                self._pending.add(directory)
+            events.extend(self._retry_pending())
+
+        fired = 0
+        for directory, name in dict.fromkeys(events):  # coalesce bursts, keep order
+            for callback in self._callbacks.get(directory, ()):
+                try:
+                    callback(name)
+                except OSError:
+                    continue
+                fired += 1
+        return fired
+
+    def run(self, stop: threading.Event):
+        """Dispatch changes until ``stop`` is set (call ``wake()`` after setting it)."""
+        while not stop.is_set():
+            self.poll_once()
+
+    def wake(self):
+        """Interrupt a blocked ``poll_once`` / ``run``."""
+        self._backend.wake()
+
+    def close(self):
+        self._backend.close()
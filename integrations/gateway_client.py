@@ -0,0 +1,346 @@
+"""OpenClaw gateway client — one persistent connection for status and chat.
+
+- ``LineChannel`` speaks line-delimited JSON over any byte stream:
+  requests are ``{"id", "method", "params"}`` and responses
+  ``{"id", "result"}`` or ``{"id", "error"}``. A reader thread routes each
+  response to its waiting caller by id, so status polls and chat sends
+  are multiplexed over the same connection.
+- ``GatewayClient`` (re)connects lazily with exponential backoff. While the
+  gateway is down, calls fail fast instead of re-dialling on every poll.
+- The endpoint is the socket at ``$OPENCLAW_GATEWAY_SOCKET`` (default
+  ``~/.openclaw/gateway.sock``) or, if ``$OPENCLAW_GATEWAY_CMD`` is set, one
+  long-lived process speaking the same protocol on stdin/stdout.
+- With neither (a stock install) the client falls back to the ``openclaw``
+  CLI, one process per call. ``transport`` reports which mode is in use so
+  the TUI can say so, and status calls through the CLI are throttled to one
+  per ``CLI_STATUS_INTERVAL`` with the last answer reused in between.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import re
+import shlex
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from config import OPENCLAW_GATEWAY_SOCKET
+
+CONNECT_TIMEOUT = 3.0
+STATUS_TIMEOUT = 10.0
+AGENT_TIMEOUT = 120.0
+CLI_STATUS_INTERVAL = 60.0  # seconds between forked status calls in fallback mode
+
+SOCKET_ENV = "OPENCLAW_GATEWAY_SOCKET"
+COMMAND_ENV = "OPENCLAW_GATEWAY_CMD"
+
+TRANSPORT_PERSISTENT = "persistent"
+TRANSPORT_CLI = "cli"
+
+
+class GatewayError(Exception):
+    """Raised when the gateway cannot be reached or answers with an error."""
+
+
+class GatewayUnavailable(GatewayError):
+    """No persistent gateway endpoint exists on this host."""
+
+
+class LineChannel:
+    """Multiplexed line-delimited JSON request/response channel."""
+
+    def __init__(self, reader, writer, close: Optional[Callable[[], None]] = None):
+        self._reader = reader
+        self._writer = writer
+        self._close = close
+        self._ids = itertools.count(1)
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, dict] = {}
+        self._pending_lock = threading.Lock()
+        self.alive = True
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+    def _read_loop(self):
+        try:
+            for line in self._reader:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                with self._pending_lock:
+                    slot = self._pending.get(message.get("id"))
+                if slot is not None:
+                    slot["response"] = message
+                    slot["event"].set()
+        except (OSError, ValueError):
+            pass
+        self._fail_all()
+
+    def _fail_all(self):
+        self.alive = False
+        with self._pending_lock:
+            slots = list(self._pending.values())
+        for slot in slots:
+            slot["event"].set()
+
+    def call(self, method: str, params: Optional[dict] = None, timeout: float = STATUS_TIMEOUT):
+        if not self.alive:
+            raise GatewayError("connection closed")
+        request_id = next(self._ids)
+        slot = {"event": threading.Event(), "response": None}
+        with self._pending_lock:
+            self._pending[request_id] = slot
+        try:
+            payload = json.dumps({"id": request_id, "method": method, "params": params or {}})
+            try:
+                with self._write_lock:
+                    self._writer.write(payload.encode() + b"\n")
+                    self._writer.flush()
+            except (OSError, ValueError) as e:
+                self._fail_all()
+                raise GatewayError(f"send failed: {e}")
+            if not slot["event"].wait(timeout):
+                raise GatewayError(f"{method} timed out after {timeout}s")
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        response = slot["response"]
+        if response is None:
+            raise GatewayError("connection closed")
+        if response.get("error"):
+            error = response["error"]
+            raise GatewayError(error.get("message", str(error)) if isinstance(error, dict) else str(error))
+        return response.get("result")
+
+    def close(self):
+        self.alive = False
+        if self._close:
+            try:
+                self._close()
+            except OSError:
+                pass
+
+
+def connect_unix(path: Path = OPENCLAW_GATEWAY_SOCKET, timeout: float = CONNECT_TIMEOUT) -> LineChannel:
+    """Open a channel to the gateway's local socket."""
+    if not Path(path).exists():
+        raise GatewayUnavailable(f"no gateway socket at {path}")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except OSError as e:
+        sock.close()
+        raise GatewayError(f"connect failed: {e}")
+    sock.settimeout(None)
+    reader, writer = sock.makefile("rb"), sock.makefile("wb")
+
+    def close():
+        for step in (lambda: sock.shutdown(socket.SHUT_RDWR),  # unblocks the reader
+                     reader.close, writer.close, sock.close):
+            try:
+                step()
+            except OSError:
+                pass
+
+    return LineChannel(reader, writer, close)
+
+
+def connect_process(argv: list) -> LineChannel:
+    """Start ``argv`` and open a channel over its stdin/stdout."""
+    try:
+        proc = subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, bufsize=0)
+    except OSError as e:
+        raise GatewayError(f"could not start {argv[0]}: {e}")
+
+    def close():
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        for stream in (proc.stdin, proc.stdout):
+            stream.close()
+
+    return LineChannel(proc.stdout, proc.stdin, close)
+
+
+def connect_default() -> LineChannel:
+    """The configured persistent endpoint: socket first, then command."""
+    path = Path(os.environ.get(SOCKET_ENV) or OPENCLAW_GATEWAY_SOCKET)
+    if path.exists():
+        return connect_unix(path)
+    command = os.environ.get(COMMAND_ENV, "").strip()
+    if command:
+        return connect_process(shlex.split(command))
+    raise GatewayUnavailable(f"no gateway socket at {path} and ${COMMAND_ENV} is not set")
+
+
+def _strip_ansi(text: str) -> str:
+    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+
+
+class GatewayClient:
+    """Shared gateway connection with reconnect/backoff and a CLI fallback."""
+
+    def __init__(self, connect: Callable[[], LineChannel] = connect_default,
+                 min_backoff: float = 1.0, max_backoff: float = 60.0,
+                 cli_fallback: bool = True, clock: Callable[[], float] = time.monotonic):
+        self._connect = connect
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.cli_fallback = cli_fallback
+        self.clock = clock
+        self._channel: Optional[LineChannel] = None
+        self._lock = threading.Lock()
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        # Which path the last call took: TRANSPORT_PERSISTENT, TRANSPORT_CLI or None
+        self.transport: Optional[str] = None
+        self._cli_status_at: Optional[float] = None
+        self._cli_status_result = None  # dict, or the GatewayError it raised
+
+    def _get_channel(self) -> LineChannel:
+        with self._lock:
+            if self._channel is not None and self._channel.alive:
+                return self._channel
+            if self.clock() < self._retry_at:
+                raise GatewayError(f"gateway unreachable, retrying in {self._retry_at - self.clock():.0f}s")
+            try:
+                self._channel = self._connect()
+            except GatewayUnavailable:
+                raise  # nothing to dial; callers fall back without waiting
+            except GatewayError:
+                self._backoff = min(self.max_backoff, max(self.min_backoff, self._backoff * 2))
+                self._retry_at = self.clock() + self._backoff
+                raise
+            self._backoff = 0.0
+            return self._channel
+
+    def call(self, method: str, params: Optional[dict] = None, timeout: float = STATUS_TIMEOUT):
+        """Send one request over the persistent connection."""
+        channel = self._get_channel()
+        self.transport = TRANSPORT_PERSISTENT
+        try:
+            return channel.call(method, params, timeout)
+        except GatewayError:
+            if not channel.alive:
+                with self._lock:
+                    if self._channel is channel:
+                        self._channel = None
+            raise
+
+    def status(self) -> dict:
+        """Gateway status dict (same shape as ``openclaw gateway call status --json``)."""
+        try:
+            result = self.call("status", timeout=STATUS_TIMEOUT)
+        except GatewayUnavailable:
+            if not self.cli_fallback:
+                raise
+            return self._throttled_cli_status()
+        if not isinstance(result, dict):
+            raise GatewayError("unexpected status payload")
+        return result
+
+    def send_agent_message(self, message: str, agent: str = "main",
+                           timeout: float = AGENT_TIMEOUT) -> Optional[str]:
+        """Send a chat message to an agent and return its reply text, if any."""
+        try:
+            result = self.call("agent", {"agentId": agent, "message": message}, timeout=timeout)
+        except GatewayUnavailable:
+            if not self.cli_fallback:
+                raise
+            self.transport = TRANSPORT_CLI
+            return self._cli_agent(message, agent, timeout)
+        return _reply_text(result)
+
+    def close(self):
+        with self._lock:
+            if self._channel is not None:
+                self._channel.close()
+                self._channel = None
+
+    # ── Legacy CLI fallback ──────────────────────────────────────────────
+
+    def _throttled_cli_status(self) -> dict:
+        """``_cli_status`` at most once per CLI_STATUS_INTERVAL; the last
+        answer (or error) is returned in between."""
+        self.transport = TRANSPORT_CLI
+        now = self.clock()
+        if self._cli_status_at is None or now - self._cli_status_at >= CLI_STATUS_INTERVAL:
+            self._cli_status_at = now
+            try:
+                self._cli_status_result = self._cli_status()
+            except GatewayError as e:
+                self._cli_status_result = e
+        if isinstance(self._cli_status_result, GatewayError):
+            raise self._cli_status_result
+        return self._cli_status_result
+
+    @staticmethod
+    def _cli_status() -> dict:
+        try:
+            result = subprocess.run(
+                ["openclaw", "gateway", "call", "status", "--json", "--timeout", "3000"],
+                capture_output=True, text=True, timeout=10,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+            raise GatewayError(f"openclaw CLI failed: {e}")
+        if result.returncode != 0:
+            raise GatewayError(f"openclaw CLI exited {result.returncode}")
+        raw = _strip_ansi(result.stdout)
+        idx = raw.find("{")
+        if idx < 0:
+            raise GatewayError("no JSON in openclaw output")
+        try:
+            return json.loads(raw[idx:])
+        except ValueError as e:
+            raise GatewayError(f"bad status JSON: {e}")
+
+    @staticmethod
+    def _cli_agent(message: str, agent: str, timeout: float) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                ["openclaw", "agent", "--agent", agent, "-m", message, "--json"],
+                capture_output=True, text=True, timeout=timeout,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+            raise GatewayError(f"openclaw CLI failed: {e}")
+        if result.returncode != 0:
+            raise GatewayError(f"openclaw CLI exited {result.returncode}")
+        try:
+            reply = _reply_text(json.loads(result.stdout))
+        except ValueError:
+            reply = None
+        return reply or result.stdout.strip() or None
+
+
+def _reply_text(result) -> Optional[str]:
+    if isinstance(result, str):
+        return result or None
+    if isinstance(result, dict):
+        return result.get("reply") or result.get("response") or result.get("text")
+    return None
+
+
+_CLIENT: Optional[GatewayClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_gateway_client() -> GatewayClient:
+    """Process-wide client shared by the watcher and the TUI chat."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = GatewayClient()
+        return _CLIENT
@@ -0,0 +1,94 @@
+"""Multi-keyword matching for relevance scoring.
+
+``KeywordMatcher`` is built once from labelled keyword sets and reports every
+keyword occurring anywhere in a text (substring semantics, like ``kw in text``)
+in one call:
+- Keywords shared between sets are searched for once; each maps back to every
+  label that listed it, so one call yields the hits for every category, the
+  noise list, or anything else the caller groups
+- Large keyword sets are compiled into a trie-shaped regex inside a lookahead
+  (an Aho-Corasick-style automaton run by the C regex engine): each start
+  position is visited once, the longest keyword there is reported, and
+  shorter keywords that are prefixes of it come from a lookup table, so
+  overlapping hits are not lost
+- Below ``AUTOMATON_MIN_KEYWORDS`` the automaton is slower than CPython's
+  substring search repeated per keyword, so small sets use that instead
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Mapping, Optional, Set, Tuple
+
+# Measured crossover: a few dozen keywords scan faster with ``in``.
+AUTOMATON_MIN_KEYWORDS = 160
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """A regex matching the longest of ``keywords`` at a position."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Finds labelled keywords in text."""
+
+    def __init__(self, groups: Mapping[str, Iterable[str]], automaton: Optional[bool] = None):
+        labels: Dict[str, Set[str]] = {}
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                if keyword:
+                    labels.setdefault(keyword, set()).add(label)
+        self._labels = {kw: frozenset(ls) for kw, ls in labels.items()}
+        self._keywords: Tuple[str, ...] = tuple(sorted(labels))
+        if automaton is None:
+            automaton = len(self._keywords) >= AUTOMATON_MIN_KEYWORDS
+        self._pattern = None
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        if automaton and self._keywords:
+            self._pattern = re.compile(f"(?=({_trie_pattern(self._keywords)}))")
+            # keyword -> itself plus every shorter keyword that is a prefix of it
+            self._prefixes = {
+                kw: tuple(other for other in self._keywords if kw.startswith(other))
+                for kw in self._keywords
+            }
+
+    @property
+    def keywords(self) -> Set[str]:
+        return set(self._keywords)
+
+    def find(self, text: str) -> Set[str]:
+        """Every keyword that occurs in ``text``."""
+        if not text:
+            return set()
+        if self._pattern is None:
+            return {kw for kw in self._keywords if kw in text}
+        found: Set[str] = set()
+        for longest in set(self._pattern.findall(text)):
+            found.update(self._prefixes[longest])
+        return found
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """Map each label to the set of its keywords occurring in ``text``."""
+        hits: Dict[str, Set[str]] = {}
+        labels = self._labels
+        for keyword in self.find(text):
+            for label in labels[keyword]:
+                if label in hits:
+                    hits[label].add(keyword)
+                else:
+                    hits[label] = {keyword}
+        return hits
@@ -1,20 +1,26 @@
 """Moltbook integration for Clawgotchi — read, learn, and share."""
 
+import http.client
 import json
 import os
 import time
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError
 
 from config import MOLTBOOK_CREDENTIALS, OPENCLAW_CACHE
+from integrations.keyword_matcher import KeywordMatcher
+from integrations.moltbook_feed import API_PREFIX, ConnectionPool, FeedClient, FeedStore
 CREDENTIALS_PATH = MOLTBOOK_CREDENTIALS
 CACHE_DIR = OPENCLAW_CACHE
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 POSTS_CACHE = CACHE_DIR / "moltbook_posts.json"
 COMMENTS_CACHE = CACHE_DIR / "moltbook_comments.json"
 
+# How stale each consumer tolerates the shared post store (seconds).
+FEED_TTLS = {
+    "tui": 300,
+    "inspiration": 3600,
+}
+
 
 def get_api_key() -> str:
     """Load Moltbook API key from credentials file."""
@@ -31,40 +37,49 @@ def make_request(endpoint: str, method: str = "GET", data: dict = None) -> dict:
     if not api_key:
         return {"error": "No API key found"}
 
-    url = f"https://www.moltbook.com/api/v1{endpoint}"
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    body = None if method == "GET" else json.dumps(data or {}).encode()
 
     try:
-        if method == "GET":
-            req = Request(url, headers=headers)
-        else:
-            req = Request(url, data=json.dumps(data or {}).encode(), headers=headers)
-            req.get_method = lambda: method
-
-        with urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except URLError as e:
+        status, _, raw = _POOL.request(method, f"{API_PREFIX}{endpoint}", body=body, headers=headers)
+        if status >= 400:
+            return {"error": f"HTTP Error {status}"}
+        return json.loads(raw.decode("utf-8"))
+    except (http.client.HTTPException, OSError, ValueError) as e:
         return {"error": str(e)}
 
 
+_POOL = ConnectionPool()
+_STORE = FeedStore(POSTS_CACHE)
+_FEED = FeedClient(_STORE, _POOL, api_key=get_api_key)
+
+
 def fetch_feed(limit: int = 20) -> list:
-    """Fetch latest posts from Moltbook."""
-    result = make_request(f"/posts?sort=new&limit={limit}")
-    if "error" in result:
-        return []
-    
-    posts = result if isinstance(result, list) else result.get("posts", [])
-    
-    # Cache posts
-    POSTS_CACHE.write_text(json.dumps({
-        "timestamp": time.time(),
-        "posts": posts,
-    }))
-    
-    return posts
+    """Fetch latest posts from Moltbook.
+
+    Only posts newer than the newest stored one cross the network; the
+    shared post store is updated in place.
+    """
+    posts = _FEED.fetch(limit)
+    return posts if posts is not None else []
+
+
+def get_feed_posts(consumer: str, limit: int = 20, block: bool = False) -> list:
+    """Return stored posts for ``consumer``, refreshing past its TTL.
+
+    With ``block=False`` a stale store triggers a background refresh and the
+    stored posts are returned immediately, so callers never wait on the network.
+    """
+    ttl = FEED_TTLS.get(consumer, 0)
+    if _STORE.age() < ttl:
+        return _STORE.posts[:limit]
+    if block:
+        return fetch_feed(limit)
+    _FEED.refresh_async(limit)
+    return _STORE.posts[:limit]
 
 
 def fetch_post(post_id: str) -> dict:
@@ -78,6 +93,7 @@ def fetch_comments(post_id: str) -> list:
     comments = result if isinstance(result, list) else result.get("comments", [])
     
     # Cache comments
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     COMMENTS_CACHE.write_text(json.dumps({
         "timestamp": time.time(),
         "post_id": post_id,
@@ -145,6 +161,21 @@ NOISE_SIGNALS = [
 ]
 
 
+NOISE_LABEL = "noise"
+
+_matcher = None
+
+
+def _relevance_matcher() -> KeywordMatcher:
+    """One matcher over every category's keywords plus the noise signals."""
+    global _matcher
+    if _matcher is None:
+        groups = {name: cat["keywords"] for name, cat in RELEVANCE_CATEGORIES.items()}
+        groups[NOISE_LABEL] = NOISE_SIGNALS
+        _matcher = KeywordMatcher(groups)
+    return _matcher
+
+
 def score_post_relevance(post: dict) -> dict:
     """Score a Moltbook post for relevance to Clawgotchi's existing modules.
 
@@ -158,8 +189,11 @@ def score_post_relevance(post: dict) -> dict:
     content = (post.get("content") or "").lower()
     text = f"{title} {content}"
 
+    # One pass over the text finds category keywords and noise signals alike
+    hits = _relevance_matcher().scan(text)
+
     # --- noise check ---
-    noise = any(signal in text for signal in NOISE_SIGNALS)
+    noise = NOISE_LABEL in hits
 
     # --- category matching ---
     raw_score = 0
@@ -168,9 +202,9 @@ def score_post_relevance(post: dict) -> dict:
 
     for cat_name, cat in RELEVANCE_CATEGORIES.items():
         max_possible += cat["weight"]
-        hits = sum(1 for kw in cat["keywords"] if kw in text)
-        if hits:
-            raw_score += cat["weight"] * min(hits, 3) / 3  # diminishing returns
+        cat_hits = len(hits.get(cat_name, ()))
+        if cat_hits:
+            raw_score += cat["weight"] * min(cat_hits, 3) / 3  # diminishing returns
             matched_categories.append(cat_name)
 
     # --- karma bonus (small) ---
@@ -198,6 +232,27 @@ def score_post_relevance(post: dict) -> dict:
     }
 
 
+def score_posts(posts: list, guard=None) -> list:
+    """Score many posts at once, in order.
+
+    Each result is ``score_post_relevance``'s dict plus ``injection``: True
+    when ``guard`` (a SafetyGuard) flags the raw title as prompt injection.
+    With a guard, relevance is scored on the sanitized title (injection lines
+    dropped), which is returned as ``title``.
+    """
+    results = []
+    for post in posts:
+        raw_title = post.get("title") or ""
+        if guard:
+            post = dict(post)
+            post["title"] = guard.sanitize_untrusted_text(raw_title or "untitled").strip() or "untitled"
+        result = dict(score_post_relevance(post))
+        result["title"] = post.get("title") or "untitled"
+        result["injection"] = bool(guard and guard.is_prompt_injection_like(raw_title))
+        results.append(result)
+    return results
+
+
 def extract_feature_ideas(posts: list) -> list:
     """Analyse posts for feature inspiration using relevance scoring.
 
@@ -209,8 +264,7 @@ def extract_feature_ideas(posts: list) -> list:
     """
     ideas = []
 
-    for post in posts:
-        result = score_post_relevance(post)
+    for post, result in zip(posts, score_posts(posts)):
         if result["noise"]:
             continue
         if result["score"] < 0.15:
@@ -234,14 +288,7 @@ def extract_feature_ideas(posts: list) -> list:
 
 def get_cached_posts() -> list:
     """Get cached posts."""
-    if POSTS_CACHE.exists():
-        try:
-            data = json.loads(POSTS_CACHE.read_text())
-            if time.time() - data.get("timestamp", 0) < 3600:  # 1 hour cache
-                return data.get("posts", [])
-        except:
-            pass
-    return []
+    return _STORE.get_posts(max_age=FEED_TTLS["inspiration"])
 
 
 def get_inspiration() -> str:
@@ -0,0 +1,281 @@
+"""Moltbook feed transport — keep-alive connections, conditional and incremental fetch.
+
+- ``ConnectionPool`` reuses HTTPS connections instead of a fresh ``urlopen``
+  (TLS handshake) per call.
+- ``FeedStore`` is the single on-disk post store shared by every consumer;
+  each consumer decides freshness with its own TTL.
+- ``FeedClient`` sends ETag / If-Modified-Since validators and pages through
+  the feed only until it reaches the newest post it already has.
+"""
+
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+from urllib.parse import urlencode
+
+API_HOST = "www.moltbook.com"
+API_PREFIX = "/api/v1"
+
+# Only these are resent after a failure: a POST may already have been applied.
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+# What a keep-alive connection the server has since closed fails with. Timeouts
+# are not among them: the server may still be working on the request.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class ConnectionPool:
+    """Small thread-safe pool of keep-alive HTTPS connections to one host."""
+
+    def __init__(self, host: str = API_HOST, size: int = 2, timeout: float = 10,
+                 connection_factory: Optional[Callable] = None):
+        self.host = host
+        self.size = size
+        self.timeout = timeout
+        self._factory = connection_factory or (
+            lambda: http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        )
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        """A connection, and whether it was reused from the idle list."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._factory(), False
+
+    def _release(self, conn):
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[dict] = None) -> Tuple[int, dict, bytes]:
+        """Send a request.
+
+        A GET or HEAD is retried once on a fresh connection if a reused idle
+        one turns out to have been dropped by the server; nothing else is
+        resent.
+        """
+        for attempt in (0, 1):
+            conn, reused = self._acquire()
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+                status = response.status
+                resp_headers = {k.lower(): v for k, v in response.getheaders()}
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if (attempt or not reused or method.upper() not in IDEMPOTENT_METHODS
+                        or not isinstance(e, STALE_CONNECTION_ERRORS)):
+                    raise
+                continue
+            if resp_headers.get("connection", "").lower() == "close":
+                conn.close()
+            else:
+                self._release(conn)
+            return status, resp_headers, data
+        raise OSError("unreachable")
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class FeedStore:
+    """On-disk post store shared by the TUI, the agent and the CLI.
+
+    File layout stays compatible with the old ``moltbook_posts.json`` cache
+    (``timestamp`` + ``posts``) and adds the HTTP validators.
+    """
+
+    def __init__(self, path: Path, max_posts: int = 200):
+        self.path = Path(path)
+        self.max_posts = max_posts
+        self._lock = threading.RLock()
+        self._data: Optional[dict] = None
+        self._mtime: Optional[int] = None
+
+    def _load(self) -> dict:
+        with self._lock:
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if self._data is None or mtime != self._mtime:
+                data = {}
+                if mtime is not None:
+                    try:
+                        data = json.loads(self.path.read_text())
+                    except (OSError, ValueError):
+                        data = {}
+                self._data = data if isinstance(data, dict) else {}
+                self._mtime = mtime
+            return self._data
+
+    def _save(self, data: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix=".moltbook_posts.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._data = data
+        self._mtime = self.path.stat().st_mtime_ns
+
+    @property
+    def posts(self) -> list:
+        return list(self._load().get("posts", []))
+
+    @property
+    def validators(self) -> dict:
+        data = self._load()
+        return {"etag": data.get("etag"), "last_modified": data.get("last_modified")}
+
+    def age(self) -> float:
+        """Seconds since the store was last confirmed fresh (inf if never)."""
+        timestamp = self._load().get("timestamp")
+        return time.time() - timestamp if timestamp else float("inf")
+
+    def get_posts(self, max_age: float, limit: Optional[int] = None) -> list:
+        """Return stored posts if younger than ``max_age`` seconds, else []."""
+        if self.age() >= max_age:
+            return []
+        posts = self.posts
+        return posts[:limit] if limit else posts
+
+    def known_ids(self) -> set:
+        return {p.get("id") for p in self.posts if p.get("id")}
+
+    def merge(self, new_posts: list, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> list:
+        """Prepend newer posts, drop duplicates and stamp the store fresh."""
+        with self._lock:
+            data = dict(self._load())
+            fresh_ids = {p.get("id") for p in new_posts}
+            older = [p for p in data.get("posts", []) if p.get("id") not in fresh_ids]
+            posts = (list(new_posts) + older)[: self.max_posts]
+            data.update({
+                "timestamp": time.time(),
+                "posts": posts,
+                "last_seen_id": posts[0].get("id") if posts else None,
+            })
+            if etag is not None:
+                data["etag"] = etag
+            if last_modified is not None:
+                data["last_modified"] = last_modified
+            self._save(data)
+            return posts
+
+    def touch(self):
+        """Mark the stored posts fresh after a 304 Not Modified."""
+        with self._lock:
+            data = dict(self._load())
+            data["timestamp"] = time.time()
+            self._save(data)
+
+
+class FeedClient:
+    """Incremental feed fetcher on top of a ``ConnectionPool`` and ``FeedStore``."""
+
+    def __init__(self, store: FeedStore, pool: ConnectionPool,
+                 api_key: Callable[[], str], page_size: int = 25, max_pages: int = 4):
+        self.store = store
+        self.pool = pool
+        self.api_key = api_key
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._refreshing = threading.Lock()
+
+    def _headers(self, conditional: bool) -> dict:
+        headers = {
+            "Authorization": f"Bearer {self.api_key()}",
+            "Accept": "application/json",
+        }
+        if conditional:
+            validators = self.store.validators
+            if validators["etag"]:
+                headers["If-None-Match"] = validators["etag"]
+            if validators["last_modified"]:
+                headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def fetch(self, limit: int = 20) -> Optional[list]:
+        """Fetch posts newer than the store's newest post.
+
+        Returns the newest ``limit`` stored posts, or None on error.
+        """
+        if not self.api_key():
+            return None
+
+        known = self.store.known_ids()
+        new_posts: list = []
+        cursor = None
+        etag = last_modified = None
+        for page in range(self.max_pages):
+            params = {"sort": "new", "limit": max(self.page_size, limit) if not known else self.page_size}
+            if cursor:
+                params["cursor"] = cursor
+            try:
+                status, headers, body = self.pool.request(
+                    "GET", f"{API_PREFIX}/posts?{urlencode(params)}",
+                    headers=self._headers(conditional=page == 0 and bool(known)),
+                )
+            except (http.client.HTTPException, OSError):
+                return None
+
+            if status == 304:
+                self.store.touch()
+                return self.store.posts[:limit]
+            if status != 200:
+                return None
+            try:
+                payload = json.loads(body.decode("utf-8"))
+            except ValueError:
+                return None
+            if page == 0:
+                etag, last_modified = headers.get("etag"), headers.get("last-modified")
+
+            posts = payload if isinstance(payload, list) else payload.get("posts", [])
+            reached_known = False
+            for post in posts:
+                if post.get("id") in known:
+                    reached_known = True
+                    break
+                new_posts.append(post)
+
+            cursor = None
+            if isinstance(payload, dict):
+                cursor = payload.get("next_cursor") or (payload.get("pagination") or {}).get("next_cursor")
+            # Stop at the first known post; a cold store needs only one page of ``limit``.
+            if reached_known or not cursor or not known or not posts:
+                break
+
+        return self.store.merge(new_posts, etag, last_modified)[:limit]
+
+    def refresh_async(self, limit: int = 20) -> bool:
+        """Refresh in a background thread. Returns False if one is already running."""
+        if not self._refreshing.acquire(blocking=False):
+            return False
+
+        def _run():
+            try:
+                self.fetch(limit)
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=_run, daemon=True).start()
+        return True
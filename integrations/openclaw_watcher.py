@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import re
-import subprocess
 import threading
 import time
 from dataclasses import dataclass, field
@@ -12,13 +11,21 @@ from datetime import datetime
 from pathlib import Path
 
 from config import OPENCLAW_DIR
+from integrations.feed_buffer import FeedBuffer, RateWindow, SeenKeys
+from integrations.file_watch import FileWatcher
+from integrations.gateway_client import (
+    CLI_STATUS_INTERVAL, TRANSPORT_CLI, GatewayClient, GatewayError, get_gateway_client,
+)
+from integrations.session_reader import is_message_line, iter_appended_lines, read_recent_messages
 GATEWAY_LOG = OPENCLAW_DIR / "logs" / "gateway.log"
 CRON_JOBS_FILE = OPENCLAW_DIR / "cron" / "jobs.json"
 SESSIONS_DIR = OPENCLAW_DIR / "agents" / "main" / "sessions"
 SESSIONS_INDEX = SESSIONS_DIR / "sessions.json"
 POLL_INTERVAL = 10  # seconds
 MAX_FEED = 500
-SESSION_TAIL_INTERVAL = 2  # seconds
+MAX_SEEN_KEYS = 200
+SESSION_TAIL_INTERVAL = 2  # seconds, polling fallback only (inotify is event-driven)
+SEED_MESSAGES = 100  # recent messages per session loaded on startup
 
 # Agent names to look for when parsing event text
 KNOWN_AGENTS = [
@@ -57,20 +64,26 @@ class GatewayState:
     active_sessions: int = 0
     channels: list = field(default_factory=list)
     last_poll_at: float = 0.0
+    transport: str | None = None  # gateway_client.TRANSPORT_*
 
 
 class OpenClawWatcher:
     """Watches the OpenClaw gateway and builds a live event feed."""
 
-    def __init__(self):
+    def __init__(self, gateway: GatewayClient | None = None):
         self.state = GatewayState()
-        self.feed: list[FeedItem] = []
+        self._gateway = gateway
+        self._feed = FeedBuffer(MAX_FEED)
         self._feed_lock = threading.Lock()
+        # window seconds → sliding counter, created on first feed_rate(window)
+        self._rates: dict[float, RateWindow] = {}
         self._stop = threading.Event()
         self._poll_thread: threading.Thread | None = None
-        self._log_thread: threading.Thread | None = None
-        self._session_thread: threading.Thread | None = None
+        self._watch_thread: threading.Thread | None = None
+        self._file_watcher: FileWatcher | None = None
         self._log_pos = 0
+        # (mtime_ns, size) of sessions.json when it was last parsed
+        self._session_index_stamp: tuple | None = None
         # job UUID → agent display name (from jobs.json)
         self._job_agent_map: dict[str, str] = {}
         # session file → file position for tailing
@@ -78,7 +91,7 @@ class OpenClawWatcher:
         # session key → agent name (from sessions.json + jobs map)
         self._session_agent_map: dict[str, str] = {}
         # Track what we've already added to avoid duplicates
-        self._seen_keys: set[str] = set()
+        self._seen_keys = SeenKeys(MAX_SEEN_KEYS)
 
     def start(self):
         self._stop.clear()
@@ -86,14 +99,14 @@ class OpenClawWatcher:
         self._load_session_map()
         self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._poll_thread.start()
-        self._log_thread = threading.Thread(target=self._log_watch_loop, daemon=True)
-        self._log_thread.start()
         self._seed_recent_messages()
-        self._session_thread = threading.Thread(target=self._session_watch_loop, daemon=True)
-        self._session_thread.start()
+        self._watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._watch_thread.start()
 
     def stop(self):
         self._stop.set()
+        if self._file_watcher is not None:
+            self._file_watcher.wake()
 
     # ── Cron jobs.json → agent name map ───────────────────────────────────
 
@@ -123,26 +136,22 @@ class OpenClawWatcher:
             self._stop.wait(POLL_INTERVAL)
 
     def _poll_gateway(self):
+        if self._gateway is None:
+            self._gateway = get_gateway_client()
         try:
-            result = subprocess.run(
-                ["openclaw", "gateway", "call", "status", "--json", "--timeout", "3000"],
-                capture_output=True, text=True, timeout=10,
-            )
-            if result.returncode == 0:
-                # Strip ANSI codes from output
-                raw = re.sub(r"\x1b\[[0-9;]*m", "", result.stdout)
-                idx = raw.find("{")
-                if idx >= 0:
-                    data = json.loads(raw[idx:])
-                    self.state.online = True
-                    self._parse_status(data)
-                else:
-                    self.state.online = False
-            else:
-                self.state.online = False
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, ValueError):
+            data = self._gateway.status()
+            self.state.online = True
+            self._parse_status(data)
+        except (GatewayError, ValueError, AttributeError):
             self.state.online = False
         self.state.last_poll_at = time.time()
+        transport = getattr(self._gateway, "transport", None)
+        if transport == TRANSPORT_CLI and self.state.transport != TRANSPORT_CLI:
+            self._add_feed(FeedItem(
+                time.time(), "[gateway]",
+                f"no gateway socket: polling status via the openclaw CLI every {CLI_STATUS_INTERVAL:.0f}s",
+            ))
+        self.state.transport = transport
 
     def _parse_status(self, data: dict):
         # Sessions
@@ -187,10 +196,8 @@ class OpenClawWatcher:
         summary = self._extract_summary(text)
 
         key = f"event:{agent}:{summary}"
-        if key in self._seen_keys:
+        if not self._seen_keys.add(key):
             return
-        self._seen_keys.add(key)
-        self._trim_seen()
 
         self._add_feed(FeedItem(
             timestamp=time.time(),
@@ -264,21 +271,30 @@ class OpenClawWatcher:
         summary = f"Session active ({age_str}, {tokens} tokens, {model})"
 
         seen_key = f"session:{job_id}:{updated_at}"
-        if seen_key in self._seen_keys:
+        if not self._seen_keys.add(seen_key):
             return
-        self._seen_keys.add(seen_key)
-        self._trim_seen()
 
         self._add_feed(FeedItem(timestamp=ts, source=agent_name, summary=summary))
 
     # ── Session JSONL tailing (chat messages) ───────────────────────────────
 
-    def _load_session_map(self):
-        """Read sessions.json to map session keys to file paths and agent names."""
-        if not SESSIONS_INDEX.exists():
-            return
+    def _load_session_map(self) -> list[str]:
+        """Read sessions.json to map session keys to file paths and agent names.
+
+        The file is only re-parsed when its mtime or size changed. Returns
+        the session files that were not mapped before.
+        """
+        new_files: list[str] = []
+        try:
+            st = SESSIONS_INDEX.stat()
+        except OSError:
+            return new_files
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._session_index_stamp:
+            return new_files
         try:
             data = json.loads(SESSIONS_INDEX.read_text())
+            self._session_index_stamp = stamp
             for session_key, val in data.items():
                 if isinstance(val, str):
                     try:
@@ -305,82 +321,113 @@ class OpenClawWatcher:
                 self._session_agent_map[str(session_file)] = agent_name
                 # Seek to end so we only get new messages
                 if str(session_file) not in self._session_positions:
+                    new_files.append(str(session_file))
                     try:
                         self._session_positions[str(session_file)] = session_file.stat().st_size
                     except OSError:
                         self._session_positions[str(session_file)] = 0
         except (json.JSONDecodeError, OSError):
             pass
+        return new_files
 
     def _seed_recent_messages(self):
         """Load recent messages from tracked sessions to populate the feed on startup."""
         for file_path_str, agent_name in list(self._session_agent_map.items()):
-            file_path = Path(file_path_str)
-            if not file_path.exists():
-                continue
-            try:
-                size = file_path.stat().st_size
-                # Main session can be very large — read more to find telegram chats
-                read_size = 500_000 if agent_name == "Clawd" else 50_000
-                read_from = max(0, size - read_size)
-                with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                    if read_from > 0:
-                        f.seek(read_from)
-                        f.readline()  # skip partial line
-                    lines = f.readlines()
-                # Parse last N relevant messages
-                for line in lines[-100:]:
-                    self._parse_session_message(line.strip(), agent_name)
-            except OSError:
-                continue
+            self._seed_session(file_path_str, agent_name)
 
-    def _session_watch_loop(self):
-        """Tail session JSONL files for new chat messages."""
-        while not self._stop.is_set():
-            try:
-                self._check_sessions()
-            except OSError:
-                pass
-            self._stop.wait(SESSION_TAIL_INTERVAL)
+    def _seed_session(self, file_path_str: str, agent_name: str):
+        """Feed the last SEED_MESSAGES of one session, then tail it from its end.
+
+        A file that doesn't exist yet is tailed from its start once it does.
+        """
+        file_path = Path(file_path_str)
+        # Main session can be very large — look further back to find telegram chats
+        read_size = 500_000 if agent_name == "Clawd" else 50_000
+        try:
+            size = file_path.stat().st_size
+            lines = read_recent_messages(file_path, SEED_MESSAGES, max_bytes=read_size)
+        except OSError:
+            return
+        self._session_positions[file_path_str] = size
+        for line in lines:
+            self._parse_session_message(line.strip(), agent_name)
+
+    def _map_new_sessions(self):
+        """Re-read sessions.json and seed any session it newly maps.
+
+        A session's file is usually written before sessions.json points at
+        it, so its first messages would be skipped if it were only tailed
+        from its size at mapping time.
+        """
+        for file_path_str in self._load_session_map():
+            self._seed_session(file_path_str, self._session_agent_map[file_path_str])
+
+    # ── Event loop: session and log tailing ──────────────────────────────
+
+    def _watch_loop(self):
+        """Drive session and gateway log tailing from one file-change loop."""
+        try:
+            self._log_pos = GATEWAY_LOG.stat().st_size
+        except OSError:
+            self._log_pos = 0
+        self._file_watcher = FileWatcher(poll_interval=SESSION_TAIL_INTERVAL)
+        self._file_watcher.watch(SESSIONS_DIR, self._on_session_change)
+        self._file_watcher.watch(GATEWAY_LOG.parent, self._on_log_change)
+        try:
+            self._file_watcher.run(self._stop)
+        finally:
+            self._file_watcher.close()
+
+    def _on_session_change(self, name: str | None):
+        if name is None:
+            self._check_sessions()  # lost track: rescan everything
+        elif name == SESSIONS_INDEX.name:
+            self._map_new_sessions()
+        elif name.endswith(".jsonl"):
+            path_str = str(SESSIONS_DIR / name)
+            agent_name = self._session_agent_map.get(path_str)
+            if agent_name is not None:
+                self._tail_session(path_str, agent_name)
+
+    def _on_log_change(self, name: str | None):
+        if name is None or name == GATEWAY_LOG.name:
+            self._check_log()
 
     def _check_sessions(self):
         """Read new lines from all tracked session files."""
-        # Periodically refresh the session map (new sessions may appear)
-        self._load_session_map()
-
+        self._map_new_sessions()
         for file_path_str, agent_name in list(self._session_agent_map.items()):
-            file_path = Path(file_path_str)
-            if not file_path.exists():
-                continue
-            try:
-                size = file_path.stat().st_size
-            except OSError:
-                continue
-            pos = self._session_positions.get(file_path_str, 0)
-            if size < pos:
-                pos = 0  # file was rotated/recreated
-            if size <= pos:
-                continue
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                    f.seek(pos)
-                    new_lines = f.readlines()
-                    self._session_positions[file_path_str] = f.tell()
-            except OSError:
-                continue
-            for line in new_lines:
+            self._tail_session(file_path_str, agent_name)
+
+    def _tail_session(self, file_path_str: str, agent_name: str):
+        """Read lines appended to one session file since the last read."""
+        try:
+            size = Path(file_path_str).stat().st_size
+        except OSError:
+            return
+        pos = self._session_positions.get(file_path_str, 0)
+        if size < pos:
+            pos = 0  # file was rotated/recreated
+        if size <= pos:
+            return
+        self._session_positions[file_path_str] = pos
+        try:
+            for line, pos in iter_appended_lines(Path(file_path_str), pos):
+                self._session_positions[file_path_str] = pos
                 self._parse_session_message(line.strip(), agent_name)
+        except OSError:
+            return
 
     def _parse_session_message(self, line: str, agent_name: str):
         """Parse a JSONL session line into a feed item."""
-        if not line:
+        if not line or not is_message_line(line):
             return
         try:
             entry = json.loads(line)
         except json.JSONDecodeError:
             return
 
-        if entry.get("type") != "message":
+        if not isinstance(entry, dict) or entry.get("type") != "message":
             return
 
         msg = entry.get("message", {})
@@ -438,34 +485,21 @@ class OpenClawWatcher:
 
     # ── Log file watching ─────────────────────────────────────────────────
 
-    def _log_watch_loop(self):
-        if not GATEWAY_LOG.exists():
-            return
+    def _check_log(self):
         try:
-            self._log_pos = GATEWAY_LOG.stat().st_size
+            size = GATEWAY_LOG.stat().st_size
         except OSError:
-            self._log_pos = 0
-        while not self._stop.is_set():
-            try:
-                self._check_log()
-            except OSError:
-                pass
-            self._stop.wait(2)
-
-    def _check_log(self):
-        if not GATEWAY_LOG.exists():
             return
-        size = GATEWAY_LOG.stat().st_size
         if size < self._log_pos:
             self._log_pos = 0
         if size <= self._log_pos:
             return
-        with open(GATEWAY_LOG, "r", encoding="utf-8", errors="replace") as f:
-            f.seek(self._log_pos)
-            new_lines = f.readlines()
-            self._log_pos = f.tell()
-        for line in new_lines:
-            self._parse_log_line(line.strip())
+        try:
+            for line, pos in iter_appended_lines(GATEWAY_LOG, self._log_pos):
+                self._log_pos = pos
+                self._parse_log_line(line.strip())
+        except OSError:
+            return
 
     def _parse_log_line(self, line: str):
         if not line:
@@ -503,27 +537,38 @@ class OpenClawWatcher:
 
     # ── Feed management ───────────────────────────────────────────────────
 
+    @property
+    def feed(self) -> list[FeedItem]:
+        """Snapshot of the whole feed, oldest first."""
+        return self._feed.snapshot()
+
+    @property
+    def feed_version(self) -> int:
+        """Changes whenever an item is added; cheap per-frame change check."""
+        return self._feed.version
+
     def _add_feed(self, item: FeedItem):
         with self._feed_lock:
-            self.feed.append(item)
-            if len(self.feed) > MAX_FEED:
-                self.feed = self.feed[-MAX_FEED:]
-
-    def _trim_seen(self):
-        if len(self._seen_keys) > 200:
-            self._seen_keys = set(list(self._seen_keys)[-100:])
+            self._feed.add(item)
+            for rate in self._rates.values():
+                rate.add(item.timestamp)
 
     def get_feed(self, count: int = 20) -> list[FeedItem]:
-        with self._feed_lock:
-            sorted_feed = sorted(self.feed, key=lambda x: x.timestamp)
-            return sorted_feed[-count:]
+        return self._feed.latest(count)
 
     def feed_rate(self, window: float = 300.0) -> float:
         """Events per minute in the last `window` seconds."""
-        cutoff = time.time() - window
-        with self._feed_lock:
-            recent = sum(1 for item in self.feed if item.timestamp > cutoff)
-        return (recent / window) * 60 if window > 0 else 0.0
+        if window <= 0:
+            return 0.0
+        rate = self._rates.get(window)
+        if rate is None:
+            with self._feed_lock:
+                rate = self._rates.get(window)
+                if rate is None:
+                    rate = RateWindow(window)
+                    rate.extend(item.timestamp for item in self._feed.snapshot())
+                    self._rates[window] = rate
+        return rate.per_minute()
 
     def get_channel_str(self) -> str:
         if not self.state.channels:
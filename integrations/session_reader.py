@@ -0,0 +1,109 @@
+"""Bounded-memory readers for append-only JSONL session files.
+
+Session transcripts grow without limit, so nothing here reads a whole file:
+- ``iter_lines_reverse`` seeks backward from EOF in fixed blocks and yields
+  complete lines newest-first; ``read_recent_messages`` stops as soon as it
+  has the last N message lines, so startup cost tracks N, not file size
+- ``iter_appended_lines`` reads what was appended since a byte offset in
+  fixed chunks and yields each complete line with the offset just past it;
+  a trailing line still being written is left for the next read
+- ``is_message_line`` is a cheap check on the raw line that rules out
+  entries which cannot be ``"type": "message"`` before any JSON decoding
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+BLOCK_SIZE = 64 * 1024
+
+_MESSAGE_TYPE = re.compile(r'"type"\s*:\s*"message"')
+
+
+def is_message_line(line: str) -> bool:
+    """False when ``line`` cannot be a ``"type": "message"`` entry."""
+    return '"message"' in line and _MESSAGE_TYPE.search(line) is not None
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def iter_lines_reverse(
+    path: Path,
+    block_size: int = BLOCK_SIZE,
+    max_bytes: Optional[int] = None,
+) -> Iterator[str]:
+    """Yield the lines of ``path`` from last to first.
+
+    Reads at most ``max_bytes`` from the end of the file; a line cut by
+    that limit is not yielded. Empty lines are skipped.
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        floor = 0 if max_bytes is None else max(0, end - max_bytes)
+        pos = end
+        tail = b""  # start of the line that continues into later blocks
+        while pos > floor:
+            step = min(block_size, pos - floor)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step) + tail
+            lines = block.split(b"\n")
+            tail = lines[0]
+            for raw in reversed(lines[1:]):
+                if raw.strip():
+                    yield _decode(raw)
+        # Whatever is left began at the floor: a whole line only at file start
+        if floor == 0 and tail.strip():
+            yield _decode(tail)
+
+
+def read_recent_messages(
+    path: Path,
+    limit: int,
+    max_bytes: Optional[int] = None,
+    block_size: int = BLOCK_SIZE,
+) -> List[str]:
+    """The last ``limit`` message lines of a session file, oldest first."""
+    found: List[str] = []
+    if limit <= 0:
+        return found
+    for line in iter_lines_reverse(path, block_size=block_size, max_bytes=max_bytes):
+        if is_message_line(line):
+            found.append(line)
+            if len(found) >= limit:
+                break
+    found.reverse()
+    return found
+
+
+def iter_appended_lines(
+    path: Path,
+    pos: int,
+    chunk_size: int = BLOCK_SIZE,
+) -> Iterator[Tuple[str, int]]:
+    """Yield ``(line, offset after line)`` for complete lines after ``pos``.
+
+    Memory is bounded by ``chunk_size`` plus the longest single line.
+    """
+    with open(path, "rb") as f:
+        f.seek(pos)
+        pending = b""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            data = pending + chunk
+            start = 0
+            while True:
+                nl = data.find(b"\n", start)
+                if nl < 0:
+                    break
+                pos += nl + 1 - start
+                yield _decode(data[start:nl]), pos
+                start = nl + 1
+            pending = data[start:]
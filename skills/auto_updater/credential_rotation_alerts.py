@@ -10,6 +10,8 @@ from enum import Enum
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
+from utils.secret_scanner import scanner_for
+
 
 class Severity(Enum):
     """Severity levels for credential rotation alerts."""
@@ -88,7 +90,8 @@ class CredentialScanner:
             rotation_threshold_days: Days after which credentials should rotate
         """
         self.rotation_threshold_days = rotation_threshold_days
-        self.patterns = [re.compile(p, re.IGNORECASE) for p in self.CREDENTIAL_PATTERNS]
+        self.scanner = scanner_for(tuple(self.CREDENTIAL_PATTERNS), re.IGNORECASE, 'ignore')
+        self.patterns = list(self.scanner.compiled)
     
     def _detect_api_keys(self, content: str) -> bool:
         """
@@ -243,11 +246,10 @@ class CredentialScanner:
             return None
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            if not self._detect_api_keys(content):
+            # Cached while the file is unchanged; read again only on a hit
+            if not self.scanner.scan_file(file_path).found:
                 return None
+            content = self.scanner.read(file_path)
             
             credential_type = self._get_credential_type(content)
             age_days = self._calculate_credential_age(file_path)
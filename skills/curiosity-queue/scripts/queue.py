@@ -1,14 +1,50 @@
 #!/usr/bin/env python3
-"""Curiosity queue manager."""
+"""Curiosity queue manager.
+
+Once ``python -m core.memory_store import`` has been run, the agent keeps its
+curiosity items in memory/memory.db and the JSON file is no longer updated;
+the queue is then read from and written to the store instead.
+"""
 
 import argparse
 import json
+import sys
+from datetime import datetime
 from pathlib import Path
 
+ROOT = Path(__file__).parent.parent.parent.parent
 QUEUE_FILE = Path(__file__).parent.parent.parent / "memory" / "curiosity_queue.json"
 
+sys.path.insert(0, str(ROOT))
+from core.memory_store import get_memory_store
+
+STORE = get_memory_store(ROOT / "memory" / "memory.db")
+
+
+def _from_record(item: dict) -> dict:
+    """An agent curiosity row in this script's shape."""
+    status = "done" if item.get("status") == "explored" else item.get("status", "pending")
+    return {"id": item["id"], "text": item.get("topic", ""), "priority": item.get("priority", 5),
+            "status": status, "created": item.get("added_at")}
+
+
+def _to_record(c: dict, existing: dict = None) -> dict:
+    item = dict(existing or {"source": "manual", "sources": ["manual"], "seen_count": 1, "categories": []})
+    item.update(id=c["id"], topic=c["text"], priority=c["priority"], added_at=c["created"],
+                status="explored" if c["status"] == "done" else c["status"])
+    if c["status"] == "done":
+        item.setdefault("explored_at", datetime.now().isoformat())
+    return item
+
+
 def load_queue() -> dict:
     """Load curiosity queue."""
+    if STORE is not None:
+        items = [_from_record(item) for item in STORE.collection("curiosity").all()]
+        # Own id series: the running agent numbers its cur-N ids in memory
+        manual = [int(c["id"][len("manual-"):]) for c in items
+                  if str(c["id"]).startswith("manual-") and c["id"][len("manual-"):].isdigit()]
+        return {"curiosities": items, "next_id": max(manual, default=0) + 1}
     if not QUEUE_FILE.exists():
         return {"curiosities": [], "next_id": 1}
     try:
@@ -18,6 +54,10 @@ def load_queue() -> dict:
 
 def save_queue(queue: dict):
     """Save curiosity queue."""
+    if STORE is not None:
+        repo = STORE.collection("curiosity")
+        repo.put_many(_to_record(c, repo.get(str(c["id"]))) for c in queue["curiosities"])
+        return
     QUEUE_FILE.write_text(json.dumps(queue, indent=2))
 
 def list_curiosities(queue: dict, pending: bool = False):
@@ -32,22 +72,23 @@ def list_curiosities(queue: dict, pending: bool = False):
 
 def add_curiosity(queue: dict, text: str, priority: int = 5):
     """Add new curiosity."""
+    next_id = queue.get("next_id", 1)
     c = {
-        "id": queue.get("next_id", 1),
+        "id": f"manual-{next_id}" if STORE is not None else next_id,
         "text": text,
         "priority": priority,
         "status": "pending",
-        "created": str(datetime.now())
+        "created": datetime.now().isoformat() if STORE is not None else str(datetime.now())
     }
     queue["curiosities"].append(c)
-    queue["next_id"] = c["id"] + 1
+    queue["next_id"] = next_id + 1
     save_queue(queue)
     print(f"Added curiosity #{c['id']}: {text}")
 
 def complete_curiosity(queue: dict, cid: int):
     """Mark curiosity as complete."""
     for c in queue["curiosities"]:
-        if c["id"] == cid:
+        if str(c["id"]) == str(cid):
             c["status"] = "done"
             save_queue(queue)
             print(f"Completed curiosity #{cid}")
@@ -60,7 +101,7 @@ def main():
     parser.add_argument("--next", action="store_true", help="Get top priority curiosity")
     parser.add_argument("--add", type=str, help="Add new curiosity")
     parser.add_argument("--priority", type=int, default=5, help="Priority for new curiosity")
-    parser.add_argument("--complete", type=int, help="Mark curiosity as complete")
+    parser.add_argument("--complete", help="Mark curiosity as complete")
     
     args = parser.parse_args()
     
@@ -83,5 +124,4 @@ def main():
         list_curiosities(queue, pending=True)
 
 if __name__ == "__main__":
-    from datetime import datetime
     main()
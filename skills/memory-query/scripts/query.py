@@ -2,29 +2,40 @@
 """Memory semantic search."""
 
 import argparse
-import re
+import sys
 from pathlib import Path
 
-MEMORY_DIR = Path(__file__).parent.parent.parent / "memory"
+ROOT = Path(__file__).parent.parent.parent.parent
+MEMORY_DIR = ROOT / "memory"
 
-def search_memory(query: str, show_files: bool = False, context: int = 3) -> list:
-    """Search memory files for query."""
+sys.path.insert(0, str(ROOT))
+from cognition.memory_index import MemoryIndex
+
+def search_memory(query: str, show_files: bool = False, context: int = 3,
+                  limit: int = 20) -> list:
+    """Search memory files for query, best BM25 matches first."""
     results = []
+    index = MemoryIndex(MEMORY_DIR)
+    index.refresh()
+    hits = index.search(query, limit=limit)
     
-    for mem_file in MEMORY_DIR.glob("*.md"):
-        text = mem_file.read_text()
-        if query.lower() in text.lower():
-            if show_files:
-                results.append(str(mem_file))
-            else:
-                lines = text.split("\n")
-                for i, line in enumerate(lines):
-                    if query.lower() in line.lower():
-                        # Get context
-                        start = max(0, i - context)
-                        end = min(len(lines), i + context + 1)
-                        snippet = "\n".join(lines[start:end])
-                        results.append(f"--- {mem_file.name} ---\n{snippet}\n")
+    if show_files:
+        for hit in hits:
+            path = str(MEMORY_DIR / hit["file"])
+            if path not in results:
+                results.append(path)
+    else:
+        texts = {}
+        for hit in hits:
+            if hit["file"] not in texts:
+                texts[hit["file"]] = (MEMORY_DIR / hit["file"]).read_text().split("\n")
+            lines = texts[hit["file"]]
+            # Get context
+            i = hit["line"] - 1
+            start = max(0, i - context)
+            end = min(len(lines), i + context + 1)
+            snippet = "\n".join(lines[start:end])
+            results.append(f"--- {hit['file']}:{hit['line']} ---\n{snippet}\n")
     
     # Also check JSON files
     for json_file in MEMORY_DIR.glob("*.json"):
@@ -37,14 +48,15 @@ def search_memory(query: str, show_files: bool = False, context: int = 3) -> lis
 
 def main():
     parser = argparse.ArgumentParser(description="Search clawgotchi memory")
-    parser.add_argument("query", help="Search term")
+    parser.add_argument("query", help='Search terms ("phrase", prefix*, since:/until:YYYY-MM-DD)')
     parser.add_argument("--files", action="store_true", help="List matching files only")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--context", type=int, default=3, help="Lines of context")
+    parser.add_argument("--limit", type=int, default=20, help="Max ranked matches")
     
     args = parser.parse_args()
     
-    results = search_memory(args.query, args.files, args.context)
+    results = search_memory(args.query, args.files, args.context, args.limit)
     
     if args.json:
         import json
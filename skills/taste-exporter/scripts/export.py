@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
-"""Taste profile exporter."""
+"""Taste profile exporter.
+
+The rejection ledger is read from memory/memory.db once
+``python -m core.memory_store import`` has been run (TasteProfile stops
+appending to the JSONL file then).
+"""
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
+ROOT = Path(__file__).parent.parent.parent.parent
+
 TASTE_FILE = Path(__file__).parent.parent.parent / "memory" / "taste_profile.json"
 REJECTIONS_FILE = Path(__file__).parent.parent.parent / "memory" / "taste_rejections.jsonl"
 
+sys.path.insert(0, str(ROOT))
+from core.memory_store import get_memory_store
+
 def load_taste() -> dict:
     """Load taste profile."""
     if TASTE_FILE.exists():
@@ -16,6 +27,9 @@ def load_taste() -> dict:
 
 def load_rejections() -> list:
     """Load rejection ledger."""
+    store = get_memory_store(ROOT / "memory" / "memory.db")
+    if store is not None:
+        return store.collection("taste_rejections").all()
     if not REJECTIONS_FILE.exists():
         return []
     return [json.loads(line) for line in REJECTIONS_FILE.read_text().strip().split("\n") if line]
@@ -2,10 +2,11 @@
 """CLI entry point for vulnerability scanner."""
 
 import sys
+import json
 import argparse
 from pathlib import Path
 
-from skills.vulnerability_scanner.scanner import VulnerabilityScanner
+from skills.vulnerability_scanner.scanner import DEFAULT_CACHE, VulnerabilityScanner
 
 
 def main():
@@ -18,6 +19,7 @@ Examples:
   python -m skills.vulnerability_scanner /path/to/code      # Scan specific directory
   python -m skills.vulnerability_scanner --json             # JSON output
   python -m skills.vulnerability_scanner --json /path       # JSON output for specific path
+  python -m skills.vulnerability_scanner --changed-since HEAD~1   # Gate: exit 1 on critical/high
         """
     )
     
@@ -43,16 +45,48 @@ Examples:
         help='Filter by category'
     )
     
+    parser.add_argument(
+        '--changed-since',
+        metavar='REV',
+        help='Only scan files changed since this git revision (plus untracked); '
+             'exits 1 if any critical or high finding remains'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes (default: one per CPU; 1 scans in-process)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not reuse or record per-file results ({DEFAULT_CACHE})'
+    )
+    
     args = parser.parse_args()
     
-    scanner = VulnerabilityScanner(args.path)
+    scanner = VulnerabilityScanner(
+        args.path,
+        cache_path=None if args.no_cache else DEFAULT_CACHE,
+        workers=args.workers,
+    )
+    
+    if args.changed_since:
+        try:
+            report = scanner.scan_directory(changed_since=args.changed_since)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print(json.dumps(report, indent=2) if args.json else report['summary'])
+        counts = report['severity_counts']
+        return 1 if counts.get('critical', 0) or counts.get('high', 0) else 0
     
     if args.json:
         report = scanner.scan_directory()
         print(report)
     else:
         scanner.print_report()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
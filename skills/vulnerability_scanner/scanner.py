@@ -14,10 +14,15 @@ Scans for:
 import re
 import os
 import ast
+import bisect
+import hashlib
 import json
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 
 @dataclass
@@ -327,14 +332,221 @@ VULNERABILITY_PATTERNS = [
 ]
 
 
+def _compile_patterns() -> List[tuple]:
+    compiled = []
+    for pattern_info in VULNERABILITY_PATTERNS:
+        if len(pattern_info) != 6:
+            continue
+        pattern, *details = pattern_info
+        try:
+            compiled.append((re.compile(pattern), *details))
+        except re.error:
+            continue
+    return compiled
+
+
+_COMPILED_PATTERNS = _compile_patterns()
+
+# Cached results are only reused by the same rules; bump on AST rule changes.
+RULES_VERSION = hashlib.sha256(
+    ("ast-1\n" + repr(VULNERABILITY_PATTERNS)).encode()
+).hexdigest()[:16]
+
+DEFAULT_CACHE = Path.home() / ".openclaw" / "cache" / "vulnerability_scan.json"
+MAX_CACHE_ENTRIES = 4096
+
+# Below this many files to scan, starting worker processes costs more than it saves.
+PARALLEL_MIN_FILES = 16
+
+SKIP_PARTS = ['.git', '__pycache__', '.venv', 'node_modules', 'tests/fixtures']
+
+
+def decode_source(raw: bytes) -> str:
+    """Decode like ``open(..., encoding='utf-8', errors='ignore')`` in text mode."""
+    return raw.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def source_lines(content: str) -> List[str]:
+    """The lines ``readlines()`` would return, without their newlines."""
+    lines = content.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def scan_patterns(file_path: str, content: str, lines: List[str]) -> List[Vulnerability]:
+    """Regex pass: each pattern runs once over the whole file."""
+    findings = []
+    starts = [0]
+    for line in lines:
+        starts.append(starts[-1] + len(line) + 1)
+
+    for regex, vuln_type, severity, category, description, recommendation in _COMPILED_PATTERNS:
+        for match in regex.finditer(content):
+            # Line number from the offset table
+            line_num = bisect.bisect_right(starts, match.start())
+            line = lines[min(line_num - 1, len(lines) - 1)].strip()
+
+            findings.append(Vulnerability(
+                file_path=file_path,
+                line_number=line_num,
+                vulnerability_type=vuln_type,
+                severity=severity,
+                category=category,
+                code_snippet=line[:100],
+                description=description,
+                recommendation=recommendation
+            ))
+
+    return findings
+
+
+def scan_ast(file_path: str, content: str, lines: List[str]) -> List[Vulnerability]:
+    """AST pass for deeper vulnerability detection."""
+    findings = []
+
+    # Only eval/exec calls are checked: ASCII source naming neither needs
+    # no parse (non-ASCII identifiers are NFKC-normalised, so always parse)
+    if content.isascii() and 'eval' not in content and 'exec' not in content:
+        return findings
+
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        return findings
+
+    for node in ast.walk(tree):
+        # Check for dangerous function calls
+        if isinstance(node, ast.Call):
+            func_name = None
+
+            if isinstance(node.func, ast.Name):
+                func_name = node.func.id
+            elif isinstance(node.func, ast.Attribute):
+                func_name = node.func.attr
+
+            if func_name in ['eval', 'exec']:
+                # Check if arguments contain untrusted sources
+                for arg in node.args:
+                    if isinstance(arg, ast.Subscript):
+                        findings.append(Vulnerability(
+                            file_path=file_path,
+                            line_number=node.lineno,
+                            vulnerability_type=f"Dangerous {func_name}() Usage",
+                            severity='critical' if func_name == 'eval' else 'high',
+                            category='injection',
+                            code_snippet=lines[node.lineno - 1].strip()[:100],
+                            description=f'{func_name}() can execute arbitrary code.',
+                            recommendation=f'Avoid {func_name}(). Use ast.literal_eval() or refactor.'
+                        ))
+
+    return findings
+
+
+def scan_source(file_path: str, content: str) -> Tuple[List[Vulnerability], int]:
+    """Findings and line count for one file's decoded source.
+
+    Module-level so worker processes can run it.
+    """
+    lines = source_lines(content)
+    findings = scan_patterns(file_path, content, lines)
+    findings.extend(scan_ast(file_path, content, lines))
+    return findings, len(lines)
+
+
+def _scan_job(job: Tuple[str, str]) -> Tuple[List[Vulnerability], int]:
+    return scan_source(*job)
+
+
+def changed_files(directory: Path, rev: str) -> List[Path]:
+    """Python files under ``directory`` changed since ``rev`` or untracked.
+
+    Covers committed, staged and unstaged changes; deleted files are left out.
+    """
+    directory = Path(directory)
+    commands = [
+        ['diff', '--name-only', '--relative', '--diff-filter=d', rev, '--', '*.py'],
+        ['ls-files', '--others', '--exclude-standard', '--', '*.py'],
+    ]
+    names: List[str] = []
+    for args in commands:
+        result = subprocess.run(
+            ['git', '-C', str(directory), *args], capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+        names.extend(line for line in result.stdout.splitlines() if line)
+    return [directory / name for name in dict.fromkeys(names)]
+
+
+class ResultCache:
+    """Per-file scan results on disk, keyed by content hash.
+
+    Entries recorded under different rules are discarded on load. The
+    oldest entries are dropped past ``MAX_CACHE_ENTRIES``.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if self.path is not None:
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get('rules') == RULES_VERSION:
+                    self.entries = data.get('entries', {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    def get(self, digest: str, file_path: str) -> Optional[Tuple[List[Vulnerability], int]]:
+        entry = self.entries.pop(digest, None)
+        if entry is None:
+            return None
+        self.entries[digest] = entry  # most recently used last
+        self.dirty = True
+        findings = [Vulnerability(file_path=file_path, **f) for f in entry['findings']]
+        return findings, entry['lines']
+
+    def put(self, digest: str, findings: List[Vulnerability], line_count: int):
+        records = []
+        for finding in findings:
+            record = dict(finding.__dict__)
+            del record['file_path']
+            records.append(record)
+        self.entries.pop(digest, None)
+        self.entries[digest] = {'lines': line_count, 'findings': records}
+        self.dirty = True
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        from core.persistence import atomic_write_json
+
+        while len(self.entries) > MAX_CACHE_ENTRIES:
+            del self.entries[next(iter(self.entries))]
+        atomic_write_json(self.path, {'rules': RULES_VERSION, 'entries': self.entries}, compact=True)
+        self.dirty = False
+
+
 class VulnerabilityScanner:
     """Scanner for detecting security vulnerabilities in Python code."""
     
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", cache_path: Optional[Path] = None,
+                 workers: Optional[int] = None):
+        """
+        Args:
+            base_path: Directory scanned by default
+            cache_path: JSON file for per-file results keyed by content hash;
+                None keeps no cache between scans
+            workers: Worker processes for directory scans (None: one per CPU,
+                1: scan in this process)
+        """
         self.base_path = Path(base_path)
         self.findings: List[Vulnerability] = []
         self.files_scanned = 0
         self.lines_scanned = 0
+        self.workers = workers
+        self.cache = ResultCache(cache_path)
     
     def scan_file(self, file_path: Path) -> List[Vulnerability]:
         """Scan a single Python file for vulnerabilities."""
@@ -348,108 +560,92 @@ class VulnerabilityScanner:
         
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                content = ''.join(lines)
-                self.files_scanned += 1
-                self.lines_scanned += len(lines)
-                
-                # Pattern-based scanning
-                findings.extend(self._scan_patterns(file_path, content, lines))
-                
-                # AST-based scanning for deeper analysis
-                findings.extend(self._scan_ast(file_path, content, lines))
-                
+                content = f.read()
         except (IOError, UnicodeDecodeError) as e:
             print(f"Warning: Could not scan {file_path}: {e}")
+            return findings
         
+        findings, line_count = scan_source(str(file_path), content)
+        self.files_scanned += 1
+        self.lines_scanned += line_count
         return findings
     
     def _scan_patterns(self, file_path: Path, content: str, lines: List[str]) -> List[Vulnerability]:
         """Scan using regex patterns."""
-        findings = []
-        
-        for pattern_info in VULNERABILITY_PATTERNS:
-            if len(pattern_info) == 6:
-                pattern, vuln_type, severity, category, description, recommendation = pattern_info
-            else:
-                continue
-            
-            try:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    # Find line number
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    # Get surrounding code
-                    line = lines[min(line_num - 1, len(lines) - 1)].strip()
-                    
-                    findings.append(Vulnerability(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        vulnerability_type=vuln_type,
-                        severity=severity,
-                        category=category,
-                        code_snippet=line[:100],
-                        description=description,
-                        recommendation=recommendation
-                    ))
-            except re.error:
-                continue
-        
-        return findings
+        return scan_patterns(str(file_path), content, [line.rstrip('\n') for line in lines])
     
     def _scan_ast(self, file_path: Path, content: str, lines: List[str]) -> List[Vulnerability]:
         """Scan using AST analysis for deeper vulnerability detection."""
-        findings = []
-        
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return findings
-        
-        for node in ast.walk(tree):
-            # Check for dangerous function calls
-            if isinstance(node, ast.Call):
-                func_name = None
-                
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                elif isinstance(node.func, ast.Attribute):
-                    func_name = node.func.attr
-                
-                if func_name in ['eval', 'exec']:
-                    # Check if arguments contain untrusted sources
-                    for arg in node.args:
-                        if isinstance(arg, ast.Subscript):
-                            findings.append(Vulnerability(
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                vulnerability_type=f"Dangerous {func_name}() Usage",
-                                severity='critical' if func_name == 'eval' else 'high',
-                                category='injection',
-                                code_snippet=lines[node.lineno - 1].strip()[:100],
-                                description=f'{func_name}() can execute arbitrary code.',
-                                recommendation=f'Avoid {func_name}(). Use ast.literal_eval() or refactor.'
-                            ))
-        
-        return findings
+        return scan_ast(str(file_path), content, lines)
+    
+    def iter_files(self, directory: Path):
+        """Python files under ``directory``, minus the usual non-source dirs."""
+        for file_path in directory.rglob('*.py'):
+            # Skip common non-vulnerable directories
+            if any(part in str(file_path) for part in SKIP_PARTS):
+                continue
+            yield file_path
     
-    def scan_directory(self, directory: Path = None) -> Dict[str, Any]:
-        """Scan a directory recursively for vulnerabilities."""
+    def scan_directory(self, directory: Path = None,
+                       changed_since: Optional[str] = None) -> Dict[str, Any]:
+        """Scan a directory recursively for vulnerabilities.
+        
+        Files whose contents are in the result cache are not scanned again;
+        the rest are fanned out across worker processes. With
+        ``changed_since`` (a git revision), only files changed since then
+        are scanned.
+        """
         if directory is None:
             directory = self.base_path
+        directory = Path(directory)
         
         self.findings = []
         
-        for file_path in directory.rglob('*.py'):
-            # Skip common non-vulnerable directories
-            if any(part in str(file_path) for part in ['.git', '__pycache__', '.venv', 'node_modules', 'tests/fixtures']):
+        if changed_since is not None:
+            paths = [p for p in changed_files(directory, changed_since)
+                     if p.is_file() and not any(part in str(p) for part in SKIP_PARTS)]
+        else:
+            paths = list(self.iter_files(directory))
+        
+        results: Dict[int, Tuple[List[Vulnerability], int]] = {}
+        jobs: List[Tuple[int, str, str, str]] = []  # (index, digest, path, content)
+        for index, file_path in enumerate(paths):
+            try:
+                raw = file_path.read_bytes()
+            except IOError as e:
+                print(f"Warning: Could not scan {file_path}: {e}")
                 continue
-            
-            self.findings.extend(self.scan_file(file_path))
+            digest = hashlib.sha256(raw).hexdigest()
+            cached = self.cache.get(digest, str(file_path))
+            if cached is not None:
+                results[index] = cached
+            else:
+                jobs.append((index, digest, str(file_path), decode_source(raw)))
+        
+        for (index, digest, _, _), result in zip(jobs, self._run_jobs([(p, c) for _, _, p, c in jobs])):
+            self.cache.put(digest, *result)
+            results[index] = result
+        self.cache.save()
+        
+        for index in sorted(results):
+            findings, line_count = results[index]
+            self.files_scanned += 1
+            self.lines_scanned += line_count
+            self.findings.extend(findings)
         
         return self.generate_report()
     
+    def _run_jobs(self, jobs: List[Tuple[str, str]]) -> List[Tuple[List[Vulnerability], int]]:
+        workers = self.workers or os.cpu_count() or 1
+        if workers > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                    chunksize = max(1, len(jobs) // (workers * 4))
+                    return list(pool.map(_scan_job, jobs, chunksize=chunksize))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                pass  # no usable process pool here; scan in this process
+        return [_scan_job(job) for job in jobs]
+    
     def generate_report(self) -> Dict[str, Any]:
         """Generate a summary report of findings."""
         # Count by severity
@@ -3,7 +3,9 @@
 import pytest
 import tempfile
 import os
+import subprocess
 from pathlib import Path
+from skills.vulnerability_scanner import scanner as scanner_module
 from skills.vulnerability_scanner.scanner import VulnerabilityScanner, Vulnerability
 
 
@@ -101,5 +103,82 @@ password_hash = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000)
         assert 'summary' in report
 
 
+VULNERABLE = 'import hashlib\n\nhash = hashlib.md5(data).hexdigest()\neval(request["x"])\n'
+
+
+def _tree(root: Path, count: int = 3) -> Path:
+    root.mkdir()
+    for i in range(count):
+        (root / f"mod{i}.py").write_text(f"# module {i}\n" + VULNERABLE)
+    (root / "clean.py").write_text("x = 1\n")
+    return root
+
+
+class TestScanPipeline:
+    """Directory scans: result cache, worker processes, changed files."""
+
+    def test_line_numbers_from_offsets(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(VULNERABLE)
+        findings = VulnerabilityScanner().scan_file(path)
+        lines = {(f.vulnerability_type, f.line_number) for f in findings}
+        assert ('Weak Cryptographic Hash (MD5)', 3) in lines
+        assert ('Dangerous eval() Usage', 4) in lines
+
+    def test_cache_skips_unchanged_files(self, tmp_path, monkeypatch):
+        root = _tree(tmp_path / "src")
+        cache = tmp_path / "cache.json"
+        first = VulnerabilityScanner(str(root), cache_path=cache, workers=1).scan_directory()
+
+        scanned = []
+        real = scanner_module.scan_source
+        monkeypatch.setattr(scanner_module, "scan_source",
+                            lambda path, content: scanned.append(path) or real(path, content))
+        (root / "mod1.py").write_text("# changed\n# twice\n" + VULNERABLE)
+        second = VulnerabilityScanner(str(root), cache_path=cache, workers=1).scan_directory()
+
+        assert scanned == [str(root / "mod1.py")]
+        assert second['total_findings'] == first['total_findings']
+        assert second['files_scanned'] == first['files_scanned'] == 4
+        assert second['lines_scanned'] == first['lines_scanned'] + 1
+
+    def test_cache_ignored_when_rules_change(self, tmp_path, monkeypatch):
+        root = _tree(tmp_path / "src", 1)
+        cache = tmp_path / "cache.json"
+        VulnerabilityScanner(str(root), cache_path=cache).scan_directory()
+        monkeypatch.setattr(scanner_module, "RULES_VERSION", "other")
+        assert scanner_module.ResultCache(cache).entries == {}
+
+    def test_worker_processes_match_serial(self, tmp_path, monkeypatch):
+        root = _tree(tmp_path / "src", 4)
+        serial = VulnerabilityScanner(str(root), workers=1).scan_directory()
+        monkeypatch.setattr(scanner_module, "PARALLEL_MIN_FILES", 1)
+        parallel = VulnerabilityScanner(str(root), workers=2).scan_directory()
+        assert parallel == serial
+
+    def test_changed_since_scans_only_changed_files(self, tmp_path):
+        root = _tree(tmp_path / "repo")
+        git = ["git", "-C", str(root), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], check=True)
+        (root / "mod0.py").write_text("# edited\n" + VULNERABLE)
+        (root / "new.py").write_text(VULNERABLE)
+        (root / "mod2.py").unlink()
+
+        scanner = VulnerabilityScanner(str(root), workers=1)
+        report = scanner.scan_directory(changed_since="HEAD")
+
+        files = {Path(f['file_path']).name for f in report['findings']}
+        assert files == {"mod0.py", "new.py"}
+        assert report['files_scanned'] == 2
+
+    def test_changed_since_bad_revision(self, tmp_path):
+        root = _tree(tmp_path / "repo", 1)
+        subprocess.run(["git", "-C", str(root), "init", "-q"], check=True)
+        with pytest.raises(RuntimeError):
+            VulnerabilityScanner(str(root)).scan_directory(changed_since="nope")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -271,3 +271,50 @@ class TestTestIntegration:
         result = manager.test_integration(module)
         assert isinstance(result, bool)
         assert result is False  # Module doesn't exist
+
+
+class TestScanCache:
+    """Tests for the cached orphan scan."""
+
+    def test_unchanged_tree_is_not_reparsed(self, temp_dirs, monkeypatch):
+        """A second scan reuses summaries and the memoized orphan list."""
+        import clawgotchi.evolution.integration_index as integration_index
+
+        tmpdir, memory_dir = temp_dirs
+        manager = IntegrationManager(memory_dir=str(memory_dir))
+        first = manager.scan_orphaned_modules(base_dir=str(tmpdir))
+
+        parsed = []
+        real_parse = integration_index.ast.parse
+        monkeypatch.setattr(integration_index.ast, "parse",
+                            lambda src: parsed.append(src) or real_parse(src))
+        assert manager.scan_orphaned_modules(base_dir=str(tmpdir)) == first
+
+        module = tmpdir / "clawgotchi" / "resilience" / "test_utility.py"
+        module.write_text(module.read_text() + "\ndef added_function():\n    pass\n")
+        rescanned = manager.scan_orphaned_modules(base_dir=str(tmpdir))
+        assert len(parsed) == 1
+        test_mod = next(m for m in rescanned if m["name"] == "test_utility")
+        assert "added_function" in test_mod["functions"]
+
+    def test_new_reference_removes_orphan(self, temp_dirs):
+        """Importing a module from an __init__.py integrates it."""
+        tmpdir, memory_dir = temp_dirs
+        manager = IntegrationManager(memory_dir=str(memory_dir))
+        assert "orphaned_module" in [m["name"] for m in manager.scan_orphaned_modules(str(tmpdir))]
+
+        init = tmpdir / "clawgotchi" / "resilience" / "__init__.py"
+        init.write_text("from .orphaned_module import OrphanedClass\n")
+        names = [m["name"] for m in manager.scan_orphaned_modules(str(tmpdir))]
+        assert "orphaned_module" not in names
+        assert "test_utility" in names
+
+    def test_integrating_invalidates_cached_list(self, temp_dirs):
+        """Status changes are part of the cache key."""
+        tmpdir, memory_dir = temp_dirs
+        manager = IntegrationManager(memory_dir=str(memory_dir))
+        orphaned = manager.scan_orphaned_modules(str(tmpdir))
+
+        manager.integrate_module(next(m for m in orphaned if m["name"] == "test_utility"))
+        names = [m["name"] for m in manager.scan_orphaned_modules(str(tmpdir))]
+        assert names == ["orphaned_module"]
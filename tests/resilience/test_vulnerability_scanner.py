@@ -298,6 +298,19 @@ class TestVulnerabilityScanner(unittest.TestCase):
         self.assertIn("CVE-2024-11015", patterns_cves)
         self.assertIn("CVE-2024-51181", patterns_cves)
 
+    def test_match_across_lines_reported_per_line(self):
+        """Matches spanning lines don't count; later lines are still checked."""
+        code = "\n".join([
+            "$q = 'SELECT * FROM t WHERE a = '",
+            "  . $x; eval($y);",
+            "# eval(commented)",
+            "   strcpy(a, b);   ",
+        ])
+        result = self.scanner.scan_code(code, "test.php")
+        found = [(v.line_number, v.cve_id) for v in result.vulnerabilities]
+        self.assertEqual(found, [(2, "CVE-2024-50854"), (4, "CVE-2024-50851")])
+        self.assertEqual(result.lines_scanned, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for the precompiled cat art and mood frame cache."""
+
+import json
+import os
+
+import pytest
+from blessed import Terminal
+
+from core import art_cache, pet_state
+from core.pet_state import PetState
+
+RED = "\x1b[38;2;255;0;0m"
+
+
+@pytest.fixture
+def sources(tmp_path):
+    cats = tmp_path / "cats.json"
+    cats.write_text(json.dumps([
+        {"name": "Lion", "art": "L"},
+        {"name": "Sleeping cat", "art": "zz"},
+        {"name": "Cat face", "art": "=^.^="},
+        {"name": "Empty", "art": ""},
+    ]))
+    moods = tmp_path / "ascii_moods.json"
+    moods.write_text(json.dumps({"moods": {
+        "happy": {"frames": [
+            {"lines": ["ab", "abcd"], "colored_lines": [RED + "ab", RED + "abcd\x1b[0m"], "duration_ms": 50},
+            {"lines": ["xy", "  "], "colored_lines": [RED + "xy", "  "]},
+        ]},
+        "sad": {"frames": [{"lines": ["..."]}]},
+    }}))
+    return cats, moods, tmp_path / "art_cache.json"
+
+
+def test_compiles_index_and_widths(sources):
+    cats, moods, _ = sources
+    art = art_cache.compile_art(cats, moods)
+    assert [name for name, _ in art.cats] == ["Lion", "Sleeping cat", "Cat face"]
+    assert art.cats_for("creative") == (0,)
+    assert art.cats_for("sleeping") == (1,)
+    assert art.cats_for("happy") == (2, 1)  # "Cat face" first, then any "Cat"
+    assert art.cats_for("proud") == art.emotion_cats[art_cache.DEFAULT_KEY]
+
+    happy = art.moods["happy"]
+    assert happy.durations == (0.05, 0.1)
+    assert happy.widths == ((2, 4), (2, 2))
+    assert happy.colored_widths == ((2, 4), (2, 2))
+    assert art.moods["sad"].colored == ()
+
+
+def test_load_reuses_cache_until_a_source_changes(sources, monkeypatch):
+    cats, moods, path = sources
+    first = art_cache.load(path, cats, moods)
+    assert path.exists()
+
+    def fail(*_):
+        raise AssertionError("recompiled an up-to-date cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(art_cache, "compile_art", fail)
+        assert art_cache.load(path, cats, moods) == first
+
+    cats.write_text(json.dumps([{"name": "Tiger", "art": "T"}]))
+    os.utime(cats, ns=(0, 0))
+    assert [name for name, _ in art_cache.load(path, cats, moods).cats] == ["Tiger"]
+
+
+def test_corrupt_cache_is_rebuilt(sources):
+    cats, moods, path = sources
+    path.write_text("not json")
+    assert len(art_cache.load(path, cats, moods).cats) == 3
+
+
+def test_cache_round_trips_as_json(sources):
+    cats, moods, path = sources
+    built = art_cache.build(path, cats, moods)
+    json.loads(path.read_text())
+    assert art_cache.load(path, cats, moods) == built
+
+
+def test_importing_pet_state_builds_no_cache(tmp_path):
+    import subprocess
+    import sys
+
+    env = dict(os.environ, HOME=str(tmp_path))
+    subprocess.run([sys.executable, "-c", "import core.pet_state"], check=True, env=env,
+                   cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert not (tmp_path / ".openclaw").exists()
+
+
+def test_face_rows_match_per_frame_rendering(sources, monkeypatch):
+    import clawgotchi_cli as cli
+
+    cats, moods, path = sources
+    art = art_cache.load(path, cats, moods)
+    monkeypatch.setattr(art_cache, "_ART", art)
+    monkeypatch.setattr(pet_state, "ASCII_MOODS", {k: m.frames for k, m in art.moods.items()})
+    monkeypatch.setattr(pet_state, "ASCII_MOODS_COLORED",
+                        {k: m.colored for k, m in art.moods.items() if m.colored})
+    art_cache.centered_frame.cache_clear()
+    term = Terminal(force_styling=True)
+    pet = PetState()
+    pet.face_key = "happy"
+    try:
+        for frame in range(3):
+            pet._anim_frame = frame
+            for w in (10, 41, 80):
+                expected = tuple(cli.pad_row(term, cli.center_art(line, w) + term.normal, w)
+                                 for line in pet.get_face_lines())
+                assert cli.face_rows(term, pet.get_face_lines(width=w), w) == expected
+        pet.face_key = "sad"
+        assert pet.get_face_lines(width=7) == (" ...",)
+    finally:
+        art_cache.centered_frame.cache_clear()
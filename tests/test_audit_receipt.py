@@ -229,3 +229,117 @@ class TestReceiptErrorHandling:
 
         with pytest.raises(ReceiptError):
             store.load(original.receipt_id)
+
+
+class TestReceiptIndex:
+    """Test the persistent index and segment compaction."""
+
+    def _receipt(self, action, n, timestamp):
+        return AuditReceipt(action=action, payload={"n": n}, timestamp=timestamp)
+
+    def test_index_survives_reopen(self, tmp_path):
+        store = ReceiptStore(tmp_path)
+        receipt = self._receipt("build", 1, "2026-01-01T00:00:00Z")
+        store.save(receipt)
+
+        reopened = ReceiptStore(tmp_path)
+        is_duplicate, existing = reopened.check_idempotency("build", receipt.content_hash)
+
+        assert is_duplicate is True
+        assert existing.receipt_id == receipt.receipt_id
+        assert (tmp_path / ReceiptStore.INDEX_FILE).exists()
+
+    def test_unindexed_files_are_picked_up_on_open(self, tmp_path):
+        receipt = self._receipt("legacy", 1, "2026-01-01T00:00:00Z")
+        (tmp_path / f"{receipt.receipt_id}.json").write_text(json.dumps(receipt.to_dict()))
+
+        store = ReceiptStore(tmp_path)
+
+        assert store.get_stats()["actions"] == {"legacy": 1}
+        assert store.check_idempotency("legacy", receipt.content_hash)[0] is True
+
+    def test_idempotency_does_not_read_other_receipts(self, tmp_path, monkeypatch):
+        store = ReceiptStore(tmp_path)
+        for i in range(20):
+            store.save(self._receipt("build", i, f"2026-01-01T00:00:{i:02d}Z"))
+        target = self._receipt("build", 99, "2026-01-02T00:00:00Z")
+        store.save(target)
+        reads = []
+        real = store._read_data
+        monkeypatch.setattr(store, "_read_data", lambda entry: reads.append(entry) or real(entry))
+
+        assert store.check_idempotency("build", target.content_hash)[0] is True
+        assert store.check_idempotency("build", "0" * 64) == (False, None)
+        assert len(reads) == 1
+        assert store.get_stats()["total_receipts"] == 21
+        assert len(reads) == 1
+
+    def test_compact_folds_files_into_segment(self, tmp_path):
+        store = ReceiptStore(tmp_path)
+        receipts = [self._receipt("build", i, f"2026-01-0{i + 1}T00:00:00Z") for i in range(3)]
+        for receipt in receipts:
+            store.save(receipt)
+
+        assert store.compact() == 3
+
+        assert list(tmp_path.glob("*.json")) == []
+        assert len(list((tmp_path / ReceiptStore.SEGMENT_DIR).glob("*.jsonl"))) == 1
+        reopened = ReceiptStore(tmp_path)
+        for receipt in receipts:
+            assert reopened.load(receipt.receipt_id).payload == receipt.payload
+        assert [r.receipt_id for r in reopened.list_by_action("build")] == [
+            r.receipt_id for r in receipts
+        ]
+
+    def test_compact_respects_cutoff_and_keeps_tampered_files(self, tmp_path):
+        store = ReceiptStore(tmp_path)
+        old = self._receipt("build", 1, "2026-01-01T00:00:00Z")
+        new = self._receipt("build", 2, "2026-03-01T00:00:00Z")
+        tampered = self._receipt("build", 3, "2026-01-02T00:00:00Z")
+        for receipt in (old, new, tampered):
+            store.save(receipt)
+        path = tmp_path / f"{tampered.receipt_id}.json"
+        data = json.loads(path.read_text())
+        data["payload"] = {"tampered": True}
+        path.write_text(json.dumps(data))
+
+        assert store.compact(before_timestamp="2026-02-01T00:00:00Z") == 1
+
+        assert not (tmp_path / f"{old.receipt_id}.json").exists()
+        assert (tmp_path / f"{new.receipt_id}.json").exists()
+        assert path.exists()
+        with pytest.raises(ReceiptError):
+            store.load(tampered.receipt_id)
+
+    def test_tampered_segment_record_detected_on_load(self, tmp_path):
+        store = ReceiptStore(tmp_path)
+        receipt = self._receipt("build", 1, "2026-01-01T00:00:00Z")
+        store.save(receipt)
+        store.compact()
+        segment = next((tmp_path / ReceiptStore.SEGMENT_DIR).glob("*.jsonl"))
+        segment.write_text(segment.read_text().replace('"n":1', '"n":7'))
+
+        with pytest.raises(ReceiptError):
+            ReceiptStore(tmp_path).load(receipt.receipt_id)
+
+    def test_prune_uses_time_index_for_files_and_segments(self, tmp_path):
+        store = ReceiptStore(tmp_path)
+        early = self._receipt("build", 1, "2026-01-01T00:00:00Z")
+        middle = self._receipt("build", 2, "2026-01-15T00:00:00.500000Z")
+        late = self._receipt("build", 3, "2026-02-01T00:00:00Z")
+        store.save(early)
+        store.compact()
+        store.save(middle)
+        store.save(late)
+
+        assert store.prune("2026-01-20T00:00:00Z") == 2
+
+        assert not (tmp_path / f"{middle.receipt_id}.json").exists()
+        reopened = ReceiptStore(tmp_path)
+        assert reopened.get_stats()["total_receipts"] == 1
+        with pytest.raises(ReceiptError):
+            reopened.load(early.receipt_id)
+        reopened.compact()
+        assert reopened.load(late.receipt_id).receipt_id == late.receipt_id
+        segment = next((tmp_path / ReceiptStore.SEGMENT_DIR).glob("*.jsonl"))
+        assert early.receipt_id not in segment.read_text()
@@ -0,0 +1,206 @@
+"""Tests for core/backup_ring.py — deduplicated, delta-encoded state backups."""
+
+import json
+from datetime import datetime, timedelta
+
+from core.backup_ring import (
+    BackupRing,
+    RetentionPolicy,
+    apply_delta,
+    content_hash,
+    json_delta,
+)
+
+
+def _state(wakes, goal="explore", extra=None):
+    data = {
+        "state": {"total_wakes": wakes, "health_score": 90, "current_goal": goal},
+        "resources": {"disk": {"used_mb": 100, "available_mb": 5000}, "notes": "x" * 400},
+    }
+    if extra:
+        data.update(extra)
+    return data
+
+
+class FakeClock:
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs).total_seconds()
+
+
+def _ring(tmp_path, **kwargs):
+    clock = FakeClock(datetime(2026, 3, 2, 9, 0).timestamp())
+    return BackupRing(tmp_path / "backups", clock=clock, **kwargs), clock
+
+
+class TestJsonDelta:
+    def test_roundtrip_nested_changes(self):
+        old = {"a": 1, "b": {"c": 2, "d": [1, 2]}, "gone": True}
+        new = {"a": 1, "b": {"c": 3, "d": [1, 2], "e": None}, "added": "x"}
+
+        delta = json_delta(old, new)
+
+        assert apply_delta(old, delta) == new
+        assert "a" not in delta["~"]
+        assert delta["-"] == ["gone"]
+
+    def test_equal_and_non_dict_values(self):
+        assert json_delta({"a": 1}, {"a": 1}) is None
+        assert apply_delta([1], json_delta([1], [2])) == [2]
+
+
+class TestBackupRing:
+    def test_identical_snapshot_is_skipped(self, tmp_path):
+        ring, clock = _ring(tmp_path)
+
+        first = ring.save(_state(1))
+        clock.advance(minutes=5)
+        second = ring.save(_state(1))
+
+        assert first is not None
+        assert second is None
+        assert len(ring) == 1
+
+    def test_changes_are_stored_as_deltas_against_keyframe(self, tmp_path):
+        ring, clock = _ring(tmp_path, retention=RetentionPolicy(hourly=100))
+        for wakes in range(1, 6):
+            ring.save(_state(wakes))
+            clock.advance(hours=1)
+
+        snapshots = ring.snapshots()
+        keyframe = snapshots[0].hash
+        assert not snapshots[0].is_delta
+        assert all(s.base == keyframe for s in snapshots[1:])
+        assert ring.load() == _state(5)
+        assert ring.load(snapshots[2]) == _state(3)
+        objects = ring.objects
+        delta_size = (objects / f"{keyframe}-{snapshots[-1].hash}.delta.json").stat().st_size
+        assert delta_size * 4 < (objects / f"{keyframe}.json").stat().st_size
+
+    def test_large_change_cuts_new_keyframe(self, tmp_path):
+        ring, clock = _ring(tmp_path, retention=RetentionPolicy(hourly=100))
+        ring.save(_state(1))
+        clock.advance(hours=1)
+        ring.save({"state": {"total_wakes": 2}, "other": "y" * 1000})
+
+        assert not ring.latest().is_delta
+        assert ring.load() == {"state": {"total_wakes": 2}, "other": "y" * 1000}
+
+    def test_keyframe_every_bounds_delta_runs(self, tmp_path):
+        ring, clock = _ring(tmp_path, retention=RetentionPolicy(hourly=100), keyframe_every=2)
+        for wakes in range(1, 5):
+            ring.save(_state(wakes))
+            clock.advance(hours=1)
+
+        assert [s.is_delta for s in ring.snapshots()] == [False, True, True, False]
+
+    def test_content_recurring_after_new_keyframe(self, tmp_path):
+        ring, clock = _ring(tmp_path, retention=RetentionPolicy(hourly=100), keyframe_every=2)
+        pad = {"pad": "p" * 200}
+        states = [pad, dict(pad, a=1), dict(pad, a=1, b=1), dict(pad, a=1, b=1, c=1)]
+        # K, A, B, C (new keyframe), A again: A's delta must be against C
+        for data in (states[0], states[1], states[2], states[3], states[1]):
+            ring.save(data)
+            clock.advance(hours=1)
+
+        snapshots = ring.snapshots()
+        assert not snapshots[3].is_delta
+        assert snapshots[4].base == snapshots[3].hash
+        assert ring.load() == states[1]
+        assert ring.load(snapshots[1]) == states[1]
+        reopened = BackupRing(tmp_path / "backups", clock=clock)
+        assert [reopened.load(s) for s in reopened.snapshots()] == [
+            states[0], states[1], states[2], states[3], states[1]]
+
+    def test_lookup_by_time(self, tmp_path):
+        ring, clock = _ring(tmp_path, retention=RetentionPolicy(hourly=100))
+        start = clock.now
+        for wakes in range(3):
+            ring.save(_state(wakes))
+            clock.advance(hours=1)
+
+        assert ring.at(start - 1) is None
+        assert ring.load(ring.at(start + 90 * 60)) == _state(1)
+        assert ring.load(ring.at(clock.now)) == _state(2)
+
+    def test_manifest_survives_reopen(self, tmp_path):
+        ring, clock = _ring(tmp_path)
+        ring.save(_state(1))
+        clock.advance(hours=1)
+        ring.save(_state(2))
+
+        reopened = BackupRing(tmp_path / "backups", clock=clock)
+
+        assert len(reopened) == 2
+        assert reopened.load() == _state(2)
+        clock.advance(hours=1)
+        assert reopened.save(_state(2)) is None
+        assert reopened.save(_state(3)).base == ring.snapshots()[0].hash
+
+    def test_tiered_retention_bounds_manifest_and_objects(self, tmp_path):
+        ring, clock = _ring(tmp_path, retention=RetentionPolicy(hourly=6, daily=3, weekly=2))
+        for wakes in range(24 * 10 * 4):  # 10 days every 15 minutes
+            ring.save(_state(wakes))
+            clock.advance(minutes=15)
+
+        assert len(ring) <= 6 + 3 + 2 + 1
+        referenced = set()
+        for s in ring.snapshots():
+            referenced.add(f"{s.base}-{s.hash}.delta.json" if s.is_delta else f"{s.hash}.json")
+            if s.is_delta:
+                referenced.add(f"{s.base}.json")
+        on_disk = {p.name for p in ring.objects.iterdir()}
+        assert referenced <= on_disk
+        assert len(on_disk - referenced) <= 1  # at most the current keyframe
+        for s in ring.snapshots():
+            assert ring.load(s)["state"]["total_wakes"] >= 0
+
+    def test_retention_policy_keeps_newest_per_bucket(self):
+        base = datetime(2026, 3, 2, 9, 0).timestamp()
+        times = [base + m * 60 for m in (0, 10, 70, 80)]
+
+        kept = RetentionPolicy(hourly=1, daily=0, weekly=0).keep(times)
+
+        assert kept == {3}
+        assert RetentionPolicy(hourly=2, daily=0, weekly=0).keep(times) == {1, 3}
+
+    def test_import_legacy_files(self, tmp_path):
+        ring, _ = _ring(tmp_path)
+        backups = tmp_path / "backups"
+        backups.mkdir(exist_ok=True)
+        for i, hour in enumerate((1, 2, 3)):
+            payload = dict(_state(i), timestamp=f"20260301_0{hour}0000", backups_count=i)
+            (backups / f"state_20260301_0{hour}0000.json").write_text(json.dumps(payload))
+        (backups / "state_garbage.json").write_text("{}")
+
+        assert ring.import_legacy() == 3
+
+        assert sorted(p.name for p in backups.glob("state_*.json")) == ["state_garbage.json"]
+        assert [s.label for s in ring.snapshots()] == [
+            "20260301_010000", "20260301_020000", "20260301_030000",
+        ]
+        assert ring.load() == _state(2)
+        assert content_hash(ring.load()) == ring.latest().hash
+
+        # The migration runs once; files written afterwards are not touched
+        (backups / "state_20260301_040000.json").write_text(json.dumps(_state(3)))
+        assert BackupRing(backups).import_legacy() == 0
+        assert (backups / "state_20260301_040000.json").exists()
+
+    def test_import_legacy_leaves_files_it_does_not_accept(self, tmp_path):
+        ring, _ = _ring(tmp_path)
+        backups = tmp_path / "backups"
+        backups.mkdir(exist_ok=True)
+        ours = dict(_state(1), timestamp="20260301_010000", backups_count=0)
+        (backups / "state_20260301_010000.json").write_text(json.dumps(ours))
+        (backups / "state_20260301_020000.json").write_text(json.dumps({"mood": "happy"}))
+
+        assert ring.import_legacy(accept=lambda data: "backups_count" in data) == 1
+
+        assert [p.name for p in backups.glob("state_*.json")] == ["state_20260301_020000.json"]
+        assert json.loads((backups / "state_20260301_020000.json").read_text()) == {"mood": "happy"}
@@ -34,3 +34,25 @@ class TestLenVisible:
         """Mixed plain and ANSI content."""
         mixed = "\x1b[34mhello\x1b[0m world"
         assert clawgotchi.len_visible(mixed) == 11
+
+
+class TestFirstFrame:
+    """The first frame is drawn before the data refresher has fetched anything."""
+
+    def test_pet_view_draws_without_vitals(self):
+        from blessed import Terminal
+        from core.data_refresher import DataRefresher
+        from core.pet_state import PetState
+        from core.screen_buffer import ScreenBuffer
+        import clawgotchi_cli as cli
+
+        term = Terminal(force_styling=True, kind="xterm-256color")
+        data = DataRefresher()
+        data.register("vitals", lambda: {"goal": "never fetched"}, 30)  # no default
+        data.register("dashboard", dict, 30)
+        written = []
+        with patch.object(Terminal, "width", 80), patch.object(Terminal, "height", 30):
+            for mode in ("pet", "dashboard"):
+                cli.draw(term, PetState(), [], [], 0, mode,
+                         screen=ScreenBuffer(term, write=written.append), data=data)
+        assert written
@@ -238,3 +238,86 @@ def test_whitespace_handling():
     
     score = scorer.score(text, topics)
     assert score.exact_matches >= 2
+
+
+def test_score_chunks_matches_per_word_rule():
+    """Batch scoring gives the same exact/partial counts as word-by-word matching."""
+    scorer = ContentRelevanceScorer()
+    chunks = [
+        "Memory and memories, remembering memo",
+        "agents agent AI said",
+        "",
+        "python py pythonic",
+    ]
+    topics = {"mem": 1.5, "ai": 1.0, "python": 0.5, "agent": 2.0}
+
+    results = scorer.score_chunks(chunks, topics)
+
+    assert [r.exact_matches for r in results] == [0, 2, 0, 1]
+    # "memory", "memories", "remembering", "memo" contain "mem"; "said"
+    # contains "ai"; "agents" contains "agent"; "pythonic" contains "python"
+    assert [r.partial_matches for r in results] == [4, 2, 0, 1]
+    assert results[1].breakdown == {"ai": 2.0 + 1.0, "agent": 4.0 + 2.0}
+    assert results[2].is_relevant is False
+    assert [r.total_score for r in results] == [scorer.score(c, topics).total_score for c in chunks]
+
+
+def test_partial_matches_respect_min_word_length():
+    """Short words are not counted as partial matches."""
+    scorer = ContentRelevanceScorer(RelevanceConfig(min_word_length=5))
+
+    score = scorer.score("ai aim aiming", ["ai"])
+
+    assert score.exact_matches == 1
+    assert score.partial_matches == 1
+
+
+def test_term_matrix_terms_containing():
+    """The n-gram index finds every vocabulary word containing a needle."""
+    scorer = ContentRelevanceScorer()
+    matrix = scorer.build_matrix(["relevance scorer", "score scores", "core"])
+
+    assert matrix.terms_containing("core") == ["core", "score", "scorer", "scores"]
+    assert matrix.terms_containing("scor") == ["score", "scorer", "scores"]
+    assert matrix.terms_containing("zz") == []
+    assert matrix.columns(["score"]) == {"score": [(1, 1)]}
+
+
+def test_rank_chunks_prefers_rare_terms_with_idf():
+    """Ranking weights hits by inverse document frequency and drops misses."""
+    scorer = ContentRelevanceScorer()
+    chunks = [
+        "agent memory",
+        "agent decay",
+        "agent",
+        "weather report",
+    ]
+    topics = {"agent": 1.0, "decay": 1.0, "memory": 1.0}
+
+    ranked = scorer.rank_chunks(chunks, topics)
+    top = scorer.rank_chunks(chunks, topics, top_k=1)
+
+    assert [r.text for r in ranked][:2] == ["agent memory", "agent decay"]
+    assert ranked[-1].text == "agent"
+    assert all(r.text != "weather report" for r in ranked)
+    assert [r.text for r in top] == ["agent memory"]
+    plain = scorer.rank_chunks(chunks, topics, use_idf=False)
+    assert plain[0].total_score == 4.0
+
+
+def test_rank_order_keeps_input_order_among_ties_with_top_k():
+    from utils.content_relevance_scorer import _rank_order
+
+    scores = [1.0, 3.0, 1.0, 3.0, 1.0, 1.0, 2.0, 1.0]
+
+    assert _rank_order(scores, top_k=5) == [1, 3, 6, 0, 2]
+    assert _rank_order(scores, top_k=None) == [1, 3, 6, 0, 2, 4, 5, 7]
+    assert _rank_order(scores, top_k=0) == []
+
+
+def test_score_chunks_reports_float_zero_for_misses():
+    scorer = ContentRelevanceScorer()
+
+    scored = scorer.score_chunks(["", "weather report"], {"agent": 1.0})
+
+    assert all(isinstance(s.total_score, float) and s.total_score == 0.0 for s in scored)
@@ -0,0 +1,128 @@
+"""Tests for the indexed, archiving CuriosityQueue."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from core import autonomous_agent as aa
+from core.curiosity_index import NearDuplicateIndex, PriorityHeap
+
+
+@pytest.fixture
+def queue_files(tmp_path, monkeypatch):
+    queue_file = tmp_path / "curiosity_queue.json"
+    archive_file = tmp_path / "curiosity_archive.jsonl"
+    monkeypatch.setattr(aa, "CURIOSITY_FILE", queue_file)
+    monkeypatch.setattr(aa, "CURIOSITY_ARCHIVE_FILE", archive_file)
+    return queue_file, archive_file
+
+
+def test_near_duplicate_index_matches_small_variations():
+    index = NearDuplicateIndex()
+    index.add("cur-1", "Adaptive memory design for autonomous agents")
+
+    assert index.find("adaptive memory design for autonomous agents!") == "cur-1"
+    assert index.find("Adaptive memory design for autonomous agent") == "cur-1"
+    assert index.find("Prompt injection firewall") is None
+
+    index.remove("cur-1")
+    assert index.find("Adaptive memory design for autonomous agents") is None
+
+
+def test_priority_heap_prefers_priority_then_newest():
+    heap = PriorityHeap()
+    heap.push("a", 3)
+    heap.push("b", 5)
+    heap.push("c", 5)
+
+    assert heap.peek() == "c"
+    heap.discard("c")
+    assert heap.peek() == "b"
+    assert heap.peek(lambda item_id: item_id == "a") == "a"
+
+
+def test_add_merges_near_duplicates(queue_files):
+    queue = aa.CuriosityQueue()
+    queue.add("Memory decay for agents", "moltbook:1", priority=3)
+    queue.add("Memory decay for agent", "moltbook:2", priority=4, categories=["memory_systems"])
+
+    assert len(queue.queue) == 1
+    item = queue.queue[0]
+    assert item["seen_count"] == 2
+    assert item["priority"] == 5
+    assert item["sources"] == ["moltbook:1", "moltbook:2"]
+    assert item["aliases"] == ["Memory decay for agent"]
+
+
+def test_get_next_and_get_mature_follow_priority(queue_files):
+    queue = aa.CuriosityQueue()
+    queue.add("Low priority idea", "s", priority=1)
+    queue.add("High priority idea", "s", priority=9)
+    queue.add("Seen twice idea", "s", priority=4)
+    queue.add("Seen twice idea", "s", priority=4)
+
+    assert queue.get_next()["topic"] == "High priority idea"
+    assert queue.get_mature()["topic"] == "Seen twice idea"
+
+    high = next(i for i in queue.queue if i["topic"] == "High priority idea")
+    high["added_at"] = (datetime.now() - timedelta(hours=13)).isoformat()
+    assert queue.get_mature()["topic"] == "High priority idea"
+
+
+def test_mark_explored_moves_item_to_archive(queue_files):
+    queue_file, archive_file = queue_files
+    queue = aa.CuriosityQueue()
+    queue.add("Curate memories", "s", priority=3)
+    item_id = queue.queue[0]["id"]
+
+    queue.mark_explored(item_id)
+    queue.flush()
+
+    assert queue.queue == []
+    assert queue.explored_count == 1
+    assert json.loads(queue_file.read_text())["queue"] == []
+    archived = [json.loads(line) for line in archive_file.read_text().splitlines()]
+    assert archived[0]["id"] == item_id and archived[0]["status"] == "explored"
+
+    queue.add("Curate memories", "s", priority=3)
+    assert len(queue.queue) == 1  # explored topics may be queued again
+
+
+def test_batch_writes_once(queue_files, monkeypatch):
+    queue = aa.CuriosityQueue()
+    writes = []
+    real_flush = queue.flush
+
+    def counting_flush():
+        writes.append(queue._dirty)
+        real_flush()
+
+    monkeypatch.setattr(queue, "flush", counting_flush)
+    with queue.batch():
+        for i in range(5):
+            queue.add(f"Distinct topic number {i} about things", "s")
+
+    assert writes == [True]
+
+
+def test_load_migrates_inline_explored_items(queue_files):
+    queue_file, archive_file = queue_files
+    queue_file.write_text(json.dumps({
+        "queue": [
+            {"id": "cur-2", "topic": "Pending", "status": "pending", "priority": 2,
+             "added_at": datetime.now().isoformat()},
+            {"id": "cur-1", "topic": "Done", "status": "explored", "priority": 1},
+        ],
+        "explored_count": 1,
+        "total_discovered": 2,
+    }))
+
+    queue = aa.CuriosityQueue()
+    queue.load()
+    assert [i["id"] for i in queue.queue] == ["cur-2"]
+    assert queue.get_next()["id"] == "cur-2"
+
+    queue.flush()
+    assert json.loads(archive_file.read_text())["id"] == "cur-1"
+    assert [i["id"] for i in json.loads(queue_file.read_text())["queue"]] == ["cur-2"]
@@ -0,0 +1,83 @@
+"""Tests for the TUI's background data refresher."""
+
+import time
+
+from core.data_refresher import DataRefresher
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counter():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    return fetch, calls
+
+
+def test_get_returns_default_until_first_fetch():
+    data = DataRefresher(clock=Clock())
+    fetch, calls = _counter()
+    data.register("vitals", fetch, ttl=5, default="empty")
+
+    assert data.get("vitals") == "empty"
+    assert data.refresh_due() == 1
+    assert data.get("vitals") == 1
+
+
+def test_sources_refresh_per_ttl_only_while_read():
+    clock = Clock()
+    data = DataRefresher(clock=clock)
+    fast, fast_calls = _counter()
+    slow, slow_calls = _counter()
+    data.register("fast", fast, ttl=2)
+    data.register("slow", slow, ttl=60)
+    data.refresh_due()
+
+    clock.now = 3
+    data.get("fast")
+    data.get("slow")
+    data.refresh_due()
+    assert (len(fast_calls), len(slow_calls)) == (2, 1)
+
+    clock.now = 10  # fast is stale but nobody read it since the last fetch
+    data.refresh_due()
+    assert len(fast_calls) == 2
+
+
+def test_failed_fetch_keeps_last_value():
+    data = DataRefresher(clock=Clock())
+    values = iter([{"health": 90}])
+
+    def fetch():
+        return next(values)  # StopIteration on the second call
+
+    data.register("vitals", fetch, ttl=0)
+    data.refresh_due()
+    data.get("vitals")
+    data.refresh_due()
+
+    assert data.get("vitals") == {"health": 90}
+
+
+def test_background_thread_fetches_on_start():
+    data = DataRefresher()
+    fetch, calls = _counter()
+    data.register("skills", fetch, ttl=120, default=[])
+    data.start()
+    try:
+        for _ in range(100):
+            if calls:
+                break
+            time.sleep(0.01)
+    finally:
+        data.stop()
+    assert calls
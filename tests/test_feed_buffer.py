@@ -0,0 +1,75 @@
+"""Tests for the OpenClaw watcher's ring-buffer feed, rate window and dedupe set."""
+
+import time
+
+from integrations.feed_buffer import FeedBuffer, RateWindow, SeenKeys
+from integrations.openclaw_watcher import FeedItem, OpenClawWatcher
+
+
+def _item(ts, source="src"):
+    return FeedItem(timestamp=ts, source=source, summary=f"at {ts}")
+
+
+def test_feed_buffer_keeps_timestamp_order_for_late_items():
+    feed = FeedBuffer(capacity=5)
+    for ts in (1, 2, 5, 3, 4):
+        feed.add(_item(ts))
+
+    assert [i.timestamp for i in feed.snapshot()] == [1, 2, 3, 4, 5]
+    assert [i.timestamp for i in feed.latest(2)] == [4, 5]
+
+
+def test_feed_buffer_evicts_oldest_and_rejects_too_old():
+    feed = FeedBuffer(capacity=3)
+    for ts in (10, 20, 30, 40):
+        feed.add(_item(ts))
+    assert [i.timestamp for i in feed.snapshot()] == [20, 30, 40]
+
+    version = feed.version
+    assert not feed.add(_item(5))
+    assert feed.version == version
+    assert feed.add(_item(25))
+    assert [i.timestamp for i in feed.snapshot()] == [25, 30, 40]
+
+
+def test_rate_window_expires_old_events():
+    now = [1000.0]
+    rate = RateWindow(60, clock=lambda: now[0])
+    rate.extend([900.0, 950.0, 990.0, 999.0])  # 900 is already outside the window
+    assert rate.count() == 3
+
+    now[0] = 1011.0
+    assert rate.count() == 2
+    assert rate.per_minute() == 2.0
+
+
+def test_seen_keys_evicts_least_recently_seen():
+    seen = SeenKeys(capacity=2)
+    assert seen.add("a") and seen.add("b")
+    assert not seen.add("a")  # refreshes "a"
+    seen.add("c")
+
+    assert "a" in seen and "c" in seen
+    assert "b" not in seen
+
+
+def test_watcher_feed_rate_and_latest():
+    watcher = OpenClawWatcher()
+    now = time.time()
+    watcher._add_feed(_item(now - 1000))
+    watcher._add_feed(_item(now - 10))
+    assert watcher.feed_rate(window=60) == 1.0
+
+    watcher._add_feed(_item(now - 5))
+    watcher._add_feed(_item(now - 20))
+    assert watcher.feed_rate(window=60) == 3.0
+    assert [i.timestamp for i in watcher.get_feed(count=2)] == [now - 10, now - 5]
+
+
+def test_duplicate_cron_events_are_ignored():
+    watcher = OpenClawWatcher()
+    watcher._parse_cron_event("Cron: **Shuri Report** all good")
+    watcher._parse_cron_event("Cron: **Shuri Report** all good")
+
+    assert len(watcher.feed) == 1
+    assert watcher.feed_version == 1
@@ -0,0 +1,111 @@
+"""Tests for the inotify/polling directory watcher and OpenClawWatcher's use of it."""
+
+import json
+import os
+
+import pytest
+
+import integrations.openclaw_watcher as ow
+from integrations.file_watch import FileWatcher
+
+
+def _bump(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(params=["inotify", "poll"])
+def watcher(request):
+    fw = FileWatcher(poll_interval=0.01, use_inotify=request.param == "inotify")
+    if fw.mode != request.param:
+        pytest.skip("inotify not available")
+    yield fw
+    fw.close()
+
+
+def test_reports_changed_file_names(tmp_path, watcher):
+    seen = []
+    watcher.watch(tmp_path, seen.append)
+    (tmp_path / "a.jsonl").write_text("one\n")
+
+    assert watcher.poll_once(timeout=2) >= 1
+    assert "a.jsonl" in seen
+
+
+def test_idle_directory_fires_nothing(tmp_path, watcher):
+    (tmp_path / "a.jsonl").write_text("one\n")
+    seen = []
+    watcher.watch(tmp_path, seen.append)
+
+    assert watcher.poll_once(timeout=0.05) == 0
+    assert seen == []
+
+
+def test_missing_directory_is_picked_up_when_created(tmp_path):
+    fw = FileWatcher(use_inotify=True, retry_interval=0.01)
+    seen = []
+    target = tmp_path / "later"
+    fw.watch(target, seen.append)
+    target.mkdir()
+    (target / "x.log").write_text("hi\n")
+
+    for _ in range(20):
+        fw.poll_once(timeout=0.05)
+        if seen:
+            break
+    fw.close()
+    assert seen  # None (rescan) for inotify, "x.log" for polling
+
+
+@pytest.fixture
+def openclaw(tmp_path, monkeypatch):
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    monkeypatch.setattr(ow, "SESSIONS_DIR", sessions)
+    monkeypatch.setattr(ow, "SESSIONS_INDEX", sessions / "sessions.json")
+    monkeypatch.setattr(ow, "GATEWAY_LOG", tmp_path / "logs" / "gateway.log")
+    return sessions
+
+
+def _message(text):
+    return json.dumps({
+        "type": "message",
+        "timestamp": "2026-02-01T10:00:00Z",
+        "message": {"role": "assistant", "content": [{"type": "text", "text": text}]},
+    }) + "\n"
+
+
+def test_session_index_only_reparsed_on_change(openclaw, monkeypatch):
+    index = openclaw / "sessions.json"
+    index.write_text(json.dumps({"agent:main:main": {"sessionId": "abc"}}))
+    watcher = ow.OpenClawWatcher()
+    watcher._load_session_map()
+    assert watcher._session_agent_map == {str(openclaw / "abc.jsonl"): "Clawd"}
+
+    reads = []
+    original = json.loads
+    monkeypatch.setattr(ow.json, "loads", lambda s: reads.append(s) or original(s))
+    watcher._on_session_change("sessions.json")
+    assert reads == []
+
+    index.write_text(json.dumps({"agent:main:main": {"sessionId": "abc"},
+                                 "agent:main:cron:j1": {"sessionId": "def"}}))
+    _bump(index)
+    watcher._on_session_change("sessions.json")
+    assert str(openclaw / "def.jsonl") in watcher._session_agent_map
+
+
+def test_session_change_tails_only_that_file(openclaw):
+    (openclaw / "sessions.json").write_text(json.dumps({"agent:main:main": {"sessionId": "abc"}}))
+    session = openclaw / "abc.jsonl"
+    session.write_text(_message("old news"))
+    watcher = ow.OpenClawWatcher()
+    watcher._load_session_map()
+
+    with open(session, "a") as f:
+        f.write(_message("fresh reply"))
+    watcher._on_session_change("abc.jsonl")
+    watcher._on_session_change("unknown.jsonl")
+
+    assert [item.summary for item in watcher.feed] == ["fresh reply"]
+    assert watcher.feed[0].source == "Clawd"
@@ -0,0 +1,195 @@
+"""Tests for the persistent OpenClaw gateway client."""
+
+import json
+import socket
+import sys
+import threading
+
+import pytest
+
+from integrations.gateway_client import (
+    COMMAND_ENV,
+    SOCKET_ENV,
+    TRANSPORT_CLI,
+    TRANSPORT_PERSISTENT,
+    GatewayClient,
+    GatewayError,
+    GatewayUnavailable,
+    connect_default,
+    connect_unix,
+)
+from integrations.openclaw_watcher import OpenClawWatcher
+
+
+class FakeGateway:
+    """Line-delimited JSON server on a Unix socket; counts connections."""
+
+    def __init__(self, path):
+        self.path = path
+        self.connections = 0
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(path))
+        self.server.listen()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        with conn, conn.makefile("rb") as reader, conn.makefile("wb") as writer:
+            for line in reader:
+                request = json.loads(line)
+                if request["method"] == "status":
+                    reply = {"id": request["id"], "result": {"sessions": {"count": 2}}}
+                elif request["method"] == "agent":
+                    text = request["params"]["message"]
+                    reply = {"id": request["id"], "result": {"reply": f"echo {text}"}}
+                else:
+                    reply = {"id": request["id"], "error": {"message": "unknown method"}}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                writer.flush()
+
+    def close(self):
+        self.server.close()
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    server = FakeGateway(tmp_path / "gw.sock")
+    yield server
+    server.close()
+
+
+def test_status_and_chat_share_one_connection(gateway):
+    client = GatewayClient(connect=lambda: connect_unix(gateway.path), cli_fallback=False)
+
+    assert client.status() == {"sessions": {"count": 2}}
+    assert client.send_agent_message("hi") == "echo hi"
+    assert client.status()["sessions"]["count"] == 2
+    assert gateway.connections == 1
+
+    with pytest.raises(GatewayError, match="unknown method"):
+        client.call("bogus")
+    client.close()
+
+
+def test_concurrent_calls_are_multiplexed(gateway):
+    client = GatewayClient(connect=lambda: connect_unix(gateway.path), cli_fallback=False)
+    replies = []
+    threads = [threading.Thread(target=lambda i=i: replies.append(client.send_agent_message(str(i))))
+               for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert sorted(replies) == sorted(f"echo {i}" for i in range(8))
+    assert gateway.connections == 1
+    client.close()
+
+
+def test_failed_connects_back_off():
+    now = [0.0]
+    attempts = []
+
+    def connect():
+        attempts.append(now[0])
+        raise GatewayError("refused")
+
+    client = GatewayClient(connect=connect, min_backoff=1, max_backoff=4, clock=lambda: now[0])
+    for t in (0.0, 0.5, 1.0, 2.0, 3.0, 10.0):
+        now[0] = t
+        with pytest.raises(GatewayError):
+            client.status()
+
+    assert attempts == [0.0, 1.0, 3.0, 10.0]  # waits 1s, then 2s, then 4s
+
+
+def test_missing_socket_falls_back_to_cli(tmp_path, monkeypatch):
+    client = GatewayClient(connect=lambda: connect_unix(tmp_path / "none.sock"))
+    monkeypatch.setattr(GatewayClient, "_cli_status", staticmethod(lambda: {"sessions": {}}))
+
+    assert client.status() == {"sessions": {}}
+    client.cli_fallback = False
+    with pytest.raises(GatewayUnavailable):
+        client.status()
+
+
+def test_watcher_polls_through_gateway_client(gateway):
+    client = GatewayClient(connect=lambda: connect_unix(gateway.path), cli_fallback=False)
+    watcher = OpenClawWatcher(gateway=client)
+    watcher._poll_gateway()
+
+    assert watcher.state.online
+    assert watcher.state.active_sessions == 2
+
+    gateway.close()
+    gateway.path.unlink()
+    client.close()
+    watcher._poll_gateway()
+    assert not watcher.state.online
+
+
+def test_cli_fallback_is_throttled_and_reported(tmp_path, monkeypatch):
+    now = [0.0]
+    forks = []
+
+    def cli_status():
+        forks.append(now[0])
+        return {"sessions": {"count": len(forks)}}
+
+    monkeypatch.setattr(GatewayClient, "_cli_status", staticmethod(cli_status))
+    client = GatewayClient(connect=lambda: connect_unix(tmp_path / "none.sock"), clock=lambda: now[0])
+    watcher = OpenClawWatcher(gateway=client)
+    for t in range(0, 130, 10):  # the watcher's 10s poll
+        now[0] = float(t)
+        watcher._poll_gateway()
+
+    assert forks == [0.0, 60.0, 120.0]
+    assert client.transport == TRANSPORT_CLI
+    assert watcher.state.transport == TRANSPORT_CLI
+    notices = [item for item in watcher.get_feed() if "openclaw CLI" in item.summary]
+    assert len(notices) == 1
+
+
+def test_cli_fallback_failures_are_throttled_too(tmp_path, monkeypatch):
+    calls = []
+
+    def cli_status():
+        calls.append(1)
+        raise GatewayError("openclaw CLI failed: not installed")
+
+    monkeypatch.setattr(GatewayClient, "_cli_status", staticmethod(cli_status))
+    client = GatewayClient(connect=lambda: connect_unix(tmp_path / "none.sock"), clock=lambda: 5.0)
+    for _ in range(3):
+        with pytest.raises(GatewayError, match="not installed"):
+            client.status()
+    assert len(calls) == 1
+
+
+def test_long_lived_process_transport(tmp_path, monkeypatch):
+    server = tmp_path / "gw.py"
+    server.write_text(
+        "import json, sys\n"
+        "for line in sys.stdin:\n"
+        "    req = json.loads(line)\n"
+        "    print(json.dumps({'id': req['id'], 'result': {'sessions': {'count': 3}}}), flush=True)\n"
+    )
+    monkeypatch.setenv(SOCKET_ENV, str(tmp_path / "none.sock"))
+    monkeypatch.setenv(COMMAND_ENV, f"{sys.executable} {server}")
+    client = GatewayClient(cli_fallback=False)
+
+    assert client.status() == {"sessions": {"count": 3}}
+    assert client.status() == {"sessions": {"count": 3}}
+    assert client.transport == TRANSPORT_PERSISTENT
+    client.close()
+
+    monkeypatch.delenv(COMMAND_ENV)
+    with pytest.raises(GatewayUnavailable):
+        connect_default()
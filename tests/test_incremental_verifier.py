@@ -0,0 +1,148 @@
+"""Tests for the incremental wake-cycle test verifier."""
+
+import os
+
+from core.incremental_verifier import ImportGraph, IncrementalVerifier
+
+
+def _write(root, rel, text=""):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _bump(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _make_tree(root):
+    _write(root, "pkg/__init__.py")
+    _write(root, "pkg/base.py", "X = 1\n")
+    _write(root, "pkg/feature.py", "from .base import X\n")
+    _write(root, "other.py", "Y = 2\n")
+    _write(root, "tests/test_feature.py", "from pkg.feature import X\n")
+    _write(root, "tests/test_other.py", "import other\n")
+
+
+class FakeRunner:
+    def __init__(self, output=""):
+        self.calls = []
+        self.output = output
+
+    def __call__(self, targets):
+        self.calls.append(list(targets))
+        return (1 if "FAILED" in self.output else 0), self.output
+
+
+def test_import_graph_resolves_relative_and_transitive_imports(tmp_path):
+    _make_tree(tmp_path)
+    verifier = IncrementalVerifier(tmp_path)
+    files = [p for p in verifier.scan() if p.endswith(".py")]
+    graph = ImportGraph(tmp_path).build(files)
+
+    assert "pkg/base.py" in graph.imports["pkg/feature.py"]
+    affected = graph.affected_by({"pkg/base.py"})
+    assert "tests/test_feature.py" in affected
+    assert "tests/test_other.py" not in affected
+
+
+def test_first_verify_runs_full_suite_and_reuses_result(tmp_path):
+    _make_tree(tmp_path)
+    runner = FakeRunner()
+    verifier = IncrementalVerifier(tmp_path, runner=runner)
+
+    first = verifier.verify()
+    second = verifier.verify()
+
+    assert runner.calls == [["tests"]]
+    assert first.full_run and first.passed
+    assert second.reused
+
+
+def test_change_runs_only_dependent_tests(tmp_path):
+    _make_tree(tmp_path)
+    runner = FakeRunner()
+    verifier = IncrementalVerifier(tmp_path, runner=runner)
+    verifier.verify()
+
+    _bump(tmp_path / "pkg" / "base.py")
+    result = verifier.verify()
+
+    assert runner.calls[-1] == ["tests/test_feature.py"]
+    assert result.selected == ["tests/test_feature.py"]
+    assert not result.full_run
+
+
+def test_known_failures_are_rerun_on_any_change(tmp_path):
+    _make_tree(tmp_path)
+    runner = FakeRunner("FAILED tests/test_other.py::test_y - AssertionError\n")
+    verifier = IncrementalVerifier(tmp_path, runner=runner)
+    assert verifier.verify().failed == ["tests/test_other.py::test_y"]
+
+    # test_other.py does not import pkg/feature.py, but it was failing
+    _bump(tmp_path / "pkg" / "feature.py")
+    result = verifier.verify()
+
+    assert runner.calls[-1] == ["tests/test_feature.py", "tests/test_other.py"]
+    assert result.failed == ["tests/test_other.py::test_y"]
+
+    runner.output = ""
+    _bump(tmp_path / "pkg" / "feature.py")
+    assert verifier.verify().passed
+
+    # Once green, it is back to running only what the change reaches
+    _bump(tmp_path / "pkg" / "feature.py")
+    verifier.verify()
+    assert runner.calls[-1] == ["tests/test_feature.py"]
+
+
+def test_conftest_change_forces_full_run(tmp_path):
+    _make_tree(tmp_path)
+    runner = FakeRunner()
+    verifier = IncrementalVerifier(tmp_path, runner=runner)
+    verifier.verify()
+
+    _write(tmp_path, "tests/conftest.py", "import pytest\n")
+    assert verifier.verify().full_run
+    assert runner.calls[-1] == ["tests"]
+
+
+def test_collection_errors_are_reported(tmp_path):
+    _make_tree(tmp_path)
+    runner = FakeRunner("ERROR tests/test_feature.py - ImportError\n")
+    verifier = IncrementalVerifier(tmp_path, runner=runner)
+
+    result = verifier.verify()
+
+    assert result.errors == ["tests/test_feature.py"]
+    assert "tests/test_feature.py" in result.failed_files
+
+
+def test_overrunning_verify_is_awaited_not_rerun(tmp_path):
+    # OBSERVE's probe may still be running verify() on its thread after its
+    # budget expired; DECIDE/VERIFY must wait for that run and reuse it.
+    import threading
+    import time
+
+    _make_tree(tmp_path)
+    started = threading.Event()
+
+    class SlowRunner(FakeRunner):
+        def __call__(self, targets):
+            started.set()
+            time.sleep(0.2)
+            return super().__call__(targets)
+
+    runner = SlowRunner()
+    verifier = IncrementalVerifier(tmp_path, runner=runner)
+    probe = threading.Thread(target=verifier.verify)
+    probe.start()
+    started.wait(5)
+
+    result = verifier.verify()
+    probe.join(5)
+
+    assert runner.calls == [["tests"]]
+    assert result.reused and result.passed
@@ -0,0 +1,135 @@
+"""Tests for the persistent BM25 memory index."""
+
+import os
+
+from cognition.memory_index import INDEX_NAME, MANIFEST_NAME, MemoryIndex, parse_query
+
+
+def _write(root, name, text):
+    path = root / name
+    path.write_text(text)
+    return path
+
+
+def _bump(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _make_logs(root):
+    _write(root, "2026-02-01.md", "# Taste profile\nBuilt the taste profile today\nShipped tests\n")
+    _write(root, "2026-02-02.md", "Worked on memory search\nTasted coffee, profile of taste unclear\n")
+    _write(root, "2026-02-03.md", "Posted about taste on moltbook\n")
+    _write(root, "KNOWLEDGE.md", "Taste stabilises after consistent rejections\n")
+    _write(root, "data.json", '{"taste": true}')
+
+
+def test_parse_query_extracts_phrases_prefixes_and_dates():
+    parsed = parse_query('"Taste Profile" mem* since:2026-02-02 until:2026-02-03 ship')
+
+    assert parsed["phrases"] == [["taste", "profile"]]
+    assert parsed["prefixes"] == ["mem"]
+    assert parsed["terms"] == ["taste", "profile", "ship"]
+    assert (parsed["since"], parsed["until"]) == ("2026-02-02", "2026-02-03")
+
+
+def test_search_ranks_with_bm25_and_skips_non_markdown(tmp_path):
+    _make_logs(tmp_path)
+    index = MemoryIndex(tmp_path)
+    index.refresh()
+
+    results = index.search("taste profile")
+
+    assert results[0]["file"] == "2026-02-01.md"
+    assert results[0]["line"] == 1  # header boost
+    assert all(r["file"] != "data.json" for r in results)
+    assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+
+def test_phrase_prefix_and_date_filters(tmp_path):
+    _make_logs(tmp_path)
+    index = MemoryIndex(tmp_path)
+    index.refresh()
+
+    phrase = index.search('"taste profile"')
+    assert {(r["file"], r["line"]) for r in phrase} == {("2026-02-01.md", 1), ("2026-02-01.md", 2)}
+
+    prefix = index.search("tast*")
+    assert ("2026-02-02.md", 2) in {(r["file"], r["line"]) for r in prefix}
+
+    dated = index.search("taste since:2026-02-02")
+    assert {r["file"] for r in dated} == {"2026-02-02.md", "2026-02-03.md"}
+
+
+def test_refresh_is_incremental_and_persisted(tmp_path):
+    _make_logs(tmp_path)
+    index = MemoryIndex(tmp_path)
+    assert index.refresh()
+    assert (tmp_path / INDEX_NAME).exists()
+    assert not index.refresh()
+
+    reloaded = MemoryIndex(tmp_path)
+    assert not reloaded.refresh()
+    assert reloaded.search("moltbook")[0]["file"] == "2026-02-03.md"
+
+    log = _write(tmp_path, "2026-02-03.md", "Refactored the watcher\n")
+    _bump(log)
+    (tmp_path / "KNOWLEDGE.md").unlink()
+    assert reloaded.refresh()
+
+    assert reloaded.search("moltbook") == []
+    assert reloaded.search("watcher")[0]["file"] == "2026-02-03.md"
+    assert reloaded.files_with("stabil", prefix=True) == set()
+    assert reloaded.files_with("moltbook") == set()
+    assert not (tmp_path / INDEX_NAME / "KNOWLEDGE.md.json").exists()
+
+
+def test_refresh_rewrites_only_changed_sidecars_and_loads_lazily(tmp_path):
+    _make_logs(tmp_path)
+    MemoryIndex(tmp_path).refresh()
+    sidecars = tmp_path / INDEX_NAME
+    stamps = {p.name: p.stat().st_mtime_ns for p in sidecars.glob("*.md.json")}
+    assert set(stamps) == {"2026-02-01.md.json", "2026-02-02.md.json",
+                           "2026-02-03.md.json", "KNOWLEDGE.md.json"}
+
+    _bump(_write(tmp_path, "2026-02-02.md", "Worked on the watcher\n"))
+    index = MemoryIndex(tmp_path)
+    assert index.refresh()
+    rewritten = {p.name for p in sidecars.glob("*.md.json")
+                 if p.stat().st_mtime_ns != stamps[p.name]}
+    assert rewritten == {"2026-02-02.md.json"}
+
+    assert index.search("moltbook")[0]["file"] == "2026-02-03.md"
+    assert set(index._sidecars) == {"2026-02-02.md", "2026-02-03.md"}
+
+
+def test_working_segments_are_indexed(tmp_path):
+    _make_logs(tmp_path)
+    (tmp_path / "working").mkdir()
+    _write(tmp_path / "working", "WORKING-2026-02-04.md", "## Wake Cycle #3\nFixed the watcher tail\n")
+    index = MemoryIndex(tmp_path)
+    index.refresh()
+
+    hit = index.search("tail")[0]
+    assert (hit["file"], hit["line"], hit["date"]) == ("working/WORKING-2026-02-04.md", 2, "2026-02-04")
+    assert index.search("tail until:2026-02-03") == []
+
+
+def test_corrupt_sidecar_is_rebuilt(tmp_path):
+    _make_logs(tmp_path)
+    (tmp_path / INDEX_NAME).mkdir()
+    (tmp_path / INDEX_NAME / MANIFEST_NAME).write_text("{not json")
+
+    index = MemoryIndex(tmp_path)
+    assert index.refresh()
+    assert index.search("coffee")[0]["file"] == "2026-02-02.md"
+
+
+def test_damaged_file_sidecar_is_rebuilt_from_source(tmp_path):
+    _make_logs(tmp_path)
+    MemoryIndex(tmp_path).refresh()
+    (tmp_path / INDEX_NAME / "2026-02-02.md.json").write_text("{not json")
+
+    index = MemoryIndex(tmp_path)
+    assert not index.refresh()
+    assert index.search("coffee")[0]["file"] == "2026-02-02.md"
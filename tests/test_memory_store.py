@@ -0,0 +1,181 @@
+"""Tests for the optional SQLite memory store."""
+
+import json
+import threading
+
+import pytest
+
+from clawgotchi.evolution.goal_generator import GoalGenerator
+from clawgotchi.evolution.integration_manager import IntegrationManager
+from cognition.assumption_tracker import AssumptionTracker
+from cognition.ikigai_engine import IkigaiEngine
+from cognition.taste_profile import RejectionCategory, TasteProfile
+from core import autonomous_agent as aa
+from core.memory_store import SQLiteMemoryStore, export_files, get_memory_store, import_files
+
+
+@pytest.fixture
+def store(tmp_path):
+    db = SQLiteMemoryStore(tmp_path / "memory.db")
+    yield db
+    db.close()
+
+
+def test_database_uses_wal(store):
+    assert store._conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_repository_point_updates_and_range_queries(store):
+    repo = store.collection("assumptions")
+    repo.put_many([
+        {"id": "a", "status": "open", "category": "fact", "timestamp": "2026-02-01T10:00:00"},
+        {"id": "b", "status": "open", "category": "prediction", "timestamp": "2026-02-03T10:00:00"},
+        {"id": "c", "status": "verified", "category": "fact", "timestamp": "2026-02-05T10:00:00"},
+    ])
+    repo.put({"id": "a", "status": "verified", "category": "fact", "timestamp": "2026-02-01T10:00:00"})
+
+    assert [r["id"] for r in repo.all()] == ["a", "b", "c"]
+    assert [r["id"] for r in repo.query(status="open")] == ["b"]
+    assert [r["id"] for r in repo.query(category="fact", newest_first=True)] == ["c", "a"]
+    assert [r["id"] for r in repo.query(since="2026-02-02", until="2026-02-05")] == ["b"]
+    assert repo.count(status="verified") == 2
+    assert repo.group_count("category") == {"fact": 2, "prediction": 1}
+
+    repo.delete("b")
+    assert repo.get("b") is None
+    assert store.collection("goals").all() == []
+
+
+def test_reader_thread_sees_committed_rows(store):
+    repo = store.collection("curiosity")
+    seen = []
+
+    def reader():
+        for _ in range(50):
+            seen.append(len(repo.all()))
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for i in range(50):
+        repo.put({"id": f"cur-{i}", "status": "pending", "added_at": f"2026-02-06T00:00:{i:02d}"})
+    thread.join()
+
+    assert seen == sorted(seen)
+    assert repo.count() == 50
+
+
+def test_import_export_round_trip(tmp_path, store):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "assumptions.json").write_text(json.dumps({"assumptions": [
+        {"id": "a1", "content": "x", "status": "open", "category": "fact", "timestamp": "2026-02-01T00:00:00"},
+    ]}))
+    (src / "goals.json").write_text(json.dumps({"goals": [], "history": [{"week_ending": "w1"}]}))
+    (src / "ikigai_state.json").write_text(json.dumps({"axes": {"energy": 0.7}, "actions": {}}))
+    (src / "integrations.json").write_text(json.dumps({"modules": {
+        "mod": {"name": "mod", "status": "orphaned", "category": "memory"},
+    }}))
+    (src / "taste_rejections.jsonl").write_text(
+        json.dumps({"fingerprint": "f1", "axis": "scope", "category": "ignored", "timestamp": "2026-02-02T00:00:00"}) + "\n"
+    )
+    (src / "curiosity_queue.json").write_text(json.dumps({
+        "queue": [
+            {"id": "cur-3", "status": "pending", "added_at": "2026-02-03T00:00:00"},
+            {"id": "cur-2", "status": "pending", "added_at": "2026-02-02T00:00:00"},
+        ],
+        "explored_count": 1,
+        "total_discovered": 3,
+    }))
+    (src / "curiosity_archive.jsonl").write_text(
+        json.dumps({"id": "cur-1", "status": "explored", "added_at": "2026-02-01T00:00:00"}) + "\n"
+    )
+
+    counts = import_files(store, src)
+    assert counts["curiosity"] == 3 and counts["assumptions"] == 1
+
+    out = tmp_path / "out"
+    export_files(store, out)
+    queue = json.loads((out / "curiosity_queue.json").read_text())
+    assert [i["id"] for i in queue["queue"]] == ["cur-3", "cur-2"]
+    assert queue["total_discovered"] == 3
+    assert json.loads((out / "curiosity_archive.jsonl").read_text())["id"] == "cur-1"
+    assert json.loads((out / "goals.json").read_text())["history"] == [{"week_ending": "w1"}]
+    assert json.loads((out / "ikigai_state.json").read_text())["axes"] == {"energy": 0.7}
+    assert json.loads((out / "integrations.json").read_text())["modules"]["mod"]["status"] == "orphaned"
+    assert json.loads((out / "assumptions.json").read_text())["assumptions"][0]["id"] == "a1"
+
+
+def test_get_memory_store_requires_database(tmp_path):
+    assert get_memory_store(tmp_path / "missing.db") is None
+    SQLiteMemoryStore(tmp_path / "memory.db").close()
+    assert get_memory_store(tmp_path / "memory.db") is get_memory_store(tmp_path / "memory.db")
+
+
+def test_trackers_persist_through_store(tmp_path, store):
+    tracker = AssumptionTracker(str(tmp_path / "unused.json"), store=store)
+    first = tracker.record("The API responds within 2s", category="prediction")
+    tracker.verify(first, correct=True)
+    assert AssumptionTracker(str(tmp_path / "unused.json"), store=store).get(first).was_correct
+    assert not (tmp_path / "unused.json").exists()
+
+    goals = GoalGenerator(memory_path=str(tmp_path / "goals.json"), store=store)
+    [goal] = goals.generate_weekly_goals(count=1)
+    goals.increment_progress(goal.id, 1.0, "progress")
+    assert GoalGenerator(store=store).get_goal(goal.id).progress == 1.0
+
+    engine = IkigaiEngine(str(tmp_path / "s.json"), str(tmp_path / "g.json"), store=store)
+    engine.set_active_policy("ikigai")
+    assert IkigaiEngine(str(tmp_path / "s.json"), str(tmp_path / "g.json"), store=store).get_active_policy() == "ikigai"
+
+    manager = IntegrationManager(memory_dir=str(tmp_path), store=store)
+    manager.integrate_module({"name": "mod", "path": "cognition/mod.py", "package": "cognition"})
+    manager.mark_orphaned("mod")
+    assert store.collection("integrations").get("mod")["status"] == "orphaned"
+
+
+def test_taste_profile_aggregates_from_store(tmp_path, store):
+    profile = TasteProfile(memory_dir=str(tmp_path), store=store)
+    profile.log_rejection("Crypto bot", "off-mission", "scope")
+    profile.log_rejection("Spam post", "low quality", "vibe", category=RejectionCategory.auto_filtered)
+    profile.log_rejection("Big rewrite", "too broad", "scope", category=RejectionCategory.deferred)
+
+    fingerprint = profile.get_taste_fingerprint()
+    assert fingerprint["axes"] == {"scope": 2, "vibe": 1}
+    assert fingerprint["matrix"]["scope"]["deferred"] == 1
+    assert fingerprint["primary_axis"] == "scope"
+    assert [r["subject"] for r in fingerprint["recent"]] == ["Crypto bot", "Spam post", "Big rewrite"]
+    assert profile.get_growth_signal(days=7)["recent_axes"] == {"scope": 2, "vibe": 1}
+    assert "Big rewrite" in profile.export_markdown()
+    assert not (tmp_path / "taste_rejections.jsonl").exists()
+
+
+def test_curiosity_queue_writes_touched_rows(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(aa, "CURIOSITY_FILE", tmp_path / "curiosity_queue.json")
+    queue = aa.CuriosityQueue(store=store)
+    with queue.batch():
+        queue.add("Memory decay for agents", "s", priority=3)
+        queue.add("Prompt injection firewall", "s", priority=5)
+    queue.mark_explored(queue.get_next()["id"])
+    queue.flush()
+
+    reloaded = aa.CuriosityQueue(store=store)
+    reloaded.load()
+    assert [i["topic"] for i in reloaded.queue] == ["Memory decay for agents"]
+    assert reloaded.total_discovered == 2 and reloaded.explored_count == 1
+    assert store.collection("curiosity").count(status="explored") == 1
+    assert not (tmp_path / "curiosity_queue.json").exists()
+
+
+def test_alert_engine_reads_assumptions_from_store(tmp_path, store):
+    from cognition.heartbeat_alerts import AlertEngine
+
+    store.collection("assumptions").put({
+        "id": "a" * 8, "content": "shaky", "status": "open", "confidence": 0.2,
+        "category": "fact", "timestamp": "2026-02-01T10:00:00",
+    })
+    (tmp_path / "assumptions.json").write_text(json.dumps({"assumptions": []}))
+
+    engine = AlertEngine(store=store)
+    assert [a["id"] for a in engine.load_assumptions()] == ["a" * 8]
+    assert engine.check_low_confidence(engine.load_assumptions())[0].severity == "high"
+    assert AlertEngine(assumptions_path=str(tmp_path / "assumptions.json")).load_assumptions() == []
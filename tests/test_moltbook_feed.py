@@ -0,0 +1,167 @@
+"""Tests for the Moltbook feed transport (pool, store, incremental client)."""
+
+import http.client
+import json
+
+import pytest
+
+from integrations.moltbook_feed import ConnectionPool, FeedClient, FeedStore
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self._body = body
+        self._headers = headers or {}
+
+    def read(self):
+        return self._body
+
+    def getheaders(self):
+        return list(self._headers.items())
+
+
+class FakeConnection:
+    """Serves queued responses and records the requests it saw."""
+
+    created = 0
+
+    def __init__(self, responses, log):
+        FakeConnection.created += 1
+        self.responses = responses
+        self.log = log
+
+    def request(self, method, path, body=None, headers=None):
+        self.log.append((method, path, dict(headers or {})))
+
+    def getresponse(self):
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+def _posts(*ids):
+    return [{"id": i, "title": f"post {i}"} for i in ids]
+
+
+def _client(tmp_path, responses, log):
+    FakeConnection.created = 0
+    pool = ConnectionPool(connection_factory=lambda: FakeConnection(responses, log))
+    store = FeedStore(tmp_path / "moltbook_posts.json")
+    return FeedClient(store, pool, api_key=lambda: "key"), store
+
+
+def test_cold_fetch_stores_posts_and_validators(tmp_path):
+    log = []
+    responses = [FakeResponse(200, json.dumps({"posts": _posts("b", "a")}).encode(), {"ETag": '"v1"'})]
+    client, store = _client(tmp_path, responses, log)
+
+    posts = client.fetch(limit=10)
+
+    assert [p["id"] for p in posts] == ["b", "a"]
+    data = json.loads((tmp_path / "moltbook_posts.json").read_text())
+    assert data["etag"] == '"v1"'
+    assert data["last_seen_id"] == "b"
+    assert "If-None-Match" not in log[0][2]
+
+
+def test_not_modified_reuses_store_and_connection(tmp_path):
+    log = []
+    responses = [
+        FakeResponse(200, json.dumps({"posts": _posts("a")}).encode(), {"ETag": '"v1"'}),
+        FakeResponse(304, b""),
+    ]
+    client, store = _client(tmp_path, responses, log)
+    client.fetch()
+
+    posts = client.fetch()
+
+    assert [p["id"] for p in posts] == ["a"]
+    assert log[1][2]["If-None-Match"] == '"v1"'
+    assert FakeConnection.created == 1
+
+
+def test_incremental_fetch_stops_at_known_post_and_follows_cursor(tmp_path):
+    log = []
+    responses = [
+        FakeResponse(200, json.dumps({"posts": _posts("b", "a")}).encode()),
+        FakeResponse(200, json.dumps({"posts": _posts("e", "d"), "next_cursor": "c1"}).encode()),
+        FakeResponse(200, json.dumps({"posts": _posts("c", "b", "a")}).encode()),
+    ]
+    client, store = _client(tmp_path, responses, log)
+    client.fetch()
+
+    posts = client.fetch(limit=10)
+
+    assert [p["id"] for p in posts] == ["e", "d", "c", "b", "a"]
+    assert "cursor=c1" in log[2][1]
+
+
+def test_fetch_error_returns_none_and_keeps_store(tmp_path):
+    log = []
+    responses = [
+        FakeResponse(200, json.dumps(_posts("a")).encode()),
+        FakeResponse(500, b"oops"),
+    ]
+    client, store = _client(tmp_path, responses, log)
+    client.fetch()
+
+    assert client.fetch() is None
+    assert [p["id"] for p in store.posts] == ["a"]
+
+
+def test_store_ttl_is_per_consumer(tmp_path):
+    store = FeedStore(tmp_path / "moltbook_posts.json")
+    store.merge(_posts("a"))
+
+    assert store.get_posts(max_age=300)
+    assert store.get_posts(max_age=0) == []
+
+
+def test_store_reads_legacy_cache_format(tmp_path):
+    path = tmp_path / "moltbook_posts.json"
+    path.write_text(json.dumps({"timestamp": 1, "posts": _posts("x")}))
+    store = FeedStore(path)
+
+    assert store.known_ids() == {"x"}
+    assert store.get_posts(max_age=3600) == []
+
+
+class DroppingConnection(FakeConnection):
+    """Fails its next request with ``error`` (an idle connection gone stale)."""
+
+    def __init__(self, responses, log, error):
+        super().__init__(responses, log)
+        self.error = error
+
+    def request(self, method, path, body=None, headers=None):
+        super().request(method, path, body, headers)
+        if self.error:
+            error, self.error = self.error, None
+            raise error
+
+
+def _pool_with_idle(log, responses, error):
+    fresh = []
+    pool = ConnectionPool(connection_factory=lambda: fresh.append(1) or FakeConnection(responses, log))
+    pool._idle.append(DroppingConnection(responses, log, error))
+    return pool, fresh
+
+
+def test_get_on_dropped_idle_connection_is_retried_once():
+    log = []
+    pool, fresh = _pool_with_idle(log, [FakeResponse(200, b"ok")], http.client.RemoteDisconnected("gone"))
+
+    assert pool.request("GET", "/posts")[2] == b"ok"
+    assert len(log) == 2 and fresh == [1]
+
+
+def test_post_and_timeouts_are_never_resent():
+    for method, error in (("POST", http.client.RemoteDisconnected("gone")),
+                          ("GET", TimeoutError("slow"))):
+        log = []
+        pool, fresh = _pool_with_idle(log, [FakeResponse(200, b"ok")], error)
+        with pytest.raises(type(error)):
+            pool.request(method, "/posts", body=b"{}")
+        assert len(log) == 1 and fresh == []
@@ -0,0 +1,128 @@
+"""Tests for the concurrent OBSERVE probes."""
+
+import asyncio
+import subprocess
+import time
+
+from core import autonomous_agent as aa
+from core.observe import ProbeResult, disk_usage_mb, git_snapshot, run_probes
+
+
+def test_probes_run_concurrently():
+    def slow(budget):
+        time.sleep(0.2)
+        return budget.remaining_ms() > 0
+
+    start = time.monotonic()
+    results = asyncio.run(run_probes({"a": (slow, 2000), "b": (slow, 2000), "c": (slow, 2000)}))
+
+    assert time.monotonic() - start < 0.5
+    assert all(r.ok and r.value for r in results.values())
+
+
+def test_probe_over_budget_times_out_without_blocking():
+    results = asyncio.run(run_probes({
+        "hung": (lambda budget: time.sleep(1), 50),
+        "fast": (lambda budget: 42, 1000),
+        "broken": (lambda budget: 1 / 0, 1000),
+    }))
+
+    assert not results["hung"].ok and "timed out" in results["hung"].error
+    assert results["hung"].elapsed_ms < 500
+    assert results["fast"].value == 42
+    assert not results["broken"].ok
+
+
+def test_disk_usage_and_git_snapshot(tmp_path):
+    disk = disk_usage_mb(tmp_path)
+    assert disk["available_mb"] > 0
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    (tmp_path / "a.txt").write_text("a")
+    subprocess.run([*git, "add", "a.txt"], check=True)
+    subprocess.run([*git, "commit", "-qm", "first"], check=True)
+
+    class Budget:
+        def remaining_ms(self):
+            return 5000
+
+    assert git_snapshot(tmp_path, Budget()) == {"dirty": False, "commits_today": 1}
+    (tmp_path / "b.txt").write_text("b")
+    assert git_snapshot(tmp_path, Budget())["dirty"] is True
+
+
+def test_check_health_scores_probe_results(monkeypatch):
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_evolution_components",
+                        lambda self: setattr(self, "_evolution_enabled", False))
+    agent = aa.AutonomousAgent()
+
+    class Verification:
+        errors = ["tests/test_x.py"]
+
+    probes = {
+        "disk": ProbeResult("disk", {"used_mb": 1, "available_mb": 300}, ok=True),
+        "git": ProbeResult("git", {"dirty": True, "commits_today": 2}, ok=True),
+        "tests": ProbeResult("tests", Verification(), ok=True),
+    }
+    assert asyncio.run(agent._check_health(probes)) == 100 - 10 - 5 - 20
+    assert agent.state.git_status == "dirty"
+
+    probes["git"] = ProbeResult("git", error="timed out")
+    probes["tests"] = ProbeResult("tests", error="timed out")
+    assert asyncio.run(agent._check_health(probes)) == 100 - 10 - 10
+
+
+def test_git_snapshot_is_one_git_call_while_head_is_unchanged(tmp_path, monkeypatch):
+    from core import observe
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "first"], check=True)
+
+    class Budget:
+        def remaining_ms(self):
+            return 5000
+
+    calls = []
+    real_git = observe._git
+    monkeypatch.setattr(observe, "_git", lambda repo, args, timeout: calls.append(args[0]) or real_git(repo, args, timeout))
+
+    assert git_snapshot(tmp_path, Budget()) == {"dirty": False, "commits_today": 1}
+    assert git_snapshot(tmp_path, Budget()) == {"dirty": False, "commits_today": 1}
+    assert calls == ["status", "rev-list", "status"]
+
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "second"], check=True)
+    assert git_snapshot(tmp_path, Budget())["commits_today"] == 2
+    assert calls[-2:] == ["status", "rev-list"]
+
+
+def test_standalone_check_health_does_not_run_the_suite(monkeypatch):
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_evolution_components",
+                        lambda self: setattr(self, "_evolution_enabled", False))
+    agent = aa.AutonomousAgent()
+
+    class Collected:
+        errors = []
+
+    def no_verify(*args, **kwargs):
+        raise AssertionError("standalone health check ran the test suite")
+
+    monkeypatch.setattr(agent.verifier, "verify", no_verify)
+    monkeypatch.setattr(agent.verifier, "collect", lambda timeout=None: Collected())
+
+    assert asyncio.run(agent._check_health()) >= 80
+
+
+def test_observe_forces_a_full_verification_every_few_wakes(monkeypatch):
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_evolution_components",
+                        lambda self: setattr(self, "_evolution_enabled", False))
+    agent = aa.AutonomousAgent()
+    calls = []
+    monkeypatch.setattr(agent.verifier, "verify", lambda force_full=False: calls.append(force_full))
+
+    for wakes in (aa.FULL_VERIFY_EVERY, aa.FULL_VERIFY_EVERY + 1):
+        agent.state.total_wakes = wakes
+        asyncio.run(agent._observe())
+
+    assert calls == [True, False]
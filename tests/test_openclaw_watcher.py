@@ -223,3 +223,83 @@ class TestKnownAgents:
         """KEYWORD_AGENT_MAP should have entries."""
         assert len(KEYWORD_AGENT_MAP) > 0
         assert "squad" in KEYWORD_AGENT_MAP
+
+
+class TestSessionTailing:
+    """Seeding and tailing session JSONL files."""
+
+    def _entry(self, text, kind="message"):
+        import json
+        return json.dumps({
+            "type": kind,
+            "timestamp": "2026-02-01T10:00:00Z",
+            "message": {"role": "assistant", "content": [{"type": "text", "text": text}]},
+        }) + "\n"
+
+    def test_seed_loads_recent_messages_only(self, tmp_path):
+        session = tmp_path / "s.jsonl"
+        with open(session, "w") as f:
+            for i in range(150):
+                f.write(self._entry(f"reply {i}"))
+                f.write(self._entry("tool output", kind="tool_result"))
+        watcher = OpenClawWatcher()
+        watcher._session_agent_map[str(session)] = "Jarvis"
+
+        watcher._seed_recent_messages()
+
+        summaries = [item.summary for item in watcher.feed]
+        assert len(summaries) == 100
+        assert summaries[-1] == "reply 149"
+        assert "tool output" not in summaries
+
+    def test_tail_session_reads_only_complete_appended_lines(self, tmp_path):
+        session = tmp_path / "s.jsonl"
+        session.write_text(self._entry("old"))
+        path = str(session)
+        watcher = OpenClawWatcher()
+        watcher._session_positions[path] = session.stat().st_size
+
+        with open(session, "a") as f:
+            f.write(self._entry("new"))
+            partial = self._entry("later")
+            f.write(partial[:10])
+        watcher._tail_session(path, "Jarvis")
+
+        assert [item.summary for item in watcher.feed] == ["new"]
+
+        with open(session, "a") as f:
+            f.write(partial[10:])
+        watcher._tail_session(path, "Jarvis")
+
+        assert [item.summary for item in watcher.feed] == ["new", "later"]
+        assert watcher._session_positions[path] == session.stat().st_size
+
+    def test_newly_mapped_session_is_seeded_then_tailed(self, tmp_path, monkeypatch):
+        import json
+        import integrations.openclaw_watcher as ow
+
+        index = tmp_path / "sessions.json"
+        monkeypatch.setattr(ow, "SESSIONS_DIR", tmp_path)
+        monkeypatch.setattr(ow, "SESSIONS_INDEX", index)
+        index.write_text(json.dumps({"agent:main:main": {"sessionId": "main"}}))
+        watcher = OpenClawWatcher()
+        watcher._load_session_map()
+
+        # The session file is written before sessions.json points at it
+        session = tmp_path / "new.jsonl"
+        session.write_text(self._entry("first") + self._entry("second"))
+        watcher._on_session_change(session.name)
+        index.write_text(json.dumps({
+            "agent:main:main": {"sessionId": "main"},
+            "agent:main:subagent:x": {"sessionId": "new"},
+        }))
+        watcher._on_session_change(index.name)
+
+        assert [item.summary for item in watcher.feed] == ["first", "second"]
+
+        with open(session, "a") as f:
+            f.write(self._entry("third"))
+        watcher._on_session_change(session.name)
+
+        assert [item.summary for item in watcher.feed] == ["first", "second", "third"]
+        assert [item.source for item in watcher.feed] == ["[agent]"] * 3
@@ -0,0 +1,156 @@
+"""Tests for write-coalescing state persistence."""
+
+import json
+
+import pytest
+
+from core import autonomous_agent as aa
+from core.persistence import PersistenceManager, atomic_write_json
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def state_files(tmp_path, monkeypatch):
+    files = {
+        "state": tmp_path / "agent_state.json",
+        "beliefs": tmp_path / "beliefs.json",
+        "resources": tmp_path / "resources.json",
+        "curiosity": tmp_path / "curiosity_queue.json",
+    }
+    monkeypatch.setattr(aa, "STATE_FILE", files["state"])
+    monkeypatch.setattr(aa, "BELIEFS_FILE", files["beliefs"])
+    monkeypatch.setattr(aa, "RESOURCES_FILE", files["resources"])
+    monkeypatch.setattr(aa, "CURIOSITY_FILE", files["curiosity"])
+    monkeypatch.setattr(aa, "CURIOSITY_ARCHIVE_FILE", tmp_path / "curiosity_archive.jsonl")
+    return files
+
+
+def _count_writes(monkeypatch):
+    writes = []
+    real = PersistenceManager.write_json
+
+    def counting(self, path, data):
+        writes.append(path.name)
+        real(self, path, data)
+
+    monkeypatch.setattr(PersistenceManager, "write_json", counting)
+    return writes
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    path = tmp_path / "state.json"
+    atomic_write_json(path, {"a": [1, 2]})
+    atomic_write_json(path, {"a": [3]}, compact=True)
+
+    assert path.read_text() == '{"a":[3]}'
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = tmp_path / "state.json"
+    atomic_write_json(path, {"ok": True})
+
+    with pytest.raises(TypeError):
+        atomic_write_json(path, {"bad": object()})
+
+    assert json.loads(path.read_text()) == {"ok": True}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_standalone_objects_still_write_through(state_files):
+    state = aa.AgentState()
+    state.health_score = 77
+    state.save()
+
+    assert json.loads(state_files["state"].read_text())["health_score"] == 77
+
+
+def test_debounce_coalesces_until_flush(state_files, monkeypatch):
+    writes = _count_writes(monkeypatch)
+    clock = Clock()
+    manager = PersistenceManager(debounce=5, clock=clock)
+    state = aa.AgentState(manager)
+
+    for score in range(10):
+        state.health_score = score
+        state.save()
+    assert writes == ["agent_state.json"]  # leading edge only
+
+    clock.now = 6
+    state.save()
+    assert len(writes) == 2
+    state.save()
+    manager.flush()
+    assert len(writes) == 3
+    assert json.loads(state_files["state"].read_text())["health_score"] == 9
+
+
+class FakeTimer:
+    def __init__(self, delay, fn):
+        self.delay, self.fn = delay, fn
+        self.started = self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_trailing_timer_writes_coalesced_saves(state_files, monkeypatch):
+    writes = _count_writes(monkeypatch)
+    clock = Clock()
+    timers = []
+    manager = PersistenceManager(debounce=5, clock=clock,
+                                 timer=lambda d, fn: timers.append(FakeTimer(d, fn)) or timers[-1])
+    state = aa.AgentState(manager)
+
+    state.save()
+    clock.now = 2
+    for score in range(3):
+        state.health_score = score
+        state.save()
+    assert writes == ["agent_state.json"]
+    assert [(t.delay, t.started) for t in timers] == [(3, True)]  # one timer per burst
+
+    clock.now = 5
+    timers[0].fn()
+    assert len(writes) == 2
+    assert json.loads(state_files["state"].read_text())["health_score"] == 2
+
+    clock.now = 6
+    state.save()
+    manager.flush()
+    assert timers[1].cancelled
+    timers[1].fn()  # fired after the explicit flush: nothing left to write
+    assert len(writes) == 3
+
+
+def test_phase_writes_each_dirty_object_once(state_files, monkeypatch):
+    writes = _count_writes(monkeypatch)
+    manager = PersistenceManager()
+    state = aa.AgentState(manager)
+    beliefs = aa.Beliefs(manager)
+    resources = aa.ResourceMonitor(manager)
+    queue = aa.CuriosityQueue(manager)
+
+    with manager.phase():
+        for i in range(5):
+            state.current_thought = f"thought {i}"
+            state.save()
+            beliefs.add_question(f"question {i}")
+            queue.add(f"Distinct topic number {i} about things", "s")
+        resources.save()
+        assert writes == []
+        assert manager.pending == 4
+
+    assert sorted(writes) == ["agent_state.json", "beliefs.json",
+                              "curiosity_queue.json", "resources.json"]
+    assert len(json.loads(state_files["beliefs"].read_text())["questions"]) == 5
@@ -0,0 +1,64 @@
+"""Tests for the persistent pytest worker pool."""
+
+import os
+
+import pytest
+
+from core.pytest_worker import PytestWorkerPool, WorkerError
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "mod.py").write_text("VALUE = 1\n")
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_mod.py").write_text(
+        "from mod import VALUE\n\n"
+        "def test_value():\n    assert VALUE == 1\n\n"
+        "def test_noisy():\n    print('not protocol output')\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def pool(project):
+    pool = PytestWorkerPool(project, timeout=120)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def test_request_before_start_raises(project):
+    with pytest.raises(WorkerError):
+        PytestWorkerPool(project).run()
+
+
+def test_collect_returns_node_ids(pool):
+    returncode, nodeids, _ = pool.collect()
+
+    assert returncode == 0
+    assert nodeids == ["tests/test_mod.py::test_value", "tests/test_mod.py::test_noisy"]
+
+
+def test_run_reimports_changed_modules(pool, project):
+    assert pool.run_all()[0] == 0
+
+    source = project / "mod.py"
+    source.write_text("VALUE = 2\n")
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    returncode, output = pool.run(["tests/test_mod.py"])
+    assert returncode == 1
+    assert "FAILED tests/test_mod.py::test_value" in output
+
+
+def test_collect_cache_is_invalidated_by_test_edits(pool, project):
+    pool.collect()
+    test_file = project / "tests" / "test_mod.py"
+    test_file.write_text(test_file.read_text() + "\ndef test_extra():\n    pass\n")
+    st = test_file.stat()
+    os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    _, nodeids, _ = pool.collect(["tests/test_mod.py"])
+    assert "tests/test_mod.py::test_extra" in nodeids
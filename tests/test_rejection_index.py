@@ -0,0 +1,93 @@
+"""Tests for the incremental rejection ledger index."""
+
+import json
+from datetime import datetime, timedelta
+
+from cognition.rejection_index import RejectionIndex
+from cognition.taste_profile import TasteProfile
+
+
+def _line(i, axis="scope", when=None):
+    return json.dumps({
+        "fingerprint": f"fp{i}",
+        "timestamp": (when or datetime.now()).isoformat(),
+        "subject": f"subject_{i}",
+        "reason": "r",
+        "axis": axis,
+        "category": "considered_rejected",
+    }) + "\n"
+
+
+def test_index_is_persisted_and_reused(tmp_path):
+    profile = TasteProfile(memory_dir=str(tmp_path))
+    for i in range(3):
+        profile.log_rejection(f"item_{i}", "reason", "scope")
+
+    sidecar = tmp_path / "taste_rejections.idx.json"
+    assert json.loads(sidecar.read_text())["total"] == 3
+
+    reloaded = RejectionIndex(tmp_path / "taste_rejections.jsonl")
+    assert reloaded.refresh() is False
+    assert reloaded.axes == {"scope": 3}
+
+
+def test_external_appends_are_folded_in(tmp_path):
+    ledger = tmp_path / "taste_rejections.jsonl"
+    ledger.write_text(_line(0))
+    index = RejectionIndex(ledger)
+    index.refresh()
+
+    with open(ledger, "a") as f:
+        f.write(_line(1, axis="vibe"))
+
+    assert index.refresh() is True
+    assert index.axes == {"scope": 1, "vibe": 1}
+
+
+def test_partial_trailing_line_waits_for_completion(tmp_path):
+    ledger = tmp_path / "taste_rejections.jsonl"
+    full = _line(0)
+    ledger.write_text(full + _line(1)[:20])
+    index = RejectionIndex(ledger)
+    index.refresh()
+    assert index.total == 1
+
+    ledger.write_text(full + _line(1))
+    index.refresh()
+    assert index.total == 2
+
+
+def test_rewritten_ledger_triggers_rebuild(tmp_path):
+    ledger = tmp_path / "taste_rejections.jsonl"
+    ledger.write_text(_line(0) + _line(1))
+    index = RejectionIndex(ledger)
+    index.refresh()
+
+    ledger.write_text(_line(9, axis="ambition"))
+    index.refresh()
+
+    assert index.total == 1
+    assert index.axes == {"ambition": 1}
+
+
+def test_recent_holds_latest_rejections(tmp_path):
+    profile = TasteProfile(memory_dir=str(tmp_path))
+    for i in range(8):
+        profile.log_rejection(f"item_{i}", "reason", "scope")
+
+    subjects = [r["subject"] for r in profile.get_taste_fingerprint()["recent"]]
+    assert subjects == [f"item_{i}" for i in range(3, 8)]
+
+
+def test_day_buckets_split_growth_window(tmp_path):
+    ledger = tmp_path / "taste_rejections.jsonl"
+    ledger.write_text(
+        _line(0, when=datetime.now() - timedelta(days=10)) + _line(1, axis="vibe")
+    )
+    index = RejectionIndex(ledger)
+    index.refresh()
+
+    cutoff = (datetime.now() - timedelta(days=7)).date().isoformat()
+    recent, older = index.split_by_day(cutoff)
+    assert recent == {"vibe": 1}
+    assert older == {"scope": 1}
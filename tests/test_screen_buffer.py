@@ -0,0 +1,78 @@
+"""Tests for the diffing TUI screen buffer."""
+
+from core.screen_buffer import ScreenBuffer, parse_cells
+
+RED = "\x1b[31m"
+NORMAL = "\x1b[m"
+
+
+class FakeTerm:
+    normal = NORMAL
+    clear = "<CLEAR>"
+    clear_eol = "<EOL>"
+
+    def __init__(self, width=20, height=5):
+        self.width = width
+        self.height = height
+
+    def move(self, row, col):
+        return f"<{row},{col}>"
+
+
+def test_parse_cells_tracks_style_and_wide_chars():
+    cells, exact = parse_cells(f"a{RED}b{NORMAL}c\U0001f49a")
+
+    assert [(style, text) for style, text, _ in cells] == [("", "a"), (RED, "b"), ("", "c"), ("", "\U0001f49a")]
+    assert cells[-1][2] == 2
+    assert exact
+
+
+def test_variation_selector_marks_row_inexact():
+    cells, exact = parse_cells("❤️ ok")
+    assert cells[0][1] == "❤️"
+    assert not exact
+
+
+def test_first_frame_paints_everything_then_idle_frame_is_empty():
+    writes = []
+    screen = ScreenBuffer(FakeTerm(), write=writes.append)
+    frame = {0: "hello", 1: "world"}
+
+    screen.flush(frame)
+    assert writes[0].startswith(NORMAL + "<CLEAR>")
+    assert "hello" in writes[0] and "world" in writes[0]
+
+    assert screen.flush(dict(frame)) == 0
+    assert len(writes) == 1
+
+
+def test_only_changed_span_is_emitted():
+    screen = ScreenBuffer(FakeTerm())
+    screen.render({0: "status: ok  |", 1: "unchanged"})
+
+    diff = screen.render({0: "status: BAD |", 1: "unchanged"})
+
+    assert diff == "<0,8>" + NORMAL + "BAD" + NORMAL
+    assert "unchanged" not in diff
+
+
+def test_shorter_row_clears_rest_and_dropped_rows_are_blanked():
+    screen = ScreenBuffer(FakeTerm())
+    screen.render({0: "long line here", 2: "gone soon"})
+
+    diff = screen.render({0: "long"})
+
+    assert diff.startswith("<0,4>")
+    assert "<EOL>" in diff
+    assert "<2,0>" + NORMAL + "<EOL>" in diff
+
+
+def test_resize_forces_full_repaint():
+    term = FakeTerm()
+    screen = ScreenBuffer(term)
+    screen.render({0: "abc"})
+
+    term.width = 40
+    diff = screen.render({0: "abc"})
+
+    assert "<CLEAR>" in diff and "abc" in diff
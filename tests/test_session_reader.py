@@ -0,0 +1,101 @@
+"""Tests for session_reader.py — bounded JSONL readers for session files."""
+
+import json
+
+from integrations.session_reader import (
+    is_message_line,
+    iter_appended_lines,
+    iter_lines_reverse,
+    read_recent_messages,
+)
+
+
+def _message(i):
+    return json.dumps({"type": "message", "message": {"role": "assistant", "content": f"m{i}"}})
+
+
+def _write(path, lines, trailing_newline=True):
+    text = "\n".join(lines) + ("\n" if trailing_newline else "")
+    path.write_text(text)
+
+
+class TestIsMessageLine:
+    def test_accepts_message_entries(self):
+        assert is_message_line('{"type":"message","message":{}}')
+        assert is_message_line('{"id": 1, "type" : "message"}')
+
+    def test_rejects_other_entries(self):
+        assert not is_message_line('{"type":"tool_result","message":"x"}')
+        assert not is_message_line('{"type":"session","id":"abc"}')
+        assert not is_message_line("")
+
+
+class TestReverseReader:
+    def test_yields_lines_newest_first_across_blocks(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        lines = [f"line-{i:03d}-" + "x" * (i % 7) for i in range(200)]
+        _write(path, lines)
+
+        assert list(iter_lines_reverse(path, block_size=16)) == lines[::-1]
+
+    def test_last_line_without_newline_and_blank_lines(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text("a\n\nb\nc")
+
+        assert list(iter_lines_reverse(path, block_size=2)) == ["c", "b", "a"]
+
+    def test_max_bytes_drops_cut_line(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        _write(path, ["aaaa", "bbbb", "cccc"])
+
+        # last 7 bytes are "b\ncccc\n": the cut "b" line is not returned
+        assert list(iter_lines_reverse(path, block_size=3, max_bytes=7)) == ["cccc"]
+
+
+class TestReadRecentMessages:
+    def test_returns_last_messages_oldest_first(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        lines = []
+        for i in range(50):
+            lines.append(_message(i))
+            lines.append(json.dumps({"type": "tool_result", "content": "x" * 100}))
+        _write(path, lines)
+
+        recent = read_recent_messages(path, 5, block_size=64)
+
+        assert recent == [_message(i) for i in range(45, 50)]
+
+    def test_limit_zero_and_byte_cap(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        _write(path, [_message(i) for i in range(10)])
+
+        assert read_recent_messages(path, 0) == []
+        assert read_recent_messages(path, 10, max_bytes=len(_message(9)) + 2) == [_message(9)]
+
+
+class TestAppendedLines:
+    def test_yields_complete_lines_with_offsets(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_bytes(b"one\ntwo\nthr")
+
+        result = list(iter_appended_lines(path, 0, chunk_size=3))
+
+        assert result == [("one", 4), ("two", 8)]
+
+    def test_resumes_after_partial_line_completes(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_bytes(b"one\ntwo\nthr")
+        pos = list(iter_appended_lines(path, 0))[-1][1]
+
+        with open(path, "ab") as f:
+            f.write(b"ee\nfour\n")
+
+        assert list(iter_appended_lines(path, pos, chunk_size=2)) == [("three", 14), ("four", 19)]
+
+    def test_multibyte_text_split_across_chunks(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_bytes("héllo wörld\nnext\n".encode())
+
+        lines = [line for line, _ in iter_appended_lines(path, 0, chunk_size=1)]
+
+        assert lines == ["héllo wörld", "next"]
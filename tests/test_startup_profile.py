@@ -0,0 +1,96 @@
+"""Tests for lazy startup and the --profile-startup report."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from core import autonomous_agent as aa
+from core import startup_profile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_phase_is_a_no_op_until_enabled(monkeypatch):
+    monkeypatch.setattr(startup_profile, "_PHASES", None)
+    with startup_profile.phase("terminal"):
+        pass
+    assert startup_profile.phases() == []
+
+    startup_profile.enable()
+    with startup_profile.phase("terminal"):
+        pass
+    assert [name for name, _ in startup_profile.phases()] == ["terminal"]
+    monkeypatch.setattr(startup_profile, "_PHASES", None)
+
+
+def test_parse_importtime_skips_header_and_noise():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   _io",
+        "import time:      2048 |      51000 | blessed",
+        "some warning",
+    ])
+    assert startup_profile.parse_importtime(stderr) == [("_io", 120, 120), ("blessed", 2048, 51000)]
+
+
+def test_agent_components_load_on_first_use(monkeypatch):
+    calls = []
+
+    def loader(name, attrs):
+        def load(self):
+            calls.append(name)
+            for attr in attrs:
+                setattr(self, attr, name)
+        return load
+
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_evolution_components", loader(
+        "evolution", ["soul_manager", "goal_generator", "knowledge_synthesizer",
+                      "integration_manager", "self_modifier", "_evolution_enabled"]))
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_ikigai_engine", loader("ikigai", ["ikigai"]))
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_self_evolution_loop",
+                        loader("self_evolution", ["self_evolution"]))
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_safety_guard", loader("safety", ["safety_guard"]))
+
+    agent = aa.AutonomousAgent()
+    assert calls == []
+
+    assert agent.soul_manager == "evolution"
+    assert agent.goal_generator == "evolution"
+    assert calls == ["evolution"]
+
+    agent.warm_up()
+    assert sorted(calls) == ["evolution", "ikigai", "safety", "self_evolution"]
+    assert agent.ikigai == "ikigai"
+
+
+def test_failed_component_is_recorded_and_left_unset(monkeypatch):
+    calls = []
+
+    def broken(self):
+        calls.append("evolution")
+        self.soul_manager = "half built"
+        raise RuntimeError("goals.json is corrupt")
+
+    monkeypatch.setattr(aa.AutonomousAgent, "_init_evolution_components", broken)
+    agent = aa.AutonomousAgent()
+
+    assert agent.goal_generator is None
+    assert agent.soul_manager is None
+    assert agent._evolution_enabled is None
+    assert agent.component_errors == {
+        "_init_evolution_components": "RuntimeError: goals.json is corrupt"}
+    agent.self_modifier
+    assert calls == ["evolution"]
+
+
+def test_importing_clawgotchi_does_not_load_the_tui():
+    code = "import sys, clawgotchi; print('clawgotchi_cli' in sys.modules, 'blessed' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["False", "False"]
+
+
+def test_len_visible_still_exported():
+    from clawgotchi import len_visible
+
+    assert len_visible("\x1b[31mab\x1b[0m") == 2
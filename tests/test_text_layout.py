@@ -0,0 +1,57 @@
+"""Tests for the TUI's visible-width and padding primitives."""
+
+from blessed import Terminal
+
+import clawgotchi_cli as cli
+from core.screen_buffer import parse_cells
+from core.text_layout import Segments, bordered_row, strip_escapes, visible_width
+
+NORMAL = "\x1b(B\x1b[m"  # blessed's ``normal`` on xterm
+
+
+def screen_width(line):
+    return sum(width for _, _, width in parse_cells(line)[0])
+
+
+def test_visible_width():
+    assert visible_width("") == 0
+    assert visible_width("hello") == 5
+    assert visible_width("\x1b[1;31;40mred bold\x1b[0m") == 8
+    assert visible_width(NORMAL + "ok" + NORMAL) == 2
+    assert visible_width("\U0001f49a 92%") == 6
+    assert visible_width("\u2764\ufe0f") == 2  # emoji presentation selector
+    assert visible_width("猫") == 2  # CJK
+    assert visible_width("é") == 1  # combining accent
+    assert strip_escapes("\x1b[2J\x1b[31mx") == "x"
+
+
+def test_segments_track_width_without_reparsing():
+    line = Segments().style("\x1b[31m").text("\U0001f9e0 3").style(NORMAL).text("abc", 3)
+    assert line.width == 7
+    assert str(line) == "\x1b[31m\U0001f9e0 3" + NORMAL + "abc"
+
+
+def test_bordered_row_pads_to_width():
+    row = bordered_row("\x1b[36m\U0001f3af goal" + NORMAL, 20, "|", "|")
+    assert screen_width(row) == 20
+    assert bordered_row("x", 5, "[", "]", width=3) == "[x]"
+    assert bordered_row("x", 5, "[", "]") is bordered_row("x", 5, "[", "]")
+
+
+def test_vitals_strip_fills_the_row():
+    term = Terminal(force_styling=True, kind="xterm-256color")
+    for vitals in (
+        {"health": 92, "trend": "↑", "curiosity_count": 3, "taste_rejections": 12,
+         "assumption_accuracy": 0.85},
+        {"health": 10, "trend": "↓", "curiosity_count": 0, "taste_rejections": 0,
+         "assumption_accuracy": None},
+    ):
+        for w in (40, 80, 133):
+            # ScreenBuffer counts "\u2764\ufe0f" per code point; measure as a whole
+            assert visible_width(cli.build_vitals_strip(term, w, vitals)) == w
+
+
+def test_pad_row_counts_blessed_normal_as_zero_width():
+    term = Terminal(force_styling=True, kind="xterm-256color")
+    row = cli.pad_row(term, term.cyan + " \U0001f4ad thinking" + term.normal, 60)
+    assert screen_width(row) == 60
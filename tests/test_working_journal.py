@@ -0,0 +1,68 @@
+"""Tests for the append-only WORKING.md journal."""
+
+from core.working_journal import WorkingJournal, split_entries
+
+
+def _entry(n):
+    return f"\n## Wake Cycle #{n} (2026-02-06 12:00)\n- Action: step {n}\n- Health: 90/100\n"
+
+
+def test_append_creates_header_and_keeps_existing_text(tmp_path):
+    path = tmp_path / "WORKING.md"
+    journal = WorkingJournal(path)
+    journal.append(_entry(1))
+    assert path.read_text().startswith("# WORKING.md\n")
+
+    path.write_text("# WORKING.md - notes\n\n## Status\n- ok\n")
+    journal.append(_entry(2))
+    journal.close()
+
+    preamble, entries = split_entries(path.read_text())
+    assert "## Status" in preamble
+    assert [e.split("\n")[0] for e in entries] == ["## Wake Cycle #2 (2026-02-06 12:00)"]
+
+
+def test_fsync_is_batched(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr("core.working_journal.os.fsync", lambda fd: synced.append(fd))
+    journal = WorkingJournal(tmp_path / "WORKING.md", fsync_every=3, clock=lambda: 0.0)
+
+    for n in range(5):
+        journal.append(_entry(n))
+    assert len(synced) == 1
+    journal.sync()
+    assert len(synced) == 2
+    journal.sync()
+    assert len(synced) == 2
+
+
+def test_rotation_moves_old_entries_to_dated_segment(tmp_path):
+    path = tmp_path / "WORKING.md"
+    journal = WorkingJournal(path, max_bytes=400, keep_entries=2, today=lambda: "2026-02-07")
+
+    for n in range(10):
+        journal.append(_entry(n))
+    journal.close()
+
+    _, kept = split_entries(path.read_text())
+    assert len(kept) <= 3
+    assert "#9 " in kept[-1]
+
+    [segment] = (tmp_path / "working").glob("WORKING-*.md")
+    assert segment.name == "WORKING-2026-02-07.md"
+    _, archived = split_entries(segment.read_text())
+    assert len(archived) + len(kept) == 10
+    assert "#0 " in archived[0]
+
+
+def test_append_reopens_after_file_is_replaced(tmp_path):
+    path = tmp_path / "WORKING.md"
+    journal = WorkingJournal(path)
+    journal.append(_entry(1))
+    path.unlink()
+    journal.append(_entry(2))
+    journal.close()
+
+    _, entries = split_entries(path.read_text())
+    assert len(entries) == 1 and "#2 " in entries[0]
+
@@ -6,10 +6,19 @@ intelligence briefing systems.
 
 Inspired by RyanAssistant's insight: "filtering quality matters more
 than generation quality" - Moltbook 2026-02-06
+
+Batch scoring tokenizes a corpus once into a sparse term matrix
+(``TermMatrix``) of per-chunk word counts, plus character n-gram indexes
+over its vocabulary. A topic's partial matches are looked up through the
+n-gram index instead of testing every word of every chunk, so scoring
+costs grow with the number of hits rather than chunks x words x topics.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import heapq
+import math
 import re
 from datetime import datetime, timedelta
 
@@ -37,6 +46,67 @@ class ScoredChunk:
     is_relevant: bool = field(default=False)
 
 
+class TermMatrix:
+    """A tokenized corpus stored as a sparse chunk x term count matrix.
+
+    ``rows[i]`` holds the term counts of chunk ``i``. Columns (the chunks
+    and counts a term appears with) are gathered on demand for just the
+    terms a query touches, in one pass over the rows. Vocabulary n-gram
+    indexes (n <= 3) are built on first use.
+    """
+
+    GRAM = 3
+
+    def __init__(self, token_lists: Sequence[List[str]]):
+        self.rows: List[Counter] = [Counter(tokens) for tokens in token_lists]
+        self.n_chunks = len(self.rows)
+        self.vocab: set = set().union(*self.rows) if self.rows else set()
+        self._columns: Dict[str, List[Tuple[int, int]]] = {}
+        self._grams: Dict[int, Dict[str, set]] = {}
+
+    def columns(self, terms: Iterable[str]) -> Dict[str, List[Tuple[int, int]]]:
+        """Map each term to its ``(chunk_index, count)`` entries."""
+        wanted = {t for t in terms if t not in self._columns}
+        if wanted:
+            gathered: Dict[str, List[Tuple[int, int]]] = {t: [] for t in wanted}
+            for chunk_index, row in enumerate(self.rows):
+                for term in row.keys() & wanted:
+                    gathered[term].append((chunk_index, row[term]))
+            self._columns.update(gathered)
+        return {t: self._columns[t] for t in terms}
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency of a term."""
+        doc_freq = len(self.columns([term])[term])
+        return math.log((1 + self.n_chunks) / (1 + doc_freq)) + 1.0
+
+    def _gram_index(self, n: int) -> Dict[str, set]:
+        index = self._grams.get(n)
+        if index is None:
+            index = {}
+            for term in self.vocab:
+                for i in range(len(term) - n + 1):
+                    index.setdefault(term[i:i + n], set()).add(term)
+            self._grams[n] = index
+        return index
+
+    def terms_containing(self, needle: str) -> List[str]:
+        """Vocabulary terms that contain ``needle`` as a substring."""
+        if not needle:
+            return sorted(self.vocab)
+        n = min(len(needle), self.GRAM)
+        index = self._gram_index(n)
+        if len(needle) == n:
+            return sorted(index.get(needle, ()))
+        candidates = None
+        for i in range(len(needle) - n + 1):
+            terms = index.get(needle[i:i + n])
+            if not terms:
+                return []
+            candidates = set(terms) if candidates is None else candidates & terms
+        return sorted(t for t in candidates if needle in t)
+
+
 class ContentRelevanceScorer:
     """Scores content relevance against defined topics/keywords."""
     
@@ -67,52 +137,92 @@ class ContentRelevanceScorer:
                 breakdown={},
                 is_relevant=False
             )
+        return self.score_chunks([content], topics)[0]
+    
+    def build_matrix(self, chunks: List[str]) -> TermMatrix:
+        """Tokenize chunks once into a TermMatrix for batch scoring."""
+        return TermMatrix([self._tokenize(self._normalize(chunk or "")) for chunk in chunks])
+    
+    def _topic_hits(
+        self,
+        matrix: TermMatrix,
+        topics: Dict[str, float]
+    ) -> List[Tuple[str, float, Optional[str], List[str]]]:
+        """Resolve each topic to (topic, weight, exact term, partial terms).
+        
+        A partial term contains the topic without being equal to it and is
+        at least ``min_word_length`` long, as in the per-word rule.
+        """
+        resolved = []
+        for topic, weight in topics.items():
+            norm_topic = self._normalize(topic)
+            exact = norm_topic if norm_topic in matrix.vocab else None
+            partial = [
+                term for term in matrix.terms_containing(norm_topic)
+                if term != norm_topic and len(term) >= self.config.min_word_length
+            ]
+            if exact is not None or partial:
+                resolved.append((topic, weight, exact, partial))
+        return resolved
+    
+    def score_matrix(
+        self,
+        matrix: TermMatrix,
+        chunks: List[str],
+        topics: Dict[str, float],
+        use_idf: bool = False
+    ) -> List[ScoredChunk]:
+        """Score every chunk of a prebuilt TermMatrix against all topics.
         
-        # Support both list and dict inputs
+        Work is proportional to the columns of matching terms only. With
+        ``use_idf`` each hit is additionally weighted by its term's inverse
+        document frequency, so words common to the whole corpus count less.
+        """
         if isinstance(topics, list):
             topics = {t: 1.0 for t in topics}
         
-        # Normalize content
-        normalized = self._normalize(content)
-        words = self._tokenize(normalized)
+        resolved = self._topic_hits(matrix, topics or {})
+        columns = matrix.columns(
+            {t for _, _, exact, partial in resolved for t in ([exact] if exact else []) + partial}
+        )
         
-        breakdown = {}
-        exact_matches = 0
-        partial_matches = 0
+        n = matrix.n_chunks
+        breakdowns: List[Dict[str, float]] = [{} for _ in range(n)]
+        exact_counts = [0] * n
+        partial_counts = [0] * n
+        exact_weight = self.config.exact_match_weight
+        partial_weight = self.config.partial_match_weight
         
-        for topic, weight in topics.items():
-            norm_topic = self._normalize(topic)
-            topic_score = 0.0
-            topic_exact = 0
-            topic_partial = 0
-            
-            # Exact match (whole word)
-            if norm_topic in words:
-                topic_score += weight * self.config.exact_match_weight
-                topic_exact += 1
-                exact_matches += 1
-            
-            # Partial match (contained in word)
-            for word in words:
-                if len(word) >= self.config.min_word_length:
-                    if norm_topic in word and norm_topic != word:
-                        topic_score += weight * self.config.partial_match_weight
-                        topic_partial += 1
-                        partial_matches += 1
-            
-            if topic_score > 0:
-                breakdown[topic] = topic_score
-        
-        total_score = sum(breakdown.values())
+        for topic, weight, exact, partial in resolved:
+            if exact is not None:
+                value = weight * exact_weight
+                if use_idf:
+                    value *= matrix.idf(exact)
+                for chunk_index, _ in columns[exact]:
+                    breakdowns[chunk_index][topic] = value
+                    exact_counts[chunk_index] += 1
+            for term in partial:
+                value = weight * partial_weight
+                if use_idf:
+                    value *= matrix.idf(term)
+                for chunk_index, count in columns[term]:
+                    breakdown = breakdowns[chunk_index]
+                    breakdown[topic] = breakdown.get(topic, 0.0) + value * count
+                    partial_counts[chunk_index] += count
         
-        return ScoredChunk(
-            text=content,
-            total_score=round(total_score, 2),
-            exact_matches=exact_matches,
-            partial_matches=partial_matches,
-            breakdown=breakdown,
-            is_relevant=total_score > 0
-        )
+        results = []
+        for i in range(n):
+            breakdown = {t: v for t, v in breakdowns[i].items() if v > 0}
+            total_score = sum(breakdown.values(), 0.0)
+            results.append(ScoredChunk(
+                text=chunks[i] or "",
+                total_score=round(total_score, 2),
+                exact_matches=exact_counts[i],
+                partial_matches=partial_counts[i],
+                breakdown=breakdown,
+                is_relevant=total_score > 0
+            ))
+        return results
     
     def score_chunks(
         self, 
@@ -121,6 +231,8 @@ class ContentRelevanceScorer:
     ) -> List[ScoredChunk]:
         """Score multiple chunks of content.
         
+        Tokenizes the corpus once and scores all topics against it.
+        
         Args:
             chunks: List of text chunks
             topics: Dict mapping topic keywords to their weights
@@ -128,7 +240,29 @@ class ContentRelevanceScorer:
         Returns:
             List of ScoredChunks in same order as input
         """
-        return [self.score(chunk, topics) for chunk in chunks]
+        return self.score_matrix(self.build_matrix(chunks), chunks, topics)
+    
+    def rank_chunks(
+        self,
+        chunks: List[str],
+        topics: Dict[str, float],
+        top_k: Optional[int] = None,
+        use_idf: bool = True
+    ) -> List[ScoredChunk]:
+        """Rank chunks by TF-IDF weighted relevance, best first.
+        
+        Args:
+            chunks: List of text chunks
+            topics: Topic weights
+            top_k: Keep only the best K chunks (all relevant chunks if None)
+            use_idf: Weight hits by inverse document frequency
+            
+        Returns:
+            Relevant ScoredChunks sorted by score descending
+        """
+        scored = self.score_matrix(self.build_matrix(chunks), chunks, topics, use_idf=use_idf)
+        order = _rank_order([chunk.total_score for chunk in scored], top_k)
+        return [scored[i] for i in order if scored[i].is_relevant]
     
     def is_relevant(
         self, 
@@ -298,6 +432,21 @@ class ContentRelevanceScorer:
         return tokens
 
 
+def _rank_order(scores: List[float], top_k: Optional[int]) -> List[int]:
+    """Indices of ``scores`` from highest to lowest (ties keep input order)."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    k = len(scores) if top_k is None else max(0, min(top_k, len(scores)))
+    if np is not None and scores:
+        # A stable sort: argpartition would pick arbitrarily among ties at the k-th score
+        return np.argsort(-np.asarray(scores, dtype=float), kind="stable")[:k].tolist()
+    if k < len(scores):
+        return heapq.nsmallest(k, range(len(scores)), key=lambda i: (-scores[i], i))
+    return sorted(range(len(scores)), key=lambda i: -scores[i])
+
+
 # Convenience functions
 
 def score_content(
@@ -342,8 +491,7 @@ def filter_relevant(
     scorer = ContentRelevanceScorer()
     results = []
     
-    for content in contents:
-        scored = scorer.score(content, topics)
+    for content, scored in zip(contents, scorer.score_chunks(contents, topics)):
         if scored.total_score >= threshold:
             results.append((content, scored.total_score))
     
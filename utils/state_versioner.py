@@ -9,6 +9,7 @@ Provides utilities to:
 
 import json
 import os
+import re
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
@@ -41,6 +42,24 @@ def save_version(state_dict: Dict[str, Any]) -> str:
     return filename
 
 
+_VERSION_NAME = re.compile(r'state_\d{8}_\d{6}\.json')
+
+
+def _version_names() -> List[str]:
+    """Version-shaped filenames, oldest first.
+    
+    The fixed-width ``state_YYYYMMDD_HHMMSS.json`` names sort in time
+    order, so nothing needs to be stat'ed, opened or date-parsed to order
+    them. Callers that need a real date still check it with
+    ``_parse_version_filename``.
+    """
+    try:
+        names = os.listdir(BACKUPS_DIR)
+    except OSError:
+        return []
+    return sorted(n for n in names if _VERSION_NAME.fullmatch(n))
+
+
 def list_versions() -> List[Dict[str, Any]]:
     """List all available versions with metadata.
     
@@ -49,25 +68,19 @@ def list_versions() -> List[Dict[str, Any]]:
     """
     versions = []
     
-    if not os.path.exists(BACKUPS_DIR):
-        return []
-    
-    for filename in sorted(os.listdir(BACKUPS_DIR)):
-        if not filename.startswith('state_') or not filename.endswith('.json'):
-            continue
-            
-        filepath = os.path.join(BACKUPS_DIR, filename)
-        
-        # Get file stats
-        stat = os.stat(filepath)
+    for filename in _version_names():
         timestamp = _parse_version_filename(filename)
-        
-        if timestamp:
-            versions.append({
-                'filename': filename,
-                'timestamp': timestamp.isoformat(),
-                'size': stat.st_size
-            })
+        if not timestamp:
+            continue
+        try:
+            stat = os.stat(os.path.join(BACKUPS_DIR, filename))
+        except OSError:
+            continue
+        versions.append({
+            'filename': filename,
+            'timestamp': timestamp.isoformat(),
+            'size': stat.st_size
+        })
     
     return versions
 
@@ -96,14 +109,10 @@ def get_latest_version() -> Optional[str]:
     Returns:
         The filename of the latest backup, or None if none exist
     """
-    versions = list_versions()
-    
-    if not versions:
-        return None
-    
-    # Sort by timestamp and return the latest
-    sorted_versions = sorted(versions, key=lambda v: v['timestamp'])
-    return sorted_versions[-1]['filename']
+    for filename in reversed(_version_names()):
+        if _parse_version_filename(filename):
+            return filename
+    return None
 
 
 def _parse_version_filename(filename: str) -> Optional[datetime]:
@@ -158,18 +167,17 @@ def cleanup_old_versions(keep_count: int = 100) -> int:
     Returns:
         Number of versions deleted
     """
-    versions = list_versions()
+    names = [n for n in _version_names() if _parse_version_filename(n)]
     
-    if len(versions) <= keep_count:
+    if len(names) <= keep_count:
         return 0
     
-    # Sort by timestamp (oldest first)
-    sorted_versions = sorted(versions, key=lambda v: v['timestamp'])
-    to_delete = sorted_versions[:-keep_count]
+    # Names sort oldest first
+    to_delete = names[:-keep_count] if keep_count > 0 else names
     
     deleted = 0
-    for version in to_delete:
-        if delete_version(version['filename']):
+    for filename in to_delete:
+        if delete_version(filename):
             deleted += 1
     
     return deleted